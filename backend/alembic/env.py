@@ -6,6 +6,7 @@ from pathlib import Path
 
 from alembic import context
 from sqlalchemy import engine_from_config, pool
+from sqlalchemy.engine import make_url
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 SRC_PATH = PROJECT_ROOT / "src"
@@ -13,6 +14,7 @@ if SRC_PATH.exists():
     sys.path.insert(0, str(SRC_PATH))
 
 from app.db import Base, get_database_settings  # noqa: E402
+from app.db.fulltext import FTS_TABLE, FULLTEXT_INDEX  # noqa: E402
 
 config = context.config
 if config.config_file_name is not None:
@@ -25,6 +27,20 @@ config.set_main_option("sqlalchemy.url", settings.url.replace("%", "%%"))
 target_metadata = Base.metadata
 
 
+def _include_object_for(dialect: str):
+    """Keep dialect-specific full-text objects out of autogenerate."""
+
+    def include_object(obj, name, type_, reflected, compare_to) -> bool:
+        # SQLite's FTS5 table and its shadow tables are created by migrations
+        if type_ == "table" and name is not None and name.startswith(FTS_TABLE):
+            return False
+        if type_ == "index" and name == FULLTEXT_INDEX:
+            return dialect == "mysql"
+        return True
+
+    return include_object
+
+
 def run_migrations_offline() -> None:
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
@@ -33,6 +49,7 @@ def run_migrations_offline() -> None:
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
         compare_type=True,
+        include_object=_include_object_for(make_url(url).get_backend_name()),
     )
 
     with context.begin_transaction():
@@ -51,6 +68,9 @@ def run_migrations_online() -> None:
             connection=connection,
             target_metadata=target_metadata,
             compare_type=True,
+            include_object=_include_object_for(connection.dialect.name),
+            # SQLite cannot ALTER constraints in place; batch mode rebuilds tables instead
+            render_as_batch=connection.dialect.name == "sqlite",
         )
 
         with context.begin_transaction():
@@ -0,0 +1,43 @@
+"""add_scheduling_indexes
+
+Revision ID: 5f1c2a7d9b3e
+Revises: c8d8decece9a
+Create Date: 2026-10-19 10:12:31.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f1c2a7d9b3e'
+down_revision: Union[str, Sequence[str], None] = 'c8d8decece9a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Free-block lookups (booking, available-blocks listing): equality columns
+    # first, start_at as the range, end_at so the bounds check stays in the index.
+    op.create_index(
+        'ix_appointment_blocks_availability_booked_start',
+        'appointment_blocks',
+        ['availability_id', 'is_booked', 'start_at', 'end_at'],
+        unique=False,
+    )
+    # Slot conflict checks and per-status doctor listings.
+    op.create_index(
+        'ix_appointments_doctor_status_start',
+        'appointments',
+        ['doctor_id', 'status', 'start_at', 'end_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_appointments_doctor_status_start', table_name='appointments')
+    op.drop_index('ix_appointment_blocks_availability_booked_start', table_name='appointment_blocks')
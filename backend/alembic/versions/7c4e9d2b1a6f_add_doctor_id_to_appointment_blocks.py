@@ -0,0 +1,83 @@
+"""add_doctor_id_to_appointment_blocks
+
+Revision ID: 7c4e9d2b1a6f
+Revises: 5f1c2a7d9b3e
+Create Date: 2026-10-19 11:40:06.902731
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c4e9d2b1a6f'
+down_revision: Union[str, Sequence[str], None] = '5f1c2a7d9b3e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BACKFILL_BATCH_SIZE = 5000
+
+BACKFILL_SQL = """
+    UPDATE appointment_blocks
+    SET doctor_id = (
+        SELECT doctor_availability.doctor_id
+        FROM doctor_availability
+        WHERE doctor_availability.id = appointment_blocks.availability_id
+    )
+    WHERE doctor_id IS NULL
+"""
+
+
+def _backfill_doctor_id() -> None:
+    """Copy doctor_id from the owning availability in primary-key batches.
+
+    Each batch commits on its own, so a large table is never locked by one long
+    UPDATE and an interrupted run resumes where it stopped (only NULL rows are
+    touched).
+    """
+    if context.is_offline_mode():
+        op.execute(BACKFILL_SQL)
+        return
+
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        low, high = bind.execute(
+            sa.text("SELECT MIN(id), MAX(id) FROM appointment_blocks WHERE doctor_id IS NULL")
+        ).one()
+        if low is None:
+            return
+        for batch_start in range(low, high + 1, BACKFILL_BATCH_SIZE):
+            bind.execute(
+                sa.text(BACKFILL_SQL + " AND id >= :batch_start AND id < :batch_end"),
+                {"batch_start": batch_start, "batch_end": batch_start + BACKFILL_BATCH_SIZE},
+            )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('appointment_blocks', sa.Column('doctor_id', sa.Integer(), nullable=True))
+
+    _backfill_doctor_id()
+
+    with op.batch_alter_table('appointment_blocks') as batch_op:
+        batch_op.alter_column('doctor_id', existing_type=sa.Integer(), nullable=False)
+        batch_op.create_foreign_key(
+            'fk_appointment_blocks_doctor_id', 'doctors', ['doctor_id'], ['id'], ondelete='CASCADE'
+        )
+    op.create_index(
+        'ix_appointment_blocks_doctor_booked_start',
+        'appointment_blocks',
+        ['doctor_id', 'is_booked', 'start_at', 'end_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_appointment_blocks_doctor_booked_start', table_name='appointment_blocks')
+    with op.batch_alter_table('appointment_blocks') as batch_op:
+        batch_op.drop_constraint('fk_appointment_blocks_doctor_id', type_='foreignkey')
+        batch_op.drop_column('doctor_id')
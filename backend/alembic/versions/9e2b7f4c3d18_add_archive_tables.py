@@ -0,0 +1,89 @@
+"""add_archive_tables
+
+Revision ID: 9e2b7f4c3d18
+Revises: 7c4e9d2b1a6f
+Create Date: 2026-10-19 14:05:52.330917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e2b7f4c3d18'
+down_revision: Union[str, Sequence[str], None] = '7c4e9d2b1a6f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('job_checkpoints',
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('last_id', sa.Integer(), nullable=False),
+    sa.Column('parameters', sa.JSON(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.create_table('appointments_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('doctor_id', sa.Integer(), nullable=False),
+    sa.Column('patient_id', sa.Integer(), nullable=False),
+    sa.Column('availability_id', sa.Integer(), nullable=True),
+    sa.Column('block_id', sa.Integer(), nullable=True),
+    sa.Column('office_id', sa.Integer(), nullable=True),
+    sa.Column('start_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('end_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('status', sa.Enum('pending', 'confirmed', 'canceled', 'completed', name='appointmentstatus'), nullable=False),
+    sa.Column('cancel_reason', sa.String(length=255), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('archived_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.ForeignKeyConstraint(['doctor_id'], ['doctors.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['patient_id'], ['patients.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_appointments_archive_patient', 'appointments_archive', ['patient_id', 'start_at'], unique=False)
+    op.create_index('ix_appointments_archive_doctor', 'appointments_archive', ['doctor_id', 'start_at'], unique=False)
+    op.create_table('appointment_blocks_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('availability_id', sa.Integer(), nullable=False),
+    sa.Column('doctor_id', sa.Integer(), nullable=False),
+    sa.Column('block_number', sa.Integer(), nullable=False),
+    sa.Column('start_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('end_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('is_booked', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('archived_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.ForeignKeyConstraint(['doctor_id'], ['doctors.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_appointment_blocks_archive_doctor', 'appointment_blocks_archive', ['doctor_id', 'start_at'], unique=False)
+    op.create_table('doctor_availability_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('doctor_id', sa.Integer(), nullable=False),
+    sa.Column('start_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('end_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('archived_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.ForeignKeyConstraint(['doctor_id'], ['doctors.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_doctor_availability_archive_doctor', 'doctor_availability_archive', ['doctor_id', 'start_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_doctor_availability_archive_doctor', table_name='doctor_availability_archive')
+    op.drop_table('doctor_availability_archive')
+    op.drop_index('ix_appointment_blocks_archive_doctor', table_name='appointment_blocks_archive')
+    op.drop_table('appointment_blocks_archive')
+    op.drop_index('ix_appointments_archive_doctor', table_name='appointments_archive')
+    op.drop_index('ix_appointments_archive_patient', table_name='appointments_archive')
+    op.drop_table('appointments_archive')
+    op.drop_table('job_checkpoints')
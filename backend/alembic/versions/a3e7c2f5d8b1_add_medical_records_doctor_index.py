@@ -0,0 +1,29 @@
+"""add_medical_records_doctor_index
+
+Revision ID: a3e7c2f5d8b1
+Revises: e1a4c8b3f7d2
+Create Date: 2026-10-19 20:51:03.477125
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3e7c2f5d8b1'
+down_revision: Union[str, Sequence[str], None] = 'e1a4c8b3f7d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Newest-first record timelines per doctor (paginated summaries)
+    op.create_index('ix_medical_records_doctor', 'medical_records', ['doctor_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_medical_records_doctor', table_name='medical_records')
@@ -0,0 +1,34 @@
+"""add_cache_versions
+
+Revision ID: a7c3e9f1b5d2
+Revises: d3f8a1c6b9e4
+Create Date: 2026-10-19 10:14:38.512907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e9f1b5d2'
+down_revision: Union[str, Sequence[str], None] = 'd3f8a1c6b9e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Rows are created by the first bump of each cache
+    op.create_table('cache_versions',
+    sa.Column('name', sa.String(length=64), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('cache_versions')
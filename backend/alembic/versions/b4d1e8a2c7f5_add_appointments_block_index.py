@@ -0,0 +1,30 @@
+"""add_appointments_block_index
+
+Revision ID: b4d1e8a2c7f5
+Revises: 9e2b7f4c3d18
+Create Date: 2026-10-19 15:20:44.102937
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4d1e8a2c7f5'
+down_revision: Union[str, Sequence[str], None] = '9e2b7f4c3d18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Block -> appointment lookups (consistency scan anti-joins, archival,
+    # orphaned-block repair); status lets "live appointment" checks stay in the index.
+    op.create_index('ix_appointments_block_status', 'appointments', ['block_id', 'status'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_appointments_block_status', table_name='appointments')
@@ -0,0 +1,38 @@
+"""add_patient_search_terms
+
+Revision ID: b8f1d6c4e2a7
+Revises: a3e7c2f5d8b1
+Create Date: 2026-10-19 21:36:18.062941
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8f1d6c4e2a7'
+down_revision: Union[str, Sequence[str], None] = 'a3e7c2f5d8b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Filled by `python scripts/run_repair.py reindex_patient_search` after upgrading
+    op.create_table('patient_search_terms',
+    sa.Column('kind', sa.String(length=16), nullable=False),
+    sa.Column('term', sa.String(length=64).with_variant(mysql.VARCHAR(length=64, charset='ascii', collation='ascii_bin'), 'mysql'), nullable=False),
+    sa.Column('patient_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['patient_id'], ['patients.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('kind', 'term', 'patient_id')
+    )
+    op.create_index('ix_patient_search_terms_patient', 'patient_search_terms', ['patient_id', 'kind', 'term'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_patient_search_terms_patient', table_name='patient_search_terms')
+    op.drop_table('patient_search_terms')
@@ -0,0 +1,29 @@
+"""add_doctor_directory_index
+
+Revision ID: c4d9e2a6f8b3
+Revises: b8f1d6c4e2a7
+Create Date: 2026-10-19 22:14:37.120934
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d9e2a6f8b3'
+down_revision: Union[str, Sequence[str], None] = 'b8f1d6c4e2a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Doctor directory filters by specialty (and office)
+    op.create_index('ix_doctors_specialty_office', 'doctors', ['specialty', 'office_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_doctors_specialty_office', table_name='doctors')
@@ -0,0 +1,43 @@
+"""move_settings_version_to_cache_versions
+
+Revision ID: c5e8b2d4f7a1
+Revises: a7c3e9f1b5d2
+Create Date: 2026-10-19 14:21:05.730416
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e8b2d4f7a1'
+down_revision: Union[str, Sequence[str], None] = 'a7c3e9f1b5d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep the counter going so running workers still notice the next change
+    op.execute(
+        "INSERT INTO cache_versions (name, version) "
+        "SELECT 'system_settings', version FROM system_settings_version WHERE id = 1"
+    )
+    op.drop_table('system_settings_version')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_table('system_settings_version',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.execute(
+        "INSERT INTO system_settings_version (id, version) "
+        "SELECT 1, COALESCE(MAX(version), 0) + 1 FROM cache_versions WHERE name = 'system_settings'"
+    )
+    op.execute("DELETE FROM cache_versions WHERE name = 'system_settings'")
@@ -0,0 +1,37 @@
+"""add_appointment_analytics_indexes
+
+Revision ID: c5f8a2d6e3b9
+Revises: f2c7a9d4e1b6
+Create Date: 2026-10-19 18:42:10.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5f8a2d6e3b9'
+down_revision: Union[str, Sequence[str], None] = 'f2c7a9d4e1b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Analytics group a start_at range by status, doctor and office; the
+    # covering index keeps the live table out of the scan.
+    op.create_index(
+        'ix_appointments_start_breakdown',
+        'appointments',
+        ['start_at', 'status', 'doctor_id', 'office_id'],
+        unique=False,
+    )
+    op.create_index('ix_appointments_archive_start', 'appointments_archive', ['start_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_appointments_archive_start', table_name='appointments_archive')
+    op.drop_index('ix_appointments_start_breakdown', table_name='appointments')
@@ -22,38 +22,22 @@ depends_on: Union[str, Sequence[str], None] = None
 def upgrade() -> None:
     """Upgrade schema."""
     # ### commands auto generated by Alembic - please adjust! ###
-    # Check if tables exist before creating them
-    connection = op.get_bind()
-    
-    # Check if system_settings table exists
-    result = connection.execute(text("""
-        SELECT COUNT(*) 
-        FROM information_schema.tables 
-        WHERE table_schema = DATABASE() 
-        AND table_name = 'system_settings'
-    """)).scalar()
-    
-    if result == 0:
+    # Check if tables exist before creating them (portable across MySQL and SQLite)
+    inspector = sa.inspect(op.get_bind())
+
+    if not inspector.has_table('system_settings'):
         op.create_table('system_settings',
     sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
     sa.Column('setting_key', sa.String(length=100), nullable=False),
     sa.Column('setting_value', sa.Text(), nullable=False),
     sa.Column('description', sa.Text(), nullable=True),
-    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
     sa.PrimaryKeyConstraint('id')
         )
         op.create_index(op.f('ix_system_settings_setting_key'), 'system_settings', ['setting_key'], unique=True)
     
-    # Check if appointment_blocks table exists
-    result = connection.execute(text("""
-        SELECT COUNT(*) 
-        FROM information_schema.tables 
-        WHERE table_schema = DATABASE() 
-        AND table_name = 'appointment_blocks'
-    """)).scalar()
-    
-    if result == 0:
+    if not inspector.has_table('appointment_blocks'):
         op.create_table('appointment_blocks',
     sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
     sa.Column('availability_id', sa.Integer(), nullable=False),
@@ -61,30 +45,29 @@ def upgrade() -> None:
     sa.Column('start_at', sa.DateTime(timezone=True), nullable=False),
     sa.Column('end_at', sa.DateTime(timezone=True), nullable=False),
     sa.Column('is_booked', sa.Boolean(), nullable=False),
-    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
     sa.ForeignKeyConstraint(['availability_id'], ['doctor_availability.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('availability_id', 'block_number', name='uq_availability_block_number')
         )
     
-    # Check if block_id column exists in appointments table
-    result = connection.execute(text("""
-        SELECT COUNT(*) 
-        FROM information_schema.columns 
-        WHERE table_schema = DATABASE() 
-        AND table_name = 'appointments' 
-        AND column_name = 'block_id'
-    """)).scalar()
-    
-    if result == 0:
-        op.add_column('appointments', sa.Column('block_id', sa.Integer(), nullable=True))
-        op.create_foreign_key(None, 'appointments', 'appointment_blocks', ['block_id'], ['id'], ondelete='SET NULL')
-    
+    appointment_columns = {column['name'] for column in inspector.get_columns('appointments')}
+    if 'block_id' not in appointment_columns:
+        # Batch mode recreates the table on SQLite, which cannot ALTER constraints
+        with op.batch_alter_table('appointments') as batch_op:
+            batch_op.add_column(sa.Column('block_id', sa.Integer(), nullable=True))
+            batch_op.create_foreign_key(
+                'fk_appointments_block_id', 'appointment_blocks', ['block_id'], ['id'], ondelete='SET NULL'
+            )
+
     # Insert initial system settings if not exists
     op.execute(text("""
-        INSERT IGNORE INTO system_settings (setting_key, setting_value, description) 
-        VALUES ('appointment_block_duration_minutes', '60', 'Duration of each appointment block in minutes')
+        INSERT INTO system_settings (setting_key, setting_value, description)
+        SELECT 'appointment_block_duration_minutes', '60', 'Duration of each appointment block in minutes'
+        WHERE NOT EXISTS (
+            SELECT 1 FROM system_settings WHERE setting_key = 'appointment_block_duration_minutes'
+        )
     """))
     # ### end Alembic commands ###
 
@@ -92,8 +75,9 @@ def upgrade() -> None:
 def downgrade() -> None:
     """Downgrade schema."""
     # ### commands auto generated by Alembic - please adjust! ###
-    op.drop_constraint(None, 'appointments', type_='foreignkey')
-    op.drop_column('appointments', 'block_id')
+    with op.batch_alter_table('appointments') as batch_op:
+        batch_op.drop_constraint('fk_appointments_block_id', type_='foreignkey')
+        batch_op.drop_column('block_id')
     op.drop_table('appointment_blocks')
     op.drop_index(op.f('ix_system_settings_setting_key'), table_name='system_settings')
     op.drop_table('system_settings')
@@ -0,0 +1,42 @@
+"""add_doctor_patients
+
+Revision ID: d3f8a1c6b9e4
+Revises: c4d9e2a6f8b3
+Create Date: 2026-10-19 23:02:51.846215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3f8a1c6b9e4'
+down_revision: Union[str, Sequence[str], None] = 'c4d9e2a6f8b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Filled by `python scripts/run_repair.py rebuild_doctor_patients` after upgrading
+    op.create_table('doctor_patients',
+    sa.Column('doctor_id', sa.Integer(), nullable=False),
+    sa.Column('patient_id', sa.Integer(), nullable=False),
+    sa.Column('first_seen', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('last_appointment_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('appointment_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['doctor_id'], ['doctors.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['patient_id'], ['patients.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('doctor_id', 'patient_id')
+    )
+    op.create_index('ix_doctor_patients_doctor_last', 'doctor_patients', ['doctor_id', 'last_appointment_at', 'patient_id'], unique=False)
+    op.create_index('ix_doctor_patients_patient', 'doctor_patients', ['patient_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Dropping the table takes its indexes along; MySQL refuses to drop the
+    # patient_id index on its own while the foreign key needs it
+    op.drop_table('doctor_patients')
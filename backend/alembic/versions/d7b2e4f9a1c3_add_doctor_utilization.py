@@ -0,0 +1,46 @@
+"""add_doctor_utilization
+
+Revision ID: d7b2e4f9a1c3
+Revises: c5f8a2d6e3b9
+Create Date: 2026-10-19 19:27:51.340612
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7b2e4f9a1c3'
+down_revision: Union[str, Sequence[str], None] = 'c5f8a2d6e3b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Filled by scripts/refresh_utilization.py (--since for the history)
+    op.create_table('doctor_utilization',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('period_start', sa.Date(), nullable=False),
+    sa.Column('doctor_id', sa.Integer(), nullable=False),
+    sa.Column('office_id', sa.Integer(), nullable=True),
+    sa.Column('offered', sa.Integer(), nullable=False),
+    sa.Column('booked', sa.Integer(), nullable=False),
+    sa.Column('refilled', sa.Integer(), nullable=False),
+    sa.Column('empty_past', sa.Integer(), nullable=False),
+    sa.Column('refreshed_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['doctor_id'], ['doctors.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['office_id'], ['offices.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ux_doctor_utilization_period_doctor', 'doctor_utilization', ['period_start', 'doctor_id'], unique=True)
+    op.create_index('ix_doctor_utilization_doctor_period', 'doctor_utilization', ['doctor_id', 'period_start'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_doctor_utilization_doctor_period', table_name='doctor_utilization')
+    op.drop_index('ux_doctor_utilization_period_doctor', table_name='doctor_utilization')
+    op.drop_table('doctor_utilization')
@@ -21,12 +21,14 @@ depends_on: Union[str, Sequence[str], None] = None
 def upgrade() -> None:
     """Upgrade schema."""
     # Add office_id column to doctors table
-    op.add_column('doctors', sa.Column('office_id', sa.Integer(), nullable=True))
-    op.create_foreign_key('fk_doctors_office_id', 'doctors', 'offices', ['office_id'], ['id'], ondelete='SET NULL')
+    with op.batch_alter_table('doctors') as batch_op:
+        batch_op.add_column(sa.Column('office_id', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key('fk_doctors_office_id', 'offices', ['office_id'], ['id'], ondelete='SET NULL')
 
 
 def downgrade() -> None:
     """Downgrade schema."""
     # Remove office_id column from doctors table
-    op.drop_constraint('fk_doctors_office_id', 'doctors', type_='foreignkey')
-    op.drop_column('doctors', 'office_id')
+    with op.batch_alter_table('doctors') as batch_op:
+        batch_op.drop_constraint('fk_doctors_office_id', type_='foreignkey')
+        batch_op.drop_column('office_id')
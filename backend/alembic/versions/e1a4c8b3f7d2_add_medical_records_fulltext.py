@@ -0,0 +1,50 @@
+"""add_medical_records_fulltext
+
+Revision ID: e1a4c8b3f7d2
+Revises: d7b2e4f9a1c3
+Create Date: 2026-10-19 20:14:36.902251
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1a4c8b3f7d2'
+down_revision: Union[str, Sequence[str], None] = 'd7b2e4f9a1c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'mysql':
+        op.create_index(
+            'ft_medical_records_text',
+            'medical_records',
+            ['diagnosis', 'treatment', 'notes'],
+            unique=False,
+            mysql_prefix='FULLTEXT',
+        )
+    elif dialect == 'sqlite':
+        # FTS5 copy kept in sync by MedicalRecordsService; see app.db.fulltext
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS medical_records_fts USING fts5("
+            "diagnosis, treatment, notes, tokenize='unicode61 remove_diacritics 2')"
+        )
+        op.execute(
+            "INSERT INTO medical_records_fts (rowid, diagnosis, treatment, notes) "
+            "SELECT id, diagnosis, treatment, notes FROM medical_records"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'mysql':
+        op.drop_index('ft_medical_records_text', table_name='medical_records')
+    elif dialect == 'sqlite':
+        op.execute("DROP TABLE IF EXISTS medical_records_fts")
@@ -0,0 +1,34 @@
+"""add_system_settings_version
+
+Revision ID: e6a3f1b9d2c4
+Revises: b4d1e8a2c7f5
+Create Date: 2026-10-19 16:02:17.448120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a3f1b9d2c4'
+down_revision: Union[str, Sequence[str], None] = 'b4d1e8a2c7f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    version_table = op.create_table('system_settings_version',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.bulk_insert(version_table, [{'id': 1, 'version': 1}])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('system_settings_version')
@@ -0,0 +1,57 @@
+"""add_dashboard_counters
+
+Revision ID: f2c7a9d4e1b6
+Revises: e6a3f1b9d2c4
+Create Date: 2026-10-19 16:48:09.215733
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c7a9d4e1b6'
+down_revision: Union[str, Sequence[str], None] = 'e6a3f1b9d2c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    counters = op.create_table('dashboard_counters',
+    sa.Column('name', sa.String(length=64), nullable=False),
+    sa.Column('value', sa.BigInteger(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+    # Seed from the live tables; later drift is fixed by scripts/reconcile_dashboard_counters.py
+    users = sa.table('users', sa.column('id'), sa.column('role'), sa.column('is_active'))
+    records = sa.table('medical_records', sa.column('id'))
+    appointments = sa.table('appointments', sa.column('start_at'), sa.column('status'))
+    totals = [
+        sa.select(sa.literal('users'), sa.func.count()).select_from(users),
+        sa.select(sa.literal('active_doctors'), sa.func.count())
+        .select_from(users)
+        .where(users.c.role == 'doctor', users.c.is_active == sa.true()),
+        sa.select(sa.literal('medical_records'), sa.func.count()).select_from(records),
+    ]
+    for select in totals:
+        op.execute(counters.insert().from_select(['name', 'value'], select))
+
+    day = sa.cast(sa.func.date(appointments.c.start_at), sa.String)
+    op.execute(
+        counters.insert().from_select(
+            ['name', 'value'],
+            sa.select(sa.literal('appointments:', sa.String) + day, sa.func.count())
+            .where(appointments.c.status != 'canceled')
+            .group_by(day),
+        )
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('dashboard_counters')
@@ -2,6 +2,8 @@
 """
 Script to fix the admin role in the database.
 Updates any admin records with invalid roles to use "superadmin".
+
+Thin wrapper around the chunked repair; see ``scripts/run_repair.py``.
 """
 
 import sys
@@ -10,45 +12,18 @@ from pathlib import Path
 # Add the src directory to the Python path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from sqlalchemy import select
-
-from app.db.broker import get_dbbroker
-from app.models import Admin
+from app.db.chunked import ChunkedJobRunner
+from app.services.repairs import NormalizeAdminRoles
 
 
 def fix_admin_roles():
     """Fix admin roles to use valid literal values."""
-    
-    db_broker = get_dbbroker()
-    
-    with db_broker.session() as session:
-        try:
-            # Get all admin records
-            print("Checking admin records...")
-            admins = session.execute(select(Admin)).scalars().all()
-            
-            if not admins:
-                print("No admin records found.")
-                return
-            
-            valid_roles = {"superadmin", "manager", "support"}
-            fixed_count = 0
-            
-            for admin in admins:
-                if admin.role not in valid_roles:
-                    old_role = admin.role
-                    admin.role = "superadmin"
-                    print(f"✓ Fixed admin ID {admin.id}: '{old_role}' → 'superadmin'")
-                    fixed_count += 1
-            
-            if fixed_count > 0:
-                print(f"\n✅ Fixed {fixed_count} admin record(s)")
-            else:
-                print("\n✅ All admin records already have valid roles")
-            
-        except Exception as e:
-            print(f"\n❌ Error fixing admin roles: {e}")
-            raise
+    report = ChunkedJobRunner().run(NormalizeAdminRoles())
+    if report.changed:
+        print(f"✅ Fixed {report.changed} admin record(s)")
+    else:
+        print("✅ All admin records already have valid roles")
+    return report.changed
 
 
 if __name__ == "__main__":
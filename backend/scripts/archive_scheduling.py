@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+"""
+Move finished appointments and expired blocks/availabilities to archive tables.
+
+Intended to run periodically (cron, systemd timer). Each batch commits on its
+own and progress is checkpointed, so the job can be stopped at any time and the
+next invocation resumes where it left off.
+
+Usage::
+
+    python scripts/archive_scheduling.py [--retention-days N] [--batch-size N] [--max-batches N]
+
+Defaults come from ARCHIVE_RETENTION_DAYS and ARCHIVE_BATCH_SIZE.
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from app.db.settings import ArchiveSettings  # noqa: E402
+from app.services.archive import ArchiveService  # noqa: E402
+
+
+def main() -> int:
+    defaults = ArchiveSettings()
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--retention-days", type=int, default=defaults.retention_days)
+    parser.add_argument("--batch-size", type=int, default=defaults.batch_size)
+    parser.add_argument("--max-batches", type=int, default=None, help="stop after N batches")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    settings = ArchiveSettings(retention_days=args.retention_days, batch_size=args.batch_size)
+    report = ArchiveService(settings=settings).run(max_batches=args.max_batches)
+
+    print(f"Cutoff: {report.cutoff.isoformat()}")
+    for name, count in report.moved.items():
+        print(f"  {name}: {count} archived")
+    print("Done." if report.completed else "Stopped early; rerun to continue from the checkpoint.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+"""
+Microbenchmark for the pre-built hot query statements.
+
+Compares building each statement inline on every call (the previous approach)
+against executing the module-level bound-parameter templates used by the
+services. Runs against an in-memory SQLite database seeded with one doctor,
+one availability split into blocks and one patient, and prints
+the mean time per call for each variant.
+
+Usage::
+
+    python scripts/bench_hot_queries.py [iterations]
+"""
+from __future__ import annotations
+
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from sqlalchemy import select  # noqa: E402
+from sqlalchemy.orm import joinedload  # noqa: E402
+
+import app.models  # noqa: E402,F401 - register models with Base metadata
+from app.db.base import Base  # noqa: E402
+from app.db.broker import DBBroker  # noqa: E402
+from app.db.settings import DatabaseSettings  # noqa: E402
+from app.models.appointment import Appointment as AppointmentModel  # noqa: E402
+from app.models.appointment_block import AppointmentBlock as AppointmentBlockModel  # noqa: E402
+from app.models.availability import Availability as AvailabilityModel  # noqa: E402
+from app.models.enums import AppointmentStatus  # noqa: E402
+from app.models.patient import Patient as PatientModel  # noqa: E402
+from app.models.user import User as UserModel  # noqa: E402
+from app.repositories import sqlalchemy_appointments as appointments_module  # noqa: E402
+from app.schemas.appointment import AvailabilityCreate  # noqa: E402
+from app.schemas.user import DoctorCreate, PatientCreate  # noqa: E402
+from app.services import patients as patients_module  # noqa: E402
+from app.services.appointments import AppointmentsService  # noqa: E402
+from app.services.doctors import DoctorsService  # noqa: E402
+from app.services.patients import PatientsService  # noqa: E402
+
+
+def _seed(session) -> tuple[int, str, datetime]:
+    doctors = DoctorsService(session)
+    patients = PatientsService(session)
+    doctor = doctors.create(
+        DoctorCreate(
+            email="bench.doctor@example.com",
+            password="benchpass123",
+            full_name="Bench Doctor",
+            specialty="Clínica Médica",
+            license_number="BENCH-001",
+        )
+    )
+    patients.create(
+        PatientCreate(
+            email="bench.patient@example.com",
+            password="benchpass123",
+            full_name="Bench Patient",
+            document_number="BENCH001",
+            address="Bench 123",
+            phone="555-0000",
+        )
+    )
+    start = (datetime.now(timezone.utc) + timedelta(days=1)).replace(
+        hour=8, minute=0, second=0, microsecond=0
+    )
+    AppointmentsService(session, doctors=doctors, patients=patients).create_availability(
+        AvailabilityCreate(doctor_id=doctor.id, start_at=start, end_at=start + timedelta(hours=8))
+    )
+    session.commit()
+    return doctor.id, "bench.patient@example.com", start
+
+
+def _inline_variants(doctor_id: int, email: str, start: datetime):
+    end = start + timedelta(minutes=30)
+    window_end = start + timedelta(days=1)
+
+    def conflict(session):
+        stmt = (
+            select(AppointmentModel)
+            .where(AppointmentModel.doctor_id == doctor_id)
+            .where(AppointmentModel.status != AppointmentStatus.CANCELED)
+            .where(AppointmentModel.start_at < end)
+            .where(AppointmentModel.end_at > start)
+            .limit(1)
+        )
+        return session.scalars(stmt).first()
+
+    def overlapping(session):
+        stmt = (
+            select(AvailabilityModel.id)
+            .where(AvailabilityModel.doctor_id == doctor_id)
+            .where(AvailabilityModel.start_at < end)
+            .where(AvailabilityModel.end_at > start)
+            .where(AvailabilityModel.id != 0)
+            .limit(1)
+        )
+        return session.scalars(stmt).first()
+
+    def available_blocks(session):
+        stmt = (
+            select(AppointmentBlockModel)
+            .where(AppointmentBlockModel.doctor_id == doctor_id)
+            .where(AppointmentBlockModel.is_booked == False)  # noqa: E712
+            .where(AppointmentBlockModel.start_at >= start)
+            .where(AppointmentBlockModel.end_at <= window_end)
+            .order_by(AppointmentBlockModel.start_at)
+        )
+        return session.scalars(stmt).all()
+
+    def authenticate(session):
+        stmt = (
+            select(PatientModel)
+            .join(PatientModel.user)
+            .options(joinedload(PatientModel.user))
+            .where(UserModel.email == email)
+        )
+        return session.scalars(stmt).first()
+
+    return {
+        "conflicting appointment": conflict,
+        "overlapping availability": overlapping,
+        "available blocks": available_blocks,
+        "authenticate": authenticate,
+    }
+
+
+def _template_variants(doctor_id: int, email: str, start: datetime):
+    end = start + timedelta(minutes=30)
+    window_end = start + timedelta(days=1)
+    slot = {"doctor_id": doctor_id, "start": start, "end": end}
+
+    def conflict(session):
+        return session.scalars(appointments_module._CONFLICTING_APPOINTMENT_STMT, slot).first()
+
+    def overlapping(session):
+        return session.scalars(
+            appointments_module._OVERLAPPING_AVAILABILITY_STMT, {**slot, "skip_id": 0}
+        ).first()
+
+    def available_blocks(session):
+        return session.scalars(
+            appointments_module._AVAILABLE_BLOCKS_STMT,
+            {"doctor_id": doctor_id, "start": start, "end": window_end},
+        ).all()
+
+    def authenticate(session):
+        return session.scalars(patients_module._AUTHENTICATE_STMT, {"email": email}).first()
+
+    return {
+        "conflicting appointment": conflict,
+        "overlapping availability": overlapping,
+        "available blocks": available_blocks,
+        "authenticate": authenticate,
+    }
+
+
+def main(iterations: int = 5000) -> None:
+    broker = DBBroker(DatabaseSettings(url="sqlite://"))
+    Base.metadata.create_all(broker.engine)
+
+    with broker.session() as session:
+        doctor_id, email, start = _seed(session)
+        inline = _inline_variants(doctor_id, email, start)
+        templates = _template_variants(doctor_id, email, start)
+
+        print(f"{'query':<26}{'inline (us)':>14}{'template (us)':>16}{'speedup':>10}")
+        for name in inline:
+            # Warm up both variants so the compiled cache is populated.
+            inline[name](session)
+            templates[name](session)
+            before = timeit.timeit(lambda: inline[name](session), number=iterations)
+            after = timeit.timeit(lambda: templates[name](session), number=iterations)
+            before_us = before / iterations * 1e6
+            after_us = after / iterations * 1e6
+            print(f"{name:<26}{before_us:>14.1f}{after_us:>16.1f}{before_us / after_us:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
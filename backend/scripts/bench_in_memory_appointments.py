@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+"""
+Scheduling simulation on the in-memory appointments backend.
+
+Runs ``InMemoryAppointmentsService`` (the database-free ``AppointmentsService``)
+over a synthetic clinic: every doctor gets eight hours of availability a day,
+patients book random free blocks, and a share of the bookings is canceled.
+Prints the time per operation, which stays flat as the schedule grows because
+range queries and conflict checks bisect per-doctor indexes.
+
+Usage::
+
+    python scripts/bench_in_memory_appointments.py [--doctors N] [--days N] [--bookings N] [--seed N]
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from app.schemas.appointment import AppointmentCreate, AvailabilityCreate  # noqa: E402
+from app.services.appointments import ValidationError  # noqa: E402
+from app.services.in_memory_appointments import InMemoryAppointmentsService  # noqa: E402
+
+
+def _report(name: str, count: int, elapsed: float) -> None:
+    print(f"{name:<22}{count:>10}{elapsed / max(count, 1) * 1e6:>14.1f} us/op")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--doctors", type=int, default=50)
+    parser.add_argument("--days", type=int, default=60)
+    parser.add_argument("--bookings", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    # The service logs every request and warns on each rejected booking
+    logging.getLogger("app.services.appointments").setLevel(logging.ERROR)
+
+    rng = random.Random(args.seed)
+    service = InMemoryAppointmentsService()
+    service.store.doctor_ids.update(range(1, args.doctors + 1))
+    service.store.patient_ids.update(range(1, args.bookings + 1))
+    first_day = (datetime.now(timezone.utc) + timedelta(days=1)).replace(hour=8, minute=0, second=0, microsecond=0)
+
+    started = time.perf_counter()
+    for doctor_id in service.store.doctor_ids:
+        for day in range(args.days):
+            start = first_day + timedelta(days=day)
+            service.create_availability(
+                AvailabilityCreate(doctor_id=doctor_id, start_at=start, end_at=start + timedelta(hours=8))
+            )
+    _report("create_availability", args.doctors * args.days, time.perf_counter() - started)
+
+    booked, rejected = [], 0
+    started = time.perf_counter()
+    for patient_id in range(1, args.bookings + 1):
+        begin = first_day + timedelta(days=rng.randrange(args.days), hours=rng.randrange(8))
+        try:
+            booked.append(
+                service.book(
+                    AppointmentCreate(
+                        doctor_id=rng.randint(1, args.doctors),
+                        patient_id=patient_id,
+                        start_at=begin,
+                        end_at=begin + timedelta(hours=1),
+                    )
+                )
+            )
+        except ValidationError:
+            rejected += 1
+    _report("book", args.bookings, time.perf_counter() - started)
+
+    started = time.perf_counter()
+    canceled = rng.sample(booked, len(booked) // 10)
+    for appointment in canceled:
+        service.cancel(appointment.id)
+    _report("cancel", len(canceled), time.perf_counter() - started)
+
+    started = time.perf_counter()
+    for doctor_id in service.store.doctor_ids:
+        day = first_day + timedelta(days=rng.randrange(args.days))
+        service.list_available_blocks(doctor_id, day, day + timedelta(days=1))
+        service.list_for_doctor(doctor_id)
+    _report("doctor queries", 2 * args.doctors, time.perf_counter() - started)
+
+    print(f"{len(booked)} booked, {rejected} rejected as taken, {len(canceled)} canceled")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""
+Check that appointment blocks and appointments agree with each other.
+
+Reports booked blocks without a live appointment, blocks held by several
+appointments, free blocks that an appointment points to, and appointments
+outside their block. Tables are streamed, so it is safe on large databases.
+
+Usage::
+
+    python scripts/check_consistency.py [--doctor-id N] [--plan FILE] [--batch-size N]
+
+``--plan`` writes every violation with its suggested action as JSON lines.
+``release_block`` actions are applied by ``scripts/run_repair.py
+release_orphaned_blocks``. Exits with status 1 when violations were found.
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from contextlib import nullcontext
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from app.services.consistency import ConsistencyScanner  # noqa: E402
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--doctor-id", type=int, default=None, help="only scan this doctor")
+    parser.add_argument("--plan", type=Path, default=None, help="write the repair plan (JSON lines) here")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    scanner = ConsistencyScanner(batch_size=args.batch_size)
+    with args.plan.open("w") if args.plan else nullcontext() as plan:
+        report = scanner.scan(doctor_id=args.doctor_id, plan=plan)
+
+    for kind, count in report.counts.items():
+        print(f"  {kind}: {count}")
+    for violation in report.samples:
+        print(
+            f"  - {violation.kind}: doctor {violation.doctor_id}, block {violation.block_id}, "
+            f"appointments {list(violation.appointment_ids)} -> {violation.action}"
+        )
+    print("Consistent." if report.consistent else f"{report.total} violation(s) found.")
+    return 0 if report.consistent else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+"""
+Import patients from a CSV file (see ``app.services.patient_import``).
+
+The header row names patient fields: email, password, document_number,
+address and phone are required; full_name, document_type, date_of_birth
+(YYYY-MM-DD), medical_record_number, emergency_contact, obra_social_name,
+obra_social_number, is_active and is_superuser are optional. The file is
+streamed and every chunk is committed on its own; rejected rows are printed
+with their line number and do not stop the import.
+
+Usage::
+
+    python scripts/import_patients.py patients.csv [--chunk-size N] [--hash-workers N]
+    python scripts/import_patients.py - < patients.csv
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from app.services.patient_import import DEFAULT_CHUNK_SIZE, PatientImportService  # noqa: E402
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("path", help="CSV file, or - for standard input")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument(
+        "--hash-workers",
+        type=int,
+        default=0,
+        help="hash passwords in a pool of N processes (worth it only for slow password hashes)",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    try:
+        service = PatientImportService(chunk_size=args.chunk_size, hash_workers=args.hash_workers)
+        if args.path == "-":
+            report = service.import_csv(sys.stdin)
+        else:
+            with open(args.path, newline="", encoding="utf-8-sig") as handle:
+                report = service.import_csv(handle)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    for error in report.errors:
+        print(f"line {error.line} ({error.email or '-'}): {error.message}", file=sys.stderr)
+    print(f"Created {report.created} patient(s); {report.failed} row(s) rejected.")
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
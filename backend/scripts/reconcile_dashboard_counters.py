@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+"""
+Recount the admin dashboard counters and fix any drift.
+
+The counters are adjusted on every ORM flush; writes that bypass the ORM
+(database cascades, manual SQL, bulk jobs) can leave them off. Run this
+periodically (cron, systemd timer) to correct them.
+
+Usage::
+
+    python scripts/reconcile_dashboard_counters.py
+"""
+from __future__ import annotations
+
+import logging
+import sys
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from app.services.admin_dashboard import AdminDashboardService  # noqa: E402
+
+
+def main() -> int:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    corrections = AdminDashboardService().reconcile()
+    for name, (stored, actual) in sorted(corrections.items()):
+        print(f"  {name}: {stored} -> {actual}")
+    print(f"Corrected {len(corrections)} counter(s)." if corrections else "All counters were accurate.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
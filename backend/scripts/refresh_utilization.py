@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+"""
+Refresh the doctor utilization summary (``doctor_utilization``).
+
+By default only open periods are recomputed: the current month and any past
+month that ended after its last refresh. Run it from cron (hourly is plenty);
+use ``--since`` once after deploying to fill in the history.
+
+Usage::
+
+    python scripts/refresh_utilization.py
+    python scripts/refresh_utilization.py --since 2025-01-01
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from datetime import date
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from app.services.utilization import UtilizationService  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--since",
+        type=date.fromisoformat,
+        help="rebuild every month from this date (YYYY-MM-DD) through the current one",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    service = UtilizationService()
+    result = service.rebuild(args.since) if args.since else service.refresh()
+    print(f"Refreshed {len(result.periods)} period(s), {result.rows} row(s).")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
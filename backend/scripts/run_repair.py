@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+"""
+Run chunked data repairs (see ``app.services.repairs``).
+
+Rows are walked in primary-key chunks, each committed on its own with progress
+kept in ``job_checkpoints``; an interrupted repair resumes where it stopped when
+rerun with the same ``--chunk-size`` and ``--workers``.
+
+Usage::
+
+    python scripts/run_repair.py [REPAIR ...] [--chunk-size N] [--workers N]
+        [--rows-per-second N] [--dry-run] [--restart] [--max-chunks N]
+
+Without repair names every registered repair runs, in registry order.
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from app.db.chunked import ChunkedJobRunner  # noqa: E402
+from app.services.repairs import REPAIRS  # noqa: E402
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("repairs", nargs="*", metavar="REPAIR", help=", ".join(REPAIRS))
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--rows-per-second", type=float, default=None, help="throttle across all workers")
+    parser.add_argument("--dry-run", action="store_true", help="run every chunk and roll it back")
+    parser.add_argument("--restart", action="store_true", help="discard saved progress first")
+    parser.add_argument("--max-chunks", type=int, default=None, help="stop after N chunks per worker")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.repairs if name not in REPAIRS]
+    if unknown:
+        parser.error(f"unknown repair(s): {', '.join(unknown)}")
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    runner = ChunkedJobRunner(
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        rows_per_second=args.rows_per_second,
+        dry_run=args.dry_run,
+    )
+
+    pending = False
+    for name in args.repairs or REPAIRS:
+        report = runner.run(REPAIRS[name](), restart=args.restart, max_chunks=args.max_chunks)
+        suffix = " (dry run)" if report.dry_run else ""
+        print(f"{name}{suffix}: {report.changed} changed of {report.scanned} matching rows in {report.chunks} chunks")
+        pending = pending or not report.completed
+    if pending:
+        print("Stopped early; rerun with the same settings to continue from the checkpoint.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
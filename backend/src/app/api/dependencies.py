@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from app.db.broker import get_session
+from app.services.unit_of_work import UnitOfWork
+
+
+# FastAPI caches dependencies per request, so every consumer of these aliases in
+# one request shares the same session; get_session commits once when it exits.
+# Function scope exits it before the response is sent, so a failed commit
+# reaches the client as an error instead of following a 2xx.
+SessionDep = Annotated[Session, Depends(get_session, scope="function")]
+
+
+def get_unit_of_work(session: SessionDep) -> UnitOfWork:
+    return UnitOfWork(session)
+
+
+UnitOfWorkDep = Annotated[UnitOfWork, Depends(get_unit_of_work)]
+
+
+__all__ = ["SessionDep", "UnitOfWorkDep", "get_unit_of_work"]
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import logging
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.db.query_stats import track_queries
+
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStatsMiddleware:
+    """Report per-request statement count and DB time in response headers.
+
+    Meant for debug builds (``DATABASE_DEBUG_QUERY_STATS=1``): the numbers make
+    N+1 patterns visible from the browser's network tab.
+    """
+
+    count_header = "X-DB-Query-Count"
+    time_header = "X-DB-Query-Time-Ms"
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_with_stats(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers[self.count_header] = str(stats.count)
+                    headers[self.time_header] = f"{stats.duration_ms:.2f}"
+                await send(message)
+
+            await self.app(scope, receive, send_with_stats)
+
+        logger.debug(
+            "%s %s ran %d queries in %.2f ms",
+            scope["method"],
+            scope["path"],
+            stats.count,
+            stats.duration_ms,
+        )
+
+
+__all__ = ["QueryStatsMiddleware"]
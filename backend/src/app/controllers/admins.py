@@ -1,68 +1,81 @@
-from app.db.broker import get_dbbroker
+from datetime import date
+from typing import Optional
+
+from app.models.enums import AppointmentStatus
 from app.schemas.admin_dashboard import AdminDashboardSummary
+from app.schemas.analytics import AppointmentAnalytics, Granularity
 from app.schemas.auth import AdminLoginResponse, LoginRequest
 from app.schemas.pagination import PaginatedResponse
 from app.schemas.user import Admin, AdminCreate, AdminUpdate
-from app.services.admin_dashboard import AdminDashboardService
-from app.services.admins import AdminsService
+from app.schemas.utilization import DoctorUtilization, UtilizationRefresh
+from app.services.unit_of_work import UnitOfWork
+
+
+def list_admins(uow: UnitOfWork) -> list[Admin]:
+    return uow.admins.list()
+
+
+def list_admins_paginated(uow: UnitOfWork, page: int = 1, size: int = 10) -> PaginatedResponse[Admin]:
+    return uow.admins.list_paginated(page=page, size=size)
+
+
+def get_admin(uow: UnitOfWork, admin_id: int) -> Admin | None:
+    return uow.admins.get(admin_id)
 
 
-def list_admins() -> list[Admin]:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = AdminsService(session)
-        return svc.list()
+def create_admin(uow: UnitOfWork, data: AdminCreate) -> Admin:
+    return uow.admins.create(data)
 
 
-def list_admins_paginated(page: int = 1, size: int = 10) -> PaginatedResponse[Admin]:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = AdminsService(session)
-        return svc.list_paginated(page=page, size=size)
+def update_admin(uow: UnitOfWork, admin_id: int, data: AdminUpdate) -> Admin | None:
+    return uow.admins.update(admin_id, data)
 
 
-def get_admin(admin_id: int) -> Admin | None:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = AdminsService(session)
-        return svc.get(admin_id)
+def delete_admin(uow: UnitOfWork, admin_id: int) -> bool:
+    return uow.admins.delete(admin_id)
 
 
-def create_admin(data: AdminCreate) -> Admin:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = AdminsService(session)
-        return svc.create(data)
+def login_admin(uow: UnitOfWork, data: LoginRequest) -> AdminLoginResponse | None:
+    result = uow.admins.authenticate(data.email, data.password)
+    if not result:
+        return None
 
+    admin, token = result
+    return AdminLoginResponse(access_token=token, user=admin)
 
-def update_admin(admin_id: int, data: AdminUpdate) -> Admin | None:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = AdminsService(session)
-        return svc.update(admin_id, data)
 
+def get_admin_dashboard_summary(uow: UnitOfWork) -> AdminDashboardSummary:
+    return uow.admin_dashboard.get_summary()
 
-def delete_admin(admin_id: int) -> bool:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = AdminsService(session)
-        return svc.delete(admin_id)
 
+def get_appointment_analytics(
+    uow: UnitOfWork,
+    start_date: date,
+    end_date: date,
+    granularity: Granularity = "day",
+    doctor_id: Optional[int] = None,
+    office_id: Optional[int] = None,
+    status: Optional[AppointmentStatus] = None,
+) -> AppointmentAnalytics:
+    return uow.analytics.appointments(
+        start_date,
+        end_date,
+        granularity=granularity,
+        doctor_id=doctor_id,
+        office_id=office_id,
+        status=status,
+    )
 
-def login_admin(data: LoginRequest) -> AdminLoginResponse | None:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = AdminsService(session)
-        result = svc.authenticate(data.email, data.password)
-        if not result:
-            return None
 
-        admin, token = result
-        return AdminLoginResponse(access_token=token, user=admin)
+def get_utilization_report(
+    uow: UnitOfWork,
+    start_date: date,
+    end_date: date,
+    doctor_id: Optional[int] = None,
+    office_id: Optional[int] = None,
+) -> list[DoctorUtilization]:
+    return uow.utilization.report(start_date, end_date, doctor_id=doctor_id, office_id=office_id)
 
 
-def get_admin_dashboard_summary() -> AdminDashboardSummary:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = AdminDashboardService(session)
-        return svc.get_summary()
+def refresh_utilization(uow: UnitOfWork) -> UtilizationRefresh:
+    return uow.utilization.refresh()
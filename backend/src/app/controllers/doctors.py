@@ -1,74 +1,73 @@
-from app.db.broker import get_dbbroker
+from typing import Optional
+
 from app.schemas.auth import DoctorLoginResponse, LoginRequest
+from app.schemas.doctor_directory import DoctorDirectory
+from app.schemas.doctor_provisioning import DoctorProvisioningReport, DoctorProvisioningRequest
 from app.schemas.pagination import PaginatedResponse
 from app.schemas.user import Doctor, DoctorCreate, DoctorUpdate, Patient
-from app.services.doctors import DoctorsService
+from app.services.unit_of_work import UnitOfWork
+
+
+def list_doctors(uow: UnitOfWork) -> list[Doctor]:
+    return uow.doctors.list()
+
+
+def list_doctors_paginated(uow: UnitOfWork, page: int = 1, size: int = 10) -> PaginatedResponse[Doctor]:
+    return uow.doctors.list_paginated(page=page, size=size)
+
+
+def get_doctor_directory(
+    uow: UnitOfWork,
+    *,
+    specialty: Optional[str] = None,
+    office_id: Optional[int] = None,
+    is_active: Optional[bool] = None,
+    page: int = 1,
+    size: int = 20,
+) -> DoctorDirectory:
+    return uow.doctor_directory.search(
+        specialty=specialty, office_id=office_id, is_active=is_active, page=page, size=size
+    )
 
 
-def list_doctors() -> list[Doctor]:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = DoctorsService(session)
-        return svc.list()
+def get_doctor(uow: UnitOfWork, doctor_id: int) -> Doctor | None:
+    return uow.doctors.get(doctor_id)
 
 
-def list_doctors_paginated(page: int = 1, size: int = 10) -> PaginatedResponse[Doctor]:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = DoctorsService(session)
-        return svc.list_paginated(page=page, size=size)
+def doctor_exists(uow: UnitOfWork, doctor_id: int) -> bool:
+    return uow.doctors.exists(doctor_id)
 
 
-def get_doctor(doctor_id: int) -> Doctor | None:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = DoctorsService(session)
-        return svc.get(doctor_id)
+def create_doctor(uow: UnitOfWork, data: DoctorCreate) -> Doctor:
+    return uow.doctors.create(data)
 
 
-def create_doctor(data: DoctorCreate) -> Doctor:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = DoctorsService(session)
-        return svc.create(data)
+def provision_doctors(uow: UnitOfWork, data: DoctorProvisioningRequest) -> DoctorProvisioningReport:
+    """Create a batch of doctors. Raises ValueError if any entry is rejected."""
+    return uow.doctor_provisioning.provision(data)
 
 
-def update_doctor(doctor_id: int, data: DoctorUpdate) -> Doctor | None:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = DoctorsService(session)
-        return svc.update(doctor_id, data)
+def update_doctor(uow: UnitOfWork, doctor_id: int, data: DoctorUpdate) -> Doctor | None:
+    return uow.doctors.update(doctor_id, data)
 
 
-def delete_doctor(doctor_id: int) -> bool:
+def delete_doctor(uow: UnitOfWork, doctor_id: int) -> bool:
     """Delete a doctor. Raises ValueError if doctor has appointments."""
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = DoctorsService(session)
-        return svc.delete(doctor_id)
+    return uow.doctors.delete(doctor_id)
 
 
-def get_doctor_patients(doctor_id: int) -> list[Patient]:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = DoctorsService(session)
-        return svc.get_patients_for_doctor(doctor_id)
+def get_doctor_patients(uow: UnitOfWork, doctor_id: int) -> list[Patient]:
+    return uow.doctors.get_patients_for_doctor(doctor_id)
 
 
-def get_doctor_patients_paginated(doctor_id: int, page: int = 1, size: int = 10) -> PaginatedResponse[Patient]:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = DoctorsService(session)
-        return svc.get_patients_for_doctor_paginated(doctor_id, page=page, size=size)
+def get_doctor_patients_paginated(uow: UnitOfWork, doctor_id: int, page: int = 1, size: int = 10) -> PaginatedResponse[Patient]:
+    return uow.doctors.get_patients_for_doctor_paginated(doctor_id, page=page, size=size)
 
 
-def login_doctor(data: LoginRequest) -> DoctorLoginResponse | None:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = DoctorsService(session)
-        result = svc.authenticate(data.email, data.password)
-        if not result:
-            return None
+def login_doctor(uow: UnitOfWork, data: LoginRequest) -> DoctorLoginResponse | None:
+    result = uow.doctors.authenticate(data.email, data.password)
+    if not result:
+        return None
 
-        doctor, token = result
-        return DoctorLoginResponse(access_token=token, user=doctor)
+    doctor, token = result
+    return DoctorLoginResponse(access_token=token, user=doctor)
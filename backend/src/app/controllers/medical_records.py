@@ -1,73 +1,97 @@
+from typing import Optional
+
 from fastapi import HTTPException
 
-from app.db.broker import get_dbbroker
 from app.schemas.medical_record import (
     MedicalRecord,
     MedicalRecordCreate,
+    MedicalRecordSearchPage,
+    MedicalRecordSummary,
     MedicalRecordUpdate,
 )
-from app.services.medical_records import MedicalRecordsService
+from app.schemas.pagination import PaginatedResponse
+from app.services.unit_of_work import UnitOfWork
+
+
+def list_patient_records(uow: UnitOfWork, patient_id: int) -> list[MedicalRecord]:
+    return uow.medical_records.list_for_patient(patient_id)
+
+
+def list_doctor_records(uow: UnitOfWork, doctor_id: int) -> list[MedicalRecord]:
+    return uow.medical_records.list_for_doctor(doctor_id)
+
+
+def list_patient_records_paginated(
+    uow: UnitOfWork, patient_id: int, page: int = 1, size: int = 10
+) -> PaginatedResponse[MedicalRecordSummary]:
+    return uow.medical_records.list_for_patient_paginated(patient_id, page=page, size=size)
+
+
+def list_doctor_records_paginated(
+    uow: UnitOfWork, doctor_id: int, page: int = 1, size: int = 10
+) -> PaginatedResponse[MedicalRecordSummary]:
+    return uow.medical_records.list_for_doctor_paginated(doctor_id, page=page, size=size)
 
 
-def list_patient_records(patient_id: int) -> list[MedicalRecord]:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = MedicalRecordsService(session)
-        return svc.list_for_patient(patient_id)
+def get_medical_record(uow: UnitOfWork, record_id: int) -> MedicalRecord:
+    record = uow.medical_records.get(record_id)
+    if not record:
+        raise HTTPException(status_code=404, detail="Medical record not found")
+    return record
 
 
-def list_doctor_records(doctor_id: int) -> list[MedicalRecord]:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = MedicalRecordsService(session)
-        return svc.list_for_doctor(doctor_id)
+def create_medical_record(uow: UnitOfWork, data: MedicalRecordCreate) -> MedicalRecord:
+    try:
+        return uow.medical_records.create(data)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
 
 
-def get_medical_record(record_id: int) -> MedicalRecord:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = MedicalRecordsService(session)
-        record = svc.get(record_id)
-        if not record:
-            raise HTTPException(status_code=404, detail="Medical record not found")
-        return record
+def update_medical_record(uow: UnitOfWork, record_id: int, data: MedicalRecordUpdate) -> MedicalRecord:
+    try:
+        record = uow.medical_records.update(record_id, data)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    if not record:
+        raise HTTPException(status_code=404, detail="Medical record not found")
+    return record
 
 
-def create_medical_record(data: MedicalRecordCreate) -> MedicalRecord:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = MedicalRecordsService(session)
-        try:
-            return svc.create(data)
-        except ValueError as exc:
-            raise HTTPException(status_code=422, detail=str(exc)) from exc
+def get_patient_medical_history(uow: UnitOfWork, patient_id: int) -> list[MedicalRecord]:
+    return uow.medical_records.get_patient_history(patient_id)
 
 
-def update_medical_record(record_id: int, data: MedicalRecordUpdate) -> MedicalRecord:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = MedicalRecordsService(session)
-        try:
-            record = svc.update(record_id, data)
-        except ValueError as exc:
-            raise HTTPException(status_code=422, detail=str(exc)) from exc
-        if not record:
-            raise HTTPException(status_code=404, detail="Medical record not found")
-        return record
+def get_patient_medical_history_paginated(
+    uow: UnitOfWork, patient_id: int, page: int = 1, size: int = 10
+) -> PaginatedResponse[MedicalRecordSummary]:
+    return uow.medical_records.get_patient_history_paginated(patient_id, page=page, size=size)
 
 
-def get_patient_medical_history(patient_id: int) -> list[MedicalRecord]:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = MedicalRecordsService(session)
-        return svc.get_patient_history(patient_id)
+def search_medical_records(
+    uow: UnitOfWork,
+    query: str,
+    doctor_id: Optional[int] = None,
+    patient_id: Optional[int] = None,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+) -> MedicalRecordSearchPage:
+    try:
+        return uow.medical_records.search(
+            query, doctor_id=doctor_id, patient_id=patient_id, limit=limit, cursor=cursor
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
 __all__ = [
     "list_patient_records",
+    "list_patient_records_paginated",
     "list_doctor_records",
+    "list_doctor_records_paginated",
     "get_medical_record",
     "create_medical_record",
     "update_medical_record",
     "get_patient_medical_history",
+    "get_patient_medical_history_paginated",
+    "search_medical_records",
 ]
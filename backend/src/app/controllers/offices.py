@@ -1,39 +1,23 @@
-from app.db.broker import get_dbbroker
 from app.schemas.office import Office, OfficeCreate, OfficeUpdate
-from app.services.offices import OfficesService
+from app.services.unit_of_work import UnitOfWork
 
 
-def list_offices() -> list[Office]:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = OfficesService(session)
-        return svc.list()
+def list_offices(uow: UnitOfWork) -> list[Office]:
+    return uow.offices.list()
 
 
-def get_office(office_id: int) -> Office | None:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = OfficesService(session)
-        return svc.get(office_id)
+def get_office(uow: UnitOfWork, office_id: int) -> Office | None:
+    return uow.offices.get(office_id)
 
 
-def create_office(data: OfficeCreate) -> Office:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = OfficesService(session)
-        return svc.create(data)
+def create_office(uow: UnitOfWork, data: OfficeCreate) -> Office:
+    return uow.offices.create(data)
 
 
-def update_office(office_id: int, data: OfficeUpdate) -> Office | None:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = OfficesService(session)
-        return svc.update(office_id, data)
+def update_office(uow: UnitOfWork, office_id: int, data: OfficeUpdate) -> Office | None:
+    return uow.offices.update(office_id, data)
 
 
-def delete_office(office_id: int) -> bool:
+def delete_office(uow: UnitOfWork, office_id: int) -> bool:
     """Delete an office. Raises ValueError if office has assigned doctors."""
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = OfficesService(session)
-        return svc.delete(office_id)
+    return uow.offices.delete(office_id)
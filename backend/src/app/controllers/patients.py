@@ -1,46 +1,40 @@
-from app.db.broker import get_dbbroker
+import io
+
 from app.schemas.pagination import PaginatedResponse
+from app.schemas.patient_import import PatientImportReport
 from app.schemas.user import Patient, PatientCreate, PatientUpdate
-from app.services.patients import PatientsService
+from app.services.unit_of_work import UnitOfWork
+
+
+def list_patients(uow: UnitOfWork) -> list[Patient]:
+    return uow.patients.list()
+
+
+def list_patients_paginated(uow: UnitOfWork, page: int = 1, size: int = 10) -> PaginatedResponse[Patient]:
+    return uow.patients.list_paginated(page=page, size=size)
 
 
-def list_patients() -> list[Patient]:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = PatientsService(session)
-        return svc.list()
+def search_patients(uow: UnitOfWork, query: str, limit: int = 20) -> list[Patient]:
+    return uow.patients.search(query, limit=limit)
 
 
-def list_patients_paginated(page: int = 1, size: int = 10) -> PaginatedResponse[Patient]:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = PatientsService(session)
-        return svc.list_paginated(page=page, size=size)
+def import_patients(uow: UnitOfWork, csv_text: str) -> PatientImportReport:
+    """Create patients from a CSV document. Raises ValueError if the header is invalid."""
+    # Spreadsheet exports start with a BOM; scripts/import_patients.py reads them as utf-8-sig
+    return uow.patient_import.import_csv(io.StringIO(csv_text.removeprefix("\ufeff"), newline=""))
 
 
-def get_patient(patient_id: int) -> Patient | None:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = PatientsService(session)
-        return svc.get(patient_id)
+def get_patient(uow: UnitOfWork, patient_id: int) -> Patient | None:
+    return uow.patients.get(patient_id)
 
 
-def create_patient(data: PatientCreate) -> Patient:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = PatientsService(session)
-        return svc.create(data)
+def create_patient(uow: UnitOfWork, data: PatientCreate) -> Patient:
+    return uow.patients.create(data)
 
 
-def update_patient(patient_id: int, data: PatientUpdate) -> Patient | None:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = PatientsService(session)
-        return svc.update(patient_id, data)
+def update_patient(uow: UnitOfWork, patient_id: int, data: PatientUpdate) -> Patient | None:
+    return uow.patients.update(patient_id, data)
 
 
-def delete_patient(patient_id: int) -> bool:
-    broker = get_dbbroker()
-    with broker.session() as session:
-        svc = PatientsService(session)
-        return svc.delete(patient_id)
+def delete_patient(uow: UnitOfWork, patient_id: int) -> bool:
+    return uow.patients.delete(patient_id)
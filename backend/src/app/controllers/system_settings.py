@@ -3,18 +3,15 @@ from __future__ import annotations
 from typing import Annotated
 
 from fastapi import Depends, HTTPException, status
-from sqlalchemy.orm import Session
 
-from app.db.broker import get_dbbroker
+from app.api.dependencies import UnitOfWorkDep
 from app.schemas.system_settings import SystemSetting, SystemSettingUpdate
 from app.services.system_settings import SystemSettingsService
 
 
-def get_system_settings_service(
-    session: Annotated[Session, Depends(get_dbbroker().dependency())]
-) -> SystemSettingsService:
-    """Dependency to get system settings service."""
-    return SystemSettingsService(session)
+def get_system_settings_service(uow: UnitOfWorkDep) -> SystemSettingsService:
+    """Dependency to get the request's system settings service."""
+    return uow.settings
 
 
 def get_settings(service: Annotated[SystemSettingsService, Depends(get_system_settings_service)]) -> list[SystemSetting]:
@@ -1,16 +1,30 @@
 from __future__ import annotations
 
+import threading
+import time
 from contextlib import contextmanager
-from typing import Callable, Generator, Iterator, Optional
+from dataclasses import dataclass
+from typing import Any, Callable, Generator, Iterator, Optional
 
 from alembic import command
 from alembic.config import Config
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine, create_engine, text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.db.base import Base
+from app.db.pool import MonitoredQueuePool, PoolStatus, pool_status
+from app.db.query_stats import install_query_counter
 from app.db.settings import DatabaseSettings, get_database_settings
+from app.db.sqlite import install_sqlite_pragmas, sqlite_engine_options
+
+
+@dataclass(frozen=True)
+class PingResult:
+    ok: bool
+    latency_ms: float
+    checked_at: float  # time.monotonic()
+    error: Optional[str] = None
 
 
 class DBBroker:
@@ -25,39 +39,11 @@ class DBBroker:
             self._settings.url,
             future=True,
             echo=self._settings.echo,
-            pool_pre_ping=self._settings.pool_pre_ping,
-        )
-        self._engine: Engine = create_engine(
-            self._settings.url,
-            future=True,
-            echo=self._settings.echo,
-            pool_pre_ping=self._settings.pool_pre_ping,
-            connect_args={
-                "ssl_disabled": False
-            }
-        )
-        self._engine: Engine = create_engine(
-            self._settings.url,
-            future=True,
-            echo=self._settings.echo,
-            pool_pre_ping=self._settings.pool_pre_ping,
-        )
-        self._engine: Engine = create_engine(
-            self._settings.url,
-            future=True,
-            echo=self._settings.echo,
-            pool_pre_ping=self._settings.pool_pre_ping,
-            connect_args={
-                "ssl_verify_cert": True,
-                "ssl_ca": None  # Let PyMySQL use system certificates
-            }
-        )
-        self._engine: Engine = create_engine(
-            self._settings.url,
-            future=True,
-            echo=self._settings.echo,
-            pool_pre_ping=self._settings.pool_pre_ping,
+            **self._engine_options(),
         )
+        if self._settings.is_sqlite:
+            install_sqlite_pragmas(self._engine, self._settings)
+        install_query_counter(self._engine)
         self._session_factory: sessionmaker[Session] = sessionmaker(
             bind=self._engine,
             expire_on_commit=False,
@@ -65,11 +51,59 @@ class DBBroker:
             autocommit=False,
             future=True,
         )
+        self._ping_lock = threading.Lock()
+        self._last_ping: Optional[PingResult] = None
+
+    def _engine_options(self) -> dict[str, Any]:
+        options: dict[str, Any] = {
+            "pool_pre_ping": self._settings.pool_pre_ping,
+            "pool_recycle": self._settings.pool_recycle,
+        }
+        if self._settings.is_sqlite:
+            options.update(sqlite_engine_options(self._settings))
+        if "poolclass" not in options:
+            options.update(
+                poolclass=MonitoredQueuePool,
+                pool_size=self._settings.pool_size,
+                max_overflow=self._settings.max_overflow,
+                pool_timeout=self._settings.pool_timeout,
+            )
+        return options
 
     @property
     def engine(self) -> Engine:
         return self._engine
 
+    def pool_status(self) -> PoolStatus:
+        return pool_status(self._engine)
+
+    def ping(self, *, max_age: Optional[float] = None) -> PingResult:
+        """Run ``SELECT 1`` unless the last result is younger than ``max_age`` seconds.
+
+        Readiness probes hit this often; caching keeps them from adding load (or
+        holding a pooled connection) when the database is already struggling.
+        """
+        max_age = self._settings.health_ping_interval if max_age is None else max_age
+        with self._ping_lock:
+            last = self._last_ping
+            if last is not None and time.monotonic() - last.checked_at < max_age:
+                return last
+
+            started = time.perf_counter()
+            try:
+                with self._engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+                error = None
+            except SQLAlchemyError as exc:
+                error = f"{type(exc).__name__}: {exc}".splitlines()[0]
+            self._last_ping = PingResult(
+                ok=error is None,
+                latency_ms=round((time.perf_counter() - started) * 1000, 3),
+                checked_at=time.monotonic(),
+                error=error,
+            )
+            return self._last_ping
+
     def create_all(self) -> None:
         Base.metadata.create_all(self._engine)
 
@@ -140,6 +174,7 @@ def get_session() -> Generator[Session, None, None]:
 
 __all__ = [
     "DBBroker",
+    "PingResult",
     "get_dbbroker",
     "get_session",
 ]
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy import ColumnElement, func, select
+from sqlalchemy.orm import Session
+
+from app.db.broker import DBBroker, get_dbbroker
+from app.models.job_checkpoint import JobCheckpoint
+
+
+logger = logging.getLogger(__name__)
+
+
+class ChunkedJob(ABC):
+    """A data repair/backfill that can be applied one primary-key range at a time.
+
+    Subclasses name the table to walk (``model``, which must have an integer
+    ``id``), optionally narrow it with ``scope()`` and implement
+    ``process_chunk``. A chunk must be idempotent: it only ever sees ids of rows
+    that still match ``scope()`` and may be retried after a crash.
+    """
+
+    name: str
+    model: type
+    description: str = ""
+
+    def scope(self) -> Optional[ColumnElement[bool]]:
+        """Extra filter for rows that need work; ``None`` means every row."""
+        return None
+
+    @abstractmethod
+    def process_chunk(self, session: Session, ids: list[int]) -> int:
+        """Repair the rows with ``ids`` and return how many were changed."""
+
+
+@dataclass
+class JobReport:
+    name: str
+    dry_run: bool
+    scanned: int = 0
+    changed: int = 0
+    chunks: int = 0
+    completed: bool = False
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.scanned / self.elapsed if self.elapsed else 0.0
+
+
+class ChunkedJobRunner:
+    """Run a ``ChunkedJob`` in fixed-size primary-key ranges, committing per chunk.
+
+    Progress is kept in ``job_checkpoints`` (one row per worker), so an
+    interrupted run continues after the last committed chunk. With ``workers``
+    > 1 the id space is split into interleaved chunks handled by a thread pool;
+    ``rows_per_second`` caps the combined rate across workers. A dry run
+    executes every chunk and rolls it back, leaving data and checkpoints alone.
+    """
+
+    def __init__(
+        self,
+        broker: DBBroker | None = None,
+        *,
+        chunk_size: int = 1000,
+        workers: int = 1,
+        rows_per_second: Optional[float] = None,
+        dry_run: bool = False,
+    ) -> None:
+        if chunk_size < 1 or workers < 1:
+            raise ValueError("chunk_size and workers must be positive")
+        self._broker = broker or get_dbbroker()
+        self._chunk_size = chunk_size
+        self._workers = workers
+        self._rows_per_second = rows_per_second
+        self._dry_run = dry_run
+        self._lock = threading.Lock()
+
+    def run(self, job: ChunkedJob, *, restart: bool = False, max_chunks: Optional[int] = None) -> JobReport:
+        """Process ``job``; ``max_chunks`` caps the chunks each worker handles in this call."""
+        report = JobReport(name=job.name, dry_run=self._dry_run)
+        started = time.monotonic()
+        bounds = self._prepare(job, restart)
+
+        if bounds is not None:
+            if self._workers == 1:
+                finished = [self._run_worker(job, 0, bounds, report, max_chunks)]
+            else:
+                with ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix=job.name) as pool:
+                    futures = [
+                        pool.submit(self._run_worker, job, worker, bounds, report, max_chunks)
+                        for worker in range(self._workers)
+                    ]
+                    finished = [future.result() for future in futures]
+            report.completed = all(finished)
+            if report.completed and not self._dry_run:
+                self._clear(job)
+        else:
+            report.completed = True
+
+        report.elapsed = time.monotonic() - started
+        logger.info(
+            "%s%s: scanned %d rows, changed %d in %d chunks (%.0f rows/s)%s",
+            job.name,
+            " [dry run]" if self._dry_run else "",
+            report.scanned,
+            report.changed,
+            report.chunks,
+            report.rows_per_second,
+            "" if report.completed else ", more work pending",
+        )
+        return report
+
+    # ------------------------------------------------------------------
+    def _checkpoint_name(self, job: ChunkedJob, worker: int) -> str:
+        return f"{job.name}:{worker}"
+
+    def _prepare(self, job: ChunkedJob, restart: bool) -> Optional[tuple[int, int]]:
+        """Create or validate the worker checkpoints; return the id range to visit.
+
+        The range is fixed when a run starts, so rows inserted while it is in
+        progress are left for the next run.
+        """
+        with self._broker.session() as session:
+            existing = session.scalars(
+                select(JobCheckpoint).where(JobCheckpoint.name.like(f"{job.name}:%"))
+            ).all()
+            if restart:
+                for checkpoint in existing:
+                    session.delete(checkpoint)
+                existing = []
+
+            if existing:
+                parameters: dict[str, Any] = existing[0].parameters or {}
+                if parameters.get("workers") != self._workers or parameters.get("chunk_size") != self._chunk_size:
+                    raise ValueError(
+                        f"{job.name} has an unfinished run with workers={parameters.get('workers')} "
+                        f"and chunk_size={parameters.get('chunk_size')}; resume with the same "
+                        "settings or restart it"
+                    )
+                return parameters["low"], parameters["high"]
+
+            pk = job.model.__table__.c.id
+            low, high = session.execute(select(func.min(pk), func.max(pk))).one()
+            if high is None:
+                return None
+            if self._dry_run:
+                return low, high
+
+            parameters = {"low": low, "high": high, "workers": self._workers, "chunk_size": self._chunk_size}
+            for worker in range(self._workers):
+                session.add(
+                    JobCheckpoint(name=self._checkpoint_name(job, worker), last_id=0, parameters=parameters)
+                )
+            return low, high
+
+    def _clear(self, job: ChunkedJob) -> None:
+        with self._broker.session() as session:
+            for checkpoint in session.scalars(
+                select(JobCheckpoint).where(JobCheckpoint.name.like(f"{job.name}:%"))
+            ):
+                session.delete(checkpoint)
+
+    def _run_worker(
+        self,
+        job: ChunkedJob,
+        worker: int,
+        bounds: tuple[int, int],
+        report: JobReport,
+        max_chunks: Optional[int],
+    ) -> bool:
+        """Handle chunks ``worker``, ``worker + workers``, ...; return True when done."""
+        first, high = bounds
+        pk = job.model.__table__.c.id
+        rate = self._rows_per_second / self._workers if self._rows_per_second else None
+        stride = self._chunk_size * self._workers
+        scanned = 0
+        processed_chunks = 0
+        started = time.monotonic()
+
+        with self._broker.session() as session:
+            checkpoint = session.get(JobCheckpoint, self._checkpoint_name(job, worker))
+            resume_after = checkpoint.last_id if checkpoint else 0
+
+        # First chunk owned by this worker that starts after its checkpoint
+        low = first + worker * self._chunk_size
+        while low + self._chunk_size - 1 <= resume_after:
+            low += stride
+
+        while low <= high:
+            if max_chunks is not None and processed_chunks >= max_chunks:
+                return False
+            chunk_end = low + self._chunk_size - 1
+
+            with self._broker.session() as session:
+                stmt = select(pk).where(pk >= low, pk <= chunk_end).order_by(pk)
+                condition = job.scope()
+                if condition is not None:
+                    stmt = stmt.where(condition)
+                ids = list(session.scalars(stmt))
+                changed = job.process_chunk(session, ids) if ids else 0
+                if self._dry_run:
+                    session.rollback()
+                else:
+                    session.get(JobCheckpoint, self._checkpoint_name(job, worker)).last_id = chunk_end
+
+            with self._lock:
+                report.scanned += len(ids)
+                report.changed += changed
+                report.chunks += 1
+            scanned += len(ids)
+            processed_chunks += 1
+            low += stride
+
+            if rate:
+                # Sleep off any lead over the target rate
+                ahead = scanned / rate - (time.monotonic() - started)
+                if ahead > 0:
+                    time.sleep(ahead)
+
+        return True
+
+
+__all__ = ["ChunkedJob", "ChunkedJobRunner", "JobReport"]
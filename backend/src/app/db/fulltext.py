@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from typing import Any, Mapping
+
+from sqlalchemy import (
+    DDL,
+    Connection,
+    Integer,
+    Table,
+    column,
+    delete,
+    event,
+    func,
+    insert,
+    literal_column,
+    select,
+    table,
+)
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.sql import ColumnElement
+
+from app.utils.text import words
+
+
+# Full-text search over medical records.
+#
+# MySQL keeps a FULLTEXT index on medical_records itself, maintained by InnoDB;
+# accent-insensitive matching comes from the columns' *_ai_ci collation. SQLite
+# has no such index, so the text is copied into an FTS5 table (keyed by the
+# record id as rowid) whose unicode61 tokenizer folds case and strips
+# diacritics, and MedicalRecordsService writes to it on create and update.
+
+FTS_TABLE = "medical_records_fts"
+SEARCH_COLUMNS = ("diagnosis", "treatment", "notes")
+FULLTEXT_INDEX = "ft_medical_records_text"
+
+_fts = table(FTS_TABLE, column("rowid", Integer), *(column(name) for name in SEARCH_COLUMNS))
+
+_CREATE_FTS = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    + ", ".join(SEARCH_COLUMNS)
+    + ", tokenize='unicode61 remove_diacritics 2')"
+)
+_DROP_FTS = f"DROP TABLE IF EXISTS {FTS_TABLE}"
+
+# Shortest term worth searching; MySQL ignores tokens below innodb_ft_min_token_size (3)
+MIN_TERM_LENGTH = 3
+
+
+def install(records: Table) -> None:
+    """Create and drop the SQLite FTS5 table along with ``medical_records``."""
+    event.listen(records, "after_create", DDL(_CREATE_FTS).execute_if(dialect="sqlite"))
+    event.listen(records, "before_drop", DDL(_DROP_FTS).execute_if(dialect="sqlite"))
+
+
+def terms(text: str) -> list[str]:
+    """Lower-cased, accent-free words of a search string, without operators."""
+    return [word for word in words(text) if len(word) >= MIN_TERM_LENGTH]
+
+
+def sync(connection: Connection, record_id: int, values: Mapping[str, Any]) -> None:
+    """Replace the FTS5 copy of one record; a no-op where the database indexes it itself."""
+    if connection.dialect.name != "sqlite":
+        return
+    connection.execute(delete(_fts).where(_fts.c.rowid == record_id))
+    connection.execute(
+        insert(_fts).values(rowid=record_id, **{name: values.get(name) for name in SEARCH_COLUMNS})
+    )
+
+
+def ranked_matches(dialect: str, search_terms: list[str], *columns: ColumnElement) -> Any:
+    """Subquery of ``(id, score)`` for records containing every term as a prefix.
+
+    Higher scores rank first. ``columns`` are the ``medical_records`` text
+    columns, used by the MySQL ``MATCH``.
+    """
+    if dialect == "sqlite":
+        expression = " ".join(f'"{term}"*' for term in search_terms)
+        return (
+            select(_fts.c.rowid.label("id"), (-func.bm25(literal_column(FTS_TABLE))).label("score"))
+            .where(literal_column(FTS_TABLE).op("MATCH")(expression))
+            .subquery()
+        )
+    if dialect == "mysql":
+        score = match(*columns, against=" ".join(f"+{term}*" for term in search_terms)).in_boolean_mode()
+        return select(columns[0].table.c.id.label("id"), score.label("score")).where(score > 0).subquery()
+    raise NotImplementedError(f"Full-text search is not available on {dialect}")  # pragma: no cover
+
+
+__all__ = [
+    "FTS_TABLE",
+    "FULLTEXT_INDEX",
+    "MIN_TERM_LENGTH",
+    "SEARCH_COLUMNS",
+    "install",
+    "ranked_matches",
+    "sync",
+    "terms",
+]
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+
+class MonitoredQueuePool(QueuePool):
+    """``QueuePool`` that records how long checkouts wait for a connection.
+
+    The wait covers queueing behind other checkouts, opening new connections
+    and any pre-ping; it grows when the pool is too small for the threads
+    serving requests in this process.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._wait_lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            with self._wait_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            with self._wait_lock:
+                self.checkouts += 1
+                self.wait_total += waited
+                self.wait_max = max(self.wait_max, waited)
+
+
+@dataclass(frozen=True)
+class PoolStatus:
+    pool_class: str
+    size: int | None = None
+    max_overflow: int | None = None
+    timeout: float | None = None
+    recycle: int = -1
+    checked_out: int | None = None
+    idle: int | None = None
+    overflow: int | None = None
+    checkouts: int | None = None
+    timeouts: int | None = None
+    wait_avg_ms: float | None = None
+    wait_max_ms: float | None = None
+
+
+def pool_status(engine: Engine) -> PoolStatus:
+    """Snapshot of the engine's pool; fields a pool class cannot report are ``None``."""
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        # StaticPool (in-memory SQLite) and friends have a single connection
+        return PoolStatus(pool_class=type(pool).__name__, recycle=pool._recycle)
+
+    status: dict[str, Any] = {
+        "pool_class": type(pool).__name__,
+        "size": pool.size(),
+        "max_overflow": pool._max_overflow,
+        "timeout": pool.timeout(),
+        "recycle": pool._recycle,
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        # QueuePool.overflow() counts down from -size; report only real overflow
+        "overflow": max(pool.overflow(), 0),
+    }
+    if isinstance(pool, MonitoredQueuePool):
+        with pool._wait_lock:
+            status["checkouts"] = pool.checkouts
+            status["timeouts"] = pool.timeouts
+            status["wait_avg_ms"] = round(pool.wait_total / pool.checkouts * 1000, 3) if pool.checkouts else 0.0
+            status["wait_max_ms"] = round(pool.wait_max * 1000, 3)
+    return PoolStatus(**status)
+
+
+__all__ = ["MonitoredQueuePool", "PoolStatus", "pool_status"]
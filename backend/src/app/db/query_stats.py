@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from sqlalchemy import Engine, event
+
+
+@dataclass
+class QueryStats:
+    """Statements executed while a ``track_queries`` block was active."""
+
+    count: int = 0
+    duration: float = 0.0
+    statements: list[str] = field(default_factory=list)
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration * 1000
+
+
+# Every active collector is incremented, so nested blocks (a test helper around a
+# request that is itself tracked by the middleware) each see their own totals.
+_active_stats: ContextVar[tuple[QueryStats, ...]] = ContextVar("query_stats", default=())
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Count statements and DB time for the current context.
+
+    The collector travels with the context, so work FastAPI hands to its
+    threadpool during a request is still attributed to that request.
+    """
+    stats = QueryStats()
+    token = _active_stats.set(_active_stats.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _active_stats.reset(token)
+
+
+def install_query_counter(engine: Engine) -> None:
+    """Feed statement counts and timings from ``engine`` into active collectors."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        if _active_stats.get():
+            conn.info.setdefault("query_stats_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        collectors = _active_stats.get()
+        starts = conn.info.get("query_stats_start")
+        if not collectors or not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+        for stats in collectors:
+            stats.count += 1
+            stats.duration += elapsed
+            stats.statements.append(statement)
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context) -> None:
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_stats_start"):
+            conn.info["query_stats_start"].pop()
+
+
+__all__ = ["QueryStats", "install_query_counter", "track_queries"]
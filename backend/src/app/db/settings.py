@@ -21,8 +21,54 @@ class DatabaseSettings(BaseModel):
         )
     )
     echo: bool = Field(default_factory=lambda: os.getenv("DATABASE_ECHO", "0") == "1")
+    # Recycling connections before the server's idle timeout (MySQL
+    # wait_timeout) avoids stale connections without the extra round trip
+    # pre-ping adds to every checkout; enable pre-ping only if the network
+    # drops idle connections earlier than that.
     pool_pre_ping: bool = Field(
-        default_factory=lambda: os.getenv("DATABASE_POOL_PRE_PING", "1") != "0"
+        default_factory=lambda: os.getenv("DATABASE_POOL_PRE_PING", "0") == "1"
+    )
+    pool_size: int = Field(
+        default_factory=lambda: int(os.getenv("DATABASE_POOL_SIZE", "5")), ge=1
+    )
+    max_overflow: int = Field(
+        default_factory=lambda: int(os.getenv("DATABASE_MAX_OVERFLOW", "10")), ge=0
+    )
+    pool_timeout: float = Field(
+        default_factory=lambda: float(os.getenv("DATABASE_POOL_TIMEOUT", "30")), gt=0
+    )
+    pool_recycle: int = Field(
+        default_factory=lambda: int(os.getenv("DATABASE_POOL_RECYCLE", "1800"))
+    )
+    # How often a worker checks the settings version row before trusting its
+    # in-memory copy of system_settings
+    settings_check_interval: float = Field(
+        default_factory=lambda: float(os.getenv("SYSTEM_SETTINGS_CHECK_INTERVAL", "5")), ge=0
+    )
+    # Longest a worker serves cached doctor directory facets; application
+    # writes bump their version and are seen at once, so this only bounds
+    # direct SQL edits
+    directory_cache_ttl: float = Field(
+        default_factory=lambda: float(os.getenv("DOCTOR_DIRECTORY_CACHE_TTL", "60")), ge=0
+    )
+    # /healthz/db pings at most once per interval and serves the cached result
+    health_ping_interval: float = Field(
+        default_factory=lambda: float(os.getenv("DATABASE_HEALTH_PING_INTERVAL", "5")), ge=0
+    )
+    debug_query_stats: bool = Field(
+        default_factory=lambda: os.getenv("DATABASE_DEBUG_QUERY_STATS", "0") == "1"
+    )
+    sqlite_journal_mode: str = Field(
+        default_factory=lambda: os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    )
+    sqlite_synchronous: str = Field(
+        default_factory=lambda: os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    )
+    sqlite_busy_timeout_ms: int = Field(
+        default_factory=lambda: int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    )
+    sqlite_cache_size_kib: int = Field(
+        default_factory=lambda: int(os.getenv("SQLITE_CACHE_SIZE_KIB", "20000"))
     )
     alembic_ini_path: Path = Field(
         default_factory=lambda: Path(
@@ -37,12 +83,42 @@ class DatabaseSettings(BaseModel):
             raise ValueError("DATABASE_URL must be a valid SQLAlchemy connection URL")
         return value
 
+    @field_validator("sqlite_journal_mode", "sqlite_synchronous")
+    @classmethod
+    def _validate_pragma_keyword(cls, value: str) -> str:
+        # Interpolated into PRAGMA statements, so only bare keywords are accepted.
+        if not value.isalpha():
+            raise ValueError("SQLite pragma values must be plain keywords (e.g. WAL, NORMAL)")
+        return value.upper()
+
+    @property
+    def is_sqlite(self) -> bool:
+        return self.url.split(":", 1)[0].split("+", 1)[0] == "sqlite"
+
 
 @lru_cache(maxsize=1)
 def get_database_settings() -> DatabaseSettings:
     return DatabaseSettings()
 
 
+class ArchiveSettings(BaseModel):
+    """Retention and batching for moving old scheduling rows to archive tables."""
+
+    retention_days: int = Field(
+        default_factory=lambda: int(os.getenv("ARCHIVE_RETENTION_DAYS", "365")),
+        ge=1,
+    )
+    batch_size: int = Field(
+        default_factory=lambda: int(os.getenv("ARCHIVE_BATCH_SIZE", "500")),
+        ge=1,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_archive_settings() -> ArchiveSettings:
+    return ArchiveSettings()
+
+
 class CORSSettings(BaseModel):
     """CORS configuration loaded from environment variables."""
 
@@ -108,5 +184,11 @@ def get_cors_settings() -> CORSSettings:
     return CORSSettings()
 
 
-__all__ = ["DatabaseSettings", "get_database_settings", "CORSSettings", "get_cors_settings"]
-__all__ = ["DatabaseSettings", "get_database_settings", "CORSSettings", "get_cors_settings"]
+__all__ = [
+    "ArchiveSettings",
+    "CORSSettings",
+    "DatabaseSettings",
+    "get_archive_settings",
+    "get_cors_settings",
+    "get_database_settings",
+]
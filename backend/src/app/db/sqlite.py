@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import Engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import StaticPool
+
+from app.db.settings import DatabaseSettings
+
+
+def is_memory_url(url: str) -> bool:
+    """Return True for in-memory SQLite URLs (``sqlite://`` or ``:memory:``)."""
+    database = make_url(url).database
+    return not database or database == ":memory:"
+
+
+def sqlite_engine_options(settings: DatabaseSettings) -> dict[str, Any]:
+    """Extra ``create_engine`` keyword arguments required by SQLite.
+
+    Connections are shared with FastAPI's threadpool, so the same-thread check is
+    disabled. In-memory databases use a single static connection; otherwise every
+    new connection would see its own empty database.
+    """
+    options: dict[str, Any] = {"connect_args": {"check_same_thread": False}}
+    if is_memory_url(settings.url):
+        options["poolclass"] = StaticPool
+    return options
+
+
+def install_sqlite_pragmas(engine: Engine, settings: DatabaseSettings) -> None:
+    """Apply WAL mode and per-connection pragmas every time SQLite connects."""
+    use_wal = not is_memory_url(settings.url)
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:  # pragma: no cover - driver hook
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("PRAGMA foreign_keys=ON")
+            if use_wal:
+                cursor.execute(f"PRAGMA journal_mode={settings.sqlite_journal_mode}")
+            cursor.execute(f"PRAGMA synchronous={settings.sqlite_synchronous}")
+            cursor.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute(f"PRAGMA cache_size=-{int(settings.sqlite_cache_size_kib)}")
+        finally:
+            cursor.close()
+
+
+__all__ = [
+    "install_sqlite_pragmas",
+    "is_memory_url",
+    "sqlite_engine_options",
+]
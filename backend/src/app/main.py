@@ -1,10 +1,15 @@
+from dataclasses import asdict
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 import os
 import logging
+import time
 
+from app.api.middleware import QueryStatsMiddleware
 from app.api.v1 import api_v1_router
-from app.db.settings import get_cors_settings
+from app.db.broker import get_dbbroker
+from app.db.settings import get_cors_settings, get_database_settings
 
 
 logger = logging.getLogger(__name__)
@@ -24,6 +29,13 @@ def create_app() -> FastAPI:
                 "Using default origins which may not be secure for production."
             )
 
+    # Debug-only per-request query stats; the headers are exposed through CORS so
+    # the frontend dev tools can read them.
+    expose_headers: list[str] = []
+    if get_database_settings().debug_query_stats:
+        app.add_middleware(QueryStatsMiddleware)
+        expose_headers = [QueryStatsMiddleware.count_header, QueryStatsMiddleware.time_header]
+
     # Add CORS middleware with environment-based configuration
     app.add_middleware(
         CORSMiddleware,
@@ -32,12 +44,31 @@ def create_app() -> FastAPI:
         allow_methods=cors_settings.allow_methods,
         allow_headers=cors_settings.allow_headers,
         allow_origin_regex=cors_settings.origin_regex,
+        expose_headers=expose_headers,
     )
 
     @app.get("/healthz")
     def healthz():
         return {"status": "ok"}
 
+    @app.get("/healthz/db")
+    def healthz_db():
+        """Readiness: cached DB ping plus pool usage, for sizing pools per worker."""
+        broker = get_dbbroker()
+        ping = broker.ping()
+        body = {
+            "status": "ok" if ping.ok else "unavailable",
+            "dialect": broker.engine.dialect.name,
+            "ping": {
+                "ok": ping.ok,
+                "latency_ms": ping.latency_ms,
+                "age_s": round(time.monotonic() - ping.checked_at, 3),
+                "error": ping.error,
+            },
+            "pool": asdict(broker.pool_status()),
+        }
+        return JSONResponse(body, status_code=200 if ping.ok else 503)
+
     app.include_router(api_v1_router, prefix="/api/v1")
     return app
 
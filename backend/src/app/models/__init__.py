@@ -3,12 +3,19 @@
 from app.models.admin import Admin
 from app.models.appointment import Appointment
 from app.models.appointment_block import AppointmentBlock
+from app.models.archive import ArchivedAppointment, ArchivedAppointmentBlock, ArchivedAvailability
 from app.models.availability import Availability
+from app.models.cache_version import CacheVersion
+from app.models.dashboard_counter import DashboardCounter
 from app.models.doctor import Doctor
+from app.models.doctor_patient import DoctorPatient
+from app.models.doctor_utilization import DoctorUtilization
 from app.models.enums import AppointmentStatus, UserRole
+from app.models.job_checkpoint import JobCheckpoint
 from app.models.medical_record import MedicalRecord
 from app.models.office import Office
 from app.models.patient import Patient
+from app.models.patient_search_term import PatientSearchTerm
 from app.models.system_settings import SystemSettings
 from app.models.user import User
 
@@ -16,11 +23,20 @@ __all__ = [
     "Admin",
     "Appointment",
     "AppointmentBlock",
+    "ArchivedAppointment",
+    "ArchivedAppointmentBlock",
+    "ArchivedAvailability",
     "Availability",
+    "CacheVersion",
+    "DashboardCounter",
     "Doctor",
+    "DoctorPatient",
+    "DoctorUtilization",
+    "JobCheckpoint",
     "MedicalRecord",
     "Office",
     "Patient",
+    "PatientSearchTerm",
     "SystemSettings",
     "User",
     "UserRole",
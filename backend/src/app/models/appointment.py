@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, String, Text, func
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -19,6 +19,16 @@ if TYPE_CHECKING:  # pragma: no cover
 
 class Appointment(Base):
     __tablename__ = "appointments"
+    __table_args__ = (
+        Index("ix_appointments_doctor_slot", "doctor_id", "start_at"),
+        Index("ix_appointments_patient", "patient_id", "start_at"),
+        # Slot conflict checks and per-status doctor listings
+        Index("ix_appointments_doctor_status_start", "doctor_id", "status", "start_at", "end_at"),
+        # Block -> appointment lookups (consistency scans, archival, repairs)
+        Index("ix_appointments_block_status", "block_id", "status"),
+        # Date-range analytics; covers every grouped column
+        Index("ix_appointments_start_breakdown", "start_at", "status", "doctor_id", "office_id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     doctor_id: Mapped[int] = mapped_column(ForeignKey("doctors.id", ondelete="CASCADE"), nullable=False)
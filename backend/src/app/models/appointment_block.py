@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -15,9 +15,30 @@ if TYPE_CHECKING:  # pragma: no cover
 
 class AppointmentBlock(Base):
     __tablename__ = "appointment_blocks"
+    __table_args__ = (
+        # Free-block lookups: availability_id and is_booked are equality filters,
+        # start_at is the range, end_at rides along so the bounds check is index-only.
+        Index(
+            "ix_appointment_blocks_availability_booked_start",
+            "availability_id",
+            "is_booked",
+            "start_at",
+            "end_at",
+        ),
+        # Per-doctor free-slot range scans without joining doctor_availability
+        Index(
+            "ix_appointment_blocks_doctor_booked_start",
+            "doctor_id",
+            "is_booked",
+            "start_at",
+            "end_at",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     availability_id: Mapped[int] = mapped_column(ForeignKey("doctor_availability.id", ondelete="CASCADE"), nullable=False)
+    # Denormalized from the availability; always equal to availability.doctor_id
+    doctor_id: Mapped[int] = mapped_column(ForeignKey("doctors.id", ondelete="CASCADE"), nullable=False)
     block_number: Mapped[int] = mapped_column(Integer, nullable=False)
     start_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     end_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
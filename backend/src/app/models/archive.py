@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+from app.models.enums import AppointmentStatus
+
+
+# Archive tables mirror the live scheduling tables column for column (same ids)
+# plus ``archived_at``. References to other scheduling rows are kept as plain
+# integers because those rows may themselves have been archived; doctor and
+# patient references keep their foreign keys so deleting either still removes
+# their history.
+
+
+class ArchivedAppointment(Base):
+    __tablename__ = "appointments_archive"
+    __table_args__ = (
+        Index("ix_appointments_archive_patient", "patient_id", "start_at"),
+        Index("ix_appointments_archive_doctor", "doctor_id", "start_at"),
+        Index("ix_appointments_archive_start", "start_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    doctor_id: Mapped[int] = mapped_column(ForeignKey("doctors.id", ondelete="CASCADE"), nullable=False)
+    patient_id: Mapped[int] = mapped_column(
+        ForeignKey("patients.id", ondelete="CASCADE"), nullable=False
+    )
+    availability_id: Mapped[int | None] = mapped_column(Integer)
+    block_id: Mapped[int | None] = mapped_column(Integer)
+    office_id: Mapped[int | None] = mapped_column(Integer)
+    start_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    end_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    notes: Mapped[str | None] = mapped_column(Text)
+    status: Mapped[AppointmentStatus] = mapped_column(
+        Enum(
+            AppointmentStatus,
+            values_callable=lambda enum: [member.value for member in enum],
+        ),
+        nullable=False,
+    )
+    cancel_reason: Mapped[str | None] = mapped_column(String(255))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"ArchivedAppointment(id={self.id!r}, doctor_id={self.doctor_id!r}, status={self.status!r})"
+
+
+class ArchivedAppointmentBlock(Base):
+    __tablename__ = "appointment_blocks_archive"
+    __table_args__ = (
+        Index("ix_appointment_blocks_archive_doctor", "doctor_id", "start_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    availability_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    doctor_id: Mapped[int] = mapped_column(ForeignKey("doctors.id", ondelete="CASCADE"), nullable=False)
+    block_number: Mapped[int] = mapped_column(Integer, nullable=False)
+    start_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    end_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    is_booked: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"ArchivedAppointmentBlock(id={self.id!r}, availability_id={self.availability_id!r})"
+
+
+class ArchivedAvailability(Base):
+    __tablename__ = "doctor_availability_archive"
+    __table_args__ = (
+        Index("ix_doctor_availability_archive_doctor", "doctor_id", "start_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    doctor_id: Mapped[int] = mapped_column(ForeignKey("doctors.id", ondelete="CASCADE"), nullable=False)
+    start_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    end_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"ArchivedAvailability(id={self.id!r}, doctor_id={self.doctor_id!r})"
+
+
+__all__ = ["ArchivedAppointment", "ArchivedAppointmentBlock", "ArchivedAvailability"]
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Integer, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -16,6 +16,9 @@ if TYPE_CHECKING:  # pragma: no cover
 
 class Availability(Base):
     __tablename__ = "doctor_availability"
+    __table_args__ = (
+        Index("ix_doctor_availability_doctor_start", "doctor_id", "start_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     doctor_id: Mapped[int] = mapped_column(ForeignKey("doctors.id", ondelete="CASCADE"), nullable=False)
@@ -31,7 +34,12 @@ class Availability(Base):
 
     doctor: Mapped["Doctor"] = relationship(back_populates="availabilities")
     appointments: Mapped[list["Appointment"]] = relationship(back_populates="availability")
-    blocks: Mapped[list["AppointmentBlock"]] = relationship(back_populates="availability")
+    blocks: Mapped[list["AppointmentBlock"]] = relationship(
+        back_populates="availability",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="AppointmentBlock.block_number",
+    )
 
     def __repr__(self) -> str:  # pragma: no cover
         return f"Availability(id={self.id!r}, doctor_id={self.doctor_id!r})"
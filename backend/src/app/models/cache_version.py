@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class CacheVersion(Base):
+    """Version of a process-wide cache, bumped by every write that makes it stale.
+
+    Workers keep cached data together with the version it was loaded at and
+    compare it to this row, read in the caller's own transaction, before
+    serving it. Rows are created by the first bump.
+    """
+
+    __tablename__ = "cache_versions"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"CacheVersion(name={self.name!r}, version={self.version!r})"
+
+
+__all__ = ["CacheVersion"]
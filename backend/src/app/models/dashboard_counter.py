@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class DashboardCounter(Base):
+    """Pre-aggregated count read by the admin dashboard.
+
+    Rows are keyed by name (``users``, ``active_doctors``, ``medical_records``,
+    ``appointments:YYYY-MM-DD``) and adjusted on every flush that creates,
+    deletes or changes a counted row; ``reconcile`` rebuilds them from scratch.
+    """
+
+    __tablename__ = "dashboard_counters"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    value: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"DashboardCounter(name={self.name!r}, value={self.value!r})"
+
+
+__all__ = ["DashboardCounter"]
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -18,6 +18,11 @@ if TYPE_CHECKING:  # pragma: no cover
 
 class Doctor(Base):
     __tablename__ = "doctors"
+    __table_args__ = (
+        # Directory filters by specialty (and office); office_id alone is
+        # covered by the foreign key index on MySQL
+        Index("ix_doctors_specialty_office", "specialty", "office_id"),
+    )
 
     id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class DoctorPatient(Base):
+    """A patient who has had at least one appointment with a doctor.
+
+    ``first_seen`` and ``last_appointment_at`` span the start of every
+    appointment of the pair, canceled ones included; ``appointment_count``
+    counts only those not canceled. Rows are adjusted on every flush that
+    books, cancels, moves or deletes an appointment (see
+    ``app.services.doctor_patients``) and survive archival of the
+    appointments themselves; the ``rebuild_doctor_patients`` repair recomputes
+    them from live and archived appointments.
+    """
+
+    __tablename__ = "doctor_patients"
+    __table_args__ = (
+        # "My patients": one doctor's range, most recent first
+        Index("ix_doctor_patients_doctor_last", "doctor_id", "last_appointment_at", "patient_id"),
+        Index("ix_doctor_patients_patient", "patient_id"),
+    )
+
+    doctor_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("doctors.id", ondelete="CASCADE"), primary_key=True
+    )
+    patient_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("patients.id", ondelete="CASCADE"), primary_key=True
+    )
+    first_seen: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    last_appointment_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    appointment_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return (
+            f"DoctorPatient(doctor_id={self.doctor_id!r}, patient_id={self.patient_id!r}, "
+            f"appointment_count={self.appointment_count!r})"
+        )
+
+
+__all__ = ["DoctorPatient"]
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, ForeignKey, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class DoctorUtilization(Base):
+    """Block occupancy of one doctor over one calendar month.
+
+    Rows are rebuilt a whole period at a time by ``UtilizationService``; a
+    period whose ``refreshed_at`` is after its end is final and never
+    recomputed.
+    """
+
+    __tablename__ = "doctor_utilization"
+    __table_args__ = (
+        Index("ux_doctor_utilization_period_doctor", "period_start", "doctor_id", unique=True),
+        Index("ix_doctor_utilization_doctor_period", "doctor_id", "period_start"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    period_start: Mapped[date] = mapped_column(Date, nullable=False)
+    doctor_id: Mapped[int] = mapped_column(ForeignKey("doctors.id", ondelete="CASCADE"), nullable=False)
+    # The doctor's office when the period was last refreshed
+    office_id: Mapped[int | None] = mapped_column(ForeignKey("offices.id", ondelete="SET NULL"), nullable=True)
+    offered: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    booked: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    refilled: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    empty_past: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    refreshed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return (
+            f"DoctorUtilization(period_start={self.period_start!r}, doctor_id={self.doctor_id!r}, "
+            f"booked={self.booked!r}, offered={self.offered!r})"
+        )
+
+
+__all__ = ["DoctorUtilization"]
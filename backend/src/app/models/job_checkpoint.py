@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import JSON, DateTime, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class JobCheckpoint(Base):
+    """Progress marker for long-running batch jobs (archival, data repairs).
+
+    ``last_id`` is the highest primary key a job has fully processed;
+    ``parameters`` records the settings the run started with, so a resumed run
+    continues with the same cutoff instead of recomputing it.
+    """
+
+    __tablename__ = "job_checkpoints"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    last_id: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    parameters: Mapped[dict[str, Any] | None] = mapped_column(JSON)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"JobCheckpoint(name={self.name!r}, last_id={self.last_id!r})"
+
+
+__all__ = ["JobCheckpoint"]
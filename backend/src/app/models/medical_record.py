@@ -3,9 +3,10 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Integer, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.db import fulltext
 from app.db.base import Base
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -15,6 +16,12 @@ if TYPE_CHECKING:  # pragma: no cover
 
 class MedicalRecord(Base):
     __tablename__ = "medical_records"
+    __table_args__ = (
+        Index("ix_medical_records_patient", "patient_id", "created_at"),
+        Index("ix_medical_records_doctor", "doctor_id", "created_at"),
+        # MySQL only; SQLite searches the FTS5 copy created by fulltext.install
+        Index(fulltext.FULLTEXT_INDEX, *fulltext.SEARCH_COLUMNS, mysql_prefix="FULLTEXT").ddl_if(dialect="mysql"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     patient_id: Mapped[int] = mapped_column(
@@ -41,4 +48,7 @@ class MedicalRecord(Base):
         return f"MedicalRecord(id={self.id!r}, patient_id={self.patient_id!r})"
 
 
+fulltext.install(MedicalRecord.__table__)
+
+
 __all__ = ["MedicalRecord"]
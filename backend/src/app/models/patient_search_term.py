@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from sqlalchemy import ForeignKey, Index, String
+from sqlalchemy.dialects import mysql
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+# Terms are folded ASCII letters and digits; a binary collation keeps MySQL's
+# ordering byte-wise, like SQLite's, so prefix lookups can use range scans.
+_TermType = String(64).with_variant(mysql.VARCHAR(64, charset="ascii", collation="ascii_bin"), "mysql")
+
+
+class PatientSearchTerm(Base):
+    """One searchable prefix key of a patient (name word, email, document).
+
+    Maintained by a flush hook in ``app.services.patient_search``; rows go
+    away with the patient through the foreign key cascade.
+    """
+
+    __tablename__ = "patient_search_terms"
+    __table_args__ = (
+        # Per-patient checks of the extra words of a multi-word query
+        Index("ix_patient_search_terms_patient", "patient_id", "kind", "term"),
+    )
+
+    # Key order (kind, term, patient_id): a prefix lookup within one kind reads
+    # the index in term order and can stop after the first matches.
+    kind: Mapped[str] = mapped_column(String(16), primary_key=True)
+    term: Mapped[str] = mapped_column(_TermType, primary_key=True)
+    patient_id: Mapped[int] = mapped_column(
+        ForeignKey("patients.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"PatientSearchTerm(term={self.term!r}, kind={self.kind!r}, patient_id={self.patient_id!r})"
+
+
+__all__ = ["PatientSearchTerm"]
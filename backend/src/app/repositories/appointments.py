@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from datetime import datetime
-from typing import Dict, Iterable, List, Optional, Protocol, runtime_checkable
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Hashable, Iterable, List, Optional, Protocol, Set, runtime_checkable
 
 from app.schemas.appointment import (
     Appointment,
+    AppointmentBlock,
     AppointmentCreate,
     AppointmentStatus,
     Availability,
@@ -16,112 +19,471 @@ from app.schemas.appointment import (
 
 @runtime_checkable
 class AppointmentRepository(Protocol):
-    def next_identity(self) -> int: ...
-
-    def add(self, appointment: Appointment) -> Appointment: ...
+    def create(
+        self,
+        data: AppointmentCreate,
+        *,
+        availability_id: Optional[int] = None,
+        block_id: Optional[int] = None,
+    ) -> Appointment: ...
 
     def get(self, appointment_id: int) -> Optional[Appointment]: ...
 
-    def list_by_patient(self, patient_id: int) -> List[Appointment]: ...
+    def list_by_patient(
+        self,
+        patient_id: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        *,
+        include_archived: bool = False,
+    ) -> List[Appointment]: ...
+
+    def list_by_doctor(
+        self,
+        doctor_id: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        *,
+        include_archived: bool = False,
+    ) -> List[Appointment]: ...
+
+    def find_conflict(self, doctor_id: int, start: datetime, end: datetime) -> Optional[Appointment]: ...
 
-    def list_by_doctor(self, doctor_id: int) -> List[Appointment]: ...
+    def booked_block_id(self, appointment_id: int) -> Optional[int]: ...
+
+    def any_for_availability(self, availability_id: int) -> bool: ...
 
     def save(self, appointment: Appointment) -> Appointment: ...
 
 
 @runtime_checkable
 class AvailabilityRepository(Protocol):
-    def next_identity(self) -> int: ...
+    """Availabilities without their blocks; ``blocks`` is always empty."""
 
-    def add(self, availability: Availability) -> Availability: ...
+    def create(self, data: AvailabilityCreate) -> Availability: ...
 
     def get(self, availability_id: int) -> Optional[Availability]: ...
 
-    def list_by_doctor(self, doctor_id: int) -> List[Availability]: ...
+    def list_by_doctor(
+        self, doctor_id: int, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> List[Availability]: ...
+
+    def find_containing(self, doctor_id: int, start: datetime, end: datetime) -> Optional[Availability]: ...
+
+    def find_overlapping(
+        self, doctor_id: int, start: datetime, end: datetime, *, skip_id: Optional[int] = None
+    ) -> Optional[Availability]: ...
 
     def save(self, availability: Availability) -> Availability: ...
 
+    def delete(self, availability_id: int) -> None:
+        """Delete the availability together with its blocks."""
+
+
+@runtime_checkable
+class AppointmentBlockRepository(Protocol):
+    def create(
+        self, availability: Availability, slots: Iterable[tuple[datetime, datetime]]
+    ) -> List[AppointmentBlock]: ...
+
+    def get(self, block_id: int) -> Optional[AppointmentBlock]: ...
+
+    def list_by_availability(self, availability_id: int) -> List[AppointmentBlock]: ...
+
+    def list_for_availabilities(self, availability_ids: Iterable[int]) -> Dict[int, List[AppointmentBlock]]: ...
+
+    def list_free(self, doctor_id: int, start: datetime, end: datetime) -> List[AppointmentBlock]: ...
+
+    def find_free(self, availability_id: int, start: datetime, end: datetime) -> Optional[AppointmentBlock]: ...
+
+    def save(self, block: AppointmentBlock) -> AppointmentBlock: ...
+
+    def delete(self, block_id: int) -> None: ...
+
+
+class AppointmentStore(Protocol):
+    """The repositories ``AppointmentsService`` reads and writes."""
+
+    appointments: AppointmentRepository
+    availability: AvailabilityRepository
+    blocks: AppointmentBlockRepository
+
+
+def _utc(value: datetime) -> datetime:
+    """Index key for ``value``: naive datetimes are taken as UTC, like the database does."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+class _StartIndex:
+    """Item ids per key, sorted by start time.
+
+    Each key holds a list of ``(start, id)`` pairs kept in order with
+    ``insort``, so range queries are two bisections. The longest interval ever
+    indexed per key bounds how far before a window an overlapping item can
+    start, which turns overlap and containment checks into range queries too.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[Hashable, List[tuple[datetime, int]]] = defaultdict(list)
+        self._longest: Dict[Hashable, timedelta] = defaultdict(timedelta)
+
+    def insert(self, key: Hashable, start: datetime, end: datetime, item_id: int) -> None:
+        start, end = _utc(start), _utc(end)
+        insort(self._entries[key], (start, item_id))
+        if end - start > self._longest[key]:
+            self._longest[key] = end - start
+
+    def remove(self, key: Hashable, start: datetime, item_id: int) -> None:
+        entries = self._entries.get(key)
+        if not entries:
+            return
+        entry = (_utc(start), item_id)
+        position = bisect_left(entries, entry)
+        if position < len(entries) and entries[position] == entry:
+            del entries[position]
+
+    def starting(
+        self, key: Hashable, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> List[int]:
+        """Ids whose start falls in ``[start, end)``, in start order."""
+        entries = self._entries.get(key)
+        if not entries:
+            return []
+        low = bisect_left(entries, (_utc(start),)) if start is not None else 0
+        high = bisect_left(entries, (_utc(end),)) if end is not None else len(entries)
+        return [item_id for _, item_id in entries[low:high]]
+
+    def started_by(self, key: Hashable, moment: datetime) -> List[int]:
+        """Ids that start at or before ``moment`` and may still be running then."""
+        entries = self._entries.get(key)
+        if not entries:
+            return []
+        moment = _utc(moment)
+        low = bisect_left(entries, (moment - self._longest[key],))
+        high = bisect_right(entries, (moment, float("inf")))
+        return [item_id for _, item_id in entries[low:high]]
+
+    def overlapping(self, key: Hashable, start: datetime, end: Optional[datetime]) -> List[int]:
+        """Candidate ids for ``[start, end)``; callers still compare the end times."""
+        return self.starting(key, _utc(start) - self._longest[key], end)
+
 
 class InMemoryAppointmentRepository(AppointmentRepository):
+    """Appointments indexed by doctor and by patient, sorted by ``start_at``.
+
+    Writes store a copy, so later changes to the caller's instance do not leak
+    in; reads return the stored instances without copying. Treat them as read
+    only and change them with ``model_copy(update=...)`` and ``save``.
+    Non-canceled appointments get their own per-doctor index, so conflict
+    checks only look at appointments that can actually overlap. The block and
+    availability an appointment was booked on, which the database keeps in
+    appointment columns, are tracked beside the schemas. Nothing is ever
+    archived, so ``include_archived`` changes nothing.
+    """
+
     def __init__(self) -> None:
         self._items: Dict[int, Appointment] = {}
         self._sequence: int = 0
+        self._by_doctor = _StartIndex()
+        self._by_patient = _StartIndex()
+        self._active = _StartIndex()
+        self._blocks: Dict[int, int] = {}
+        self._per_availability: Counter = Counter()
 
     def next_identity(self) -> int:
         self._sequence += 1
         return self._sequence
 
     def add(self, appointment: Appointment) -> Appointment:
-        self._items[appointment.id] = appointment
+        return self.save(appointment)
+
+    def create(
+        self,
+        data: AppointmentCreate,
+        *,
+        availability_id: Optional[int] = None,
+        block_id: Optional[int] = None,
+    ) -> Appointment:
+        appointment = self.add(build_appointment_from_create(self, data))
+        if availability_id is not None:
+            self._per_availability[availability_id] += 1
+        if block_id is not None:
+            self._blocks[appointment.id] = block_id
         return appointment
 
     def get(self, appointment_id: int) -> Optional[Appointment]:
-        item = self._items.get(appointment_id)
-        return item.model_copy() if item else None
-
-    def list_by_patient(self, patient_id: int) -> List[Appointment]:
-        return [item.model_copy() for item in self._items.values() if item.patient_id == patient_id]
-
-    def list_by_doctor(self, doctor_id: int) -> List[Appointment]:
-        return [item.model_copy() for item in self._items.values() if item.doctor_id == doctor_id]
+        return self._items.get(appointment_id)
+
+    def list_by_patient(
+        self,
+        patient_id: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        *,
+        include_archived: bool = False,
+    ) -> List[Appointment]:
+        """Appointments of the patient starting in ``[start, end)``, by start time."""
+        return [self._items[item_id] for item_id in self._by_patient.starting(patient_id, start, end)]
+
+    def list_by_doctor(
+        self,
+        doctor_id: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        *,
+        include_archived: bool = False,
+    ) -> List[Appointment]:
+        """Appointments of the doctor starting in ``[start, end)``, by start time."""
+        return [self._items[item_id] for item_id in self._by_doctor.starting(doctor_id, start, end)]
+
+    def find_conflict(self, doctor_id: int, start: datetime, end: datetime) -> Optional[Appointment]:
+        """The earliest non-canceled appointment of the doctor overlapping ``[start, end)``."""
+        start = _utc(start)
+        for item_id in self._active.overlapping(doctor_id, start, end):
+            item = self._items[item_id]
+            if _utc(item.end_at) > start:
+                return item
+        return None
+
+    def booked_block_id(self, appointment_id: int) -> Optional[int]:
+        return self._blocks.get(appointment_id)
+
+    def any_for_availability(self, availability_id: int) -> bool:
+        return self._per_availability[availability_id] > 0
 
     def save(self, appointment: Appointment) -> Appointment:
-        self._items[appointment.id] = appointment
-        return appointment
+        previous = self._items.get(appointment.id)
+        if previous is not None:
+            self._unindex(previous)
+        stored = appointment.model_copy()
+        self._items[stored.id] = stored
+        self._index(stored)
+        self._sequence = max(self._sequence, stored.id)
+        return stored
 
     def iter(self) -> Iterable[Appointment]:
-        return (item.model_copy() for item in self._items.values())
+        return iter(self._items.values())
+
+    def _index(self, item: Appointment) -> None:
+        self._by_doctor.insert(item.doctor_id, item.start_at, item.end_at, item.id)
+        self._by_patient.insert(item.patient_id, item.start_at, item.end_at, item.id)
+        if item.status != AppointmentStatus.CANCELED:
+            self._active.insert(item.doctor_id, item.start_at, item.end_at, item.id)
+
+    def _unindex(self, item: Appointment) -> None:
+        self._by_doctor.remove(item.doctor_id, item.start_at, item.id)
+        self._by_patient.remove(item.patient_id, item.start_at, item.id)
+        self._active.remove(item.doctor_id, item.start_at, item.id)
 
 
 class InMemoryAvailabilityRepository(AvailabilityRepository):
-    def __init__(self) -> None:
+    """Availabilities indexed by doctor and sorted by ``start_at``.
+
+    Copy-on-write like ``InMemoryAppointmentRepository``. Blocks live in their
+    own repository; the stored availabilities keep an empty ``blocks`` list.
+    ``delete`` also removes the availability's blocks from ``blocks``.
+    """
+
+    def __init__(self, blocks: Optional[InMemoryAppointmentBlockRepository] = None) -> None:
         self._items: Dict[int, Availability] = {}
         self._sequence: int = 0
-        self._by_doctor: Dict[int, List[int]] = defaultdict(list)
+        self._by_doctor = _StartIndex()
+        self._blocks = blocks
 
     def next_identity(self) -> int:
         self._sequence += 1
         return self._sequence
 
     def add(self, availability: Availability) -> Availability:
-        self._items[availability.id] = availability
-        self._by_doctor[availability.doctor_id].append(availability.id)
-        return availability
+        return self.save(availability)
 
-    def get(self, availability_id: int) -> Optional[Availability]:
-        item = self._items.get(availability_id)
-        return item.model_copy() if item else None
+    def create(self, data: AvailabilityCreate) -> Availability:
+        return self.add(build_availability_from_create(self, data))
 
-    def list_by_doctor(self, doctor_id: int) -> List[Availability]:
-        ids = self._by_doctor.get(doctor_id, [])
-        return [self._items[item_id].model_copy() for item_id in ids]
+    def get(self, availability_id: int) -> Optional[Availability]:
+        return self._items.get(availability_id)
+
+    def list_by_doctor(
+        self, doctor_id: int, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> List[Availability]:
+        """Availabilities of the doctor overlapping ``[start, end)``, by start time."""
+        if start is None:
+            return [self._items[item_id] for item_id in self._by_doctor.starting(doctor_id, None, end)]
+        start = _utc(start)
+        items = (self._items[item_id] for item_id in self._by_doctor.overlapping(doctor_id, start, end))
+        return [item for item in items if _utc(item.end_at) > start]
+
+    def find_containing(self, doctor_id: int, start: datetime, end: datetime) -> Optional[Availability]:
+        """An availability of the doctor covering all of ``[start, end]``."""
+        end = _utc(end)
+        for item_id in self._by_doctor.started_by(doctor_id, start):
+            item = self._items[item_id]
+            if _utc(item.end_at) >= end:
+                return item
+        return None
+
+    def find_overlapping(
+        self, doctor_id: int, start: datetime, end: datetime, *, skip_id: Optional[int] = None
+    ) -> Optional[Availability]:
+        start = _utc(start)
+        for item_id in self._by_doctor.overlapping(doctor_id, start, end):
+            item = self._items[item_id]
+            if item_id != skip_id and _utc(item.end_at) > start:
+                return item
+        return None
 
     def save(self, availability: Availability) -> Availability:
-        self._items[availability.id] = availability
-        if availability.id not in self._by_doctor[availability.doctor_id]:
-            self._by_doctor[availability.doctor_id].append(availability.id)
-        return availability
+        previous = self._items.get(availability.id)
+        if previous is not None:
+            self._by_doctor.remove(previous.doctor_id, previous.start_at, previous.id)
+        stored = availability.model_copy(update={"blocks": []})
+        self._items[stored.id] = stored
+        self._by_doctor.insert(stored.doctor_id, stored.start_at, stored.end_at, stored.id)
+        self._sequence = max(self._sequence, stored.id)
+        return stored
+
+    def delete(self, availability_id: int) -> None:
+        if self._blocks is not None:
+            for block in self._blocks.list_by_availability(availability_id):
+                self._blocks.delete(block.id)
+        item = self._items.pop(availability_id, None)
+        if item is not None:
+            self._by_doctor.remove(item.doctor_id, item.start_at, item.id)
+
+
+class InMemoryAppointmentBlockRepository(AppointmentBlockRepository):
+    """Blocks indexed by availability and by doctor, sorted by ``start_at``.
+
+    ``AppointmentBlock`` does not carry its doctor, so ``add`` takes it; a
+    block keeps that doctor when it moves to another availability.
+    """
+
+    def __init__(self) -> None:
+        self._items: Dict[int, AppointmentBlock] = {}
+        self._doctors: Dict[int, int] = {}
+        self._sequence: int = 0
+        self._by_availability = _StartIndex()
+        self._by_doctor = _StartIndex()
+
+    def next_identity(self) -> int:
+        self._sequence += 1
+        return self._sequence
+
+    def add(self, block: AppointmentBlock, *, doctor_id: int) -> AppointmentBlock:
+        self._doctors[block.id] = doctor_id
+        return self.save(block)
+
+    def create(
+        self, availability: Availability, slots: Iterable[tuple[datetime, datetime]]
+    ) -> List[AppointmentBlock]:
+        return [
+            self.add(
+                AppointmentBlock(
+                    id=self.next_identity(),
+                    availability_id=availability.id,
+                    block_number=number,
+                    start_at=start,
+                    end_at=end,
+                    is_booked=False,
+                ),
+                doctor_id=availability.doctor_id,
+            )
+            for number, (start, end) in enumerate(slots, start=1)
+        ]
+
+    def get(self, block_id: int) -> Optional[AppointmentBlock]:
+        return self._items.get(block_id)
+
+    def list_by_availability(self, availability_id: int) -> List[AppointmentBlock]:
+        return [self._items[item_id] for item_id in self._by_availability.starting(availability_id)]
+
+    def list_for_availabilities(self, availability_ids: Iterable[int]) -> Dict[int, List[AppointmentBlock]]:
+        return {availability_id: self.list_by_availability(availability_id) for availability_id in availability_ids}
+
+    def list_free(self, doctor_id: int, start: datetime, end: datetime) -> List[AppointmentBlock]:
+        """Unbooked blocks of the doctor lying within ``[start, end]``, by start time."""
+        end = _utc(end)
+        items = (self._items[item_id] for item_id in self._by_doctor.starting(doctor_id, start, end))
+        return [item for item in items if not item.is_booked and _utc(item.end_at) <= end]
+
+    def find_free(self, availability_id: int, start: datetime, end: datetime) -> Optional[AppointmentBlock]:
+        """The unbooked block of the availability covering ``[start, end]``, if any."""
+        end = _utc(end)
+        for item_id in self._by_availability.started_by(availability_id, start):
+            item = self._items[item_id]
+            if not item.is_booked and _utc(item.end_at) >= end:
+                return item
+        return None
+
+    def save(self, block: AppointmentBlock) -> AppointmentBlock:
+        if block.id not in self._doctors:
+            raise KeyError(f"Block {block.id} was never added")
+        previous = self._items.get(block.id)
+        if previous is not None:
+            self._unindex(previous)
+        stored = block.model_copy()
+        self._items[stored.id] = stored
+        self._by_availability.insert(stored.availability_id, stored.start_at, stored.end_at, stored.id)
+        self._by_doctor.insert(self._doctors[stored.id], stored.start_at, stored.end_at, stored.id)
+        self._sequence = max(self._sequence, stored.id)
+        return stored
+
+    def delete(self, block_id: int) -> None:
+        item = self._items.pop(block_id, None)
+        if item is not None:
+            self._unindex(item)
+            del self._doctors[block_id]
+
+    def _unindex(self, item: AppointmentBlock) -> None:
+        self._by_availability.remove(item.availability_id, item.start_at, item.id)
+        self._by_doctor.remove(self._doctors[item.id], item.start_at, item.id)
+
+
+@dataclass
+class InMemoryAppointmentStore(AppointmentStore):
+    """Everything ``InMemoryAppointmentsService`` reads and writes.
+
+    Doctors and patients exist when their ids are in ``doctor_ids`` and
+    ``patient_ids``.
+    """
+
+    appointments: InMemoryAppointmentRepository = field(default_factory=InMemoryAppointmentRepository)
+    blocks: InMemoryAppointmentBlockRepository = field(default_factory=InMemoryAppointmentBlockRepository)
+    availability: Optional[InMemoryAvailabilityRepository] = None
+    doctor_ids: Set[int] = field(default_factory=set)
+    patient_ids: Set[int] = field(default_factory=set)
+
+    def __post_init__(self) -> None:
+        if self.availability is None:
+            self.availability = InMemoryAvailabilityRepository(self.blocks)
 
 
 def build_appointment_from_create(
-    repo: AppointmentRepository, data: AppointmentCreate
+    repo: InMemoryAppointmentRepository, data: AppointmentCreate
 ) -> Appointment:
     appointment_id = repo.next_identity()
     return Appointment(id=appointment_id, **data.model_dump())
 
 
 def build_availability_from_create(
-    repo: AvailabilityRepository, data: AvailabilityCreate
+    repo: InMemoryAvailabilityRepository, data: AvailabilityCreate
 ) -> Availability:
     availability_id = repo.next_identity()
     return Availability(id=availability_id, **data.model_dump())
 
 
+def apply_availability_update(availability: Availability, data: AvailabilityUpdate) -> Availability:
+    return availability.model_copy(update=data.model_dump(exclude_unset=True))
+
+
 def overlaps(start: datetime, end: datetime, *, other_start: datetime, other_end: datetime) -> bool:
     return start < other_end and other_start < end
 
 
 def ensure_doctor_is_free(appointments: Iterable[Appointment], *, start: datetime, end: datetime) -> bool:
+    """Linear check over ``appointments``; prefer ``AppointmentRepository.find_conflict``."""
     for appointment in appointments:
         if appointment.status != AppointmentStatus.CANCELED and overlaps(
             start, end, other_start=appointment.start_at, other_end=appointment.end_at
@@ -0,0 +1,381 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import Session
+
+from app.models.appointment import Appointment as AppointmentModel
+from app.models.appointment_block import AppointmentBlock as AppointmentBlockModel
+from app.models.archive import ArchivedAppointment
+from app.models.availability import Availability as AvailabilityModel
+from app.models.enums import AppointmentStatus
+from app.repositories.appointments import (
+    AppointmentBlockRepository,
+    AppointmentRepository,
+    AppointmentStore,
+    AvailabilityRepository,
+    _utc,
+)
+from app.schemas.appointment import (
+    Appointment,
+    AppointmentBlock,
+    AppointmentCreate,
+    Availability,
+    AvailabilityCreate,
+)
+
+
+# Hot-path statements are built once at import time and executed with bound
+# parameters, so SQLAlchemy reuses both the construct and its memoized cache key
+# instead of rebuilding them on every call.
+_CONFLICTING_APPOINTMENT_STMT = (
+    select(AppointmentModel)
+    .where(AppointmentModel.doctor_id == bindparam("doctor_id"))
+    .where(AppointmentModel.status != AppointmentStatus.CANCELED)
+    .where(AppointmentModel.start_at < bindparam("end"))
+    .where(AppointmentModel.end_at > bindparam("start"))
+    .limit(1)
+)
+
+_CONTAINING_AVAILABILITY_STMT = (
+    select(AvailabilityModel)
+    .where(AvailabilityModel.doctor_id == bindparam("doctor_id"))
+    .where(AvailabilityModel.start_at <= bindparam("start"))
+    .where(AvailabilityModel.end_at >= bindparam("end"))
+    .limit(1)
+)
+
+# Availability ids are positive, so skip_id=0 means "skip nothing"
+_OVERLAPPING_AVAILABILITY_STMT = (
+    select(AvailabilityModel.id)
+    .where(AvailabilityModel.doctor_id == bindparam("doctor_id"))
+    .where(AvailabilityModel.start_at < bindparam("end"))
+    .where(AvailabilityModel.end_at > bindparam("start"))
+    .where(AvailabilityModel.id != bindparam("skip_id"))
+    .limit(1)
+)
+
+# Single range scan over ix_appointment_blocks_doctor_booked_start, which also
+# yields the rows already ordered by start_at.
+_AVAILABLE_BLOCKS_STMT = (
+    select(AppointmentBlockModel)
+    .where(AppointmentBlockModel.doctor_id == bindparam("doctor_id"))
+    .where(AppointmentBlockModel.is_booked == False)
+    .where(AppointmentBlockModel.start_at >= bindparam("start"))
+    .where(AppointmentBlockModel.end_at <= bindparam("end"))
+    .order_by(AppointmentBlockModel.start_at)
+)
+
+_FREE_BLOCK_STMT = (
+    select(AppointmentBlockModel)
+    .where(AppointmentBlockModel.availability_id == bindparam("availability_id"))
+    .where(AppointmentBlockModel.is_booked == False)
+    .where(AppointmentBlockModel.start_at <= bindparam("start"))
+    .where(AppointmentBlockModel.end_at >= bindparam("end"))
+    .limit(1)
+)
+
+_ANY_FOR_AVAILABILITY_STMT = (
+    select(AppointmentModel.id)
+    .where(AppointmentModel.availability_id == bindparam("availability_id"))
+    .limit(1)
+)
+
+
+class SqlAlchemyAppointmentRepository(AppointmentRepository):
+    """Appointments in the ``appointments`` table, with ``appointments_archive`` on request.
+
+    Writes flush at once, so later reads in the session see them and the flush
+    hooks (dashboard counters, analytics, doctor-patient pairs) run with them.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def create(
+        self,
+        data: AppointmentCreate,
+        *,
+        availability_id: Optional[int] = None,
+        block_id: Optional[int] = None,
+    ) -> Appointment:
+        model = AppointmentModel(
+            **data.model_dump(),
+            availability_id=availability_id,
+            block_id=block_id,
+            status=AppointmentStatus.PENDING,
+        )
+        self._session.add(model)
+        self._session.flush()
+        return _appointment_to_schema(model)
+
+    def get(self, appointment_id: int) -> Optional[Appointment]:
+        model = self._session.get(AppointmentModel, appointment_id)
+        return _appointment_to_schema(model) if model else None
+
+    def list_by_patient(
+        self,
+        patient_id: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        *,
+        include_archived: bool = False,
+    ) -> List[Appointment]:
+        return self._list(
+            AppointmentModel.patient_id == patient_id,
+            ArchivedAppointment.patient_id == patient_id,
+            start,
+            end,
+            include_archived,
+        )
+
+    def list_by_doctor(
+        self,
+        doctor_id: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        *,
+        include_archived: bool = False,
+    ) -> List[Appointment]:
+        return self._list(
+            AppointmentModel.doctor_id == doctor_id,
+            ArchivedAppointment.doctor_id == doctor_id,
+            start,
+            end,
+            include_archived,
+        )
+
+    def find_conflict(self, doctor_id: int, start: datetime, end: datetime) -> Optional[Appointment]:
+        model = self._session.scalars(
+            _CONFLICTING_APPOINTMENT_STMT,
+            {"doctor_id": doctor_id, "start": start, "end": end},
+        ).first()
+        return _appointment_to_schema(model) if model else None
+
+    def booked_block_id(self, appointment_id: int) -> Optional[int]:
+        model = self._session.get(AppointmentModel, appointment_id)
+        return model.block_id if model else None
+
+    def any_for_availability(self, availability_id: int) -> bool:
+        found = self._session.scalars(_ANY_FOR_AVAILABILITY_STMT, {"availability_id": availability_id}).first()
+        return found is not None
+
+    def save(self, appointment: Appointment) -> Appointment:
+        model = self._session.get(AppointmentModel, appointment.id)
+        _assign(model, appointment.model_dump(include={"doctor_id", "patient_id", "start_at", "end_at", "notes", "status"}))
+        self._session.flush()
+        return _appointment_to_schema(model)
+
+    def _list(self, live, archived, start, end, include_archived: bool) -> List[Appointment]:
+        """Appointments matching ``live`` (and ``archived``) starting in ``[start, end)``."""
+        stmt = select(AppointmentModel).where(live)
+        archived_criteria = [archived]
+        if start is not None:
+            stmt = stmt.where(AppointmentModel.start_at >= start)
+            archived_criteria.append(ArchivedAppointment.start_at >= start)
+        if end is not None:
+            stmt = stmt.where(AppointmentModel.start_at < end)
+            archived_criteria.append(ArchivedAppointment.start_at < end)
+        models: list = list(self._session.scalars(stmt.order_by(AppointmentModel.start_at)))
+        if include_archived:
+            models.extend(self._session.scalars(select(ArchivedAppointment).where(*archived_criteria)))
+            models.sort(key=lambda model: _utc(model.start_at))
+        return [_appointment_to_schema(model) for model in models]
+
+
+class SqlAlchemyAvailabilityRepository(AvailabilityRepository):
+    """Availabilities in ``doctor_availability``; blocks are read through the block repository."""
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def create(self, data: AvailabilityCreate) -> Availability:
+        model = AvailabilityModel(**data.model_dump())
+        self._session.add(model)
+        self._session.flush()
+        return _availability_to_schema(model)
+
+    def get(self, availability_id: int) -> Optional[Availability]:
+        model = self._session.get(AvailabilityModel, availability_id)
+        return _availability_to_schema(model) if model else None
+
+    def list_by_doctor(
+        self, doctor_id: int, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> List[Availability]:
+        stmt = select(AvailabilityModel).where(AvailabilityModel.doctor_id == doctor_id)
+        if start is not None:
+            stmt = stmt.where(AvailabilityModel.end_at > _utc(start))
+        if end is not None:
+            stmt = stmt.where(AvailabilityModel.start_at < _utc(end))
+        models = self._session.scalars(stmt.order_by(AvailabilityModel.start_at))
+        return [_availability_to_schema(model) for model in models]
+
+    def find_containing(self, doctor_id: int, start: datetime, end: datetime) -> Optional[Availability]:
+        model = self._session.scalars(
+            _CONTAINING_AVAILABILITY_STMT,
+            {"doctor_id": doctor_id, "start": start, "end": end},
+        ).first()
+        return _availability_to_schema(model) if model else None
+
+    def find_overlapping(
+        self, doctor_id: int, start: datetime, end: datetime, *, skip_id: Optional[int] = None
+    ) -> Optional[Availability]:
+        # Only the key is selected; the row is loaded when there is a conflict
+        conflict_id = self._session.scalars(
+            _OVERLAPPING_AVAILABILITY_STMT,
+            {"doctor_id": doctor_id, "start": start, "end": end, "skip_id": skip_id or 0},
+        ).first()
+        return self.get(conflict_id) if conflict_id is not None else None
+
+    def save(self, availability: Availability) -> Availability:
+        model = self._session.get(AvailabilityModel, availability.id)
+        _assign(model, availability.model_dump(include={"doctor_id", "start_at", "end_at"}))
+        self._session.flush()
+        return _availability_to_schema(model)
+
+    def delete(self, availability_id: int) -> None:
+        # Availability.blocks cascades the delete to the blocks
+        model = self._session.get(AvailabilityModel, availability_id)
+        if model is not None:
+            self._session.delete(model)
+            self._session.flush()
+
+
+class SqlAlchemyAppointmentBlockRepository(AppointmentBlockRepository):
+    """Blocks in ``appointment_blocks``; each row carries its availability's doctor."""
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def create(
+        self, availability: Availability, slots: Iterable[tuple[datetime, datetime]]
+    ) -> List[AppointmentBlock]:
+        models = [
+            AppointmentBlockModel(
+                availability_id=availability.id,
+                doctor_id=availability.doctor_id,
+                block_number=number,
+                start_at=start,
+                end_at=end,
+                is_booked=False,
+            )
+            for number, (start, end) in enumerate(slots, start=1)
+        ]
+        self._session.add_all(models)
+        self._session.flush()
+        return [_block_to_schema(model) for model in models]
+
+    def get(self, block_id: int) -> Optional[AppointmentBlock]:
+        model = self._session.get(AppointmentBlockModel, block_id)
+        return _block_to_schema(model) if model else None
+
+    def list_by_availability(self, availability_id: int) -> List[AppointmentBlock]:
+        return self.list_for_availabilities([availability_id]).get(availability_id, [])
+
+    def list_for_availabilities(self, availability_ids: Iterable[int]) -> Dict[int, List[AppointmentBlock]]:
+        """Blocks of every availability in one query, each list by start time."""
+        ids = list(availability_ids)
+        blocks: Dict[int, List[AppointmentBlock]] = {availability_id: [] for availability_id in ids}
+        if not ids:
+            return blocks
+        models = self._session.scalars(
+            select(AppointmentBlockModel)
+            .where(AppointmentBlockModel.availability_id.in_(ids))
+            .order_by(AppointmentBlockModel.start_at, AppointmentBlockModel.id)
+        )
+        for model in models:
+            blocks[model.availability_id].append(_block_to_schema(model))
+        return blocks
+
+    def list_free(self, doctor_id: int, start: datetime, end: datetime) -> List[AppointmentBlock]:
+        models = self._session.scalars(
+            _AVAILABLE_BLOCKS_STMT,
+            {"doctor_id": doctor_id, "start": start, "end": end},
+        )
+        return [_block_to_schema(model) for model in models]
+
+    def find_free(self, availability_id: int, start: datetime, end: datetime) -> Optional[AppointmentBlock]:
+        model = self._session.scalars(
+            _FREE_BLOCK_STMT,
+            {"availability_id": availability_id, "start": start, "end": end},
+        ).first()
+        return _block_to_schema(model) if model else None
+
+    def save(self, block: AppointmentBlock) -> AppointmentBlock:
+        # Blocks only move between availabilities of the same doctor
+        model = self._session.get(AppointmentBlockModel, block.id)
+        _assign(
+            model,
+            block.model_dump(include={"availability_id", "block_number", "start_at", "end_at", "is_booked"}),
+        )
+        self._session.flush()
+        return _block_to_schema(model)
+
+    def delete(self, block_id: int) -> None:
+        model = self._session.get(AppointmentBlockModel, block_id)
+        if model is not None:
+            self._session.delete(model)
+            self._session.flush()
+
+
+class SqlAlchemyAppointmentStore(AppointmentStore):
+    """The database-backed repositories, sharing one session."""
+
+    def __init__(self, session: Session) -> None:
+        self.appointments = SqlAlchemyAppointmentRepository(session)
+        self.availability = SqlAlchemyAvailabilityRepository(session)
+        self.blocks = SqlAlchemyAppointmentBlockRepository(session)
+
+
+def _assign(model: Any, values: dict[str, Any]) -> None:
+    """Set only the attributes that change, so unchanged ones stay out of the flush."""
+    for name, value in values.items():
+        current = getattr(model, name)
+        if isinstance(value, datetime) and isinstance(current, datetime):
+            if _utc(value) == _utc(current):
+                continue
+        elif value == current:
+            continue
+        setattr(model, name, value)
+
+
+def _appointment_to_schema(model: AppointmentModel | ArchivedAppointment) -> Appointment:
+    return Appointment(
+        id=model.id,
+        doctor_id=model.doctor_id,
+        patient_id=model.patient_id,
+        start_at=_utc(model.start_at),
+        end_at=_utc(model.end_at),
+        notes=model.notes,
+        status=model.status,
+    )
+
+
+def _availability_to_schema(model: AvailabilityModel) -> Availability:
+    return Availability(
+        id=model.id,
+        doctor_id=model.doctor_id,
+        start_at=_utc(model.start_at),
+        end_at=_utc(model.end_at),
+    )
+
+
+def _block_to_schema(model: AppointmentBlockModel) -> AppointmentBlock:
+    return AppointmentBlock(
+        id=model.id,
+        availability_id=model.availability_id,
+        block_number=model.block_number,
+        start_at=_utc(model.start_at),
+        end_at=_utc(model.end_at),
+        is_booked=model.is_booked,
+    )
+
+
+__all__ = [
+    "SqlAlchemyAppointmentBlockRepository",
+    "SqlAlchemyAppointmentRepository",
+    "SqlAlchemyAppointmentStore",
+    "SqlAlchemyAvailabilityRepository",
+]
@@ -1,73 +1,127 @@
+from datetime import date
+from typing import Optional
+
 from fastapi import APIRouter, HTTPException, Query
 
+from app.api.dependencies import UnitOfWorkDep
 from app.controllers.admins import (
     create_admin,
     delete_admin,
     get_admin,
     get_admin_dashboard_summary,
+    get_appointment_analytics,
+    get_utilization_report,
     list_admins,
     list_admins_paginated,
     login_admin,
+    refresh_utilization,
     update_admin,
 )
+from app.models.enums import AppointmentStatus
 from app.schemas.admin_dashboard import AdminDashboardSummary
+from app.schemas.analytics import AppointmentAnalytics, Granularity
 from app.schemas.auth import AdminLoginResponse, LoginRequest
 from app.schemas.pagination import PaginatedResponse
 from app.schemas.user import Admin, AdminCreate, AdminUpdate
+from app.schemas.utilization import DoctorUtilization, UtilizationRefresh
 
 
 router = APIRouter()
 
 
 @router.get("/", response_model=list[Admin])
-def route_list_admins():
-    return list_admins()
+def route_list_admins(uow: UnitOfWorkDep):
+    return list_admins(uow)
 
 
 @router.get("/paginated", response_model=PaginatedResponse[Admin])
 def route_list_admins_paginated(
+    uow: UnitOfWorkDep,
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(10, ge=1, le=100, description="Items per page")
 ):
-    return list_admins_paginated(page=page, size=size)
+    return list_admins_paginated(uow, page=page, size=size)
 
 
 @router.get("/dashboard/summary", response_model=AdminDashboardSummary)
-def route_get_admin_dashboard_summary():
-    return get_admin_dashboard_summary()
+def route_get_admin_dashboard_summary(uow: UnitOfWorkDep):
+    return get_admin_dashboard_summary(uow)
+
+
+@router.get("/analytics/appointments", response_model=AppointmentAnalytics)
+def route_get_appointment_analytics(
+    uow: UnitOfWorkDep,
+    start_date: date,
+    end_date: date,
+    granularity: Granularity = "day",
+    doctor_id: Optional[int] = None,
+    office_id: Optional[int] = None,
+    status: Optional[AppointmentStatus] = None,
+):
+    try:
+        return get_appointment_analytics(
+            uow,
+            start_date,
+            end_date,
+            granularity=granularity,
+            doctor_id=doctor_id,
+            office_id=office_id,
+            status=status,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@router.get("/reports/utilization", response_model=list[DoctorUtilization])
+def route_get_utilization_report(
+    uow: UnitOfWorkDep,
+    start_date: date,
+    end_date: date,
+    doctor_id: Optional[int] = None,
+    office_id: Optional[int] = None,
+):
+    try:
+        return get_utilization_report(uow, start_date, end_date, doctor_id=doctor_id, office_id=office_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@router.post("/reports/utilization/refresh", response_model=UtilizationRefresh)
+def route_refresh_utilization(uow: UnitOfWorkDep):
+    return refresh_utilization(uow)
 
 
 @router.get("/{admin_id}", response_model=Admin)
-def route_get_admin(admin_id: int):
-    data = get_admin(admin_id)
+def route_get_admin(uow: UnitOfWorkDep, admin_id: int):
+    data = get_admin(uow, admin_id)
     if not data:
         raise HTTPException(status_code=404, detail="Admin not found")
     return data
 
 
 @router.post("/login", response_model=AdminLoginResponse)
-def route_login_admin(data: LoginRequest):
-    response = login_admin(data)
+def route_login_admin(uow: UnitOfWorkDep, data: LoginRequest):
+    response = login_admin(uow, data)
     if not response:
         raise HTTPException(status_code=401, detail="Invalid credentials")
     return response
 
 
 @router.post("/", response_model=Admin, status_code=201)
-def route_create_admin(data: AdminCreate):
-    return create_admin(data)
+def route_create_admin(uow: UnitOfWorkDep, data: AdminCreate):
+    return create_admin(uow, data)
 
 
 @router.put("/{admin_id}", response_model=Admin)
-def route_update_admin(admin_id: int, data: AdminUpdate):
-    item = update_admin(admin_id, data)
+def route_update_admin(uow: UnitOfWorkDep, admin_id: int, data: AdminUpdate):
+    item = update_admin(uow, admin_id, data)
     if not item:
         raise HTTPException(status_code=404, detail="Admin not found")
     return item
 
 
 @router.delete("/{admin_id}", status_code=204)
-def route_delete_admin(admin_id: int):
-    ok = delete_admin(admin_id)
+def route_delete_admin(uow: UnitOfWorkDep, admin_id: int):
+    ok = delete_admin(uow, admin_id)
     if not ok:
         raise HTTPException(status_code=404, detail="Admin not found")
@@ -3,6 +3,7 @@ from typing import Optional
 
 from fastapi import APIRouter, HTTPException
 
+from app.api.dependencies import UnitOfWorkDep
 from app.controllers.appointments import (
     book_appointment,
     cancel_appointment,
@@ -31,9 +32,9 @@ router = APIRouter()
 
 
 @router.get("/patients/{patient_id}", response_model=list[Appointment])
-def route_list_patient_appointments(patient_id: int):
+def route_list_patient_appointments(uow: UnitOfWorkDep, patient_id: int, include_archived: bool = False):
     try:
-        return list_patient_appointments(patient_id)
+        return list_patient_appointments(uow, patient_id, include_archived)
     except HTTPException:
         raise
     except Exception as exc:  # pragma: no cover - defensive
@@ -42,15 +43,17 @@ def route_list_patient_appointments(patient_id: int):
 
 @router.get("/patients/{patient_id}/filtered", response_model=list[Appointment])
 def route_list_patient_appointments_filtered(
+    uow: UnitOfWorkDep,
     patient_id: int,
     start_date: Optional[str] = None,
-    end_date: Optional[str] = None
+    end_date: Optional[str] = None,
+    include_archived: bool = False,
 ):
     try:
         start_dt = datetime.fromisoformat(start_date) if start_date else None
         end_dt = datetime.fromisoformat(end_date) if end_date else None
         
-        return list_patient_appointments_filtered(patient_id, start_dt, end_dt)
+        return list_patient_appointments_filtered(uow, patient_id, start_dt, end_dt, include_archived)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail="Invalid date format. Use ISO format: YYYY-MM-DDTHH:MM:SS") from exc
     except Exception as exc:  # pragma: no cover - defensive
@@ -58,55 +61,61 @@ def route_list_patient_appointments_filtered(
 
 
 @router.get("/doctors/{doctor_id}", response_model=list[Appointment])
-def route_list_doctor_appointments(doctor_id: int):
-    return list_doctor_appointments(doctor_id)
+def route_list_doctor_appointments(uow: UnitOfWorkDep, doctor_id: int, include_archived: bool = False):
+    return list_doctor_appointments(uow, doctor_id, include_archived)
 
 
 @router.post("/", response_model=Appointment, status_code=201)
-def route_book_appointment(data: AppointmentCreate):
-    return book_appointment(data)
+def route_book_appointment(uow: UnitOfWorkDep, data: AppointmentCreate):
+    return book_appointment(uow, data)
 
 
 @router.post("/{appointment_id}/cancel", response_model=Appointment)
-def route_cancel_appointment(appointment_id: int):
-    return cancel_appointment(appointment_id)
+def route_cancel_appointment(uow: UnitOfWorkDep, appointment_id: int):
+    return cancel_appointment(uow, appointment_id)
 
 
 @router.post("/{appointment_id}/confirm", response_model=Appointment)
-def route_confirm_appointment(appointment_id: int):
-    return confirm_appointment(appointment_id)
+def route_confirm_appointment(uow: UnitOfWorkDep, appointment_id: int):
+    return confirm_appointment(uow, appointment_id)
 
 
 @router.post("/{appointment_id}/complete", response_model=Appointment)
-def route_complete_appointment(appointment_id: int):
-    return complete_appointment(appointment_id)
+def route_complete_appointment(uow: UnitOfWorkDep, appointment_id: int):
+    return complete_appointment(uow, appointment_id)
 
 
 @router.get("/doctor/{doctor_id}/availability", response_model=list[Availability])
-def route_list_doctor_availability(doctor_id: int):
-    return list_availability(doctor_id)
+def route_list_doctor_availability(
+    uow: UnitOfWorkDep,
+    doctor_id: int,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+):
+    """List availabilities overlapping the window; ``start_date`` defaults to now."""
+    return list_availability(uow, doctor_id, start_date, end_date)
 
 
 @router.post("/availability", response_model=Availability, status_code=201)
-def route_create_availability(data: AvailabilityCreate):
-    return create_availability(data)
+def route_create_availability(uow: UnitOfWorkDep, data: AvailabilityCreate):
+    return create_availability(uow, data)
 
 
 @router.patch("/availability/{availability_id}", response_model=Availability)
-def route_update_availability(availability_id: int, data: AvailabilityUpdate):
-    return update_availability(availability_id, data)
+def route_update_availability(uow: UnitOfWorkDep, availability_id: int, data: AvailabilityUpdate):
+    return update_availability(uow, availability_id, data)
 
 
 @router.delete("/availability/{availability_id}", status_code=204)
-def route_delete_availability(availability_id: int):
-    delete_availability(availability_id)
+def route_delete_availability(uow: UnitOfWorkDep, availability_id: int):
+    delete_availability(uow, availability_id)
 
 
 @router.delete("/availability/{availability_id}/unbooked", status_code=204)
-def route_delete_unbooked_blocks(availability_id: int):
+def route_delete_unbooked_blocks(uow: UnitOfWorkDep, availability_id: int):
     """Delete only unbooked blocks for an availability. If none remain, availability is removed."""
     try:
-        delete_unbooked_blocks(availability_id)
+        delete_unbooked_blocks(uow, availability_id)
     except HTTPException:
         raise
     except Exception as exc:  # pragma: no cover - defensive
@@ -114,6 +123,6 @@ def route_delete_unbooked_blocks(availability_id: int):
 
 
 @router.delete("/blocks/{block_id}", status_code=204)
-def route_delete_appointment_block(block_id: int):
+def route_delete_appointment_block(uow: UnitOfWorkDep, block_id: int):
     """Delete a specific appointment block."""
-    delete_appointment_block(block_id)
+    delete_appointment_block(uow, block_id)
@@ -1,18 +1,27 @@
+from datetime import datetime
+from typing import Optional
+
 from fastapi import APIRouter, HTTPException, Query
 
+from app.api.dependencies import UnitOfWorkDep
 from app.controllers.doctors import (
     create_doctor,
     delete_doctor,
+    doctor_exists,
     get_doctor,
+    get_doctor_directory,
     get_doctor_patients,
     get_doctor_patients_paginated,
     login_doctor,
+    provision_doctors,
     list_doctors,
     list_doctors_paginated,
     update_doctor,
 )
 from app.controllers.appointments import get_doctor_availability, get_available_blocks
 from app.schemas.auth import DoctorLoginResponse, LoginRequest
+from app.schemas.doctor_directory import DoctorDirectory
+from app.schemas.doctor_provisioning import DoctorProvisioningReport, DoctorProvisioningRequest
 from app.schemas.pagination import PaginatedResponse
 from app.schemas.user import Doctor, DoctorCreate, DoctorUpdate, Patient
 from app.schemas.appointment import AppointmentBlock
@@ -22,71 +31,101 @@ router = APIRouter()
 
 
 @router.get("/", response_model=list[Doctor])
-def route_list_doctors():
-    return list_doctors()
+def route_list_doctors(uow: UnitOfWorkDep):
+    return list_doctors(uow)
 
 
 @router.get("/paginated", response_model=PaginatedResponse[Doctor])
 def route_list_doctors_paginated(
+    uow: UnitOfWorkDep,
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(10, ge=1, le=100, description="Items per page")
 ):
-    return list_doctors_paginated(page=page, size=size)
+    return list_doctors_paginated(uow, page=page, size=size)
+
+
+@router.get("/directory", response_model=DoctorDirectory)
+def route_get_doctor_directory(
+    uow: UnitOfWorkDep,
+    specialty: Optional[str] = Query(None, description="Exact specialty"),
+    office_id: Optional[int] = Query(None, description="Office the doctor works at"),
+    is_active: Optional[bool] = Query(None, description="Only active (true) or inactive (false) doctors"),
+    page: int = Query(1, ge=1, description="Page number"),
+    size: int = Query(20, ge=1, le=100, description="Items per page"),
+):
+    """One page of matching doctors plus per-specialty and per-office counts."""
+    return get_doctor_directory(
+        uow, specialty=specialty, office_id=office_id, is_active=is_active, page=page, size=size
+    )
 
 
 @router.get("/{doctor_id}", response_model=Doctor)
-def route_get_doctor(doctor_id: int):
-    data = get_doctor(doctor_id)
+def route_get_doctor(uow: UnitOfWorkDep, doctor_id: int):
+    data = get_doctor(uow, doctor_id)
     if not data:
         raise HTTPException(status_code=404, detail="Doctor not found")
     return data
 
 
 @router.post("/login", response_model=DoctorLoginResponse)
-def route_login_doctor(data: LoginRequest):
-    response = login_doctor(data)
+def route_login_doctor(uow: UnitOfWorkDep, data: LoginRequest):
+    response = login_doctor(uow, data)
     if not response:
         raise HTTPException(status_code=401, detail="Invalid credentials")
     return response
 
 
 @router.post("/", response_model=Doctor, status_code=201)
-def route_create_doctor(data: DoctorCreate):
-    return create_doctor(data)
+def route_create_doctor(uow: UnitOfWorkDep, data: DoctorCreate):
+    return create_doctor(uow, data)
+
+
+@router.post("/batch", response_model=DoctorProvisioningReport, status_code=201)
+def route_provision_doctors(uow: UnitOfWorkDep, data: DoctorProvisioningRequest):
+    """Create many doctors, and optionally their weekly availability, in one transaction.
+
+    Nothing is written unless every entry is valid; the 400 response lists
+    each rejected entry.
+    """
+    try:
+        return provision_doctors(uow, data)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
 @router.put("/{doctor_id}", response_model=Doctor)
-def route_update_doctor(doctor_id: int, data: DoctorUpdate):
-    item = update_doctor(doctor_id, data)
+def route_update_doctor(uow: UnitOfWorkDep, doctor_id: int, data: DoctorUpdate):
+    item = update_doctor(uow, doctor_id, data)
     if not item:
         raise HTTPException(status_code=404, detail="Doctor not found")
     return item
 
 
 @router.get("/{doctor_id}/patients", response_model=list[Patient])
-def route_get_doctor_patients(doctor_id: int):
-    patients = get_doctor_patients(doctor_id)
-    if not patients and get_doctor(doctor_id) is None:
+def route_get_doctor_patients(uow: UnitOfWorkDep, doctor_id: int):
+    patients = get_doctor_patients(uow, doctor_id)
+    if not patients and not doctor_exists(uow, doctor_id):
         raise HTTPException(status_code=404, detail="Doctor not found")
     return patients
 
 
 @router.get("/{doctor_id}/patients/paginated", response_model=PaginatedResponse[Patient])
 def route_get_doctor_patients_paginated(
+    uow: UnitOfWorkDep,
     doctor_id: int,
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(10, ge=1, le=100, description="Items per page")
 ):
-    patients = get_doctor_patients_paginated(doctor_id, page=page, size=size)
-    if not patients.items and get_doctor(doctor_id) is None:
+    patients = get_doctor_patients_paginated(uow, doctor_id, page=page, size=size)
+    if not patients.items and not doctor_exists(uow, doctor_id):
         raise HTTPException(status_code=404, detail="Doctor not found")
     return patients
 
 
 @router.delete("/{doctor_id}", status_code=204)
-def route_delete_doctor(doctor_id: int):
+def route_delete_doctor(uow: UnitOfWorkDep, doctor_id: int):
     try:
-        ok = delete_doctor(doctor_id)
+        ok = delete_doctor(uow, doctor_id)
         if not ok:
             raise HTTPException(status_code=404, detail="Doctor not found")
     except ValueError as e:
@@ -94,13 +133,19 @@ def route_delete_doctor(doctor_id: int):
 
 
 @router.get("/{doctor_id}/availability")
-def route_get_doctor_availability(doctor_id: int):
-    """Get doctor's availability with blocks."""
-    return get_doctor_availability(doctor_id)
+def route_get_doctor_availability(
+    uow: UnitOfWorkDep,
+    doctor_id: int,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+):
+    """Get doctor's availability with blocks; past availabilities need an explicit ``start_date``."""
+    return get_doctor_availability(uow, doctor_id, start_date, end_date)
 
 
 @router.get("/{doctor_id}/available-blocks")
 def route_get_available_blocks(
+    uow: UnitOfWorkDep,
     doctor_id: int,
     start_date: str,
     end_date: str
@@ -136,7 +181,7 @@ def route_get_available_blocks(
         if start >= end:
             raise HTTPException(status_code=400, detail="Start date must be before end date")
             
-        return get_available_blocks(doctor_id, start, end)
+        return get_available_blocks(uow, doctor_id, start, end)
     except ValueError as e:
         logger.error(f"Date parsing error: {e}")
         raise HTTPException(status_code=400, detail=f"Invalid date format: {str(e)}") from e
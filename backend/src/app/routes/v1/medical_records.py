@@ -1,51 +1,105 @@
-from fastapi import APIRouter, HTTPException
+from typing import Optional
 
+from fastapi import APIRouter, HTTPException, Query
+
+from app.api.dependencies import UnitOfWorkDep
 from app.controllers.medical_records import (
     create_medical_record,
     get_medical_record,
     get_patient_medical_history,
+    get_patient_medical_history_paginated,
     list_doctor_records,
+    list_doctor_records_paginated,
     list_patient_records,
+    list_patient_records_paginated,
+    search_medical_records,
     update_medical_record,
 )
 from app.schemas.medical_record import (
     MedicalRecord,
     MedicalRecordCreate,
+    MedicalRecordSearchPage,
+    MedicalRecordSummary,
     MedicalRecordUpdate,
 )
+from app.schemas.pagination import PaginatedResponse
 
 
 router = APIRouter()
 
 
 @router.get("/patients/{patient_id}", response_model=list[MedicalRecord])
-def route_list_patient_records(patient_id: int):
-    return list_patient_records(patient_id)
+def route_list_patient_records(uow: UnitOfWorkDep, patient_id: int):
+    return list_patient_records(uow, patient_id)
+
+
+@router.get("/patients/{patient_id}/paginated", response_model=PaginatedResponse[MedicalRecordSummary])
+def route_list_patient_records_paginated(
+    uow: UnitOfWorkDep,
+    patient_id: int,
+    page: int = Query(1, ge=1, description="Page number"),
+    size: int = Query(10, ge=1, le=100, description="Items per page")
+):
+    return list_patient_records_paginated(uow, patient_id, page=page, size=size)
 
 
 @router.get("/doctors/{doctor_id}", response_model=list[MedicalRecord])
-def route_list_doctor_records(doctor_id: int):
-    return list_doctor_records(doctor_id)
+def route_list_doctor_records(uow: UnitOfWorkDep, doctor_id: int):
+    return list_doctor_records(uow, doctor_id)
+
+
+@router.get("/doctors/{doctor_id}/paginated", response_model=PaginatedResponse[MedicalRecordSummary])
+def route_list_doctor_records_paginated(
+    uow: UnitOfWorkDep,
+    doctor_id: int,
+    page: int = Query(1, ge=1, description="Page number"),
+    size: int = Query(10, ge=1, le=100, description="Items per page")
+):
+    return list_doctor_records_paginated(uow, doctor_id, page=page, size=size)
 
 
 @router.get("/patients/{patient_id}/history", response_model=list[MedicalRecord])
-def route_get_patient_medical_history(patient_id: int):
-    return get_patient_medical_history(patient_id)
+def route_get_patient_medical_history(uow: UnitOfWorkDep, patient_id: int):
+    return get_patient_medical_history(uow, patient_id)
+
+
+@router.get("/patients/{patient_id}/history/paginated", response_model=PaginatedResponse[MedicalRecordSummary])
+def route_get_patient_medical_history_paginated(
+    uow: UnitOfWorkDep,
+    patient_id: int,
+    page: int = Query(1, ge=1, description="Page number"),
+    size: int = Query(10, ge=1, le=100, description="Items per page")
+):
+    return get_patient_medical_history_paginated(uow, patient_id, page=page, size=size)
+
+
+@router.get("/search", response_model=MedicalRecordSearchPage)
+def route_search_medical_records(
+    uow: UnitOfWorkDep,
+    q: str = Query(..., min_length=1, max_length=200, description="Words to find in diagnosis, treatment or notes"),
+    doctor_id: Optional[int] = None,
+    patient_id: Optional[int] = None,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+):
+    return search_medical_records(
+        uow, q, doctor_id=doctor_id, patient_id=patient_id, limit=limit, cursor=cursor
+    )
 
 
 @router.get("/{record_id}", response_model=MedicalRecord)
-def route_get_medical_record(record_id: int):
+def route_get_medical_record(uow: UnitOfWorkDep, record_id: int):
     try:
-        return get_medical_record(record_id)
+        return get_medical_record(uow, record_id)
     except HTTPException:
         raise
 
 
 @router.post("/", response_model=MedicalRecord, status_code=201)
-def route_create_medical_record(data: MedicalRecordCreate):
-    return create_medical_record(data)
+def route_create_medical_record(uow: UnitOfWorkDep, data: MedicalRecordCreate):
+    return create_medical_record(uow, data)
 
 
 @router.patch("/{record_id}", response_model=MedicalRecord)
-def route_update_medical_record(record_id: int, data: MedicalRecordUpdate):
-    return update_medical_record(record_id, data)
+def route_update_medical_record(uow: UnitOfWorkDep, record_id: int, data: MedicalRecordUpdate):
+    return update_medical_record(uow, record_id, data)
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, HTTPException
 
+from app.api.dependencies import UnitOfWorkDep
 from app.controllers.offices import (
     create_office,
     delete_office,
@@ -14,35 +15,35 @@ router = APIRouter()
 
 
 @router.get("/", response_model=list[Office])
-def route_list_offices():
-    return list_offices()
+def route_list_offices(uow: UnitOfWorkDep):
+    return list_offices(uow)
 
 
 @router.get("/{office_id}", response_model=Office)
-def route_get_office(office_id: int):
-    data = get_office(office_id)
+def route_get_office(uow: UnitOfWorkDep, office_id: int):
+    data = get_office(uow, office_id)
     if not data:
         raise HTTPException(status_code=404, detail="Office not found")
     return data
 
 
 @router.post("/", response_model=Office, status_code=201)
-def route_create_office(data: OfficeCreate):
-    return create_office(data)
+def route_create_office(uow: UnitOfWorkDep, data: OfficeCreate):
+    return create_office(uow, data)
 
 
 @router.put("/{office_id}", response_model=Office)
-def route_update_office(office_id: int, data: OfficeUpdate):
-    item = update_office(office_id, data)
+def route_update_office(uow: UnitOfWorkDep, office_id: int, data: OfficeUpdate):
+    item = update_office(uow, office_id, data)
     if not item:
         raise HTTPException(status_code=404, detail="Office not found")
     return item
 
 
 @router.delete("/{office_id}", status_code=204)
-def route_delete_office(office_id: int):
+def route_delete_office(uow: UnitOfWorkDep, office_id: int):
     try:
-        ok = delete_office(office_id)
+        ok = delete_office(uow, office_id)
         if not ok:
             raise HTTPException(status_code=404, detail="Office not found")
     except ValueError as e:
@@ -1,14 +1,18 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Body, HTTPException, Query
 
+from app.api.dependencies import UnitOfWorkDep
 from app.controllers.patients import (
     create_patient,
     delete_patient,
     get_patient,
+    import_patients,
     list_patients,
     list_patients_paginated,
+    search_patients,
     update_patient,
 )
 from app.schemas.pagination import PaginatedResponse
+from app.schemas.patient_import import PatientImportReport
 from app.schemas.user import Patient, PatientCreate, PatientUpdate
 
 
@@ -16,30 +20,59 @@ router = APIRouter()
 
 
 @router.get("/", response_model=list[Patient])
-def route_list_patients():
-    return list_patients()
+def route_list_patients(uow: UnitOfWorkDep):
+    return list_patients(uow)
 
 
 @router.get("/paginated", response_model=PaginatedResponse[Patient])
 def route_list_patients_paginated(
+    uow: UnitOfWorkDep,
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(10, ge=1, le=100, description="Items per page")
 ):
-    return list_patients_paginated(page=page, size=size)
+    return list_patients_paginated(uow, page=page, size=size)
+
+
+@router.get("/search", response_model=list[Patient])
+def route_search_patients(
+    uow: UnitOfWorkDep,
+    q: str = Query(..., min_length=1, max_length=100, description="Part of a name, email or document number"),
+    limit: int = Query(20, ge=1, le=100),
+):
+    try:
+        return search_patients(uow, q, limit=limit)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@router.post("/import", response_model=PatientImportReport)
+def route_import_patients(
+    uow: UnitOfWorkDep,
+    csv_text: str = Body(..., media_type="text/csv", description="CSV with a header row of patient fields"),
+):
+    """Create patients from a CSV body in one transaction; rejected rows are listed by line.
+
+    Large imports are better run with ``scripts/import_patients.py``, which
+    commits chunk by chunk.
+    """
+    try:
+        return import_patients(uow, csv_text)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
 @router.get("/{patient_id}", response_model=Patient)
-def route_get_patient(patient_id: int):
-    data = get_patient(patient_id)
+def route_get_patient(uow: UnitOfWorkDep, patient_id: int):
+    data = get_patient(uow, patient_id)
     if not data:
         raise HTTPException(status_code=404, detail="Patient not found")
     return data
 
 
 @router.post("/", response_model=Patient, status_code=201)
-def route_create_patient(data: PatientCreate):
+def route_create_patient(uow: UnitOfWorkDep, data: PatientCreate):
     try:
-        return create_patient(data)
+        return create_patient(uow, data)
     except ValueError as exc:
         detail = str(exc)
         status = 409 if "Email already in use" in detail else 400
@@ -47,15 +80,15 @@ def route_create_patient(data: PatientCreate):
 
 
 @router.put("/{patient_id}", response_model=Patient)
-def route_update_patient(patient_id: int, data: PatientUpdate):
-    item = update_patient(patient_id, data)
+def route_update_patient(uow: UnitOfWorkDep, patient_id: int, data: PatientUpdate):
+    item = update_patient(uow, patient_id, data)
     if not item:
         raise HTTPException(status_code=404, detail="Patient not found")
     return item
 
 
 @router.delete("/{patient_id}", status_code=204)
-def route_delete_patient(patient_id: int):
-    ok = delete_patient(patient_id)
+def route_delete_patient(uow: UnitOfWorkDep, patient_id: int):
+    ok = delete_patient(uow, patient_id)
     if not ok:
         raise HTTPException(status_code=404, detail="Patient not found")
@@ -3,14 +3,12 @@ from __future__ import annotations
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
 
 from app.controllers.system_settings import (
     get_block_duration,
     get_settings,
     update_block_duration,
 )
-from app.db.broker import get_dbbroker
 from app.schemas.system_settings import SystemSetting, SystemSettingUpdate
 
 router = APIRouter()
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, HTTPException, Query
 
+from app.api.dependencies import UnitOfWorkDep
 from app.controllers.users import (
     create_user,
     delete_user,
@@ -18,38 +19,39 @@ router = APIRouter()
 
 
 @router.get("/", response_model=list[User])
-def route_list_users():
-    return list_users()
+def route_list_users(uow: UnitOfWorkDep):
+    return list_users(uow)
 
 
 @router.get("/paginated", response_model=PaginatedResponse[User])
 def route_list_users_paginated(
+    uow: UnitOfWorkDep,
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(10, ge=1, le=100, description="Items per page")
 ):
-    return list_users_paginated(page=page, size=size)
+    return list_users_paginated(uow, page=page, size=size)
 
 
 @router.get("/{user_id}", response_model=User)
-def route_get_user(user_id: int):
-    user = get_user(user_id)
+def route_get_user(uow: UnitOfWorkDep, user_id: int):
+    user = get_user(uow, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return user
 
 
 @router.post("/login", response_model=UserLoginResponse)
-def route_login_user(data: LoginRequest):
-    response = login_user(data)
+def route_login_user(uow: UnitOfWorkDep, data: LoginRequest):
+    response = login_user(uow, data)
     if not response:
         raise HTTPException(status_code=401, detail="Invalid credentials")
     return response
 
 
 @router.post("/", response_model=User, status_code=201)
-def route_create_user(data: UserCreate):
+def route_create_user(uow: UnitOfWorkDep, data: UserCreate):
     try:
-        return create_user(data)
+        return create_user(uow, data)
     except ValueError as exc:
         detail = str(exc)
         status = 409 if "Email already in use" in detail else 400
@@ -57,15 +59,15 @@ def route_create_user(data: UserCreate):
 
 
 @router.put("/{user_id}", response_model=User)
-def route_update_user(user_id: int, data: UserUpdate):
-    user = update_user(user_id, data)
+def route_update_user(uow: UnitOfWorkDep, user_id: int, data: UserUpdate):
+    user = update_user(uow, user_id, data)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return user
 
 
 @router.delete("/{user_id}", status_code=204)
-def route_delete_user(user_id: int):
-    ok = delete_user(user_id)
+def route_delete_user(uow: UnitOfWorkDep, user_id: int):
+    ok = delete_user(uow, user_id)
     if not ok:
         raise HTTPException(status_code=404, detail="User not found")
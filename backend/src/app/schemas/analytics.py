@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Literal, Optional
+
+from pydantic import BaseModel
+
+from app.models.enums import AppointmentStatus
+
+
+Granularity = Literal["day", "week"]
+
+
+class AppointmentBucket(BaseModel):
+    bucket_start: date
+    status: AppointmentStatus
+    doctor_id: int
+    office_id: Optional[int] = None
+    count: int
+
+
+class AppointmentAnalytics(BaseModel):
+    granularity: Granularity
+    start_date: date
+    end_date: date
+    buckets: list[AppointmentBucket]
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "granularity": "week",
+                "start_date": "2026-09-01",
+                "end_date": "2026-09-30",
+                "buckets": [
+                    {
+                        "bucket_start": "2026-08-31",
+                        "status": "completed",
+                        "doctor_id": 3,
+                        "office_id": 1,
+                        "count": 12,
+                    }
+                ],
+            }
+        }
+    }
+
+
+__all__ = ["AppointmentAnalytics", "AppointmentBucket", "Granularity"]
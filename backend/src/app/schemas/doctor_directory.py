@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+from app.schemas.pagination import PaginatedResponse
+
+
+class DirectoryDoctor(BaseModel):
+    id: int
+    full_name: Optional[str] = None
+    specialty: Optional[str] = None
+    office_id: Optional[int] = None
+    years_experience: int = 0
+    is_active: bool
+
+
+class SpecialtyFacet(BaseModel):
+    specialty: Optional[str] = None
+    count: int
+
+
+class OfficeFacet(BaseModel):
+    office_id: Optional[int] = None
+    office_name: Optional[str] = None
+    count: int
+
+
+class DirectoryFacets(BaseModel):
+    # Each facet applies every filter except its own, so the counts show what
+    # choosing another value would return
+    specialties: list[SpecialtyFacet]
+    offices: list[OfficeFacet]
+
+
+class DoctorDirectory(BaseModel):
+    doctors: PaginatedResponse[DirectoryDoctor]
+    facets: DirectoryFacets
+
+
+__all__ = ["DirectoryDoctor", "DirectoryFacets", "DoctorDirectory", "OfficeFacet", "SpecialtyFacet"]
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from datetime import date, time
+
+from pydantic import BaseModel, Field, model_validator
+
+from app.schemas.user import Doctor, DoctorCreate
+
+
+class WeeklySlot(BaseModel):
+    # Monday is 0, as in date.weekday(); times are UTC
+    weekday: int = Field(ge=0, le=6)
+    start: time
+    end: time
+
+    @model_validator(mode="after")
+    def _check_order(self) -> "WeeklySlot":
+        if self.end <= self.start:
+            raise ValueError("end must be later than start")
+        return self
+
+
+class DoctorProvision(DoctorCreate):
+    weekly_availability: list[WeeklySlot] = Field(default_factory=list)
+
+
+class DoctorProvisioningRequest(BaseModel):
+    doctors: list[DoctorProvision] = Field(min_length=1, max_length=1000)
+    # Weekly slots are laid out from this date (default: today) for ``weeks`` weeks
+    availability_from: date | None = None
+    weeks: int = Field(4, ge=1, le=52)
+
+
+class DoctorProvisioningReport(BaseModel):
+    doctors: list[Doctor]
+    availabilities: int = 0
+    blocks: int = 0
+
+
+__all__ = ["DoctorProvision", "DoctorProvisioningReport", "DoctorProvisioningRequest", "WeeklySlot"]
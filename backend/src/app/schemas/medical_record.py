@@ -48,4 +48,35 @@ class MedicalRecord(MedicalRecordBase):
     doctor_name: Optional[str] = None
 
 
-__all__ = ["MedicalRecord", "MedicalRecordCreate", "MedicalRecordUpdate"]
+class MedicalRecordSummary(BaseModel):
+    """Timeline entry; the full texts come from ``GET /medical-records/{id}``."""
+
+    id: PositiveInt
+    patient_id: PositiveInt
+    doctor_id: Optional[PositiveInt] = None
+    doctor_name: Optional[str] = None
+    # First characters of the diagnosis, ending in "…" when cut
+    diagnosis_preview: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+
+class MedicalRecordHit(MedicalRecord):
+    # Relevance; higher is better, only comparable within one search
+    score: float
+
+
+class MedicalRecordSearchPage(BaseModel):
+    items: list[MedicalRecordHit]
+    # Pass back as ``cursor`` for the next page; None on the last one
+    next_cursor: Optional[str] = None
+
+
+__all__ = [
+    "MedicalRecord",
+    "MedicalRecordCreate",
+    "MedicalRecordHit",
+    "MedicalRecordSearchPage",
+    "MedicalRecordSummary",
+    "MedicalRecordUpdate",
+]
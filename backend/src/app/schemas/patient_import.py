@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class PatientImportError(BaseModel):
+    # Line of the CSV file (the header is line 1)
+    line: int
+    email: Optional[str] = None
+    message: str
+
+
+class PatientImportReport(BaseModel):
+    created: int = 0
+    failed: int = 0
+    errors: list[PatientImportError] = Field(default_factory=list)
+
+
+__all__ = ["PatientImportError", "PatientImportReport"]
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class DoctorUtilization(BaseModel):
+    period_start: date
+    doctor_id: int
+    office_id: Optional[int] = None
+    offered: int
+    booked: int
+    refilled: int
+    empty_past: int
+    # booked / offered, as a percentage; None when nothing was offered
+    utilization: Optional[float] = None
+    refreshed_at: datetime
+
+
+class UtilizationRefresh(BaseModel):
+    periods: list[date]
+    rows: int
+
+
+__all__ = ["DoctorUtilization", "UtilizationRefresh"]
@@ -1 +1,9 @@
+"""Service layer. Importing it registers the flush hooks that keep the dashboard
+counters, the doctor-patient pairs and the patient search terms current, and
+drop stale doctor directory facets and appointment analytics."""
 
+from app.services import analytics  # noqa: F401
+from app.services import dashboard_counters  # noqa: F401
+from app.services import doctor_directory  # noqa: F401
+from app.services import doctor_patients  # noqa: F401
+from app.services import patient_search  # noqa: F401
@@ -1,67 +1,99 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from typing import Iterator
 
-from sqlalchemy import func, select
+from sqlalchemy import String, cast, delete, func, literal, select
 from sqlalchemy.orm import Session
 
 from app.db.broker import DBBroker, get_dbbroker
 from app.models.appointment import Appointment as AppointmentModel
+from app.models.dashboard_counter import DashboardCounter
 from app.models.enums import AppointmentStatus, UserRole
 from app.models.medical_record import MedicalRecord as MedicalRecordModel
 from app.models.user import User as UserModel
 from app.schemas.admin_dashboard import AdminDashboardSummary
+from app.services.dashboard_counters import (
+    ACTIVE_DOCTORS,
+    APPOINTMENTS_PREFIX,
+    MEDICAL_RECORDS,
+    USERS,
+    appointments_key,
+)
 
 
 class AdminDashboardService:
-    """Aggregate metrics for the admin dashboard."""
+    """Aggregate metrics for the admin dashboard.
+
+    The summary reads pre-aggregated rows from ``dashboard_counters`` (kept
+    current by a flush hook, see ``app.services.dashboard_counters``) instead
+    of counting the underlying tables. ``reconcile`` recounts everything and
+    corrects drift left by writes that bypass the ORM.
+    """
 
     def __init__(self, session: Session | None = None, *, broker: DBBroker | None = None) -> None:
         self._session = session
         self._broker = broker
 
     def get_summary(self) -> AdminDashboardSummary:
+        today = appointments_key(datetime.now(timezone.utc).date())
         with self._session_scope() as session:
-            total_users = session.scalar(
-                select(func.count()).select_from(UserModel)
-            ) or 0
-
-            active_doctors = session.scalar(
-                select(func.count())
-                .select_from(UserModel)
-                .where(
-                    UserModel.role == UserRole.DOCTOR,
-                    UserModel.is_active.is_(True),
-                )
-            ) or 0
-
-            now = datetime.now(timezone.utc)
-            start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            end_of_day = start_of_day + timedelta(days=1)
-
-            appointments_today = session.scalar(
-                select(func.count())
-                .select_from(AppointmentModel)
-                .where(
-                    AppointmentModel.start_at >= start_of_day,
-                    AppointmentModel.start_at < end_of_day,
-                    AppointmentModel.status != AppointmentStatus.CANCELED,
-                )
-            ) or 0
-
-            medical_records = session.scalar(
-                select(func.count()).select_from(MedicalRecordModel)
-            ) or 0
+            counters = dict(
+                session.execute(
+                    select(DashboardCounter.name, DashboardCounter.value).where(
+                        DashboardCounter.name.in_([USERS, ACTIVE_DOCTORS, MEDICAL_RECORDS, today])
+                    )
+                ).all()
+            )
+        return AdminDashboardSummary(
+            total_users=counters.get(USERS, 0),
+            active_doctors=counters.get(ACTIVE_DOCTORS, 0),
+            appointments_today=counters.get(today, 0),
+            medical_records=counters.get(MEDICAL_RECORDS, 0),
+        )
 
-            return AdminDashboardSummary(
-                total_users=total_users,
-                active_doctors=active_doctors,
-                appointments_today=appointments_today,
-                medical_records=medical_records,
+    def reconcile(self) -> dict[str, tuple[int, int]]:
+        """Recount every counter; return ``{name: (stored, actual)}`` for those that drifted."""
+        with self._session_scope() as session:
+            expected = {
+                USERS: session.scalar(select(func.count()).select_from(UserModel)) or 0,
+                ACTIVE_DOCTORS: session.scalar(
+                    select(func.count())
+                    .select_from(UserModel)
+                    .where(UserModel.role == UserRole.DOCTOR, UserModel.is_active.is_(True))
+                ) or 0,
+                MEDICAL_RECORDS: session.scalar(select(func.count()).select_from(MedicalRecordModel)) or 0,
+            }
+            day = cast(func.date(AppointmentModel.start_at), String)
+            expected.update(
+                session.execute(
+                    select(literal(APPOINTMENTS_PREFIX) + day, func.count())
+                    .where(AppointmentModel.status != AppointmentStatus.CANCELED)
+                    .group_by(day)
+                ).all()
             )
 
+            stored = {row.name: row for row in session.scalars(select(DashboardCounter))}
+            corrections: dict[str, tuple[int, int]] = {}
+            for name, value in expected.items():
+                row = stored.pop(name, None)
+                if row is None:
+                    if value:
+                        session.add(DashboardCounter(name=name, value=value))
+                        corrections[name] = (0, value)
+                elif row.value != value:
+                    corrections[name] = (row.value, value)
+                    row.value = value
+            # Buckets whose rows are all gone (canceled, deleted or archived)
+            stale = [name for name, row in stored.items() if row.value]
+            for name in stale:
+                corrections[name] = (stored[name].value, 0)
+            if stored:
+                session.execute(delete(DashboardCounter).where(DashboardCounter.name.in_(list(stored))))
+            session.flush()
+            return corrections
+
     @contextmanager
     def _session_scope(self) -> Iterator[Session]:
         if self._session is not None:
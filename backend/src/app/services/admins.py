@@ -3,7 +3,7 @@ from __future__ import annotations
 from contextlib import contextmanager
 from typing import Iterator
 
-from sqlalchemy import select, func
+from sqlalchemy import bindparam, select, func
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload
 
@@ -16,6 +16,15 @@ from app.schemas.user import Admin, AdminCreate, AdminUpdate
 from app.utils.security import hash_password, verify_password
 
 
+# Built once at import; login only binds the email.
+_AUTHENTICATE_STMT = (
+    select(AdminModel)
+    .join(AdminModel.user)
+    .options(joinedload(AdminModel.user))
+    .where(UserModel.email == bindparam("email"))
+)
+
+
 class AdminsService:
     """Service layer backed by the relational database for administrators."""
 
@@ -127,13 +136,7 @@ class AdminsService:
 
     def authenticate(self, email: str, password: str) -> tuple[Admin, str] | None:
         with self._session_scope() as session:
-            stmt = (
-                select(AdminModel)
-                .join(AdminModel.user)
-                .options(joinedload(AdminModel.user))
-                .where(UserModel.email == email)
-            )
-            admin = session.scalars(stmt).first()
+            admin = session.scalars(_AUTHENTICATE_STMT, {"email": email}).first()
             if not admin or not admin.user or not admin.user.is_active:
                 return None
 
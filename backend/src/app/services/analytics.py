@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Iterable, Iterator, Optional
+
+from sqlalchemy import String, cast, event, func, inspect, select, union_all
+from sqlalchemy.orm import Session
+
+from app.db.broker import DBBroker, get_dbbroker
+from app.models.appointment import Appointment as AppointmentModel
+from app.models.archive import ArchivedAppointment
+from app.models.enums import AppointmentStatus
+from app.schemas.analytics import AppointmentAnalytics, AppointmentBucket, Granularity
+from app.services import cache_versions
+
+
+MAX_RANGE_DAYS = 366
+GRANULARITIES = ("day", "week")
+
+# (status, doctor_id, office_id, count) for one day
+_DayRow = tuple[AppointmentStatus, int, Optional[int], int]
+
+
+class AnalyticsCache:
+    """Process-wide, bounded cache of per-day appointment breakdowns.
+
+    Only days before today (UTC) are stored, each with the ``analytics`` cache
+    version it was counted at. Writes that touch an appointment of a past day
+    (completing yesterday's visit, say) bump that version, so every worker
+    recounts on its next read. Each entry holds the day's full breakdown by
+    status, doctor and office, so every filter combination shares it.
+    """
+
+    def __init__(self, max_days: int = 4096) -> None:
+        self._max_days = max_days
+        self._lock = threading.Lock()
+        self._days: OrderedDict[date, tuple[int, tuple[_DayRow, ...]]] = OrderedDict()
+
+    def get(self, day: date, version: int) -> Optional[tuple[_DayRow, ...]]:
+        with self._lock:
+            entry = self._days.get(day)
+            if entry is None or entry[0] != version:
+                return None
+            self._days.move_to_end(day)
+            return entry[1]
+
+    def put(self, day: date, version: int, rows: Iterable[_DayRow]) -> None:
+        with self._lock:
+            self._days[day] = (version, tuple(rows))
+            self._days.move_to_end(day)
+            while len(self._days) > self._max_days:
+                self._days.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Forget every cached day, e.g. after SQL edits that skip the version bump."""
+        with self._lock:
+            self._days.clear()
+
+
+analytics_cache = AnalyticsCache()
+
+
+def _bucket_start(day: date, granularity: Granularity) -> date:
+    if granularity == "week":
+        # ISO weeks start on Monday
+        return day - timedelta(days=day.weekday())
+    return day
+
+
+class AppointmentAnalyticsService:
+    """Appointment counts per day or week by status, doctor and office.
+
+    Counts come from one ``GROUP BY`` over live and archived appointments,
+    bucketed on the stored date of ``start_at``. Past days are served from
+    ``analytics_cache`` while its version matches the one read in this
+    session; today and later days are recounted on every call, together with
+    any past days missing from the cache, in a single query.
+    """
+
+    def __init__(
+        self,
+        session: Session | None = None,
+        *,
+        broker: DBBroker | None = None,
+        cache: AnalyticsCache | None = None,
+    ) -> None:
+        self._session = session
+        self._broker = broker
+        self._cache = cache or analytics_cache
+
+    def appointments(
+        self,
+        start_date: date,
+        end_date: date,
+        *,
+        granularity: Granularity = "day",
+        doctor_id: Optional[int] = None,
+        office_id: Optional[int] = None,
+        status: Optional[AppointmentStatus] = None,
+    ) -> AppointmentAnalytics:
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"Granularity must be one of: {', '.join(GRANULARITIES)}")
+        if end_date < start_date:
+            raise ValueError("end_date must not be before start_date")
+        if (end_date - start_date).days + 1 > MAX_RANGE_DAYS:
+            raise ValueError(f"Range cannot exceed {MAX_RANGE_DAYS} days")
+
+        counts: dict[tuple, int] = defaultdict(int)
+        for day, rows in self._days(start_date, end_date):
+            bucket = _bucket_start(day, granularity)
+            for row_status, row_doctor_id, row_office_id, count in rows:
+                if status is not None and row_status != status:
+                    continue
+                if doctor_id is not None and row_doctor_id != doctor_id:
+                    continue
+                if office_id is not None and row_office_id != office_id:
+                    continue
+                counts[(bucket, row_status, row_doctor_id, row_office_id)] += count
+
+        buckets = [
+            AppointmentBucket(
+                bucket_start=bucket,
+                status=row_status,
+                doctor_id=row_doctor_id,
+                office_id=row_office_id,
+                count=count,
+            )
+            for (bucket, row_status, row_doctor_id, row_office_id), count in sorted(
+                counts.items(),
+                key=lambda item: (item[0][0], item[0][1].value, item[0][2], item[0][3] or 0),
+            )
+        ]
+        return AppointmentAnalytics(
+            granularity=granularity,
+            start_date=start_date,
+            end_date=end_date,
+            buckets=buckets,
+        )
+
+    # ------------------------------------------------------------------
+    def _days(self, start_date: date, end_date: date) -> Iterator[tuple[date, tuple[_DayRow, ...]]]:
+        """Breakdown of every day in the range, from the cache where possible."""
+        today = datetime.now(timezone.utc).date()
+        days = [start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1)]
+
+        known: dict[date, tuple[_DayRow, ...]] = {}
+        with self._session_scope() as session:
+            # The version and the counts come from the same transaction, so a
+            # reader with an older snapshot files its counts under the older
+            # version. A session with its own uncommitted changes skips the cache.
+            version = (
+                None
+                if cache_versions.pending(session, cache_versions.ANALYTICS)
+                else cache_versions.current(session, cache_versions.ANALYTICS)
+            )
+            pending: list[date] = []
+            for day in days:
+                rows = self._cache.get(day, version) if day < today and version is not None else None
+                if rows is None:
+                    pending.append(day)
+                else:
+                    known[day] = rows
+
+            if pending:
+                fetched = self._fetch(session, pending[0], pending[-1])
+                for day in pending:
+                    rows = tuple(fetched.get(day, ()))
+                    known[day] = rows
+                    if day < today and version is not None:
+                        self._cache.put(day, version, rows)
+
+        for day in days:
+            yield day, known[day]
+
+    @staticmethod
+    def _fetch(session: Session, first: date, last: date) -> dict[date, list[_DayRow]]:
+        low = datetime.combine(first, time.min)
+        high = datetime.combine(last + timedelta(days=1), time.min)
+        sources = [
+            select(model.start_at, model.status, model.doctor_id, model.office_id).where(
+                model.start_at >= low, model.start_at < high
+            )
+            for model in (AppointmentModel, ArchivedAppointment)
+        ]
+        rows = union_all(*sources).subquery()
+        day = cast(func.date(rows.c.start_at), String)
+        stmt = select(day, rows.c.status, rows.c.doctor_id, rows.c.office_id, func.count()).group_by(
+            day, rows.c.status, rows.c.doctor_id, rows.c.office_id
+        )
+
+        fetched: dict[date, list[_DayRow]] = defaultdict(list)
+        for day_value, row_status, row_doctor_id, row_office_id, count in session.execute(stmt):
+            fetched[date.fromisoformat(day_value)].append(
+                (AppointmentStatus(row_status), row_doctor_id, row_office_id, count)
+            )
+        return fetched
+
+    @contextmanager
+    def _session_scope(self) -> Iterator[Session]:
+        if self._session is not None:
+            yield self._session
+        else:
+            broker = self._broker or get_dbbroker()
+            with broker.session() as session:
+                yield session
+
+
+_BREAKDOWN = ("status", "start_at", "doctor_id", "office_id")
+
+
+def _start_days(obj: AppointmentModel) -> set[date]:
+    """Stored dates of the appointment's start, before and after this flush."""
+    history = inspect(obj).attrs.start_at.history
+    return {value.date() for value in (obj.start_at, *history.deleted) if value is not None}
+
+
+def _bump_past_days(session: Session, flush_context) -> None:
+    """Bump the analytics version when this flush changed a past day's breakdown.
+
+    Today and later days are never cached, so bookings for them bump nothing.
+    """
+    today = datetime.now(timezone.utc).date()
+    for obj in (*session.new, *session.deleted, *session.dirty):
+        if not isinstance(obj, AppointmentModel):
+            continue
+        if obj in session.dirty and not any(
+            inspect(obj).attrs[attr].history.has_changes() for attr in _BREAKDOWN
+        ):
+            continue
+        if any(day < today for day in _start_days(obj)):
+            cache_versions.bump(session, cache_versions.ANALYTICS)
+            return
+
+
+event.listen(Session, "after_flush", _bump_past_days)
+
+
+__all__ = [
+    "AnalyticsCache",
+    "AppointmentAnalyticsService",
+    "GRANULARITIES",
+    "MAX_RANGE_DAYS",
+    "analytics_cache",
+]
@@ -1,15 +1,14 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import Optional
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, Optional
 
-from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.models.appointment import Appointment as AppointmentModel
-from app.models.appointment_block import AppointmentBlock as AppointmentBlockModel
-from app.models.availability import Availability as AvailabilityModel
 from app.models.enums import AppointmentStatus
+from app.repositories.appointments import AppointmentStore, apply_availability_update
+from app.repositories.sqlalchemy_appointments import SqlAlchemyAppointmentStore
 from app.schemas.appointment import (
     Appointment,
     AppointmentBlock,
@@ -23,6 +22,9 @@ from app.services.patients import PatientsService
 from app.services.system_settings import SystemSettingsService
 
 
+logger = logging.getLogger(__name__)
+
+
 class AppointmentError(Exception):
     """Base class for appointment-related errors."""
 
@@ -36,197 +38,144 @@ class ValidationError(AppointmentError):
 
 
 class AppointmentsService:
-    """Application service that orchestrates appointments workflow using the database."""
+    """Application service that orchestrates the appointments workflow.
+
+    The scheduling rules live here once; storage goes through the repositories
+    of ``store``, which defaults to the database behind ``session``.
+    """
 
-    def __init__(self, session: Session) -> None:
-        self._session = session
-        self._patients = PatientsService(session)
-        self._doctors = DoctorsService(session)
-        self._settings = SystemSettingsService(session)
+    def __init__(
+        self,
+        session: Session | None,
+        *,
+        patients: PatientsService | None = None,
+        doctors: DoctorsService | None = None,
+        settings: SystemSettingsService | None = None,
+        store: AppointmentStore | None = None,
+    ) -> None:
+        self._patients = patients or PatientsService(session)
+        self._doctors = doctors or DoctorsService(session)
+        self._settings = settings or SystemSettingsService(session)
+        store = store or SqlAlchemyAppointmentStore(session)
+        self._appointments = store.appointments
+        self._availability = store.availability
+        self._blocks = store.blocks
 
     # --------- Query methods ---------
-    def list_for_patient(self, patient_id: int) -> list[Appointment]:
+    def list_for_patient(self, patient_id: int, include_archived: bool = False) -> list[Appointment]:
         self._ensure_patient_exists(patient_id)
-        stmt = (
-            select(AppointmentModel)
-            .where(AppointmentModel.patient_id == patient_id)
-            .order_by(AppointmentModel.start_at)
-        )
-        appointments = self._session.scalars(stmt).all()
-        return [self._to_schema(model) for model in appointments]
+        return self._appointments.list_by_patient(patient_id, include_archived=include_archived)
 
     def list_for_patient_filtered(
         self,
         patient_id: int,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        include_archived: bool = False,
     ) -> list[Appointment]:
         """List patient appointments with optional date range filtering."""
         self._ensure_patient_exists(patient_id)
-        
-        stmt = select(AppointmentModel).where(AppointmentModel.patient_id == patient_id)
-        
-        if start_date:
-            stmt = stmt.where(AppointmentModel.start_at >= start_date)
-        if end_date:
-            stmt = stmt.where(AppointmentModel.end_at <= end_date)
-        
-        stmt = stmt.order_by(AppointmentModel.start_at)
-        appointments = self._session.scalars(stmt).all()
-        return [self._to_schema(model) for model in appointments]
-
-    def list_for_doctor(self, doctor_id: int) -> list[Appointment]:
-        self._ensure_doctor_exists(doctor_id)
-        stmt = (
-            select(AppointmentModel)
-            .where(AppointmentModel.doctor_id == doctor_id)
-            .order_by(AppointmentModel.start_at)
+        # Anything ending by end_date also starts before it
+        appointments = self._appointments.list_by_patient(
+            patient_id, start_date, end_date, include_archived=include_archived
         )
-        appointments = self._session.scalars(stmt).all()
-        return [self._to_schema(model) for model in appointments]
+        if end_date is not None:
+            end_date = self._normalize_datetime(end_date)
+            appointments = [item for item in appointments if self._normalize_datetime(item.end_at) <= end_date]
+        return appointments
 
-    def list_availability(self, doctor_id: int) -> list[Availability]:
+    def list_for_doctor(self, doctor_id: int, include_archived: bool = False) -> list[Appointment]:
         self._ensure_doctor_exists(doctor_id)
-        stmt = (
-            select(AvailabilityModel)
-            .where(AvailabilityModel.doctor_id == doctor_id)
-            .order_by(AvailabilityModel.start_at)
-        )
-        availability = self._session.scalars(stmt).all()
-        return [self._availability_to_schema(item) for item in availability]
+        return self._appointments.list_by_doctor(doctor_id, include_archived=include_archived)
+
+    def list_availability(
+        self,
+        doctor_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> list[Availability]:
+        """List a doctor's availabilities overlapping ``[start_date, end_date)``.
+
+        ``start_date`` defaults to now, so availabilities that already ended are
+        left out unless an earlier start is requested. Blocks are loaded in one
+        extra query for all availabilities rather than one per availability.
+        """
+        self._ensure_doctor_exists(doctor_id)
+        window_start = self._normalize_datetime(start_date or datetime.now(timezone.utc))
+        if end_date is not None:
+            end_date = self._normalize_datetime(end_date)
+        availability = self._availability.list_by_doctor(doctor_id, window_start, end_date)
+        blocks = self._blocks.list_for_availabilities(item.id for item in availability)
+        return [item.model_copy(update={"blocks": blocks[item.id]}) for item in availability]
 
     def list_available_blocks(self, doctor_id: int, start_date: datetime, end_date: datetime) -> list[AppointmentBlock]:
         """Get available blocks for a doctor within a date range."""
         self._ensure_doctor_exists(doctor_id)
-        stmt = (
-            select(AppointmentBlockModel)
-            .join(AvailabilityModel, AppointmentBlockModel.availability_id == AvailabilityModel.id)
-            .where(AvailabilityModel.doctor_id == doctor_id)
-            .where(AppointmentBlockModel.start_at >= start_date)
-            .where(AppointmentBlockModel.end_at <= end_date)
-            .where(AppointmentBlockModel.is_booked == False)
-            .order_by(AppointmentBlockModel.start_at)
-        )
-        blocks = self._session.scalars(stmt).all()
-        return [self._block_to_schema(block) for block in blocks]
+        return self._blocks.list_free(doctor_id, start_date, end_date)
 
     # --------- Command methods ---------
     def book(self, data: AppointmentCreate) -> Appointment:
-        # Add logging for debugging
-        import logging
-        logger = logging.getLogger(__name__)
         logger.info(f"Booking appointment: doctor_id={data.doctor_id}, patient_id={data.patient_id}")
         logger.info(f"Requested time range: start_at={data.start_at}, end_at={data.end_at}")
-        
+
         # Validate datetime logic first
         self._validate_datetime_range(data.start_at, data.end_at)
-        
+
         self._ensure_patient_exists(data.patient_id)
         self._ensure_doctor_exists(data.doctor_id)
-        self._ensure_slot_available(data.doctor_id, data.start_at, data.end_at)
-
-        availability = self._session.scalars(
-            select(AvailabilityModel)
-            .where(AvailabilityModel.doctor_id == data.doctor_id)
-            .where(AvailabilityModel.start_at <= data.start_at)
-            .where(AvailabilityModel.end_at >= data.end_at)
-        ).first()
-
-        logger.info(f"Found availability: {availability.id if availability else None}")
-
-        appointment = AppointmentModel(
-            doctor_id=data.doctor_id,
-            patient_id=data.patient_id,
-            availability_id=availability.id if availability else None,
-            start_at=data.start_at,
-            end_at=data.end_at,
-            notes=data.notes,
-            status=AppointmentStatus.PENDING,
+        availability = self._ensure_slot_available(data.doctor_id, data.start_at, data.end_at)
+
+        # The block covering the slot; with aligned blocks it matches the slot exactly
+        block = self._blocks.find_free(availability.id, data.start_at, data.end_at)
+        appointment = self._appointments.create(
+            data,
+            availability_id=availability.id,
+            block_id=block.id if block else None,
         )
-        self._session.add(appointment)
-        self._session.flush()
-        
-        # Mark the corresponding block as booked
-        block = self._session.scalars(
-            select(AppointmentBlockModel)
-            .where(AppointmentBlockModel.availability_id == availability.id)
-            .where(AppointmentBlockModel.start_at == data.start_at)
-            .where(AppointmentBlockModel.end_at == data.end_at)
-            .where(AppointmentBlockModel.is_booked == False)
-        ).first()
-        
         if block:
-            block.is_booked = True
-            # Set the relationship between appointment and block
-            appointment.block_id = block.id
+            self._blocks.save(block.model_copy(update={"is_booked": True}))
             logger.info(f"Marked block {block.id} as booked and linked to appointment {appointment.id}")
         else:
             logger.warning(f"No matching block found for appointment {appointment.id}")
-            # If no block found, we should still try to find any block in the time range
-            # This handles edge cases with timezone differences
-            block = self._session.scalars(
-                select(AppointmentBlockModel)
-                .where(AppointmentBlockModel.availability_id == availability.id)
-                .where(AppointmentBlockModel.start_at <= data.start_at)
-                .where(AppointmentBlockModel.end_at >= data.end_at)
-                .where(AppointmentBlockModel.is_booked == False)
-            ).first()
-            
-            if block:
-                block.is_booked = True
-                appointment.block_id = block.id
-                logger.info(f"Found and marked block {block.id} using range matching")
-        
-        # Commit the transaction to ensure changes are persisted
-        self._session.commit()
+
         logger.info(f"Created appointment with ID: {appointment.id}")
-        return self._to_schema(appointment)
+        return appointment
 
     def cancel(self, appointment_id: int) -> Appointment:
         """Cancel an appointment and free its associated availability block."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         appointment = self._get_appointment_or_raise(appointment_id)
-        
+
         # Idempotent: if already cancelled, just return
         if appointment.status == AppointmentStatus.CANCELED:
             logger.info(f"Appointment {appointment_id} already cancelled")
-            return self._to_schema(appointment)
-        
+            return appointment
+
         # Free the associated block if it exists
-        if appointment.block_id:
-            block = self._session.get(AppointmentBlockModel, appointment.block_id)
+        block_id = self._appointments.booked_block_id(appointment_id)
+        if block_id:
+            block = self._blocks.get(block_id)
             if block and block.is_booked:
-                block.is_booked = False
+                self._blocks.save(block.model_copy(update={"is_booked": False}))
                 logger.info(f"Freed block {block.id} for cancelled appointment {appointment_id}")
             else:
-                logger.warning(f"Block {appointment.block_id} not found or already free for appointment {appointment_id}")
+                logger.warning(f"Block {block_id} not found or already free for appointment {appointment_id}")
         else:
             logger.info(f"Appointment {appointment_id} has no associated block to free")
-        
-        # Mark appointment as cancelled
-        appointment.status = AppointmentStatus.CANCELED
-        self._session.flush()
-        
+
         logger.info(f"Cancelled appointment {appointment_id}")
-        return self._to_schema(appointment)
+        return self._set_status(appointment, AppointmentStatus.CANCELED)
 
     def confirm(self, appointment_id: int) -> Appointment:
         appointment = self._get_appointment_or_raise(appointment_id)
         if appointment.status == AppointmentStatus.CANCELED:
             raise ValidationError("Cannot confirm a canceled appointment")
-        appointment.status = AppointmentStatus.CONFIRMED
-        self._session.flush()
-        return self._to_schema(appointment)
+        return self._set_status(appointment, AppointmentStatus.CONFIRMED)
 
     def complete(self, appointment_id: int) -> Appointment:
         appointment = self._get_appointment_or_raise(appointment_id)
         if appointment.status != AppointmentStatus.CONFIRMED:
             raise ValidationError("Only confirmed appointments can be completed")
-        appointment.status = AppointmentStatus.COMPLETED
-        self._session.flush()
-        return self._to_schema(appointment)
+        return self._set_status(appointment, AppointmentStatus.COMPLETED)
 
     def create_availability(self, data: AvailabilityCreate) -> Availability:
         self._ensure_doctor_exists(data.doctor_id)
@@ -235,236 +184,176 @@ class AppointmentsService:
             start=data.start_at,
             end=data.end_at,
         )
-        
+
         # Validate that times align with block boundaries
         block_duration = self._settings.get_block_duration()
         self._validate_block_alignment(data.start_at, data.end_at, block_duration)
-        
-        availability = AvailabilityModel(
-            doctor_id=data.doctor_id,
-            start_at=data.start_at,
-            end_at=data.end_at,
+
+        availability = self._availability.create(data)
+        blocks = self._blocks.create(
+            availability, self._block_slots(data.start_at, data.end_at, block_duration)
         )
-        self._session.add(availability)
-        self._session.flush()
-        
-        # Create blocks for this availability
-        self._create_blocks_for_availability(availability, block_duration)
-        
-        return self._availability_to_schema(availability)
+        return availability.model_copy(update={"blocks": blocks})
 
     def update_availability(self, availability_id: int, data: AvailabilityUpdate) -> Availability:
-        availability = self._session.get(AvailabilityModel, availability_id)
-        if not availability:
-            raise NotFoundError("Availability not found")
-
-        payload = data.model_dump(exclude_unset=True)
-        new_start = payload.get("start_at", availability.start_at)
-        new_end = payload.get("end_at", availability.end_at)
+        availability = self._get_availability_or_raise(availability_id)
+        changed = apply_availability_update(availability, data)
         self._deny_overlapping_availability(
             doctor_id=availability.doctor_id,
-            start=new_start,
-            end=new_end,
+            start=changed.start_at,
+            end=changed.end_at,
             skip_id=availability_id,
         )
-
-        for field, value in payload.items():
-            setattr(availability, field, value)
-
-        self._session.flush()
-        return self._availability_to_schema(availability)
+        return self._with_blocks(self._availability.save(changed))
 
     def delete_availability(self, availability_id: int) -> bool:
         """Remove an availability only if it has never been booked."""
-        availability = self._session.get(AvailabilityModel, availability_id)
-        if not availability:
-            raise NotFoundError("Availability not found")
-
-        has_bookings = self._session.scalars(
-            select(AppointmentModel.id)
-            .where(AppointmentModel.availability_id == availability_id)
-            .limit(1)
-        ).first()
-
-        if has_bookings:
+        self._get_availability_or_raise(availability_id)
+        if self._appointments.any_for_availability(availability_id):
             raise ValidationError("Cannot delete availability that has existing appointments")
-
-        self._session.delete(availability)
-        self._session.flush()
+        self._availability.delete(availability_id)
         return True
 
     def delete_unbooked_blocks(self, availability_id: int) -> Optional[Availability]:
         """Remove only unbooked blocks. If none remain, delete availability and return None."""
-        availability = self._session.get(AvailabilityModel, availability_id)
-        if not availability:
-            raise NotFoundError("Availability not found")
+        availability = self._get_availability_or_raise(availability_id)
 
         # Partition blocks
-        booked_blocks = [block for block in availability.blocks if block.is_booked]
-        unbooked_blocks = [block for block in availability.blocks if not block.is_booked]
+        blocks = self._blocks.list_by_availability(availability_id)
+        booked_blocks = [block for block in blocks if block.is_booked]
 
         # Nothing to delete
-        if not unbooked_blocks:
-            return self._availability_to_schema(availability)
-
-        # Remove unbooked blocks
-        for block in unbooked_blocks:
-            self._session.delete(block)
+        if len(booked_blocks) == len(blocks):
+            return availability.model_copy(update={"blocks": blocks})
 
         # If no blocks remain, remove availability
         if not booked_blocks:
-            self._session.delete(availability)
-            self._session.flush()
+            self._availability.delete(availability_id)
             return None
 
-        # Adjust availability window to booked blocks only
-        availability.start_at = min(block.start_at for block in booked_blocks)
-        availability.end_at = max(block.end_at for block in booked_blocks)
+        # Remove unbooked blocks
+        for block in blocks:
+            if not block.is_booked:
+                self._blocks.delete(block.id)
 
-        self._session.flush()
-        return self._availability_to_schema(availability)
+        # Adjust availability window to booked blocks only
+        availability = self._availability.save(
+            availability.model_copy(
+                update={
+                    "start_at": min(block.start_at for block in booked_blocks),
+                    "end_at": max(block.end_at for block in booked_blocks),
+                }
+            )
+        )
+        return availability.model_copy(update={"blocks": booked_blocks})
 
     def delete_block(self, block_id: int) -> bool:
         """
         Delete a specific appointment block.
         If the block is in the middle of an availability, split the availability into two.
         """
-        block = self._session.get(AppointmentBlockModel, block_id)
+        block = self._blocks.get(block_id)
         if not block:
             raise NotFoundError("Appointment block not found")
 
         if block.is_booked:
             raise ValidationError("Cannot delete a booked block")
 
-        availability = block.availability
-        
-        # Sort blocks by start time to determine position
-        sorted_blocks = sorted(availability.blocks, key=lambda b: b.start_at)
-        block_index = next((i for i, b in enumerate(sorted_blocks) if b.id == block.id), -1)
-        
-        if block_index == -1:
-            # Should not happen given relationship
-            raise NotFoundError("Block not found in availability")
+        availability = self._get_availability_or_raise(block.availability_id)
 
-        is_first = block_index == 0
-        is_last = block_index == len(sorted_blocks) - 1
+        # Blocks come sorted by start time, which gives the block's position
+        blocks = self._blocks.list_by_availability(availability.id)
+        block_index = next(index for index, item in enumerate(blocks) if item.id == block_id)
 
         # Case 1: Only one block in availability -> delete availability
-        if len(sorted_blocks) == 1:
-            self._session.delete(availability) # Cascades to block
-            self._session.flush()
+        if len(blocks) == 1:
+            self._availability.delete(availability.id)
             return True
 
+        self._blocks.delete(block_id)
+
         # Case 2: Block is at the start -> shrink availability from start
-        if is_first:
-            next_block = sorted_blocks[1]
-            availability.start_at = next_block.start_at
-            self._session.delete(block)
-            self._session.flush()
+        if block_index == 0:
+            self._availability.save(availability.model_copy(update={"start_at": blocks[1].start_at}))
             return True
 
         # Case 3: Block is at the end -> shrink availability from end
-        if is_last:
-            prev_block = sorted_blocks[-2]
-            availability.end_at = prev_block.end_at
-            self._session.delete(block)
-            self._session.flush()
+        if block_index == len(blocks) - 1:
+            self._availability.save(availability.model_copy(update={"end_at": blocks[-2].end_at}))
             return True
 
         # Case 4: Block is in the middle -> split availability
         # Original availability ends at the end of the previous block
-        prev_block = sorted_blocks[block_index - 1]
-        original_end = availability.end_at
-        availability.end_at = prev_block.end_at
-        
-        # New availability starts at the start of the next block
-        next_block = sorted_blocks[block_index + 1]
-        
-        new_availability = AvailabilityModel(
-            doctor_id=availability.doctor_id,
-            start_at=next_block.start_at,
-            end_at=original_end,
+        self._availability.save(availability.model_copy(update={"end_at": blocks[block_index - 1].end_at}))
+
+        # New availability starts at the start of the next block and takes the blocks after it
+        tail = self._availability.create(
+            AvailabilityCreate(
+                doctor_id=availability.doctor_id,
+                start_at=blocks[block_index + 1].start_at,
+                end_at=availability.end_at,
+            )
         )
-        self._session.add(new_availability)
-        self._session.flush() # Get ID for new availability
-        
-        # Move subsequent blocks to new availability
-        for subsequent_block in sorted_blocks[block_index + 1:]:
-            subsequent_block.availability_id = new_availability.id
-            
-        # Delete the target block
-        self._session.delete(block)
-        self._session.flush()
-        
+        for item in blocks[block_index + 1:]:
+            self._blocks.save(item.model_copy(update={"availability_id": tail.id}))
         return True
 
     # --------- Internal helpers ---------
     def _validate_datetime_range(self, start: datetime, end: datetime) -> None:
         """Validate that start time is before end time and both are in the future."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         logger.info(f"Validating datetime range: start={start}, end={end}")
-        
+
         # Check if start is before end
         if start >= end:
             raise ValidationError(f"Start time ({start}) must be before end time ({end})")
-        
+
         # Check if appointment is in the future (allowing for current time buffer)
-        from datetime import datetime, timedelta, timezone
         now = datetime.now(start.tzinfo) if start.tzinfo else datetime.now(timezone.utc)
         min_future_time = now + timedelta(minutes=30)  # Minimum 30 minutes in advance
-        
+
         if start < min_future_time:
             raise ValidationError(f"Appointment must be scheduled at least 30 minutes in advance. Start time: {start}, Current time: {now}")
-        
+
         logger.info("Datetime validation passed")
 
     def _ensure_patient_exists(self, patient_id: int) -> None:
-        if not self._patients.get(patient_id):
+        if not self._patients.exists(patient_id):
             raise ValidationError("Patient not found")
 
     def _ensure_doctor_exists(self, doctor_id: int) -> None:
-        if not self._doctors.get(doctor_id):
+        if not self._doctors.exists(doctor_id):
             raise ValidationError("Doctor not found")
 
-    def _get_appointment_or_raise(self, appointment_id: int) -> AppointmentModel:
-        appointment = self._session.get(AppointmentModel, appointment_id)
+    def _get_appointment_or_raise(self, appointment_id: int) -> Appointment:
+        appointment = self._appointments.get(appointment_id)
         if not appointment:
             raise NotFoundError("Appointment not found")
         return appointment
 
-    def _ensure_slot_available(self, doctor_id: int, start: datetime, end: datetime) -> None:
-        import logging
-        logger = logging.getLogger(__name__)
-        
+    def _get_availability_or_raise(self, availability_id: int) -> Availability:
+        availability = self._availability.get(availability_id)
+        if not availability:
+            raise NotFoundError("Availability not found")
+        return availability
+
+    def _ensure_slot_available(self, doctor_id: int, start: datetime, end: datetime) -> Availability:
+        """Return the availability containing the slot, if no appointment overlaps it."""
         logger.info(f"Checking slot availability for doctor {doctor_id}: {start} to {end}")
-        
+
         # Check for conflicting appointments
-        stmt = (
-            select(AppointmentModel)
-            .where(AppointmentModel.doctor_id == doctor_id)
-            .where(AppointmentModel.status != AppointmentStatus.CANCELED)
-            .where(AppointmentModel.start_at < end)
-            .where(start < AppointmentModel.end_at)
-        )
-        conflict = self._session.scalars(stmt).first()
+        conflict = self._appointments.find_conflict(doctor_id, start, end)
         if conflict:
             logger.warning(f"Found conflicting appointment: {conflict.id} from {conflict.start_at} to {conflict.end_at}")
             raise ValidationError(f"Doctor already has an appointment in this slot (conflicting appointment ID: {conflict.id})")
 
         # Check if doctor is available during this time
-        availability = self._session.scalars(
-            select(AvailabilityModel)
-            .where(AvailabilityModel.doctor_id == doctor_id)
-            .where(AvailabilityModel.start_at <= start)
-            .where(AvailabilityModel.end_at >= end)
-        ).first()
+        availability = self._availability.find_containing(doctor_id, start, end)
         if not availability:
             logger.warning(f"No availability found for doctor {doctor_id} during {start} to {end}")
             raise ValidationError("Doctor is not available in this time range")
-        
+
         logger.info(f"Slot is available, found availability ID: {availability.id}")
+        return availability
 
     def _deny_overlapping_availability(
         self,
@@ -474,51 +363,14 @@ class AppointmentsService:
         end: datetime,
         skip_id: Optional[int] = None,
     ) -> None:
-        stmt = (
-            select(AvailabilityModel)
-            .where(AvailabilityModel.doctor_id == doctor_id)
-            .where(AvailabilityModel.start_at < end)
-            .where(start < AvailabilityModel.end_at)
-        )
-        if skip_id is not None:
-            stmt = stmt.where(AvailabilityModel.id != skip_id)
-        conflict = self._session.scalars(stmt).first()
-        if conflict:
+        if self._availability.find_overlapping(doctor_id, start, end, skip_id=skip_id):
             raise ValidationError("Overlapping availability slot")
 
-    @staticmethod
-    def _to_schema(model: AppointmentModel) -> Appointment:
-        return Appointment(
-            id=model.id,
-            doctor_id=model.doctor_id,
-            patient_id=model.patient_id,
-            start_at=AppointmentsService._normalize_datetime(model.start_at),
-            end_at=AppointmentsService._normalize_datetime(model.end_at),
-            notes=model.notes,
-            status=model.status,
-        )
-
-    @staticmethod
-    def _availability_to_schema(model: AvailabilityModel) -> Availability:
-        blocks = [AppointmentsService._block_to_schema(block) for block in model.blocks]
-        return Availability(
-            id=model.id,
-            doctor_id=model.doctor_id,
-            start_at=AppointmentsService._normalize_datetime(model.start_at),
-            end_at=AppointmentsService._normalize_datetime(model.end_at),
-            blocks=blocks,
-        )
+    def _set_status(self, appointment: Appointment, status: AppointmentStatus) -> Appointment:
+        return self._appointments.save(appointment.model_copy(update={"status": status}))
 
-    @staticmethod
-    def _block_to_schema(model: AppointmentBlockModel) -> AppointmentBlock:
-        return AppointmentBlock(
-            id=model.id,
-            availability_id=model.availability_id,
-            block_number=model.block_number,
-            start_at=AppointmentsService._normalize_datetime(model.start_at),
-            end_at=AppointmentsService._normalize_datetime(model.end_at),
-            is_booked=model.is_booked,
-        )
+    def _with_blocks(self, availability: Availability) -> Availability:
+        return availability.model_copy(update={"blocks": self._blocks.list_by_availability(availability.id)})
 
     @staticmethod
     def _normalize_datetime(value: datetime) -> datetime:
@@ -529,39 +381,20 @@ class AppointmentsService:
 
     def _validate_block_alignment(self, start: datetime, end: datetime, block_duration: int) -> None:
         """Validate that start and end times align with block boundaries."""
-        from datetime import timedelta
-        
         # Check if start time aligns with block boundaries (e.g., on the hour)
         if start.minute != 0 or start.second != 0:
             raise ValidationError("Start time must align with block boundaries (e.g., 9:00, 10:00)")
-        
+
         # Check if duration is a multiple of block duration
         duration_minutes = int((end - start).total_seconds() / 60)
         if duration_minutes % block_duration != 0:
             raise ValidationError(f"Duration must be a multiple of {block_duration} minutes")
 
-    def _create_blocks_for_availability(self, availability: AvailabilityModel, block_duration: int) -> None:
-        """Create appointment blocks for an availability period."""
-        from datetime import timedelta
-        
-        current_time = availability.start_at
-        block_number = 1
-        
-        while current_time < availability.end_at:
-            block_end = current_time + timedelta(minutes=block_duration)
-            
-            block = AppointmentBlockModel(
-                availability_id=availability.id,
-                block_number=block_number,
-                start_at=current_time,
-                end_at=block_end,
-                is_booked=False,
-            )
-            # Keep relationship in-memory so the response includes blocks without reloading
-            availability.blocks.append(block)
-            self._session.add(block)
-            
-            current_time = block_end
-            block_number += 1
-        
-        self._session.flush()
+    @staticmethod
+    def _block_slots(start: datetime, end: datetime, block_duration: int) -> Iterator[tuple[datetime, datetime]]:
+        """Consecutive ``block_duration``-minute slots from ``start`` to ``end``."""
+        step = timedelta(minutes=block_duration)
+        current = start
+        while current < end:
+            yield current, current + step
+            current += step
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+from sqlalchemy import ColumnElement, String, and_, cast, delete, exists, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.db.broker import DBBroker, get_dbbroker
+from app.db.settings import ArchiveSettings, get_archive_settings
+from app.models.appointment import Appointment as AppointmentModel
+from app.models.appointment_block import AppointmentBlock as AppointmentBlockModel
+from app.models.archive import ArchivedAppointment, ArchivedAppointmentBlock, ArchivedAvailability
+from app.models.availability import Availability as AvailabilityModel
+from app.models.enums import AppointmentStatus
+from app.models.job_checkpoint import JobCheckpoint
+from app.services.dashboard_counters import APPOINTMENTS_PREFIX, apply_deltas
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class _Phase:
+    name: str
+    live: type
+    archive: type
+    eligible: Callable[[datetime], ColumnElement[bool]]
+
+
+def _finished_appointments(cutoff: datetime) -> ColumnElement[bool]:
+    return and_(
+        AppointmentModel.status.in_([AppointmentStatus.COMPLETED, AppointmentStatus.CANCELED]),
+        AppointmentModel.end_at < cutoff,
+    )
+
+
+def _past_blocks(cutoff: datetime) -> ColumnElement[bool]:
+    # Blocks still referenced by a live appointment (e.g. a past appointment that
+    # was never completed) stay until that appointment is archived.
+    return and_(
+        AppointmentBlockModel.end_at < cutoff,
+        ~exists().where(AppointmentModel.block_id == AppointmentBlockModel.id),
+    )
+
+
+def _past_availabilities(cutoff: datetime) -> ColumnElement[bool]:
+    return and_(
+        AvailabilityModel.end_at < cutoff,
+        ~exists().where(AppointmentBlockModel.availability_id == AvailabilityModel.id),
+        ~exists().where(AppointmentModel.availability_id == AvailabilityModel.id),
+    )
+
+
+# Order matters: appointments release their blocks, blocks release their
+# availabilities.
+PHASES: tuple[_Phase, ...] = (
+    _Phase("appointments", AppointmentModel, ArchivedAppointment, _finished_appointments),
+    _Phase("blocks", AppointmentBlockModel, ArchivedAppointmentBlock, _past_blocks),
+    _Phase("availabilities", AvailabilityModel, ArchivedAvailability, _past_availabilities),
+)
+
+
+@dataclass
+class ArchiveReport:
+    cutoff: datetime
+    moved: dict[str, int] = field(default_factory=lambda: {phase.name: 0 for phase in PHASES})
+    batches: int = 0
+    completed: bool = False
+
+
+class ArchiveService:
+    """Move finished appointments and past blocks/availabilities to archive tables.
+
+    Work is split into batches of ``batch_size`` rows walked in primary-key
+    order. Each batch copies the rows, deletes them from the live table and
+    advances the ``job_checkpoints`` row in one short transaction, so an
+    interrupted run resumes from the last committed batch with the cutoff it
+    started with.
+    """
+
+    JOB_NAME = "archive_scheduling"
+
+    def __init__(
+        self,
+        broker: DBBroker | None = None,
+        settings: ArchiveSettings | None = None,
+    ) -> None:
+        self._broker = broker or get_dbbroker()
+        self._settings = settings or get_archive_settings()
+
+    def run(self, *, now: Optional[datetime] = None, max_batches: Optional[int] = None) -> ArchiveReport:
+        """Archive until nothing is left or ``max_batches`` batches have committed."""
+        cutoff = self._start_or_resume(now or datetime.now(timezone.utc))
+        report = ArchiveReport(cutoff=cutoff)
+
+        while max_batches is None or report.batches < max_batches:
+            with self._broker.session() as session:
+                done = self._run_batch(session, report)
+            report.batches += 1
+            if done:
+                report.completed = True
+                break
+
+        logger.info(
+            "Archive run (cutoff %s) moved %s in %d batches%s",
+            cutoff.isoformat(),
+            report.moved,
+            report.batches,
+            "" if report.completed else ", more work pending",
+        )
+        return report
+
+    # ------------------------------------------------------------------
+    def _start_or_resume(self, now: datetime) -> datetime:
+        with self._broker.session() as session:
+            checkpoint = session.get(JobCheckpoint, self.JOB_NAME)
+            if checkpoint is not None:
+                return datetime.fromisoformat(checkpoint.parameters["cutoff"])
+
+            cutoff = now - timedelta(days=self._settings.retention_days)
+            session.add(
+                JobCheckpoint(
+                    name=self.JOB_NAME,
+                    last_id=0,
+                    parameters={"cutoff": cutoff.isoformat(), "phase": PHASES[0].name},
+                )
+            )
+            return cutoff
+
+    def _run_batch(self, session: Session, report: ArchiveReport) -> bool:
+        """Process one batch; return True once the last phase is exhausted."""
+        checkpoint = session.get(JobCheckpoint, self.JOB_NAME)
+        parameters = dict(checkpoint.parameters)
+        phase_index = next(i for i, phase in enumerate(PHASES) if phase.name == parameters["phase"])
+        phase = PHASES[phase_index]
+
+        live_table = phase.live.__table__
+        ids = session.scalars(
+            select(live_table.c.id)
+            .where(live_table.c.id > checkpoint.last_id)
+            .where(phase.eligible(report.cutoff))
+            .order_by(live_table.c.id)
+            .limit(self._settings.batch_size)
+        ).all()
+
+        if ids:
+            if phase.live is AppointmentModel:
+                self._release_counters(session, ids)
+            columns = [column.name for column in live_table.columns]
+            session.execute(
+                insert(phase.archive.__table__).from_select(
+                    columns,
+                    select(*(live_table.c[name] for name in columns)).where(live_table.c.id.in_(ids)),
+                )
+            )
+            session.execute(delete(live_table).where(live_table.c.id.in_(ids)))
+            checkpoint.last_id = ids[-1]
+            report.moved[phase.name] += len(ids)
+
+        if len(ids) == self._settings.batch_size:
+            return False
+
+        if phase_index + 1 == len(PHASES):
+            # Next run starts over with a fresh cutoff
+            session.delete(checkpoint)
+            return True
+
+        parameters["phase"] = PHASES[phase_index + 1].name
+        checkpoint.parameters = parameters
+        checkpoint.last_id = 0
+        return False
+
+    @staticmethod
+    def _release_counters(session: Session, ids: list[int]) -> None:
+        # Bulk deletes skip the ORM flush hook; keep the daily buckets in step
+        day = cast(func.date(AppointmentModel.start_at), String)
+        rows = session.execute(
+            select(day, func.count())
+            .where(AppointmentModel.id.in_(ids), AppointmentModel.status != AppointmentStatus.CANCELED)
+            .group_by(day)
+        ).all()
+        apply_deltas(session.connection(), {f"{APPOINTMENTS_PREFIX}{value}": -count for value, count in rows})
+
+
+__all__ = ["ArchiveReport", "ArchiveService", "PHASES"]
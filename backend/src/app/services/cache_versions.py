@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from sqlalchemy import bindparam, event, select, update
+from sqlalchemy.dialects import mysql, sqlite
+from sqlalchemy.orm import Session, SessionTransaction
+
+from app.models.cache_version import CacheVersion
+
+
+ANALYTICS = "analytics"
+DOCTOR_DIRECTORY = "doctor_directory"
+SYSTEM_SETTINGS = "system_settings"
+
+_VERSION_STMT = select(CacheVersion.version).where(CacheVersion.name == bindparam("name"))
+
+# Names bumped by the session's open transaction
+_BUMPED_KEY = "cache_versions.bumped"
+
+
+def current(session: Session, name: str) -> int:
+    """Version of the ``name`` cache as seen by ``session``'s transaction."""
+    return session.scalar(_VERSION_STMT, {"name": name}) or 0
+
+
+def bump(session: Session, name: str) -> None:
+    """Make every copy of the ``name`` cache stale once this transaction commits.
+
+    Called on every write that changes what the cache holds, not once per
+    transaction, so a rolled back savepoint cannot take the only bump with it.
+    """
+    table = CacheVersion.__table__
+    connection = session.connection()
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        stmt = sqlite.insert(table).values(name=name, version=1)
+        connection.execute(
+            stmt.on_conflict_do_update(index_elements=[table.c.name], set_={"version": table.c.version + 1})
+        )
+    elif dialect == "mysql":
+        stmt = mysql.insert(table).values(name=name, version=1)
+        connection.execute(stmt.on_duplicate_key_update(version=table.c.version + 1))
+    else:  # pragma: no cover - only SQLite and MySQL are supported
+        result = connection.execute(
+            update(table).where(table.c.name == name).values(version=table.c.version + 1)
+        )
+        if result.rowcount == 0:
+            connection.execute(table.insert().values(name=name, version=1))
+    session.info.setdefault(_BUMPED_KEY, set()).add(name)
+
+
+def pending(session: Session, name: str) -> bool:
+    """Whether ``session`` has uncommitted writes to what the ``name`` cache holds.
+
+    Such a session sees data no other session does yet, so it must neither be
+    served from the shared cache nor fill it.
+    """
+    return name in session.info.get(_BUMPED_KEY, ())
+
+
+def _forget_bumps(session: Session, transaction: SessionTransaction) -> None:
+    # Savepoints end inside the outer transaction, which still holds the writes
+    if transaction.parent is None:
+        session.info.pop(_BUMPED_KEY, None)
+
+
+event.listen(Session, "after_transaction_end", _forget_bumps)
+
+
+__all__ = ["ANALYTICS", "DOCTOR_DIRECTORY", "SYSTEM_SETTINGS", "bump", "current", "pending"]
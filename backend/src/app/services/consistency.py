@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import asdict, dataclass, field
+from itertools import groupby
+from typing import IO, Iterator, Optional
+
+from sqlalchemy import Select, and_, exists, func, or_, select
+from sqlalchemy.orm import Session
+
+from app.db.broker import DBBroker, get_dbbroker
+from app.models.appointment import Appointment as AppointmentModel
+from app.models.appointment_block import AppointmentBlock as AppointmentBlockModel
+from app.models.enums import AppointmentStatus
+
+
+logger = logging.getLogger(__name__)
+
+# Canceled appointments keep their block_id but no longer hold the block
+_LIVE = AppointmentModel.status != AppointmentStatus.CANCELED
+
+BOOKED_WITHOUT_APPOINTMENT = "booked_without_appointment"
+MULTIPLE_APPOINTMENTS = "multiple_appointments"
+FREE_WITH_APPOINTMENT = "free_with_appointment"
+OUTSIDE_BLOCK = "appointment_outside_block"
+
+KINDS = (BOOKED_WITHOUT_APPOINTMENT, MULTIPLE_APPOINTMENTS, FREE_WITH_APPOINTMENT, OUTSIDE_BLOCK)
+
+
+@dataclass(frozen=True)
+class Violation:
+    kind: str
+    doctor_id: int
+    block_id: int
+    appointment_ids: tuple[int, ...] = ()
+    # Suggested fix for the repair plan; "manual" needs a person to decide
+    action: str = "manual"
+
+
+@dataclass
+class ConsistencyReport:
+    counts: dict[str, int] = field(default_factory=lambda: {kind: 0 for kind in KINDS})
+    samples: list[Violation] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    @property
+    def consistent(self) -> bool:
+        return self.total == 0
+
+
+class ConsistencyScanner:
+    """Check the invariants between ``appointment_blocks`` and ``appointments``.
+
+    * a booked block has exactly one live (non-canceled) appointment;
+    * a free block has none;
+    * a live appointment lies inside its block, for the same doctor.
+
+    Each invariant is one set-based query (anti-join or join on
+    ``appointments.block_id``) ordered by doctor and block and streamed in
+    ``batch_size`` rows, so memory stays flat however large the tables are.
+    The report keeps counts and the first ``sample_size`` violations; the full
+    list goes to the optional repair plan as JSON lines.
+    """
+
+    def __init__(
+        self,
+        broker: DBBroker | None = None,
+        *,
+        batch_size: int = 1000,
+        sample_size: int = 20,
+    ) -> None:
+        self._broker = broker or get_dbbroker()
+        self._batch_size = batch_size
+        self._sample_size = sample_size
+
+    def scan(self, *, doctor_id: Optional[int] = None, plan: Optional[IO[str]] = None) -> ConsistencyReport:
+        """Scan all doctors (or one) and optionally write a repair plan to ``plan``."""
+        report = ConsistencyReport()
+        for violation in self.iter_violations(doctor_id=doctor_id):
+            report.counts[violation.kind] += 1
+            if len(report.samples) < self._sample_size:
+                report.samples.append(violation)
+            if plan is not None:
+                plan.write(json.dumps(asdict(violation)) + "\n")
+
+        logger.info("Consistency scan: %d violations %s", report.total, report.counts)
+        return report
+
+    def iter_violations(self, *, doctor_id: Optional[int] = None) -> Iterator[Violation]:
+        with self._broker.session() as session:
+            yield from self._booked_without_appointment(session, doctor_id)
+            yield from self._block_appointments(session, doctor_id)
+            yield from self._outside_block(session, doctor_id)
+
+    # ------------------------------------------------------------------
+    def _stream(self, session: Session, stmt: Select, doctor_id: Optional[int]):
+        if doctor_id is not None:
+            stmt = stmt.where(AppointmentBlockModel.doctor_id == doctor_id)
+        return session.execute(stmt.execution_options(yield_per=self._batch_size))
+
+    def _booked_without_appointment(self, session: Session, doctor_id: Optional[int]) -> Iterator[Violation]:
+        stmt = (
+            select(AppointmentBlockModel.doctor_id, AppointmentBlockModel.id)
+            .where(AppointmentBlockModel.is_booked.is_(True))
+            .where(~exists().where(AppointmentModel.block_id == AppointmentBlockModel.id, _LIVE))
+            .order_by(AppointmentBlockModel.doctor_id, AppointmentBlockModel.id)
+        )
+        for block_doctor_id, block_id in self._stream(session, stmt, doctor_id):
+            # Same fix as the release_orphaned_blocks repair
+            yield Violation(BOOKED_WITHOUT_APPOINTMENT, block_doctor_id, block_id, action="release_block")
+
+    def _block_appointments(self, session: Session, doctor_id: Optional[int]) -> Iterator[Violation]:
+        # Live appointments of blocks that are free or held more than once; the
+        # rows arrive grouped by block, so only one block is in memory at a time.
+        crowded = (
+            select(AppointmentModel.block_id)
+            .where(AppointmentModel.block_id.is_not(None), _LIVE)
+            .group_by(AppointmentModel.block_id)
+            .having(func.count() > 1)
+        )
+        stmt = (
+            select(
+                AppointmentBlockModel.doctor_id,
+                AppointmentBlockModel.id,
+                AppointmentBlockModel.is_booked,
+                AppointmentModel.id,
+            )
+            .join(AppointmentModel, and_(AppointmentModel.block_id == AppointmentBlockModel.id, _LIVE))
+            .where(or_(AppointmentBlockModel.is_booked.is_(False), AppointmentBlockModel.id.in_(crowded)))
+            .order_by(AppointmentBlockModel.doctor_id, AppointmentBlockModel.id, AppointmentModel.id)
+        )
+        rows = self._stream(session, stmt, doctor_id)
+        for (block_doctor_id, block_id, is_booked), group in groupby(rows, key=lambda row: tuple(row[:3])):
+            appointment_ids = tuple(row[3] for row in group)
+            if not is_booked:
+                action = "mark_block_booked" if len(appointment_ids) == 1 else "manual"
+                yield Violation(FREE_WITH_APPOINTMENT, block_doctor_id, block_id, appointment_ids, action)
+            if len(appointment_ids) > 1:
+                yield Violation(MULTIPLE_APPOINTMENTS, block_doctor_id, block_id, appointment_ids)
+
+    def _outside_block(self, session: Session, doctor_id: Optional[int]) -> Iterator[Violation]:
+        stmt = (
+            select(AppointmentBlockModel.doctor_id, AppointmentBlockModel.id, AppointmentModel.id)
+            .join(AppointmentModel, and_(AppointmentModel.block_id == AppointmentBlockModel.id, _LIVE))
+            .where(
+                or_(
+                    AppointmentModel.start_at < AppointmentBlockModel.start_at,
+                    AppointmentModel.end_at > AppointmentBlockModel.end_at,
+                    AppointmentModel.doctor_id != AppointmentBlockModel.doctor_id,
+                )
+            )
+            .order_by(AppointmentBlockModel.doctor_id, AppointmentBlockModel.id, AppointmentModel.id)
+        )
+        for block_doctor_id, block_id, appointment_id in self._stream(session, stmt, doctor_id):
+            yield Violation(OUTSIDE_BLOCK, block_doctor_id, block_id, (appointment_id,))
+
+
+__all__ = [
+    "BOOKED_WITHOUT_APPOINTMENT",
+    "ConsistencyReport",
+    "ConsistencyScanner",
+    "FREE_WITH_APPOINTMENT",
+    "KINDS",
+    "MULTIPLE_APPOINTMENTS",
+    "OUTSIDE_BLOCK",
+    "Violation",
+]
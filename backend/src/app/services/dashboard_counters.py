@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Any, Mapping
+
+from sqlalchemy import Connection, event, inspect, update
+from sqlalchemy.dialects import mysql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models.appointment import Appointment as AppointmentModel
+from app.models.dashboard_counter import DashboardCounter
+from app.models.enums import AppointmentStatus, UserRole
+from app.models.medical_record import MedicalRecord as MedicalRecordModel
+from app.models.user import User as UserModel
+
+
+USERS = "users"
+ACTIVE_DOCTORS = "active_doctors"
+MEDICAL_RECORDS = "medical_records"
+APPOINTMENTS_PREFIX = "appointments:"
+
+
+def appointments_key(day: date) -> str:
+    """Counter of non-canceled appointments starting on ``day``."""
+    return f"{APPOINTMENTS_PREFIX}{day.isoformat()}"
+
+
+def _bucket_day(start_at: datetime) -> date:
+    # Bucket on the stored wall-clock date, which is what SQL date(start_at)
+    # returns during reconciliation.
+    return start_at.date()
+
+
+def _contribution(obj: Any, values: Mapping[str, Any]) -> dict[str, int]:
+    """Counters a row adds to while it exists with ``values``."""
+    if isinstance(obj, UserModel):
+        counts = {USERS: 1}
+        if values["role"] == UserRole.DOCTOR and values["is_active"]:
+            counts[ACTIVE_DOCTORS] = 1
+        return counts
+    if isinstance(obj, AppointmentModel):
+        if values["status"] == AppointmentStatus.CANCELED or values["start_at"] is None:
+            return {}
+        return {appointments_key(_bucket_day(values["start_at"])): 1}
+    if isinstance(obj, MedicalRecordModel):
+        return {MEDICAL_RECORDS: 1}
+    return {}
+
+
+_TRACKED: dict[type, tuple[str, ...]] = {
+    UserModel: ("role", "is_active"),
+    AppointmentModel: ("status", "start_at"),
+    MedicalRecordModel: (),
+}
+
+
+def _values(obj: Any, *, before: bool) -> dict[str, Any]:
+    """Tracked attribute values before or after the pending changes."""
+    state = inspect(obj)
+    values: dict[str, Any] = {}
+    for attr in _TRACKED[type(obj)]:
+        history = state.attrs[attr].load_history()
+        if before:
+            current = history.deleted or history.unchanged
+        else:
+            current = history.added or history.unchanged
+        value = current[0] if current else None
+        if value is None and not before:
+            # New rows get scalar column defaults only at INSERT time
+            default = type(obj).__table__.c[attr].default
+            value = default.arg if default is not None and default.is_scalar else None
+        values[attr] = value
+    return values
+
+
+def _track_counters(session: Session, flush_context, instances) -> None:
+    """Translate the rows about to be flushed into counter deltas."""
+    deltas: dict[str, int] = defaultdict(int)
+    for obj in session.new:
+        if type(obj) in _TRACKED:
+            for name, count in _contribution(obj, _values(obj, before=False)).items():
+                deltas[name] += count
+    for obj in session.deleted:
+        if type(obj) in _TRACKED:
+            for name, count in _contribution(obj, _values(obj, before=True)).items():
+                deltas[name] -= count
+    for obj in session.dirty:
+        if type(obj) in _TRACKED and _TRACKED[type(obj)] and session.is_modified(obj):
+            for name, count in _contribution(obj, _values(obj, before=False)).items():
+                deltas[name] += count
+            for name, count in _contribution(obj, _values(obj, before=True)).items():
+                deltas[name] -= count
+    if any(deltas.values()):
+        apply_deltas(session.connection(), deltas)
+
+
+def apply_deltas(connection: Connection, deltas: Mapping[str, int]) -> None:
+    """Add ``deltas`` to the counters in the current transaction.
+
+    Counters are touched in name order so concurrent transactions take the row
+    locks in the same order. Paths that bypass the ORM (bulk deletes) call this
+    directly.
+    """
+    table = DashboardCounter.__table__
+    for name in sorted(deltas):
+        delta = deltas[name]
+        if not delta:
+            continue
+        dialect = connection.dialect.name
+        if dialect == "sqlite":
+            stmt = sqlite.insert(table).values(name=name, value=delta)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.name], set_={"value": table.c.value + stmt.excluded.value}
+            )
+            connection.execute(stmt)
+        elif dialect == "mysql":
+            stmt = mysql.insert(table).values(name=name, value=delta)
+            connection.execute(stmt.on_duplicate_key_update(value=table.c.value + stmt.inserted.value))
+        else:  # pragma: no cover - only SQLite and MySQL are supported
+            result = connection.execute(
+                update(table).where(table.c.name == name).values(value=table.c.value + delta)
+            )
+            if result.rowcount == 0:
+                connection.execute(table.insert().values(name=name, value=delta))
+
+
+# Every session (request units of work, scripts, tests) keeps the counters in
+# step with its own writes.
+event.listen(Session, "before_flush", _track_counters)
+
+
+__all__ = [
+    "ACTIVE_DOCTORS",
+    "APPOINTMENTS_PREFIX",
+    "MEDICAL_RECORDS",
+    "USERS",
+    "appointments_key",
+    "apply_deltas",
+]
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from sqlalchemy import event, func, inspect, select
+from sqlalchemy.orm import Session
+
+from app.db.broker import DBBroker, get_dbbroker
+from app.db.settings import get_database_settings
+from app.models.doctor import Doctor as DoctorModel
+from app.models.enums import UserRole
+from app.models.office import Office as OfficeModel
+from app.models.user import User as UserModel
+from app.schemas.doctor_directory import (
+    DirectoryDoctor,
+    DirectoryFacets,
+    DoctorDirectory,
+    OfficeFacet,
+    SpecialtyFacet,
+)
+from app.schemas.pagination import PaginatedResponse
+from app.services import cache_versions
+
+
+# (specialty, office_id, office_name, is_active, doctors)
+_FacetRow = tuple[Optional[str], Optional[int], Optional[str], bool, int]
+
+_FACETS_STMT = (
+    select(
+        DoctorModel.specialty,
+        DoctorModel.office_id,
+        OfficeModel.name,
+        UserModel.is_active,
+        func.count(),
+    )
+    .join(UserModel, UserModel.id == DoctorModel.id)
+    .outerjoin(OfficeModel, OfficeModel.id == DoctorModel.office_id)
+    .group_by(DoctorModel.specialty, DoctorModel.office_id, OfficeModel.name, UserModel.is_active)
+)
+
+
+class DirectoryCache:
+    """Process-wide count of doctors per specialty, office and active flag.
+
+    The aggregate is small (specialties x offices x 2 rows) and answers every
+    filter combination, so the directory never counts doctors per request.
+    It is kept with the ``doctor_directory`` cache version it was loaded at,
+    and every read compares that with the version in the reader's own
+    transaction. Doctor, doctor-user and office writes bump the version (see
+    ``_invalidate_flushed``), so they show up in every worker as soon as they
+    commit, and a reader with an older snapshot cannot pass its rows off as
+    current. ``ttl`` only bounds how long a copy survives SQL edits that skip
+    the bump.
+    """
+
+    def __init__(self, ttl: Optional[float] = None) -> None:
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._rows: Optional[tuple[_FacetRow, ...]] = None
+        self._version = 0
+        self._loaded_at = 0.0
+
+    @property
+    def ttl(self) -> float:
+        if self._ttl is None:
+            return get_database_settings().directory_cache_ttl
+        return self._ttl
+
+    def rows(self, session: Session) -> tuple[_FacetRow, ...]:
+        if cache_versions.pending(session, cache_versions.DOCTOR_DIRECTORY):
+            # Uncommitted changes: count them for this session only
+            return _load(session)
+        version = cache_versions.current(session, cache_versions.DOCTOR_DIRECTORY)
+        with self._lock:
+            if (
+                self._rows is not None
+                and self._version == version
+                and time.monotonic() - self._loaded_at < self.ttl
+            ):
+                return self._rows
+            rows = _load(session)
+            if self._rows is None or version >= self._version:
+                self._rows, self._version, self._loaded_at = rows, version, time.monotonic()
+            return rows
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._rows = None
+            self._loaded_at = 0.0
+
+    def invalidate_on_commit(self, session: Session) -> None:
+        """Make every worker's copy stale once ``session``'s transaction commits.
+
+        Writes that bypass the ORM call this; flushed ones are caught by
+        ``_invalidate_flushed``.
+        """
+        cache_versions.bump(session, cache_versions.DOCTOR_DIRECTORY)
+
+
+def _load(session: Session) -> tuple[_FacetRow, ...]:
+    return tuple(tuple(row) for row in session.execute(_FACETS_STMT))
+
+
+directory_cache = DirectoryCache()
+
+
+class DoctorDirectoryService:
+    """Filtered, paginated doctor listing with specialty and office facets.
+
+    Only one page of doctors is read per request; the total and the facet
+    counts come from ``directory_cache``.
+    """
+
+    def __init__(
+        self,
+        session: Session | None = None,
+        *,
+        broker: DBBroker | None = None,
+        cache: DirectoryCache | None = None,
+    ) -> None:
+        self._session = session
+        self._broker = broker
+        self._cache = cache or directory_cache
+
+    def search(
+        self,
+        *,
+        specialty: Optional[str] = None,
+        office_id: Optional[int] = None,
+        is_active: Optional[bool] = None,
+        page: int = 1,
+        size: int = 20,
+    ) -> DoctorDirectory:
+        stmt = (
+            select(
+                DoctorModel.id,
+                UserModel.full_name,
+                DoctorModel.specialty,
+                DoctorModel.office_id,
+                DoctorModel.years_experience,
+                UserModel.is_active,
+            )
+            .join(UserModel, UserModel.id == DoctorModel.id)
+            .order_by(UserModel.full_name, DoctorModel.id)
+            .offset((page - 1) * size)
+            .limit(size)
+        )
+        if specialty is not None:
+            stmt = stmt.where(DoctorModel.specialty == specialty)
+        if office_id is not None:
+            stmt = stmt.where(DoctorModel.office_id == office_id)
+        if is_active is not None:
+            stmt = stmt.where(UserModel.is_active.is_(is_active))
+
+        with self._session_scope() as session:
+            rows = self._cache.rows(session)
+            doctors = [DirectoryDoctor(**row._mapping) for row in session.execute(stmt)]
+
+        total = 0
+        specialties: dict[Optional[str], int] = defaultdict(int)
+        offices: dict[tuple[Optional[int], Optional[str]], int] = defaultdict(int)
+        for row_specialty, row_office_id, office_name, row_active, count in rows:
+            if is_active is not None and row_active != is_active:
+                continue
+            specialty_matches = specialty is None or row_specialty == specialty
+            office_matches = office_id is None or row_office_id == office_id
+            if office_matches:
+                specialties[row_specialty] += count
+            if specialty_matches:
+                offices[(row_office_id, office_name)] += count
+            if specialty_matches and office_matches:
+                total += count
+
+        facets = DirectoryFacets(
+            specialties=[
+                SpecialtyFacet(specialty=value, count=count)
+                for value, count in sorted(specialties.items(), key=lambda item: (-item[1], _sort_key(item[0])))
+            ],
+            offices=[
+                OfficeFacet(office_id=value, office_name=name, count=count)
+                for (value, name), count in sorted(offices.items(), key=lambda item: (-item[1], _sort_key(item[0][0])))
+            ],
+        )
+        return DoctorDirectory(
+            doctors=PaginatedResponse.create(items=doctors, total=total, page=page, size=size),
+            facets=facets,
+        )
+
+    @contextmanager
+    def _session_scope(self) -> Iterator[Session]:
+        if self._session is not None:
+            yield self._session
+        else:
+            broker = self._broker or get_dbbroker()
+            with broker.session() as session:
+                yield session
+
+
+def _sort_key(value) -> tuple:
+    # Most doctors first; ties by value, with "none" last
+    return (value is None, value if value is not None else 0)
+
+
+def _changed(obj, attributes: tuple[str, ...]) -> bool:
+    state = inspect(obj)
+    return any(state.attrs[attr].history.has_changes() for attr in attributes)
+
+
+def _affects_directory(obj, *, dirty: bool) -> bool:
+    if isinstance(obj, DoctorModel):
+        return not dirty or _changed(obj, ("specialty", "office_id"))
+    if isinstance(obj, UserModel):
+        return obj.role == UserRole.DOCTOR and (not dirty or _changed(obj, ("role", "is_active")))
+    if isinstance(obj, OfficeModel):
+        return not dirty or _changed(obj, ("name",))
+    return False
+
+
+def _invalidate_flushed(session: Session, flush_context) -> None:
+    """Drop the directory facets when this flush touched what they count."""
+    if any(_affects_directory(obj, dirty=False) for obj in (*session.new, *session.deleted)) or any(
+        _affects_directory(obj, dirty=True) for obj in session.dirty
+    ):
+        directory_cache.invalidate_on_commit(session)
+
+
+event.listen(Session, "after_flush", _invalidate_flushed)
+
+
+__all__ = ["DirectoryCache", "DoctorDirectoryService", "directory_cache"]
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Iterable, Mapping, Optional
+
+from sqlalchemy import Connection, case, delete, event, func, insert, inspect, select, union_all, update
+from sqlalchemy.dialects import mysql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models.appointment import Appointment as AppointmentModel
+from app.models.archive import ArchivedAppointment
+from app.models.doctor_patient import DoctorPatient
+from app.models.enums import AppointmentStatus
+
+
+_TRACKED = ("doctor_id", "patient_id", "status", "start_at")
+
+
+@dataclass
+class _PairChange:
+    count: int = 0
+    first: Optional[datetime] = None
+    last: Optional[datetime] = None
+
+    def see(self, start_at: datetime) -> None:
+        # Compare stored wall-clock values, which is what the columns hold
+        start_at = start_at.replace(tzinfo=None)
+        self.first = start_at if self.first is None else min(self.first, start_at)
+        self.last = start_at if self.last is None else max(self.last, start_at)
+
+
+def _values(obj: AppointmentModel, *, before: bool) -> dict[str, Any]:
+    """Tracked attribute values before or after the flush that just ran."""
+    state = inspect(obj)
+    values: dict[str, Any] = {}
+    for attr in _TRACKED:
+        history = state.attrs[attr].history
+        current = (history.deleted or history.unchanged) if before else (history.added or history.unchanged)
+        values[attr] = current[0] if current else None
+    return values
+
+
+def _record(changes: dict, values: Mapping[str, Any], sign: int, *, seen: bool) -> None:
+    if values["doctor_id"] is None or values["patient_id"] is None:
+        return
+    change = changes[(values["doctor_id"], values["patient_id"])]
+    if values["status"] != AppointmentStatus.CANCELED:
+        change.count += sign
+    if seen and values["start_at"] is not None:
+        change.see(values["start_at"])
+
+
+def _track_appointments(session: Session, flush_context) -> None:
+    """Apply the appointments written by this flush to their doctor/patient pairs.
+
+    Runs after the flush so new appointments, patients and doctors already
+    exist; their history still shows what changed.
+    """
+    changes: dict[tuple[int, int], _PairChange] = defaultdict(_PairChange)
+    for obj in session.new:
+        if isinstance(obj, AppointmentModel):
+            _record(changes, _values(obj, before=False), 1, seen=True)
+    for obj in session.deleted:
+        if isinstance(obj, AppointmentModel):
+            _record(changes, _values(obj, before=True), -1, seen=False)
+    for obj in session.dirty:
+        if isinstance(obj, AppointmentModel):
+            state = inspect(obj)
+            if any(state.attrs[attr].history.has_changes() for attr in _TRACKED):
+                _record(changes, _values(obj, before=True), -1, seen=False)
+                _record(changes, _values(obj, before=False), 1, seen=True)
+    if changes:
+        _apply(session.connection(), changes)
+
+
+def _apply(connection: Connection, changes: Mapping[tuple[int, int], _PairChange]) -> None:
+    """Upsert pair rows in key order, so concurrent flushes lock them in the same order."""
+    table = DoctorPatient.__table__
+    for doctor_id, patient_id in sorted(changes):
+        change = changes[(doctor_id, patient_id)]
+        if change.first is None:
+            # Cancellations and deletions never create a pair
+            if change.count:
+                connection.execute(
+                    update(table)
+                    .where(table.c.doctor_id == doctor_id, table.c.patient_id == patient_id)
+                    .values(appointment_count=table.c.appointment_count + change.count)
+                )
+            continue
+        values = {
+            "doctor_id": doctor_id,
+            "patient_id": patient_id,
+            "first_seen": change.first,
+            "last_appointment_at": change.last,
+            "appointment_count": change.count,
+        }
+        dialect = connection.dialect.name
+        if dialect == "sqlite":
+            stmt = sqlite.insert(table).values(**values)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.doctor_id, table.c.patient_id],
+                set_={
+                    # Two-argument min()/max() are scalar functions in SQLite
+                    "first_seen": func.min(table.c.first_seen, stmt.excluded.first_seen),
+                    "last_appointment_at": func.max(table.c.last_appointment_at, stmt.excluded.last_appointment_at),
+                    "appointment_count": table.c.appointment_count + stmt.excluded.appointment_count,
+                },
+            )
+        elif dialect == "mysql":
+            stmt = mysql.insert(table).values(**values)
+            stmt = stmt.on_duplicate_key_update(
+                first_seen=func.least(table.c.first_seen, stmt.inserted.first_seen),
+                last_appointment_at=func.greatest(table.c.last_appointment_at, stmt.inserted.last_appointment_at),
+                appointment_count=table.c.appointment_count + stmt.inserted.appointment_count,
+            )
+        else:  # pragma: no cover - only SQLite and MySQL are supported
+            raise NotImplementedError(f"doctor_patients upserts are not available on {dialect}")
+        connection.execute(stmt)
+
+
+def rebuild(connection: Connection, doctor_ids: Iterable[int]) -> None:
+    """Recompute the pairs of ``doctor_ids`` from live and archived appointments."""
+    ids = sorted(set(doctor_ids))
+    if not ids:
+        return
+    table = DoctorPatient.__table__
+    sources = [
+        select(model.doctor_id, model.patient_id, model.start_at, model.status).where(model.doctor_id.in_(ids))
+        for model in (AppointmentModel, ArchivedAppointment)
+    ]
+    rows = union_all(*sources).subquery()
+    aggregate = select(
+        rows.c.doctor_id,
+        rows.c.patient_id,
+        func.min(rows.c.start_at),
+        func.max(rows.c.start_at),
+        func.coalesce(func.sum(case((rows.c.status != AppointmentStatus.CANCELED, 1), else_=0)), 0),
+    ).group_by(rows.c.doctor_id, rows.c.patient_id)
+    connection.execute(delete(table).where(table.c.doctor_id.in_(ids)))
+    connection.execute(
+        insert(table).from_select(
+            ["doctor_id", "patient_id", "first_seen", "last_appointment_at", "appointment_count"],
+            aggregate,
+        )
+    )
+
+
+event.listen(Session, "after_flush", _track_appointments)
+
+
+__all__ = ["rebuild"]
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+from collections import Counter
+from contextlib import contextmanager
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Iterator
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.db.broker import DBBroker, get_dbbroker
+from app.models.appointment_block import AppointmentBlock as AppointmentBlockModel
+from app.models.availability import Availability as AvailabilityModel
+from app.models.doctor import Doctor as DoctorModel
+from app.models.enums import UserRole
+from app.models.office import Office as OfficeModel
+from app.models.user import User as UserModel
+from app.schemas.doctor_provisioning import (
+    DoctorProvision,
+    DoctorProvisioningReport,
+    DoctorProvisioningRequest,
+    WeeklySlot,
+)
+from app.schemas.user import Doctor
+from app.services.dashboard_counters import ACTIVE_DOCTORS, USERS, apply_deltas
+from app.services.doctor_directory import directory_cache
+from app.services.system_settings import SystemSettingsService
+from app.utils.security import hash_password
+
+
+_USER_FIELDS = ("email", "is_active", "is_superuser", "full_name")
+_DOCTOR_FIELDS = ("specialty", "license_number", "years_experience", "office_id")
+
+
+class DoctorProvisioningService:
+    """Create many doctors, and optionally their weekly availability, at once.
+
+    The whole batch is checked before anything is written: offices, emails and
+    license numbers are looked up with one ``IN`` query each, and any problem
+    rejects the batch with a ``ValueError`` naming every offending entry. The
+    rows are then written with one multi-row ``INSERT`` per table, so the
+    statement count does not grow with the batch. The inserts bypass the ORM,
+    so the dashboard counters and the directory cache are updated here.
+    """
+
+    def __init__(self, session: Session | None = None, *, broker: DBBroker | None = None) -> None:
+        self._session = session
+        self._broker = broker
+
+    def provision(self, data: DoctorProvisioningRequest) -> DoctorProvisioningReport:
+        with self._session_scope() as session:
+            block_duration = SystemSettingsService(session).get_block_duration()
+            problems = self._problems(session, data.doctors, block_duration)
+            if problems:
+                raise ValueError("; ".join(problems))
+
+            connection = session.connection()
+            connection.execute(
+                insert(UserModel.__table__),
+                [
+                    {
+                        **entry.model_dump(include=set(_USER_FIELDS)),
+                        "password_hash": hash_password(entry.password),
+                        "role": UserRole.DOCTOR,
+                    }
+                    for entry in data.doctors
+                ],
+            )
+            emails = [entry.email for entry in data.doctors]
+            ids = {
+                email.lower(): user_id
+                for email, user_id in session.execute(
+                    select(UserModel.email, UserModel.id).where(UserModel.email.in_(emails))
+                )
+            }
+            doctor_ids = [ids[entry.email.lower()] for entry in data.doctors]
+            connection.execute(
+                insert(DoctorModel.__table__),
+                [
+                    {"id": doctor_id, **entry.model_dump(include=set(_DOCTOR_FIELDS))}
+                    for doctor_id, entry in zip(doctor_ids, data.doctors)
+                ],
+            )
+            availabilities, blocks = self._insert_availability(
+                session, data, doctor_ids, timedelta(minutes=block_duration)
+            )
+
+            active = sum(1 for entry in data.doctors if entry.is_active)
+            apply_deltas(connection, {USERS: len(data.doctors), ACTIVE_DOCTORS: active})
+            directory_cache.invalidate_on_commit(session)
+            return DoctorProvisioningReport(
+                doctors=[_to_schema(doctor_id, entry) for doctor_id, entry in zip(doctor_ids, data.doctors)],
+                availabilities=availabilities,
+                blocks=blocks,
+            )
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _problems(session: Session, doctors: list[DoctorProvision], block_duration: int) -> list[str]:
+        """Everything that keeps the batch from being written, one query per lookup."""
+        emails = Counter(entry.email.lower() for entry in doctors)
+        licenses = Counter(entry.license_number for entry in doctors if entry.license_number)
+        office_ids = {entry.office_id for entry in doctors if entry.office_id is not None}
+
+        taken_emails = {
+            email.lower()
+            for email in session.scalars(
+                select(UserModel.email).where(UserModel.email.in_([entry.email for entry in doctors]))
+            )
+        }
+        taken_licenses = (
+            set(session.scalars(select(DoctorModel.license_number).where(DoctorModel.license_number.in_(licenses))))
+            if licenses
+            else set()
+        )
+        offices = (
+            set(session.scalars(select(OfficeModel.id).where(OfficeModel.id.in_(office_ids))))
+            if office_ids
+            else set()
+        )
+
+        problems: list[str] = []
+        for index, entry in enumerate(doctors):
+            email = entry.email.lower()
+            if emails[email] > 1:
+                problems.append(f"doctors[{index}]: email {entry.email} repeated in the batch")
+            elif email in taken_emails:
+                problems.append(f"doctors[{index}]: email {entry.email} already registered")
+            if entry.license_number:
+                if licenses[entry.license_number] > 1:
+                    problems.append(f"doctors[{index}]: license number {entry.license_number} repeated in the batch")
+                elif entry.license_number in taken_licenses:
+                    problems.append(f"doctors[{index}]: license number {entry.license_number} already registered")
+            if entry.office_id is not None and entry.office_id not in offices:
+                problems.append(f"doctors[{index}]: office with id {entry.office_id} does not exist")
+            problems.extend(
+                f"doctors[{index}]: {problem}" for problem in _slot_problems(entry.weekly_availability, block_duration)
+            )
+        return problems
+
+    @staticmethod
+    def _insert_availability(
+        session: Session,
+        data: DoctorProvisioningRequest,
+        doctor_ids: list[int],
+        block: timedelta,
+    ) -> tuple[int, int]:
+        first_day = data.availability_from or datetime.now(timezone.utc).date()
+        rows = [
+            {"doctor_id": doctor_id, "start_at": start, "end_at": end}
+            for doctor_id, entry in zip(doctor_ids, data.doctors)
+            for slot in entry.weekly_availability
+            for start, end in _occurrences(slot, first_day, data.weeks)
+        ]
+        if not rows:
+            return 0, 0
+        connection = session.connection()
+        connection.execute(insert(AvailabilityModel.__table__), rows)
+
+        # The doctors are new, so every availability they have was just written
+        created = session.execute(
+            select(AvailabilityModel.id, AvailabilityModel.doctor_id, AvailabilityModel.start_at, AvailabilityModel.end_at)
+            .where(AvailabilityModel.doctor_id.in_(doctor_ids))
+        ).all()
+        blocks = []
+        for availability_id, doctor_id, start_at, end_at in created:
+            current, number = start_at, 1
+            while current < end_at:
+                blocks.append(
+                    {
+                        "availability_id": availability_id,
+                        "doctor_id": doctor_id,
+                        "block_number": number,
+                        "start_at": current,
+                        "end_at": current + block,
+                        "is_booked": False,
+                    }
+                )
+                current += block
+                number += 1
+        connection.execute(insert(AppointmentBlockModel.__table__), blocks)
+        return len(created), len(blocks)
+
+    @contextmanager
+    def _session_scope(self) -> Iterator[Session]:
+        if self._session is not None:
+            yield self._session
+        else:
+            broker = self._broker or get_dbbroker()
+            with broker.session() as session:
+                yield session
+
+
+def _slot_problems(slots: list[WeeklySlot], block_duration: int) -> list[str]:
+    # The same alignment rules as AppointmentsService.create_availability
+    problems: list[str] = []
+    latest_end: dict[int, time] = {}
+    for slot in sorted(slots, key=lambda slot: (slot.weekday, slot.start)):
+        label = f"slot {slot.start:%H:%M}-{slot.end:%H:%M} on weekday {slot.weekday}"
+        if slot.start.minute or slot.start.second:
+            problems.append(f"{label} must start on the hour")
+        minutes = (slot.end.hour * 60 + slot.end.minute) - (slot.start.hour * 60 + slot.start.minute)
+        if minutes % block_duration:
+            problems.append(f"{label} must last a multiple of {block_duration} minutes")
+        end = latest_end.get(slot.weekday)
+        if end is not None and slot.start < end:
+            problems.append(f"{label} overlaps another slot")
+        latest_end[slot.weekday] = max(end, slot.end) if end is not None else slot.end
+    return problems
+
+
+def _occurrences(slot: WeeklySlot, first_day: date, weeks: int) -> Iterator[tuple[datetime, datetime]]:
+    day = first_day + timedelta(days=(slot.weekday - first_day.weekday()) % 7)
+    for _ in range(weeks):
+        yield (
+            datetime.combine(day, slot.start, tzinfo=timezone.utc),
+            datetime.combine(day, slot.end, tzinfo=timezone.utc),
+        )
+        day += timedelta(weeks=1)
+
+
+def _to_schema(doctor_id: int, entry: DoctorProvision) -> Doctor:
+    return Doctor(
+        id=doctor_id,
+        password="***",
+        role=UserRole.DOCTOR.value,
+        **entry.model_dump(include={*_USER_FIELDS, *_DOCTOR_FIELDS}),
+    )
+
+
+__all__ = ["DoctorProvisioningService"]
@@ -3,29 +3,85 @@ from __future__ import annotations
 from contextlib import contextmanager
 from typing import Iterator
 
-from sqlalchemy import select, func, distinct
+from sqlalchemy import bindparam, delete, select, func, union_all, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload
 
 from app.db.broker import DBBroker, get_dbbroker
 from app.models.doctor import Doctor as DoctorModel
+from app.models.doctor_patient import DoctorPatient as DoctorPatientModel
 from app.models.enums import UserRole
 from app.models.user import User as UserModel
 from app.models.patient import Patient as PatientModel
 from app.models.appointment import Appointment as AppointmentModel
+from app.models.archive import ArchivedAppointment
 from app.models.office import Office as OfficeModel
 from app.models.availability import Availability
+from app.models.appointment_block import AppointmentBlock
+from app.models.medical_record import MedicalRecord as MedicalRecordModel
 from app.schemas.pagination import PaginatedResponse
 from app.schemas.user import Doctor, DoctorCreate, DoctorUpdate, Patient
+from app.services.dashboard_counters import ACTIVE_DOCTORS, USERS, apply_deltas
+from app.services.doctor_directory import directory_cache
 from app.utils.security import hash_password, verify_password
 
 
+# Built once at import; login only binds the email.
+_AUTHENTICATE_STMT = (
+    select(DoctorModel)
+    .join(DoctorModel.user)
+    .options(joinedload(DoctorModel.user))
+    .where(UserModel.email == bindparam("email"))
+)
+
+# Existence checks only need the key. The user join mirrors get(), which treats
+# a doctor without its user row as missing.
+_EXISTS_STMT = (
+    select(DoctorModel.id)
+    .join(DoctorModel.user)
+    .where(DoctorModel.id == bindparam("doctor_id"))
+)
+
+# Deletion reads only what its checks and the counters need. A doctor row
+# without its user is still deleted.
+_DELETE_TARGET_STMT = (
+    select(UserModel.full_name, UserModel.email, UserModel.role, UserModel.is_active)
+    .select_from(DoctorModel)
+    .outerjoin(UserModel, UserModel.id == DoctorModel.id)
+    .where(DoctorModel.id == bindparam("doctor_id"))
+)
+
+# Archived appointments count too: their rows cascade with the doctor
+_APPOINTMENT_HISTORY = union_all(
+    select(AppointmentModel.id, AppointmentModel.patient_id, AppointmentModel.start_at)
+    .where(AppointmentModel.doctor_id == bindparam("doctor_id")),
+    select(ArchivedAppointment.id, ArchivedAppointment.patient_id, ArchivedAppointment.start_at)
+    .where(ArchivedAppointment.doctor_id == bindparam("doctor_id")),
+).subquery("history")
+
+_APPOINTMENT_COUNT_STMT = select(func.count()).select_from(_APPOINTMENT_HISTORY)
+
+# Patients named in the "has appointments" error; the first three are enough
+_APPOINTMENT_PATIENTS_STMT = (
+    select(func.coalesce(UserModel.full_name, UserModel.email))
+    .select_from(_APPOINTMENT_HISTORY)
+    .join(UserModel, UserModel.id == _APPOINTMENT_HISTORY.c.patient_id)
+    .order_by(_APPOINTMENT_HISTORY.c.start_at, _APPOINTMENT_HISTORY.c.id)
+    .limit(3)
+)
+
+
 class DoctorsService:
     """Service layer backed by the relational database for doctor profiles."""
 
     def __init__(self, session: Session | None = None, *, broker: DBBroker | None = None) -> None:
         self._session = session
         self._broker = broker
+        # Existence memo for session-bound services. A UnitOfWork builds
+        # services per request, so each doctor is checked at most once per
+        # request; broker-backed instances span sessions and skip it. get() is
+        # not memoized: writes through other services would leave it stale.
+        self._known: dict[int, bool] = {}
 
     # ------------------------------------------------------------------
     # Public API
@@ -59,9 +115,19 @@ class DoctorsService:
     def get(self, doctor_id: int) -> Doctor | None:
         with self._session_scope() as session:
             model = session.get(DoctorModel, doctor_id)
-            if not model or not model.user:
-                return None
-            return self._to_schema(model)
+            result = self._to_schema(model) if model and model.user else None
+        self._remember(doctor_id, result)
+        return result
+
+    def exists(self, doctor_id: int) -> bool:
+        """Whether the doctor exists, without loading the row or building a schema."""
+        if doctor_id in self._known:
+            return self._known[doctor_id]
+        with self._session_scope() as session:
+            found = session.scalar(_EXISTS_STMT, {"doctor_id": doctor_id}) is not None
+        if self._session is not None:
+            self._known[doctor_id] = found
+        return found
 
     def create(self, data: DoctorCreate) -> Doctor:
         payload = data.model_dump()
@@ -96,6 +162,7 @@ class DoctorsService:
             return self._to_schema(doctor)
 
     def update(self, doctor_id: int, data: DoctorUpdate) -> Doctor | None:
+        self._forget(doctor_id)
         changes = data.model_dump(exclude_unset=True)
         with self._session_scope() as session:
             doctor = session.get(DoctorModel, doctor_id)
@@ -127,116 +194,70 @@ class DoctorsService:
             return self._to_schema(doctor)
 
     def delete(self, doctor_id: int) -> bool:
+        """Delete a doctor with its schedule. Raises ValueError if they have appointments.
+
+        Archived appointments count as well, since deleting the doctor would
+        cascade to them.
+
+        Blocks, availabilities and the doctor's own rows go in one DELETE each
+        and medical records are detached with one UPDATE, so the cost does not
+        grow with the size of the schedule. Those statements skip the flush
+        hooks, so the dashboard counters and directory facets are adjusted
+        here.
+        """
+        self._forget(doctor_id)
         with self._session_scope() as session:
-            doctor = session.get(DoctorModel, doctor_id)
-            if not doctor:
+            row = session.execute(_DELETE_TARGET_STMT, {"doctor_id": doctor_id}).first()
+            if not row:
                 return False
 
-            user = doctor.user
-            
-            # Check if any appointments exist for this doctor
-            stmt = select(AppointmentModel).where(AppointmentModel.doctor_id == doctor_id)
-            appointments = session.scalars(stmt).all()
-            
-            if appointments:
-                patient_names = []
-                for appointment in appointments[:3]:  # Show first 3 appointments
-                    if appointment.patient and appointment.patient.user:
-                        patient_names.append(appointment.patient.user.full_name or appointment.patient.user.email)
-                
-                names_str = ', '.join(patient_names)
-                more_str = f" y {len(appointments) - 3} más" if len(appointments) > 3 else ""
-                
+            count = session.scalar(_APPOINTMENT_COUNT_STMT, {"doctor_id": doctor_id}) or 0
+            if count:
+                names_str = ', '.join(session.scalars(_APPOINTMENT_PATIENTS_STMT, {"doctor_id": doctor_id}))
+                more_str = f" y {count - 3} más" if count > 3 else ""
+
                 raise ValueError(
-                    f"No se puede eliminar al doctor '{doctor.user.full_name or doctor.user.email}' porque tiene "
-                    f"{len(appointments)} turno(s) con pacientes: {names_str}{more_str}. "
+                    f"No se puede eliminar al doctor '{row.full_name or row.email}' porque tiene "
+                    f"{count} turno(s) con pacientes: {names_str}{more_str}. "
                     f"Por favor cancelá todos los turnos primero."
                 )
-            
-            # Import models locally to avoid circular imports
-            from app.models.appointment_block import AppointmentBlock
-            
-            # Delete appointment_blocks that are linked to availabilities for this doctor
-            stmt = select(AppointmentBlock).join(Availability).where(Availability.doctor_id == doctor_id)
-            appointment_blocks = session.scalars(stmt).all()
-            for block in appointment_blocks:
-                session.delete(block)
-            
-            # Delete availabilities that reference this doctor
-            stmt = select(Availability).where(Availability.doctor_id == doctor_id)
-            availabilities = session.scalars(stmt).all()
-            for availability in availabilities:
-                session.delete(availability)
-            
-            # Delete doctor record
-            session.delete(doctor)
-            
-            # Delete user record last
-            if user:
-                session.delete(user)
-                
-            session.flush()
+
+            # Blocks reference availabilities, so they go first
+            session.execute(delete(AppointmentBlock).where(AppointmentBlock.doctor_id == doctor_id))
+            session.execute(delete(Availability).where(Availability.doctor_id == doctor_id))
+            session.execute(
+                update(MedicalRecordModel).where(MedicalRecordModel.doctor_id == doctor_id).values(doctor_id=None)
+            )
+            session.execute(delete(DoctorModel).where(DoctorModel.id == doctor_id))
+
+            if row.role is not None:
+                session.execute(delete(UserModel).where(UserModel.id == doctor_id))
+                deltas = {USERS: -1}
+                if row.role == UserRole.DOCTOR and row.is_active:
+                    deltas[ACTIVE_DOCTORS] = -1
+                apply_deltas(session.connection(), deltas)
+            directory_cache.invalidate_on_commit(session)
             return True
 
     def get_patients_for_doctor(self, doctor_id: int) -> list[Patient]:
-        """Get all patients that have had appointments with this doctor."""
+        """Get all patients that have had appointments with this doctor, most recent first."""
         with self._session_scope() as session:
-            # Fixed query to handle MySQL DISTINCT with ORDER BY limitation
-            # First get distinct patient IDs with their latest appointment time
-            subquery = (
-                select(
-                    AppointmentModel.patient_id,
-                    func.max(AppointmentModel.start_at).label('latest_appointment')
-                )
-                .where(AppointmentModel.doctor_id == doctor_id)
-                .group_by(AppointmentModel.patient_id)
-                .subquery()
-            )
-            
-            # Then join with patients and order by the latest appointment time
-            stmt = (
-                select(PatientModel)
-                .options(joinedload(PatientModel.user))
-                .join(subquery, PatientModel.id == subquery.c.patient_id)
-                .order_by(subquery.c.latest_appointment.desc())
-            )
-            patients = session.scalars(stmt).all()
+            patients = session.scalars(self._patients_stmt(doctor_id)).all()
             return [self._patient_to_schema(patient) for patient in patients if patient.user]
 
     def get_patients_for_doctor_paginated(self, doctor_id: int, page: int = 1, size: int = 10) -> PaginatedResponse[Patient]:
         """Get paginated list of patients that have had appointments with this doctor."""
         with self._session_scope() as session:
-            # Get total count
             count_stmt = (
-                select(func.count(distinct(PatientModel.id)))
-                .join(AppointmentModel, PatientModel.id == AppointmentModel.patient_id)
-                .where(AppointmentModel.doctor_id == doctor_id)
+                select(func.count())
+                .select_from(DoctorPatientModel)
+                .where(DoctorPatientModel.doctor_id == doctor_id)
             )
             total = session.scalar(count_stmt) or 0
-            
-            # Fixed query to handle MySQL DISTINCT with ORDER BY limitation
-            # First get distinct patient IDs with their latest appointment time
-            subquery = (
-                select(
-                    AppointmentModel.patient_id,
-                    func.max(AppointmentModel.start_at).label('latest_appointment')
-                )
-                .where(AppointmentModel.doctor_id == doctor_id)
-                .group_by(AppointmentModel.patient_id)
-                .subquery()
-            )
-            
-            # Then join with patients and order by the latest appointment time
-            stmt = (
-                select(PatientModel)
-                .options(joinedload(PatientModel.user))
-                .join(subquery, PatientModel.id == subquery.c.patient_id)
-                .order_by(subquery.c.latest_appointment.desc())
-            )
-            
+
             # Apply pagination
             offset = (page - 1) * size
-            paginated_stmt = stmt.offset(offset).limit(size)
+            paginated_stmt = self._patients_stmt(doctor_id).offset(offset).limit(size)
             patients = session.scalars(paginated_stmt).all()
             
             return PaginatedResponse.create(
@@ -248,13 +269,7 @@ class DoctorsService:
 
     def authenticate(self, email: str, password: str) -> tuple[Doctor, str] | None:
         with self._session_scope() as session:
-            stmt = (
-                select(DoctorModel)
-                .join(DoctorModel.user)
-                .options(joinedload(DoctorModel.user))
-                .where(UserModel.email == email)
-            )
-            doctor = session.scalars(stmt).first()
+            doctor = session.scalars(_AUTHENTICATE_STMT, {"email": email}).first()
             if not doctor or not doctor.user or not doctor.user.is_active:
                 return None
 
@@ -268,6 +283,25 @@ class DoctorsService:
             return self._to_schema(doctor), f"doctor-token-{doctor.user.id}"
 
     # ------------------------------------------------------------------
+    def _remember(self, doctor_id: int, value: Doctor | None) -> None:
+        if self._session is not None:
+            self._known[doctor_id] = value is not None
+
+    def _forget(self, doctor_id: int) -> None:
+        self._known.pop(doctor_id, None)
+
+    @staticmethod
+    def _patients_stmt(doctor_id: int):
+        # A range of the maintained doctor_patients index instead of grouping
+        # every appointment of the doctor
+        return (
+            select(PatientModel)
+            .options(joinedload(PatientModel.user))
+            .join(DoctorPatientModel, DoctorPatientModel.patient_id == PatientModel.id)
+            .where(DoctorPatientModel.doctor_id == doctor_id)
+            .order_by(DoctorPatientModel.last_appointment_at.desc(), DoctorPatientModel.patient_id.desc())
+        )
+
     @contextmanager
     def _session_scope(self) -> Iterator[Session]:
         if self._session is not None:
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from app.repositories.appointments import InMemoryAppointmentStore
+from app.services.appointments import AppointmentsService
+from app.services.system_settings import DEFAULT_BLOCK_DURATION
+
+
+class _KnownIds:
+    """Stands in for the patients or doctors service: an id exists when it is in ``ids``."""
+
+    def __init__(self, ids: set[int]) -> None:
+        self._ids = ids
+
+    def exists(self, item_id: int) -> bool:
+        return item_id in self._ids
+
+
+class _FixedBlockDuration:
+    """Stands in for the settings service with a constant block duration."""
+
+    def __init__(self, minutes: int) -> None:
+        self._minutes = minutes
+
+    def get_block_duration(self) -> int:
+        return self._minutes
+
+
+class InMemoryAppointmentsService(AppointmentsService):
+    """``AppointmentsService`` running on an ``InMemoryAppointmentStore``.
+
+    Same commands, queries, validation rules and errors as the database-backed
+    service, without a database: meant for simulations and benchmarks of the
+    scheduling rules. Doctors and patients exist when their ids are in the
+    store's ``doctor_ids`` and ``patient_ids``; nothing is ever archived, so
+    ``include_archived`` changes nothing. Returned appointments are the stored
+    instances and must not be modified in place.
+    """
+
+    def __init__(
+        self,
+        store: InMemoryAppointmentStore | None = None,
+        *,
+        block_duration: int = DEFAULT_BLOCK_DURATION,
+    ) -> None:
+        self.store = store or InMemoryAppointmentStore()
+        super().__init__(
+            None,
+            patients=_KnownIds(self.store.patient_ids),
+            doctors=_KnownIds(self.store.doctor_ids),
+            settings=_FixedBlockDuration(block_duration),
+            store=self.store,
+        )
+
+
+__all__ = ["InMemoryAppointmentsService"]
@@ -1,32 +1,56 @@
 from __future__ import annotations
 
+import base64
+import binascii
+import json
 from contextlib import contextmanager
 from typing import Iterator, Optional
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, and_, func, or_, select
 from sqlalchemy.orm import Session, joinedload
 
+from app.db import fulltext
 from app.db.broker import DBBroker, get_dbbroker
 from app.models.medical_record import MedicalRecord as MedicalRecordModel
 from app.models.doctor import Doctor as DoctorModel
 from app.models.user import User as UserModel
-from app.schemas.medical_record import MedicalRecord, MedicalRecordCreate, MedicalRecordUpdate
+from app.schemas.medical_record import (
+    MedicalRecord,
+    MedicalRecordCreate,
+    MedicalRecordHit,
+    MedicalRecordSearchPage,
+    MedicalRecordSummary,
+    MedicalRecordUpdate,
+)
+from app.schemas.pagination import PaginatedResponse
 from app.services.doctors import DoctorsService
 from app.services.patients import PatientsService
 
 
+# Characters of the diagnosis sent in list summaries
+PREVIEW_LENGTH = 120
+
+
 class MedicalRecordsService:
     """Service layer backed by the database for clinical records."""
 
-    def __init__(self, session: Session | None = None, *, broker: DBBroker | None = None) -> None:
+    def __init__(
+        self,
+        session: Session | None = None,
+        *,
+        broker: DBBroker | None = None,
+        patients: PatientsService | None = None,
+        doctors: DoctorsService | None = None,
+    ) -> None:
         self._session = session
         self._broker = broker
+        self._patients = patients
+        self._doctors = doctors
 
     # ------------------------------------------------------------------
     def list_for_patient(self, patient_id: int) -> list[MedicalRecord]:
         with self._session_scope() as session:
-            patients = PatientsService(session)
-            if not patients.get(patient_id):
+            if not self._patients_for(session).exists(patient_id):
                 return []
 
             stmt = (
@@ -42,8 +66,7 @@ class MedicalRecordsService:
 
     def list_for_doctor(self, doctor_id: int) -> list[MedicalRecord]:
         with self._session_scope() as session:
-            doctors = DoctorsService(session)
-            if not doctors.get(doctor_id):
+            if not self._doctors_for(session).exists(doctor_id):
                 return []
 
             stmt = (
@@ -60,8 +83,7 @@ class MedicalRecordsService:
     def get_patient_history(self, patient_id: int) -> list[MedicalRecord]:
         """Get all medical records for a patient from all doctors."""
         with self._session_scope() as session:
-            patients = PatientsService(session)
-            if not patients.get(patient_id):
+            if not self._patients_for(session).exists(patient_id):
                 return []
 
             stmt = (
@@ -75,6 +97,79 @@ class MedicalRecordsService:
             records = session.scalars(stmt).all()
             return [self._to_schema_with_doctor(record) for record in records]
 
+    def list_for_patient_paginated(
+        self, patient_id: int, page: int = 1, size: int = 10
+    ) -> PaginatedResponse[MedicalRecordSummary]:
+        return self._summaries(MedicalRecordModel.patient_id == patient_id, page, size)
+
+    def list_for_doctor_paginated(
+        self, doctor_id: int, page: int = 1, size: int = 10
+    ) -> PaginatedResponse[MedicalRecordSummary]:
+        return self._summaries(MedicalRecordModel.doctor_id == doctor_id, page, size)
+
+    def get_patient_history_paginated(
+        self, patient_id: int, page: int = 1, size: int = 10
+    ) -> PaginatedResponse[MedicalRecordSummary]:
+        """Page of a patient's records from all doctors, newest first."""
+        return self.list_for_patient_paginated(patient_id, page=page, size=size)
+
+    def search(
+        self,
+        query: str,
+        *,
+        doctor_id: Optional[int] = None,
+        patient_id: Optional[int] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> MedicalRecordSearchPage:
+        """Records whose diagnosis, treatment or notes contain every word of ``query``.
+
+        Words match as prefixes, ignoring case and accents. Results are ranked
+        by relevance (ties by newest id) and paged by keyset: ``next_cursor``
+        holds the last (score, id) returned.
+        """
+        search_terms = fulltext.terms(query)
+        if not search_terms:
+            raise ValueError(f"Search needs a word of at least {fulltext.MIN_TERM_LENGTH} characters")
+
+        with self._session_scope() as session:
+            matches = fulltext.ranked_matches(
+                session.get_bind().dialect.name,
+                search_terms,
+                MedicalRecordModel.diagnosis,
+                MedicalRecordModel.treatment,
+                MedicalRecordModel.notes,
+            )
+            stmt = (
+                select(MedicalRecordModel, matches.c.score)
+                .join(matches, matches.c.id == MedicalRecordModel.id)
+                .options(joinedload(MedicalRecordModel.doctor).joinedload(DoctorModel.user))
+                .order_by(matches.c.score.desc(), MedicalRecordModel.id.desc())
+                .limit(limit + 1)
+            )
+            if doctor_id is not None:
+                stmt = stmt.where(MedicalRecordModel.doctor_id == doctor_id)
+            if patient_id is not None:
+                stmt = stmt.where(MedicalRecordModel.patient_id == patient_id)
+            if cursor is not None:
+                last_score, last_id = self._decode_cursor(cursor)
+                stmt = stmt.where(
+                    or_(
+                        matches.c.score < last_score,
+                        and_(matches.c.score == last_score, MedicalRecordModel.id < last_id),
+                    )
+                )
+
+            rows = session.execute(stmt).all()
+            items = [
+                MedicalRecordHit(**self._to_schema_with_doctor(record).model_dump(), score=score)
+                for record, score in rows[:limit]
+            ]
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = self._encode_cursor(items[-1].score, items[-1].id)
+        return MedicalRecordSearchPage(items=items, next_cursor=next_cursor)
+
     def get(self, record_id: int) -> MedicalRecord | None:
         with self._session_scope() as session:
             record = session.get(MedicalRecordModel, record_id)
@@ -85,19 +180,18 @@ class MedicalRecordsService:
     def create(self, data: MedicalRecordCreate) -> MedicalRecord:
         payload = data.model_dump()
         with self._session_scope() as session:
-            patients = PatientsService(session)
-            if not patients.get(payload["patient_id"]):
+            if not self._patients_for(session).exists(payload["patient_id"]):
                 raise ValueError("Patient not found")
 
             doctor_id: Optional[int] = payload.get("doctor_id")
             if doctor_id is not None:
-                doctors = DoctorsService(session)
-                if not doctors.get(doctor_id):
+                if not self._doctors_for(session).exists(doctor_id):
                     raise ValueError("Doctor not found")
 
             record = MedicalRecordModel(**payload)
             session.add(record)
             session.flush()
+            fulltext.sync(session.connection(), record.id, payload)
             return self._to_schema(record)
 
     def update(self, record_id: int, data: MedicalRecordUpdate) -> MedicalRecord | None:
@@ -110,17 +204,68 @@ class MedicalRecordsService:
 
             doctor_id = changes.get("doctor_id")
             if doctor_id is not None:
-                doctors = DoctorsService(session)
-                if not doctors.get(doctor_id):
+                if not self._doctors_for(session).exists(doctor_id):
                     raise ValueError("Doctor not found")
 
             for field, value in changes.items():
                 setattr(record, field, value)
 
             session.flush()
+            if changes.keys() & set(fulltext.SEARCH_COLUMNS):
+                fulltext.sync(
+                    session.connection(),
+                    record.id,
+                    {name: getattr(record, name) for name in fulltext.SEARCH_COLUMNS},
+                )
             return self._to_schema(record)
 
     # ------------------------------------------------------------------
+    def _summaries(
+        self, condition: ColumnElement[bool], page: int, size: int
+    ) -> PaginatedResponse[MedicalRecordSummary]:
+        """Newest-first page selecting only the summary columns, never the full texts."""
+        with self._session_scope() as session:
+            total = session.scalar(select(func.count()).select_from(MedicalRecordModel).where(condition)) or 0
+            if not total:
+                return PaginatedResponse.create(items=[], total=0, page=page, size=size)
+
+            stmt = (
+                select(
+                    MedicalRecordModel.id,
+                    MedicalRecordModel.patient_id,
+                    MedicalRecordModel.doctor_id,
+                    UserModel.full_name,
+                    # One extra character tells whether the text was cut
+                    func.substr(MedicalRecordModel.diagnosis, 1, PREVIEW_LENGTH + 1),
+                    MedicalRecordModel.created_at,
+                    MedicalRecordModel.updated_at,
+                )
+                .outerjoin(UserModel, UserModel.id == MedicalRecordModel.doctor_id)
+                .where(condition)
+                .order_by(MedicalRecordModel.created_at.desc(), MedicalRecordModel.id.desc())
+                .offset((page - 1) * size)
+                .limit(size)
+            )
+            items = [
+                MedicalRecordSummary(
+                    id=record_id,
+                    patient_id=patient_id,
+                    doctor_id=doctor_id,
+                    doctor_name=(full_name or f"Dr. #{doctor_id}") if doctor_id is not None else None,
+                    diagnosis_preview=(
+                        preview[:PREVIEW_LENGTH].rstrip() + "…"
+                        if preview and len(preview) > PREVIEW_LENGTH
+                        else preview
+                    ),
+                    created_at=created_at,
+                    updated_at=updated_at,
+                )
+                for record_id, patient_id, doctor_id, full_name, preview, created_at, updated_at in session.execute(
+                    stmt
+                )
+            ]
+        return PaginatedResponse.create(items=items, total=total, page=page, size=size)
+
     @contextmanager
     def _session_scope(self) -> Iterator[Session]:
         if self._session is not None:
@@ -130,6 +275,24 @@ class MedicalRecordsService:
             with broker.session() as session:
                 yield session
 
+    def _patients_for(self, session: Session) -> PatientsService:
+        return self._patients or PatientsService(session)
+
+    def _doctors_for(self, session: Session) -> DoctorsService:
+        return self._doctors or DoctorsService(session)
+
+    @staticmethod
+    def _encode_cursor(score: float, record_id: int) -> str:
+        return base64.urlsafe_b64encode(json.dumps([score, record_id]).encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple[float, int]:
+        try:
+            score, record_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return float(score), int(record_id)
+        except (binascii.Error, ValueError, TypeError) as exc:
+            raise ValueError("Invalid cursor") from exc
+
     @staticmethod
     def _to_schema(model: MedicalRecordModel) -> MedicalRecord:
         return MedicalRecord(
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import csv
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
+from itertools import islice
+from typing import Iterable, Iterator, Mapping, Optional
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.db.broker import DBBroker, get_dbbroker
+from app.models.enums import UserRole
+from app.models.patient import Patient as PatientModel
+from app.models.user import User as UserModel
+from app.schemas.patient_import import PatientImportError, PatientImportReport
+from app.schemas.user import PatientCreate
+from app.services.dashboard_counters import USERS, apply_deltas
+from app.services.patient_search import reindex
+from app.utils.security import hash_password
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1000
+# Columns of the CSV file: the PatientCreate fields, required ones first
+CSV_COLUMNS = tuple(
+    sorted(PatientCreate.model_fields, key=lambda name: not PatientCreate.model_fields[name].is_required())
+)
+REQUIRED_COLUMNS = tuple(name for name, field in PatientCreate.model_fields.items() if field.is_required())
+
+_USER_FIELDS = ("email", "is_active", "is_superuser", "full_name")
+
+# (CSV line, row as read)
+_Row = tuple[int, Mapping[str, Optional[str]]]
+
+
+class PatientImportService:
+    """Create patients in bulk from CSV rows.
+
+    Rows are handled ``chunk_size`` at a time: each is validated like
+    ``PatientCreate``, emails, document numbers and medical record numbers are
+    checked against the file so far and against the database with one ``IN``
+    query each, and the survivors are written with one multi-row ``INSERT``
+    into ``users`` and one into ``patients``. Rejected rows are reported with
+    their line and never stop the import.
+
+    Bound to a session, everything runs in that session's transaction;
+    broker-backed, every chunk commits on its own, so an interrupted import
+    keeps the chunks already written. The inserts bypass the ORM, so the
+    dashboard counters and patient search terms are updated here.
+    """
+
+    def __init__(
+        self,
+        session: Session | None = None,
+        *,
+        broker: DBBroker | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        hash_workers: int = 0,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        self._session = session
+        self._broker = broker
+        self._chunk_size = chunk_size
+        self._hash_workers = hash_workers
+
+    def import_csv(self, lines: Iterable[str]) -> PatientImportReport:
+        """Import a CSV file (an iterable of lines) whose header names ``CSV_COLUMNS``."""
+        reader = csv.DictReader(lines)
+        columns = [name.strip() for name in reader.fieldnames or []]
+        unknown = sorted(set(columns) - set(CSV_COLUMNS))
+        if unknown:
+            raise ValueError(f"Unknown column(s): {', '.join(unknown)}")
+        missing = [name for name in REQUIRED_COLUMNS if name not in columns]
+        if missing:
+            raise ValueError(f"Missing required column(s): {', '.join(missing)}")
+        reader.fieldnames = columns
+        # DictReader.line_num is the line the row ended on (quoted fields may span lines)
+        return self.import_rows((reader.line_num, row) for row in reader)
+
+    def import_rows(self, rows: Iterable[_Row]) -> PatientImportReport:
+        """Import ``(line, row)`` pairs; values are strings, blank meaning unset."""
+        report = PatientImportReport()
+        seen: dict[str, set] = {"email": set(), "document": set(), "medical_record_number": set()}
+        pool = ProcessPoolExecutor(self._hash_workers) if self._hash_workers > 1 else nullcontext()
+        with pool as executor:
+            iterator = iter(rows)
+            while chunk := list(islice(iterator, self._chunk_size)):
+                with self._session_scope() as session:
+                    created, errors = self._import_chunk(session, chunk, seen, executor)
+                report.created += created
+                report.failed += len(errors)
+                report.errors.extend(errors)
+                logger.info("Imported %d patient(s), %d rejected so far", report.created, report.failed)
+        return report
+
+    # ------------------------------------------------------------------
+    def _import_chunk(
+        self,
+        session: Session,
+        chunk: list[_Row],
+        seen: dict[str, set],
+        executor: Optional[Executor],
+    ) -> tuple[int, list[PatientImportError]]:
+        errors: list[PatientImportError] = []
+        valid: list[tuple[int, PatientCreate]] = []
+        for line, row in chunk:
+            values = _clean(row)
+            try:
+                valid.append((line, PatientCreate.model_validate(values)))
+            except ValidationError as exc:
+                errors.append(PatientImportError(line=line, email=values.get("email"), message=_describe(exc)))
+
+        taken = self._taken(session, [data for _, data in valid])
+        accepted: list[tuple[int, PatientCreate]] = []
+        for line, data in valid:
+            keys = _unique_keys(data)
+            # Earlier chunks are in the database too, so the file is checked first
+            duplicate = next((name for name, key in keys.items() if key is not None and key in seen[name]), None)
+            clash = next((name for name, key in keys.items() if key is not None and key in taken[name]), None)
+            if duplicate or clash:
+                if duplicate:
+                    message = f"{_LABELS[duplicate]} repeated in the file"
+                else:
+                    message = f"{_LABELS[clash]} already registered"
+                errors.append(PatientImportError(line=line, email=data.email, message=message))
+                continue
+            for name, key in keys.items():
+                if key is not None:
+                    seen[name].add(key)
+            accepted.append((line, data))
+
+        errors.sort(key=lambda error: error.line)
+        if not accepted:
+            return 0, errors
+
+        passwords = [data.password for _, data in accepted]
+        if executor is not None:
+            hashes = list(executor.map(hash_password, passwords, chunksize=64))
+        else:
+            hashes = [hash_password(password) for password in passwords]
+
+        connection = session.connection()
+        connection.execute(
+            insert(UserModel.__table__),
+            [
+                {
+                    **data.model_dump(include=set(_USER_FIELDS)),
+                    "password_hash": password_hash,
+                    "role": UserRole.PATIENT,
+                }
+                for (_, data), password_hash in zip(accepted, hashes)
+            ],
+        )
+        emails = [data.email for _, data in accepted]
+        ids = dict(session.execute(select(UserModel.email, UserModel.id).where(UserModel.email.in_(emails))).all())
+        connection.execute(
+            insert(PatientModel.__table__),
+            [
+                {"id": ids[data.email], **data.model_dump(exclude={"password", *_USER_FIELDS})}
+                for _, data in accepted
+            ],
+        )
+        reindex(connection, ids.values())
+        apply_deltas(connection, {USERS: len(accepted)})
+        return len(accepted), errors
+
+    @staticmethod
+    def _taken(session: Session, rows: list[PatientCreate]) -> dict[str, set]:
+        """Unique keys of ``rows`` that already belong to someone, one query per key."""
+        emails = {data.email for data in rows}
+        numbers = {data.document_number for data in rows}
+        records = {data.medical_record_number for data in rows if data.medical_record_number}
+        taken: dict[str, set] = {"email": set(), "document": set(), "medical_record_number": set()}
+        if emails:
+            taken["email"] = {
+                email.lower() for email in session.scalars(select(UserModel.email).where(UserModel.email.in_(emails)))
+            }
+        if numbers:
+            taken["document"] = {
+                (document_type, document_number)
+                for document_type, document_number in session.execute(
+                    select(PatientModel.document_type, PatientModel.document_number).where(
+                        PatientModel.document_number.in_(numbers)
+                    )
+                )
+            }
+        if records:
+            taken["medical_record_number"] = set(
+                session.scalars(
+                    select(PatientModel.medical_record_number).where(PatientModel.medical_record_number.in_(records))
+                )
+            )
+        return taken
+
+    @contextmanager
+    def _session_scope(self) -> Iterator[Session]:
+        if self._session is not None:
+            yield self._session
+        else:
+            broker = self._broker or get_dbbroker()
+            with broker.session() as session:
+                yield session
+
+
+_LABELS = {
+    "email": "Email",
+    "document": "Document number",
+    "medical_record_number": "Medical record number",
+}
+
+
+def _clean(row: Mapping[str, Optional[str]]) -> dict[str, str]:
+    # Blank cells fall back to the field defaults; passwords are kept verbatim
+    return {
+        key: value if key == "password" else value.strip()
+        for key, value in row.items()
+        if key and isinstance(value, str) and value.strip()
+    }
+
+
+def _unique_keys(data: PatientCreate) -> dict[str, Optional[object]]:
+    return {
+        # Emails compare case-insensitively, as the MySQL collation does
+        "email": data.email.lower(),
+        "document": (data.document_type, data.document_number),
+        "medical_record_number": data.medical_record_number,
+    }
+
+
+def _describe(exc: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(map(str, error['loc'])) or 'row'}: {error['msg']}" for error in exc.errors())
+
+
+__all__ = ["CSV_COLUMNS", "DEFAULT_CHUNK_SIZE", "PatientImportService", "REQUIRED_COLUMNS"]
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+from sqlalchemy import (
+    Connection,
+    Subquery,
+    and_,
+    case,
+    delete,
+    event,
+    exists,
+    insert,
+    inspect,
+    literal,
+    select,
+    union_all,
+)
+from sqlalchemy.orm import Session, aliased
+
+from app.models.enums import UserRole
+from app.models.patient import Patient as PatientModel
+from app.models.patient_search_term import PatientSearchTerm
+from app.models.user import User as UserModel
+from app.utils.text import compact, words
+
+
+NAME = "name"
+EMAIL = "email"
+DOCUMENT = "document"
+# Suffixes of the document number, so partial numbers match anywhere
+DOCUMENT_PART = "document_part"
+
+MAX_TERM_LENGTH = 64
+MIN_QUERY_LENGTH = 2
+_MIN_PART_LENGTH = 3
+
+# Rank 0 is an exact document match; everything else follows in term order
+EXACT_DOCUMENT = 0
+OTHER = 1
+
+
+def patient_terms(
+    full_name: Optional[str], email: Optional[str], document_number: Optional[str]
+) -> set[tuple[str, str]]:
+    """``(term, kind)`` keys a patient can be found by."""
+    terms: set[tuple[str, str]] = set()
+    for word in words(full_name or ""):
+        key = compact(word)[:MAX_TERM_LENGTH]
+        if key:
+            terms.add((key, NAME))
+    key = compact(email or "")[:MAX_TERM_LENGTH]
+    if key:
+        terms.add((key, EMAIL))
+    key = compact(document_number or "")[:MAX_TERM_LENGTH]
+    if key:
+        terms.add((key, DOCUMENT))
+        terms.update((key[start:], DOCUMENT_PART) for start in range(1, len(key) - _MIN_PART_LENGTH + 1))
+    return terms
+
+
+def reindex(connection: Connection, patient_ids: Iterable[int]) -> None:
+    """Rewrite the search terms of ``patient_ids`` from their current rows."""
+    ids = sorted(set(patient_ids))
+    if not ids:
+        return
+    table = PatientSearchTerm.__table__
+    rows = connection.execute(
+        select(PatientModel.id, UserModel.full_name, UserModel.email, PatientModel.document_number)
+        .join(UserModel, UserModel.id == PatientModel.id)
+        .where(PatientModel.id.in_(ids))
+    ).all()
+    connection.execute(delete(table).where(table.c.patient_id.in_(ids)))
+    values = [
+        {"term": term, "kind": kind, "patient_id": patient_id}
+        for patient_id, full_name, email, document_number in rows
+        for term, kind in patient_terms(full_name, email, document_number)
+    ]
+    if values:
+        connection.execute(insert(table), values)
+
+
+def candidates(query: str, limit: int) -> Optional[Subquery]:
+    """Subquery of ``(patient_id, rank, term)`` for patients matching ``query``, or None if too short.
+
+    The compacted query is matched as a prefix of document numbers (and their
+    suffixes) and emails; separately, every word of the query must prefix a
+    word of the name. Each branch walks the term index in order and stops
+    after ``limit`` rows, so broad queries cost no more than narrow ones; a
+    patient can appear more than once, so callers group by ``patient_id``.
+    """
+    key = compact(query)[:MAX_TERM_LENGTH]
+    if len(key) < MIN_QUERY_LENGTH:
+        return None
+
+    term = PatientSearchTerm
+    branches = [
+        select(
+            term.patient_id,
+            case((and_(term.kind == DOCUMENT, term.term == key), EXACT_DOCUMENT), else_=OTHER).label("rank"),
+            term.term,
+        )
+        .where(term.kind == kind, _prefix(term, key))
+        .order_by(term.term, term.patient_id)
+        .limit(limit)
+        for kind in (DOCUMENT, DOCUMENT_PART, EMAIL)
+    ]
+
+    # The longest word drives the index walk; the others are checked per patient
+    name_words = sorted({compact(word)[:MAX_TERM_LENGTH] for word in words(query)} - {""}, key=len, reverse=True)
+    if name_words:
+        driver, *others = name_words
+        stmt = select(term.patient_id, literal(OTHER).label("rank"), term.term).where(
+            term.kind == NAME, _prefix(term, driver)
+        )
+        for word in others:
+            other = aliased(PatientSearchTerm)
+            known = aliased(PatientSearchTerm)
+            stmt = stmt.where(
+                # Uncorrelated, so evaluated once: a word nobody has ends the walk early
+                exists().where(known.kind == NAME, _prefix(known, word)),
+                exists().where(other.patient_id == term.patient_id, other.kind == NAME, _prefix(other, word)),
+            )
+        branches.append(stmt.order_by(term.term, term.patient_id).limit(limit))
+
+    # SQLite only allows ORDER BY/LIMIT in a compound member inside a subquery
+    return union_all(*(select(branch.subquery()) for branch in branches)).subquery()
+
+
+def _prefix(term, key: str):
+    # A range instead of LIKE, so both SQLite and MySQL walk the index in order
+    upper = key[:-1] + chr(ord(key[-1]) + 1)
+    return and_(term.term >= key, term.term < upper)
+
+
+def _changed(obj, attributes: tuple[str, ...]) -> bool:
+    state = inspect(obj)
+    return any(state.attrs[attr].history.has_changes() for attr in attributes)
+
+
+def _reindex_flushed(session: Session, flush_context) -> None:
+    """Reindex patients whose name, email or document changed in this flush."""
+    ids: set[int] = set()
+    for obj in session.new:
+        if isinstance(obj, PatientModel):
+            ids.add(obj.id)
+    for obj in session.dirty:
+        if isinstance(obj, PatientModel) and _changed(obj, ("document_number",)):
+            ids.add(obj.id)
+        elif isinstance(obj, UserModel) and obj.role == UserRole.PATIENT and _changed(obj, ("full_name", "email")):
+            ids.add(obj.id)
+    if ids:
+        reindex(session.connection(), ids)
+
+
+# Instance state still shows the flushed changes at after_flush, and new
+# patients already have their ids.
+event.listen(Session, "after_flush", _reindex_flushed)
+
+
+__all__ = [
+    "DOCUMENT",
+    "DOCUMENT_PART",
+    "EMAIL",
+    "EXACT_DOCUMENT",
+    "MIN_QUERY_LENGTH",
+    "NAME",
+    "candidates",
+    "patient_terms",
+    "reindex",
+]
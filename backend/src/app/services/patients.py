@@ -3,9 +3,9 @@ from __future__ import annotations
 from contextlib import contextmanager
 from typing import Iterator
 
-from sqlalchemy import select, func
+from sqlalchemy import bindparam, select, func
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, contains_eager, joinedload
 
 from app.db.broker import DBBroker, get_dbbroker
 from app.models.enums import UserRole
@@ -13,16 +13,39 @@ from app.models.patient import Patient as PatientModel
 from app.models.user import User as UserModel
 from app.schemas.pagination import PaginatedResponse
 from app.schemas.user import Patient, PatientCreate, PatientUpdate
+from app.services import patient_search
 from app.utils.security import hash_password, verify_password
 from app.utils.pagination import paginate_query
 
 
+# Login is a hot path; build the statement once and bind the email per call.
+_AUTHENTICATE_STMT = (
+    select(PatientModel)
+    .join(PatientModel.user)
+    .options(joinedload(PatientModel.user))
+    .where(UserModel.email == bindparam("email"))
+)
+
+# Existence checks only need the key. The user join mirrors get(), which treats
+# a patient without its user row as missing.
+_EXISTS_STMT = (
+    select(PatientModel.id)
+    .join(PatientModel.user)
+    .where(PatientModel.id == bindparam("patient_id"))
+)
+
+
 class PatientsService:
     """Service layer backed by the relational database for patients."""
 
     def __init__(self, session: Session | None = None, *, broker: DBBroker | None = None) -> None:
         self._session = session
         self._broker = broker
+        # Existence memo for session-bound services. A UnitOfWork builds
+        # services per request, so each patient is checked at most once per
+        # request; broker-backed instances span sessions and skip it. get() is
+        # not memoized: writes through other services would leave it stale.
+        self._known: dict[int, bool] = {}
 
     # ------------------------------------------------------------------
     # Public API
@@ -53,12 +76,56 @@ class PatientsService:
                 size=size
             )
 
+    def search(self, query: str, limit: int = 20) -> list[Patient]:
+        """Patients matching ``query`` by name words, email or document number.
+
+        Matching is by prefix (anywhere in the document number), ignoring case,
+        accents and punctuation. An exact document match comes first, the rest
+        follow alphabetically by the matching word, so "gom" lists Gómez
+        before Gomila. Broad queries return the first ``limit`` matches in
+        that order rather than counting every match.
+        """
+        # Headroom for patients matched by more than one term
+        matches = patient_search.candidates(query, limit * 2)
+        if matches is None:
+            raise ValueError(f"Search needs at least {patient_search.MIN_QUERY_LENGTH} letters or digits")
+
+        best = (
+            select(
+                matches.c.patient_id,
+                func.min(matches.c.rank).label("rank"),
+                func.min(matches.c.term).label("term"),
+            )
+            .group_by(matches.c.patient_id)
+            .subquery()
+        )
+        stmt = (
+            select(PatientModel)
+            .join(best, best.c.patient_id == PatientModel.id)
+            .join(PatientModel.user)
+            .options(contains_eager(PatientModel.user))
+            .order_by(best.c.rank, best.c.term, PatientModel.id)
+            .limit(limit)
+        )
+        with self._session_scope() as session:
+            return [self._to_schema(model) for model in session.scalars(stmt)]
+
     def get(self, patient_id: int) -> Patient | None:
         with self._session_scope() as session:
             model = session.get(PatientModel, patient_id)
-            if not model or not model.user:
-                return None
-            return self._to_schema(model)
+            result = self._to_schema(model) if model and model.user else None
+        self._remember(patient_id, result)
+        return result
+
+    def exists(self, patient_id: int) -> bool:
+        """Whether the patient exists, without loading the row or building a schema."""
+        if patient_id in self._known:
+            return self._known[patient_id]
+        with self._session_scope() as session:
+            found = session.scalar(_EXISTS_STMT, {"patient_id": patient_id}) is not None
+        if self._session is not None:
+            self._known[patient_id] = found
+        return found
 
     def create(self, data: PatientCreate) -> Patient:
         payload = data.model_dump()
@@ -89,6 +156,7 @@ class PatientsService:
             return self._to_schema(patient)
 
     def update(self, patient_id: int, data: PatientUpdate) -> Patient | None:
+        self._forget(patient_id)
         changes = data.model_dump(exclude_unset=True)
         with self._session_scope() as session:
             patient = session.get(PatientModel, patient_id)
@@ -113,6 +181,7 @@ class PatientsService:
             return self._to_schema(patient)
 
     def delete(self, patient_id: int) -> bool:
+        self._forget(patient_id)
         with self._session_scope() as session:
             patient = session.get(PatientModel, patient_id)
             if not patient:
@@ -127,13 +196,7 @@ class PatientsService:
 
     def authenticate(self, email: str, password: str) -> Patient | None:
         with self._session_scope() as session:
-            stmt = (
-                select(PatientModel)
-                .join(PatientModel.user)
-                .options(joinedload(PatientModel.user))
-                .where(UserModel.email == email)
-            )
-            patient = session.scalars(stmt).first()
+            patient = session.scalars(_AUTHENTICATE_STMT, {"email": email}).first()
             if not patient or not patient.user or not patient.user.is_active:
                 return None
 
@@ -144,6 +207,13 @@ class PatientsService:
 
     # ------------------------------------------------------------------
     # Internal helpers
+    def _remember(self, patient_id: int, value: Patient | None) -> None:
+        if self._session is not None:
+            self._known[patient_id] = value is not None
+
+    def _forget(self, patient_id: int) -> None:
+        self._known.pop(patient_id, None)
+
     @contextmanager
     def _session_scope(self) -> Iterator[Session]:
         if self._session is not None:
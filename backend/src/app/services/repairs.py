@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import logging
+from typing import Optional
+
+from sqlalchemy import ColumnElement, exists, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.db.chunked import ChunkedJob
+from app.models.admin import Admin as AdminModel
+from app.models.appointment import Appointment as AppointmentModel
+from app.models.appointment_block import AppointmentBlock as AppointmentBlockModel
+from app.models.doctor import Doctor as DoctorModel
+from app.models.enums import AppointmentStatus
+from app.models.patient import Patient as PatientModel
+from app.services import doctor_patients
+from app.services.patient_search import reindex
+
+
+logger = logging.getLogger(__name__)
+
+VALID_ADMIN_ROLES = ("superadmin", "manager", "support")
+
+
+class LinkAppointmentsToBlocks(ChunkedJob):
+    """Attach appointments without a block to a free block of their doctor.
+
+    An exact time match wins; otherwise the first free block containing the
+    appointment is used. Appointments with no free block are left untouched.
+    Candidate blocks are locked (skipping rows other workers hold) and each
+    is claimed only if it is still free, so parallel chunks and live bookings
+    cannot end up on the same block.
+    """
+
+    name = "link_appointments_to_blocks"
+    model = AppointmentModel
+    description = "link appointments without block_id to a free matching block"
+
+    def scope(self) -> Optional[ColumnElement[bool]]:
+        return (AppointmentModel.block_id.is_(None)) & (AppointmentModel.status != AppointmentStatus.CANCELED)
+
+    def process_chunk(self, session: Session, ids: list[int]) -> int:
+        appointments = session.scalars(
+            select(AppointmentModel).where(AppointmentModel.id.in_(ids)).order_by(AppointmentModel.id)
+        ).all()
+        doctor_ids = {appointment.doctor_id for appointment in appointments}
+        earliest = min(appointment.start_at for appointment in appointments)
+        latest = max(appointment.end_at for appointment in appointments)
+
+        # One query for every candidate block of the chunk, then match in memory
+        free_blocks: dict[int, list[AppointmentBlockModel]] = {}
+        for block in session.scalars(
+            select(AppointmentBlockModel)
+            .where(AppointmentBlockModel.doctor_id.in_(doctor_ids))
+            .where(AppointmentBlockModel.is_booked.is_(False))
+            .where(AppointmentBlockModel.start_at <= latest)
+            .where(AppointmentBlockModel.end_at >= earliest)
+            .order_by(AppointmentBlockModel.start_at, AppointmentBlockModel.id)
+            .with_for_update(skip_locked=True)
+        ):
+            free_blocks.setdefault(block.doctor_id, []).append(block)
+
+        changed = 0
+        for appointment in appointments:
+            candidates = free_blocks.get(appointment.doctor_id, [])
+            slot = (appointment.start_at, appointment.end_at)
+            containing = [
+                block
+                for block in candidates
+                if block.start_at <= appointment.start_at and block.end_at >= appointment.end_at
+            ]
+            # An exact time match first, then the rest in start order
+            containing.sort(key=lambda block: (block.start_at, block.end_at) != slot)
+            block = next((block for block in containing if self._claim(session, block, candidates)), None)
+            if block is None:
+                logger.warning(
+                    "No free block for appointment %s (%s - %s)",
+                    appointment.id,
+                    appointment.start_at,
+                    appointment.end_at,
+                )
+                continue
+            appointment.block_id = block.id
+            changed += 1
+        return changed
+
+    @staticmethod
+    def _claim(session: Session, block: AppointmentBlockModel, candidates: list[AppointmentBlockModel]) -> bool:
+        """Book ``block`` unless someone else did since it was read; drop it from ``candidates`` either way."""
+        candidates.remove(block)
+        result = session.execute(
+            update(AppointmentBlockModel)
+            .where(AppointmentBlockModel.id == block.id)
+            .where(AppointmentBlockModel.is_booked.is_(False))
+            .values(is_booked=True)
+            .execution_options(synchronize_session=False)
+        )
+        return bool(result.rowcount)
+
+
+class ReleaseOrphanedBlocks(ChunkedJob):
+    """Fix blocks marked booked that no live appointment points to.
+
+    A block is re-linked to an unlinked, active appointment of the same doctor
+    at the same time if there is one, and freed otherwise.
+    """
+
+    name = "release_orphaned_blocks"
+    model = AppointmentBlockModel
+    description = "re-link or free booked blocks without an appointment"
+
+    def scope(self) -> Optional[ColumnElement[bool]]:
+        # Canceled appointments keep block_id but no longer hold the block
+        return AppointmentBlockModel.is_booked.is_(True) & ~exists().where(
+            AppointmentModel.block_id == AppointmentBlockModel.id,
+            AppointmentModel.status != AppointmentStatus.CANCELED,
+        )
+
+    def process_chunk(self, session: Session, ids: list[int]) -> int:
+        blocks = session.scalars(
+            select(AppointmentBlockModel).where(AppointmentBlockModel.id.in_(ids)).order_by(AppointmentBlockModel.id)
+        ).all()
+        unlinked: dict[tuple, list[AppointmentModel]] = {}
+        for appointment in session.scalars(
+            select(AppointmentModel)
+            .where(AppointmentModel.doctor_id.in_({block.doctor_id for block in blocks}))
+            .where(AppointmentModel.block_id.is_(None))
+            .where(AppointmentModel.status != AppointmentStatus.CANCELED)
+            .where(AppointmentModel.start_at.in_({block.start_at for block in blocks}))
+            .order_by(AppointmentModel.id)
+        ):
+            unlinked.setdefault((appointment.doctor_id, appointment.start_at, appointment.end_at), []).append(
+                appointment
+            )
+
+        for block in blocks:
+            matches = unlinked.get((block.doctor_id, block.start_at, block.end_at))
+            if matches:
+                matches.pop(0).block_id = block.id
+            else:
+                block.is_booked = False
+        return len(blocks)
+
+
+class NormalizeAdminRoles(ChunkedJob):
+    """Reset admin roles outside the allowed set to ``superadmin``."""
+
+    name = "normalize_admin_roles"
+    model = AdminModel
+    description = "set invalid admin roles to superadmin"
+
+    def scope(self) -> Optional[ColumnElement[bool]]:
+        return or_(AdminModel.role.is_(None), AdminModel.role.not_in(VALID_ADMIN_ROLES))
+
+    def process_chunk(self, session: Session, ids: list[int]) -> int:
+        result = session.execute(update(AdminModel).where(AdminModel.id.in_(ids)).values(role="superadmin"))
+        return result.rowcount
+
+
+class ReindexPatientSearch(ChunkedJob):
+    """Rebuild ``patient_search_terms`` from the patients and users tables.
+
+    Backfills the index after it is introduced and fixes patients edited with
+    SQL that bypassed the ORM flush hook.
+    """
+
+    name = "reindex_patient_search"
+    model = PatientModel
+    description = "rebuild the patient search terms"
+
+    def process_chunk(self, session: Session, ids: list[int]) -> int:
+        reindex(session.connection(), ids)
+        return len(ids)
+
+
+class RebuildDoctorPatients(ChunkedJob):
+    """Recompute ``doctor_patients`` from live and archived appointments.
+
+    Backfills the table after it is introduced and fixes pairs left behind by
+    appointment writes that bypassed the ORM flush hook.
+    """
+
+    name = "rebuild_doctor_patients"
+    model = DoctorModel
+    description = "rebuild the doctor-patient pairs"
+
+    def process_chunk(self, session: Session, ids: list[int]) -> int:
+        doctor_patients.rebuild(session.connection(), ids)
+        return len(ids)
+
+
+REPAIRS: dict[str, type[ChunkedJob]] = {
+    job.name: job
+    for job in (
+        LinkAppointmentsToBlocks,
+        ReleaseOrphanedBlocks,
+        NormalizeAdminRoles,
+        ReindexPatientSearch,
+        RebuildDoctorPatients,
+    )
+}
+
+
+__all__ = [
+    "LinkAppointmentsToBlocks",
+    "NormalizeAdminRoles",
+    "REPAIRS",
+    "RebuildDoctorPatients",
+    "ReindexPatientSearch",
+    "ReleaseOrphanedBlocks",
+    "VALID_ADMIN_ROLES",
+]
@@ -1,38 +1,144 @@
 from __future__ import annotations
 
+import threading
+import time
 from contextlib import contextmanager
-from typing import Iterator
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.db.broker import DBBroker, get_dbbroker
+from app.db.settings import get_database_settings
 from app.models.system_settings import SystemSettings as SystemSettingsModel
 from app.schemas.system_settings import SystemSetting, SystemSettingUpdate
+from app.services import cache_versions
+
+
+BLOCK_DURATION_KEY = "appointment_block_duration_minutes"
+DEFAULT_BLOCK_DURATION = 60
+
+_SETTINGS_STMT = select(SystemSettingsModel).order_by(SystemSettingsModel.id)
+
+
+@dataclass(frozen=True)
+class SettingsSnapshot:
+    """Immutable view of every setting at one settings version."""
+
+    version: int
+    settings: dict[str, SystemSetting] = field(default_factory=dict)
+
+    def get(self, key: str) -> str | None:
+        setting = self.settings.get(key)
+        return setting.setting_value if setting else None
+
+    def get_int(self, key: str, default: int) -> int:
+        value = self.get(key)
+        return int(value) if value else default
+
+
+class SettingsCache:
+    """Process-wide copy of ``system_settings``.
+
+    Reads are served from memory. At most once per ``check_interval`` seconds
+    a read also fetches the ``system_settings`` cache version in its own
+    transaction; when it differs from the cached one (another worker called
+    ``update_setting``) every row is loaded again. A session with an
+    uncommitted write reads the table itself and leaves the shared copy
+    alone, and a reader on an older snapshot never replaces a newer copy.
+    Writes made in this process are picked up by the first read after they
+    commit; other workers see them within the interval. Direct SQL edits that
+    skip the version bump are not picked up.
+    """
+
+    def __init__(self, check_interval: Optional[float] = None) -> None:
+        self._check_interval = check_interval
+        self._lock = threading.Lock()
+        self._snapshot: Optional[SettingsSnapshot] = None
+        self._checked_at = 0.0
+        # Version written by this process and not seen in the cache yet
+        self._expected = 0
+
+    @property
+    def check_interval(self) -> float:
+        if self._check_interval is None:
+            return get_database_settings().settings_check_interval
+        return self._check_interval
+
+    def snapshot(self, session: Session) -> SettingsSnapshot:
+        if cache_versions.pending(session, cache_versions.SYSTEM_SETTINGS):
+            # Uncommitted changes: read them for this session only
+            return _load(session, cache_versions.current(session, cache_versions.SYSTEM_SETTINGS))
+        with self._lock:
+            cached = self._snapshot
+            if (
+                cached is not None
+                and cached.version >= self._expected
+                and time.monotonic() - self._checked_at < self.check_interval
+            ):
+                return cached
+
+        version = cache_versions.current(session, cache_versions.SYSTEM_SETTINGS)
+        if cached is None or cached.version != version:
+            cached = _load(session, version)
+        with self._lock:
+            if self._snapshot is None or version >= self._snapshot.version:
+                self._snapshot = cached
+                self._checked_at = time.monotonic()
+        return cached
+
+    def expect(self, version: int) -> None:
+        """Check the version on every read until the cache reaches ``version``."""
+        with self._lock:
+            self._expected = max(self._expected, version)
+
+    def invalidate(self) -> None:
+        """Forget the cached rows; the next read reloads them."""
+        with self._lock:
+            self._snapshot = None
+            self._checked_at = 0.0
+            self._expected = 0
+
+
+def _load(session: Session, version: int) -> SettingsSnapshot:
+    return SettingsSnapshot(
+        version=version,
+        settings={row.setting_key: SystemSettingsService._to_schema(row) for row in session.scalars(_SETTINGS_STMT)},
+    )
+
+
+settings_cache = SettingsCache()
 
 
 class SystemSettingsService:
     """Service layer for managing system-wide settings."""
 
-    def __init__(self, session: Session | None = None, *, broker: DBBroker | None = None) -> None:
+    def __init__(
+        self,
+        session: Session | None = None,
+        *,
+        broker: DBBroker | None = None,
+        cache: SettingsCache | None = None,
+    ) -> None:
         self._session = session
         self._broker = broker
+        self._cache = cache or settings_cache
 
     # ------------------------------------------------------------------
     # Public API
     def get_setting(self, key: str) -> str | None:
         """Get a system setting value by key."""
-        with self._session_scope() as session:
-            stmt = select(SystemSettingsModel).where(SystemSettingsModel.setting_key == key)
-            setting = session.scalars(stmt).first()
-            return setting.setting_value if setting else None
+        return self.snapshot().get(key)
 
     def get_all_settings(self) -> list[SystemSetting]:
         """Get all system settings."""
+        return list(self.snapshot().settings.values())
+
+    def snapshot(self) -> SettingsSnapshot:
+        """Current settings from the process-wide cache."""
         with self._session_scope() as session:
-            stmt = select(SystemSettingsModel)
-            settings = session.scalars(stmt).all()
-            return [self._to_schema(model) for model in settings]
+            return self._cache.snapshot(session)
 
     def update_setting(self, key: str, value: str) -> SystemSetting:
         """Update a system setting value."""
@@ -52,16 +158,17 @@ class SystemSettingsService:
                 setting.setting_value = value
             
             session.flush()
+            cache_versions.bump(session, cache_versions.SYSTEM_SETTINGS)
+            self._cache.expect(cache_versions.current(session, cache_versions.SYSTEM_SETTINGS))
             return self._to_schema(setting)
 
     def get_block_duration(self) -> int:
         """Get the current appointment block duration in minutes."""
-        duration_str = self.get_setting("appointment_block_duration_minutes")
-        return int(duration_str) if duration_str else 60
+        return self.snapshot().get_int(BLOCK_DURATION_KEY, DEFAULT_BLOCK_DURATION)
 
     def update_block_duration(self, minutes: int) -> SystemSetting:
         """Update the appointment block duration."""
-        return self.update_setting("appointment_block_duration_minutes", str(minutes))
+        return self.update_setting(BLOCK_DURATION_KEY, str(minutes))
 
     # ------------------------------------------------------------------
     @contextmanager
@@ -83,4 +190,4 @@ class SystemSettingsService:
         )
 
 
-__all__ = ["SystemSettingsService"]
+__all__ = ["SettingsCache", "SettingsSnapshot", "SystemSettingsService", "settings_cache"]
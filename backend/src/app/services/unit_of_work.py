@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from functools import cached_property
+
+from sqlalchemy.orm import Session
+
+from app.services.admin_dashboard import AdminDashboardService
+from app.services.admins import AdminsService
+from app.services.analytics import AppointmentAnalyticsService
+from app.services.appointments import AppointmentsService
+from app.services.doctor_directory import DoctorDirectoryService
+from app.services.doctor_provisioning import DoctorProvisioningService
+from app.services.doctors import DoctorsService
+from app.services.medical_records import MedicalRecordsService
+from app.services.offices import OfficesService
+from app.services.patient_import import PatientImportService
+from app.services.patients import PatientsService
+from app.services.system_settings import SystemSettingsService
+from app.services.users import UsersService
+from app.services.utilization import UtilizationService
+
+
+class UnitOfWork:
+    """Services for one request, all bound to a single session and transaction.
+
+    Services are built lazily and at most once, and collaborators are shared, so
+    ``appointments`` reuses the same ``patients``/``doctors``/``settings``
+    instances. Committing is left to whoever owns the session.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    @cached_property
+    def patients(self) -> PatientsService:
+        return PatientsService(self.session)
+
+    @cached_property
+    def patient_import(self) -> PatientImportService:
+        return PatientImportService(self.session)
+
+    @cached_property
+    def doctors(self) -> DoctorsService:
+        return DoctorsService(self.session)
+
+    @cached_property
+    def doctor_directory(self) -> DoctorDirectoryService:
+        return DoctorDirectoryService(self.session)
+
+    @cached_property
+    def doctor_provisioning(self) -> DoctorProvisioningService:
+        return DoctorProvisioningService(self.session)
+
+    @cached_property
+    def admins(self) -> AdminsService:
+        return AdminsService(self.session)
+
+    @cached_property
+    def users(self) -> UsersService:
+        return UsersService(self.session)
+
+    @cached_property
+    def offices(self) -> OfficesService:
+        return OfficesService(self.session)
+
+    @cached_property
+    def settings(self) -> SystemSettingsService:
+        return SystemSettingsService(self.session)
+
+    @cached_property
+    def admin_dashboard(self) -> AdminDashboardService:
+        return AdminDashboardService(self.session)
+
+    @cached_property
+    def analytics(self) -> AppointmentAnalyticsService:
+        return AppointmentAnalyticsService(self.session)
+
+    @cached_property
+    def utilization(self) -> UtilizationService:
+        return UtilizationService(self.session)
+
+    @cached_property
+    def appointments(self) -> AppointmentsService:
+        return AppointmentsService(
+            self.session,
+            patients=self.patients,
+            doctors=self.doctors,
+            settings=self.settings,
+        )
+
+    @cached_property
+    def medical_records(self) -> MedicalRecordsService:
+        return MedicalRecordsService(
+            self.session,
+            patients=self.patients,
+            doctors=self.doctors,
+        )
+
+
+__all__ = ["UnitOfWork"]
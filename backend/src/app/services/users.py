@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Optional
 
-from sqlalchemy import select, func
+from sqlalchemy import bindparam, select, func
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -13,6 +13,10 @@ from app.schemas.user import User, UserCreate, UserUpdate
 from app.utils.security import hash_password, verify_password
 
 
+# Shared by both authenticate variants below; only the email is bound per call.
+_AUTHENTICATE_STMT = select(UserModel).where(UserModel.email == bindparam("email"))
+
+
 class UsersService:
     """Service layer wrapping persistence logic for users."""
 
@@ -91,9 +95,7 @@ class UsersService:
         return True
 
     def authenticate(self, email: str, password: str) -> Optional[User]:
-        model = self._session.scalar(
-            select(UserModel).where(UserModel.email == email)
-        )
+        model = self._session.scalar(_AUTHENTICATE_STMT, {"email": email})
         if not model or not model.is_active:
             return None
         if not verify_password(password, model.password_hash):
@@ -102,9 +104,7 @@ class UsersService:
         return self._to_schema(model)
     # ------------------------------------------------------------------
     def authenticate(self, email: str, password: str) -> Optional[User]:
-        model = self._session.scalar(
-            select(UserModel).where(UserModel.email == email)
-        )
+        model = self._session.scalar(_AUTHENTICATE_STMT, {"email": email})
         if not model or not model.is_active:
             return None
         if not verify_password(password, model.password_hash):
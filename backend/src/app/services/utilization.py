@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import logging
+from contextlib import contextmanager
+from datetime import date, datetime, time, timezone
+from typing import Iterator, Optional
+
+from sqlalchemy import Integer, and_, case, cast, delete, exists, func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from app.db.broker import DBBroker, get_dbbroker
+from app.models.appointment import Appointment as AppointmentModel
+from app.models.appointment_block import AppointmentBlock as AppointmentBlockModel
+from app.models.doctor import Doctor as DoctorModel
+from app.models.doctor_utilization import DoctorUtilization as DoctorUtilizationModel
+from app.models.enums import AppointmentStatus
+from app.schemas.utilization import DoctorUtilization, UtilizationRefresh
+
+
+logger = logging.getLogger(__name__)
+
+
+def period_start(day: date) -> date:
+    """First day of the calendar month containing ``day``."""
+    return day.replace(day=1)
+
+
+def next_period(period: date) -> date:
+    return date(period.year + 1, 1, 1) if period.month == 12 else date(period.year, period.month + 1, 1)
+
+
+def _count(condition) -> object:
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+class UtilizationService:
+    """Booked vs. offered block capacity per doctor and month.
+
+    Each period is computed by one grouped ``INSERT ... SELECT`` over
+    ``appointment_blocks`` (joined to ``doctors`` for the office) into
+    ``doctor_utilization``, and reports only read that table:
+
+    * offered: blocks starting in the period;
+    * booked: those currently booked;
+    * refilled: booked blocks that also hold a canceled appointment;
+    * empty_past: free blocks that have already ended.
+
+    ``refresh`` recomputes only the periods that are still open (the current
+    month, and a past month whose last refresh ran before it ended), so
+    history is never scanned again. Periods older than the archive retention
+    should not be rebuilt: their blocks are no longer in the live table.
+    """
+
+    def __init__(self, session: Session | None = None, *, broker: DBBroker | None = None) -> None:
+        self._session = session
+        self._broker = broker
+
+    def refresh(self, *, now: Optional[datetime] = None) -> UtilizationRefresh:
+        """Recompute the current period and any period that closed since its last refresh."""
+        now = now or datetime.now(timezone.utc)
+        current = period_start(now.date())
+        with self._session_scope() as session:
+            periods = sorted({*self._open_periods(session, current), current})
+            rows = sum(self._refresh_period(session, period, now) for period in periods)
+        logger.info("Utilization refreshed for %s (%d rows)", ", ".join(map(str, periods)), rows)
+        return UtilizationRefresh(periods=periods, rows=rows)
+
+    def rebuild(self, since: date, *, now: Optional[datetime] = None) -> UtilizationRefresh:
+        """Recompute every period from ``since`` through the current one."""
+        now = now or datetime.now(timezone.utc)
+        current = period_start(now.date())
+        periods: list[date] = []
+        period = period_start(since)
+        while period <= current:
+            periods.append(period)
+            period = next_period(period)
+        with self._session_scope() as session:
+            rows = sum(self._refresh_period(session, period, now) for period in periods)
+        return UtilizationRefresh(periods=periods, rows=rows)
+
+    def report(
+        self,
+        start_date: date,
+        end_date: date,
+        *,
+        doctor_id: Optional[int] = None,
+        office_id: Optional[int] = None,
+    ) -> list[DoctorUtilization]:
+        if end_date < start_date:
+            raise ValueError("end_date must not be before start_date")
+        stmt = (
+            select(DoctorUtilizationModel)
+            .where(DoctorUtilizationModel.period_start >= period_start(start_date))
+            .where(DoctorUtilizationModel.period_start <= end_date)
+            .order_by(DoctorUtilizationModel.period_start, DoctorUtilizationModel.doctor_id)
+        )
+        if doctor_id is not None:
+            stmt = stmt.where(DoctorUtilizationModel.doctor_id == doctor_id)
+        if office_id is not None:
+            stmt = stmt.where(DoctorUtilizationModel.office_id == office_id)
+        with self._session_scope() as session:
+            return [self._to_schema(row) for row in session.scalars(stmt)]
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _open_periods(session: Session, current: date) -> list[date]:
+        """Past periods last refreshed before they ended."""
+        latest = (
+            select(
+                DoctorUtilizationModel.period_start,
+                func.max(DoctorUtilizationModel.refreshed_at).label("refreshed_at"),
+            )
+            .where(DoctorUtilizationModel.period_start < current)
+            .group_by(DoctorUtilizationModel.period_start)
+        )
+        return [
+            period
+            for period, refreshed_at in session.execute(latest)
+            if refreshed_at.replace(tzinfo=None) < datetime.combine(next_period(period), time.min)
+        ]
+
+    @staticmethod
+    def _refresh_period(session: Session, period: date, now: datetime) -> int:
+        low = datetime.combine(period, time.min)
+        high = datetime.combine(next_period(period), time.min)
+        block = AppointmentBlockModel
+        refilled = and_(
+            block.is_booked.is_(True),
+            exists().where(
+                AppointmentModel.block_id == block.id,
+                AppointmentModel.status == AppointmentStatus.CANCELED,
+            ),
+        )
+        aggregate = (
+            select(
+                literal(period),
+                block.doctor_id,
+                DoctorModel.office_id,
+                func.count(),
+                cast(_count(block.is_booked.is_(True)), Integer),
+                cast(_count(refilled), Integer),
+                cast(_count(and_(block.is_booked.is_(False), block.end_at < now)), Integer),
+                literal(now),
+            )
+            .join(DoctorModel, DoctorModel.id == block.doctor_id)
+            .where(block.start_at >= low, block.start_at < high)
+            .group_by(block.doctor_id, DoctorModel.office_id)
+        )
+        table = DoctorUtilizationModel.__table__
+        session.execute(delete(table).where(table.c.period_start == period))
+        result = session.execute(
+            insert(table).from_select(
+                [
+                    "period_start",
+                    "doctor_id",
+                    "office_id",
+                    "offered",
+                    "booked",
+                    "refilled",
+                    "empty_past",
+                    "refreshed_at",
+                ],
+                aggregate,
+            )
+        )
+        return result.rowcount
+
+    @staticmethod
+    def _to_schema(row: DoctorUtilizationModel) -> DoctorUtilization:
+        return DoctorUtilization(
+            period_start=row.period_start,
+            doctor_id=row.doctor_id,
+            office_id=row.office_id,
+            offered=row.offered,
+            booked=row.booked,
+            refilled=row.refilled,
+            empty_past=row.empty_past,
+            utilization=round(row.booked * 100 / row.offered, 1) if row.offered else None,
+            refreshed_at=row.refreshed_at,
+        )
+
+    @contextmanager
+    def _session_scope(self) -> Iterator[Session]:
+        if self._session is not None:
+            yield self._session
+        else:
+            broker = self._broker or get_dbbroker()
+            with broker.session() as session:
+                yield session
+
+
+__all__ = ["UtilizationService", "next_period", "period_start"]
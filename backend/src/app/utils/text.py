@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import re
+import unicodedata
+
+
+def fold(text: str) -> str:
+    """Lower-case ``text`` and strip accents (``"Hipertensión"`` -> ``"hipertension"``)."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def words(text: str) -> list[str]:
+    """Folded words of ``text``, split on anything that is not a letter or digit."""
+    return re.findall(r"\w+", fold(text))
+
+
+def compact(text: str) -> str:
+    """Folded ASCII letters and digits of ``text`` only (``"30.123.456"`` -> ``"30123456"``)."""
+    return re.sub(r"[^a-z0-9]", "", fold(text))
+
+
+__all__ = ["compact", "fold", "words"]
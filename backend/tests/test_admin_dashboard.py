@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import update
+
+from app.models.appointment import Appointment as AppointmentModel
+from app.models.dashboard_counter import DashboardCounter
+from app.models.enums import AppointmentStatus
+from app.schemas.medical_record import MedicalRecordCreate
+from app.schemas.user import DoctorUpdate
+from app.services.admin_dashboard import AdminDashboardService
+from app.services.unit_of_work import UnitOfWork
+
+
+def _summary(session) -> dict:
+    return AdminDashboardService(session).get_summary().model_dump()
+
+
+def _appointment_today(session, doctor_id: int, patient_id: int) -> AppointmentModel:
+    start = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    appointment = AppointmentModel(
+        doctor_id=doctor_id,
+        patient_id=patient_id,
+        start_at=start,
+        end_at=start + timedelta(hours=1),
+        status=AppointmentStatus.PENDING,
+    )
+    session.add(appointment)
+    session.flush()
+    return appointment
+
+
+def test_counters_follow_service_writes(db_session, sample_doctor, sample_patient):
+    uow = UnitOfWork(db_session)
+    assert _summary(db_session) == {
+        "total_users": 2,
+        "active_doctors": 1,
+        "appointments_today": 0,
+        "medical_records": 0,
+    }
+
+    appointment = _appointment_today(db_session, sample_doctor.id, sample_patient.id)
+    uow.medical_records.create(MedicalRecordCreate(patient_id=sample_patient.id, doctor_id=sample_doctor.id))
+    assert _summary(db_session)["appointments_today"] == 1
+    assert _summary(db_session)["medical_records"] == 1
+
+    uow.appointments.cancel(appointment.id)
+    uow.doctors.update(sample_doctor.id, DoctorUpdate(is_active=False))
+    assert _summary(db_session)["appointments_today"] == 0
+    assert _summary(db_session)["active_doctors"] == 0
+
+    # Deleting the patient cascades to their records through the ORM
+    _appointment_today(db_session, sample_doctor.id, sample_patient.id)
+    uow.patients.delete(sample_patient.id)
+    db_session.commit()
+    assert _summary(db_session) == {
+        "total_users": 1,
+        "active_doctors": 0,
+        "appointments_today": 0,
+        "medical_records": 0,
+    }
+
+
+def test_dashboard_is_a_single_read(client, db_session, sample_doctor, sample_patient, assert_max_queries):
+    db_session.commit()
+
+    with assert_max_queries(1):
+        response = client.get("/api/v1/admins/dashboard/summary")
+
+    assert response.status_code == 200
+    assert response.json()["total_users"] == 2
+
+
+def test_reconcile_corrects_drift(db_session, sample_doctor, sample_patient):
+    _appointment_today(db_session, sample_doctor.id, sample_patient.id)
+    db_session.commit()
+    expected = _summary(db_session)
+
+    # Writes that bypass the ORM leave the counters alone
+    db_session.execute(update(DashboardCounter).where(DashboardCounter.name == "users").values(value=40))
+    db_session.add(DashboardCounter(name="appointments:2001-01-01", value=3))
+    db_session.commit()
+
+    service = AdminDashboardService(db_session)
+    corrections = service.reconcile()
+    db_session.commit()
+
+    assert corrections == {"users": (40, 2), "appointments:2001-01-01": (3, 0)}
+    assert _summary(db_session) == expected
+    assert service.reconcile() == {}
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta, timezone
+
+import pytest
+
+from app.models.appointment import Appointment as AppointmentModel
+from app.models.enums import AppointmentStatus
+from app.services.analytics import AppointmentAnalyticsService
+from app.services.appointments import AppointmentsService
+
+
+def _today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+def _book(session, doctor_id: int, patient_id: int, day: date, hour: int = 10, **fields) -> AppointmentModel:
+    start = datetime.combine(day, time(hour))
+    appointment = AppointmentModel(
+        doctor_id=doctor_id,
+        patient_id=patient_id,
+        start_at=start,
+        end_at=start + timedelta(minutes=30),
+        status=fields.pop("status", AppointmentStatus.PENDING),
+        **fields,
+    )
+    session.add(appointment)
+    session.flush()
+    return appointment
+
+
+def _counts(analytics) -> list[tuple]:
+    return [(bucket.bucket_start, bucket.status, bucket.count) for bucket in analytics.buckets]
+
+
+def test_daily_and_weekly_buckets(db_session, sample_doctor, sample_patient):
+    # A fixed past Monday..Wednesday keeps the weekly folding deterministic
+    monday = _today() - timedelta(days=_today().weekday() + 14)
+    _book(db_session, sample_doctor.id, sample_patient.id, monday, status=AppointmentStatus.COMPLETED)
+    _book(db_session, sample_doctor.id, sample_patient.id, monday, hour=11, status=AppointmentStatus.COMPLETED)
+    _book(db_session, sample_doctor.id, sample_patient.id, monday + timedelta(days=2), status=AppointmentStatus.CANCELED)
+    _book(db_session, sample_doctor.id, sample_patient.id, monday + timedelta(days=7))
+    service = AppointmentAnalyticsService(db_session)
+
+    daily = service.appointments(monday, monday + timedelta(days=6))
+    assert _counts(daily) == [
+        (monday, AppointmentStatus.COMPLETED, 2),
+        (monday + timedelta(days=2), AppointmentStatus.CANCELED, 1),
+    ]
+
+    weekly = service.appointments(monday, monday + timedelta(days=13), granularity="week")
+    assert _counts(weekly) == [
+        (monday, AppointmentStatus.CANCELED, 1),
+        (monday, AppointmentStatus.COMPLETED, 2),
+        (monday + timedelta(days=7), AppointmentStatus.PENDING, 1),
+    ]
+
+    filtered = service.appointments(
+        monday, monday + timedelta(days=13), granularity="week", status=AppointmentStatus.PENDING
+    )
+    assert _counts(filtered) == [(monday + timedelta(days=7), AppointmentStatus.PENDING, 1)]
+    assert service.appointments(monday, monday, doctor_id=sample_doctor.id + 1).buckets == []
+
+
+def test_past_days_are_cached_and_today_is_recounted(
+    db_session, sample_doctor, sample_patient, assert_max_queries
+):
+    today = _today()
+    yesterday = today - timedelta(days=1)
+    _book(db_session, sample_doctor.id, sample_patient.id, yesterday)
+    _book(db_session, sample_doctor.id, sample_patient.id, today)
+    db_session.commit()
+    service = AppointmentAnalyticsService(db_session)
+
+    # The cache version, then the counts
+    with assert_max_queries(2):
+        assert _counts(service.appointments(yesterday, today)) == [
+            (yesterday, AppointmentStatus.PENDING, 1),
+            (today, AppointmentStatus.PENDING, 1),
+        ]
+
+    # Today's bucket is recomputed
+    _book(db_session, sample_doctor.id, sample_patient.id, today, hour=12)
+    db_session.commit()
+    with assert_max_queries(2):
+        assert _counts(service.appointments(yesterday, today)) == [
+            (yesterday, AppointmentStatus.PENDING, 1),
+            (today, AppointmentStatus.PENDING, 2),
+        ]
+
+    # A fully past range only reads the version
+    with assert_max_queries(1):
+        assert _counts(service.appointments(yesterday, yesterday)) == [(yesterday, AppointmentStatus.PENDING, 1)]
+
+
+def test_changes_to_past_appointments_are_recounted(db_broker, db_session, sample_doctor, sample_patient):
+    yesterday = _today() - timedelta(days=1)
+    appointment = _book(
+        db_session, sample_doctor.id, sample_patient.id, yesterday, status=AppointmentStatus.CONFIRMED
+    )
+    db_session.commit()
+    # A broker-backed service reads in its own session, like another request
+    other_request = AppointmentAnalyticsService(broker=db_broker)
+    assert _counts(other_request.appointments(yesterday, yesterday)) == [(yesterday, AppointmentStatus.CONFIRMED, 1)]
+
+    # Completing the visit after midnight: the writer sees its change at once,
+    # everyone else once it commits
+    AppointmentsService(db_session).complete(appointment.id)
+    assert _counts(AppointmentAnalyticsService(db_session).appointments(yesterday, yesterday)) == [
+        (yesterday, AppointmentStatus.COMPLETED, 1)
+    ]
+    assert _counts(other_request.appointments(yesterday, yesterday)) == [(yesterday, AppointmentStatus.CONFIRMED, 1)]
+
+    db_session.commit()
+    assert _counts(other_request.appointments(yesterday, yesterday)) == [(yesterday, AppointmentStatus.COMPLETED, 1)]
+
+
+def test_range_validation(db_session):
+    service = AppointmentAnalyticsService(db_session)
+    today = _today()
+    with pytest.raises(ValueError):
+        service.appointments(today, today - timedelta(days=1))
+    with pytest.raises(ValueError):
+        service.appointments(today - timedelta(days=400), today)
+
+
+def test_analytics_endpoint(client, db_session, sample_doctor, sample_patient):
+    today = _today()
+    _book(db_session, sample_doctor.id, sample_patient.id, today, office_id=None)
+    db_session.commit()
+
+    response = client.get(
+        "/api/v1/admins/analytics/appointments",
+        params={"start_date": str(today), "end_date": str(today), "doctor_id": sample_doctor.id},
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["granularity"] == "day"
+    assert body["buckets"] == [
+        {
+            "bucket_start": str(today),
+            "status": "pending",
+            "doctor_id": sample_doctor.id,
+            "office_id": None,
+            "count": 1,
+        }
+    ]
+
+    response = client.get(
+        "/api/v1/admins/analytics/appointments",
+        params={"start_date": str(today), "end_date": str(today - timedelta(days=1))},
+    )
+    assert response.status_code == 400
@@ -189,3 +189,27 @@ def test_doctor_cannot_delete_booked_availability(db_session, unique_suffix):
 
     still_there = appointments.list_availability(doctor.id)
     assert still_there
+
+
+@pytest.mark.integration
+def test_blocks_carry_doctor_id_through_split(db_session, unique_suffix):
+    doctor = _make_doctor(DoctorsService(db_session), unique_suffix)
+    appointments = AppointmentsService(db_session)
+
+    start_time = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0) + timedelta(days=1)
+    end_time = start_time + timedelta(hours=3)
+    availability = appointments.create_availability(
+        AvailabilityCreate(doctor_id=doctor.id, start_at=start_time, end_at=end_time)
+    )
+    assert len(availability.blocks) == 3
+
+    # Deleting the middle block moves the last one to a new availability
+    appointments.delete_block(availability.blocks[1].id)
+
+    blocks = db_session.scalars(select(AppointmentBlockModel)).all()
+    assert len(blocks) == 2
+    assert len({block.availability_id for block in blocks}) == 2
+    assert {block.doctor_id for block in blocks} == {doctor.id}
+
+    free = appointments.list_available_blocks(doctor.id, start_time, end_time)
+    assert [block.id for block in free] == [availability.blocks[0].id, availability.blocks[2].id]
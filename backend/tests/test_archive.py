@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select
+
+from app.db.settings import ArchiveSettings
+from app.models.appointment import Appointment as AppointmentModel
+from app.models.appointment_block import AppointmentBlock as AppointmentBlockModel
+from app.models.archive import ArchivedAppointment, ArchivedAppointmentBlock, ArchivedAvailability
+from app.models.availability import Availability as AvailabilityModel
+from app.models.enums import AppointmentStatus
+from app.models.job_checkpoint import JobCheckpoint
+from app.services.admin_dashboard import AdminDashboardService
+from app.services.archive import ArchiveService
+from app.services.unit_of_work import UnitOfWork
+
+
+NOW = datetime(2026, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _availability(session, doctor_id: int, start: datetime, *, booked_with=None) -> AvailabilityModel:
+    """An availability with two one-hour blocks; optionally book the first one."""
+    availability = AvailabilityModel(doctor_id=doctor_id, start_at=start, end_at=start + timedelta(hours=2))
+    session.add(availability)
+    session.flush()
+    blocks = [
+        AppointmentBlockModel(
+            availability_id=availability.id,
+            doctor_id=doctor_id,
+            block_number=number + 1,
+            start_at=start + timedelta(hours=number),
+            end_at=start + timedelta(hours=number + 1),
+            is_booked=False,
+        )
+        for number in range(2)
+    ]
+    session.add_all(blocks)
+    session.flush()
+    if booked_with is not None:
+        patient_id, status = booked_with
+        blocks[0].is_booked = True
+        session.add(
+            AppointmentModel(
+                doctor_id=doctor_id,
+                patient_id=patient_id,
+                availability_id=availability.id,
+                block_id=blocks[0].id,
+                start_at=blocks[0].start_at,
+                end_at=blocks[0].end_at,
+                status=status,
+            )
+        )
+    return availability
+
+
+def _count(session, model) -> int:
+    return session.scalar(select(func.count()).select_from(model))
+
+
+@pytest.fixture()
+def schedule(db_session, sample_doctor, sample_patient):
+    old = NOW - timedelta(days=60)
+    _availability(db_session, sample_doctor.id, old, booked_with=(sample_patient.id, AppointmentStatus.COMPLETED))
+    # Never completed: the appointment and its block must stay live
+    _availability(
+        db_session, sample_doctor.id, old + timedelta(days=1), booked_with=(sample_patient.id, AppointmentStatus.PENDING)
+    )
+    _availability(db_session, sample_doctor.id, old + timedelta(days=2))
+    # Inside the retention window
+    _availability(db_session, sample_doctor.id, NOW - timedelta(days=5), booked_with=(sample_patient.id, AppointmentStatus.CANCELED))
+    db_session.commit()
+    return {"doctor": sample_doctor, "patient": sample_patient}
+
+
+@pytest.mark.integration
+def test_archive_moves_only_finished_rows_past_retention(db_broker, db_session, schedule):
+    report = ArchiveService(db_broker, ArchiveSettings(retention_days=30, batch_size=100)).run(now=NOW)
+
+    assert report.completed
+    assert report.moved == {"appointments": 1, "blocks": 5, "availabilities": 2}
+    db_session.expire_all()
+    assert _count(db_session, AppointmentModel) == 2
+    assert _count(db_session, ArchivedAppointment) == 1
+    assert _count(db_session, ArchivedAppointmentBlock) == 5
+    assert _count(db_session, ArchivedAvailability) == 2
+    # The pending appointment keeps its block, and that block its availability
+    assert _count(db_session, AppointmentBlockModel) == 3
+    assert _count(db_session, AvailabilityModel) == 2
+    assert db_session.get(JobCheckpoint, ArchiveService.JOB_NAME) is None
+    # The archived appointment left the dashboard counters with it
+    assert AdminDashboardService(db_session).reconcile() == {}
+
+
+@pytest.mark.integration
+def test_archive_resumes_from_checkpoint(db_broker, db_session, schedule):
+    service = ArchiveService(db_broker, ArchiveSettings(retention_days=30, batch_size=1))
+
+    first = service.run(now=NOW, max_batches=3)
+    assert not first.completed
+    checkpoint = db_session.get(JobCheckpoint, ArchiveService.JOB_NAME)
+    assert checkpoint.parameters["phase"] == "blocks"
+    assert checkpoint.last_id > 0
+
+    # A later "now" must not move the cutoff of the interrupted run
+    second = service.run(now=NOW + timedelta(days=365))
+    assert second.completed
+    assert second.cutoff == first.cutoff
+    db_session.expire_all()
+    assert _count(db_session, ArchivedAppointment) == 1
+    assert _count(db_session, ArchivedAppointmentBlock) == 5
+    assert _count(db_session, ArchivedAvailability) == 2
+
+
+@pytest.mark.integration
+def test_history_can_include_archived_appointments(db_broker, db_session, client, schedule):
+    ArchiveService(db_broker, ArchiveSettings(retention_days=30, batch_size=100)).run(now=NOW)
+    patient_id = schedule["patient"].id
+
+    live = UnitOfWork(db_session).appointments.list_for_patient(patient_id)
+    assert [item.status for item in live] == [AppointmentStatus.PENDING, AppointmentStatus.CANCELED]
+
+    response = client.get(f"/api/v1/appointments/patients/{patient_id}", params={"include_archived": True})
+    assert response.status_code == 200
+    assert [item["status"] for item in response.json()] == ["completed", "pending", "canceled"]
+
+    doctor_history = client.get(
+        f"/api/v1/appointments/doctors/{schedule['doctor'].id}", params={"include_archived": True}
+    ).json()
+    assert len(doctor_history) == 3
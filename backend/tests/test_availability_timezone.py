@@ -213,8 +213,8 @@ def test_list_availability_preserves_timezone(db_session, sample_doctor):
         end_at=end_at
     ))
     
-    # List availability
-    availability_list = service.list_availability(sample_doctor.id)
+    # List availability (the fixed date is in the past, so widen the window)
+    availability_list = service.list_availability(sample_doctor.id, start_date=start_at)
     
     assert len(availability_list) > 0
     
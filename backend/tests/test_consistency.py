@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import io
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.db.chunked import ChunkedJobRunner
+from app.models.appointment import Appointment as AppointmentModel
+from app.models.appointment_block import AppointmentBlock as AppointmentBlockModel
+from app.models.availability import Availability as AvailabilityModel
+from app.models.enums import AppointmentStatus
+from app.services.consistency import (
+    BOOKED_WITHOUT_APPOINTMENT,
+    FREE_WITH_APPOINTMENT,
+    MULTIPLE_APPOINTMENTS,
+    OUTSIDE_BLOCK,
+    ConsistencyScanner,
+)
+from app.services.repairs import ReleaseOrphanedBlocks
+
+
+START = datetime(2026, 7, 1, 9, 0, tzinfo=timezone.utc)
+
+
+def _blocks(session, doctor_id: int, count: int) -> list[AppointmentBlockModel]:
+    availability = AvailabilityModel(doctor_id=doctor_id, start_at=START, end_at=START + timedelta(hours=count))
+    session.add(availability)
+    session.flush()
+    blocks = [
+        AppointmentBlockModel(
+            availability_id=availability.id,
+            doctor_id=doctor_id,
+            block_number=number + 1,
+            start_at=START + timedelta(hours=number),
+            end_at=START + timedelta(hours=number + 1),
+            is_booked=False,
+        )
+        for number in range(count)
+    ]
+    session.add_all(blocks)
+    session.flush()
+    return blocks
+
+
+def _book(session, block, patient_id, *, status=AppointmentStatus.PENDING, shift=timedelta(0)):
+    appointment = AppointmentModel(
+        doctor_id=block.doctor_id,
+        patient_id=patient_id,
+        availability_id=block.availability_id,
+        block_id=block.id,
+        start_at=block.start_at + shift,
+        end_at=block.end_at + shift,
+        status=status,
+    )
+    session.add(appointment)
+    session.flush()
+    return appointment
+
+
+@pytest.mark.integration
+def test_consistent_schedule_has_no_violations(db_broker, db_session, sample_doctor, sample_patient):
+    blocks = _blocks(db_session, sample_doctor.id, 3)
+    blocks[0].is_booked = True
+    _book(db_session, blocks[0], sample_patient.id)
+    # A canceled appointment does not hold its (now free) block
+    _book(db_session, blocks[1], sample_patient.id, status=AppointmentStatus.CANCELED)
+    db_session.commit()
+
+    report = ConsistencyScanner(db_broker).scan()
+
+    assert report.consistent
+    assert report.samples == []
+
+
+@pytest.mark.integration
+def test_scanner_reports_each_invariant(db_broker, db_session, sample_doctor, sample_patient, another_patient):
+    blocks = _blocks(db_session, sample_doctor.id, 5)
+    # 0: booked, only a canceled appointment
+    blocks[0].is_booked = True
+    _book(db_session, blocks[0], sample_patient.id, status=AppointmentStatus.CANCELED)
+    # 1: booked twice
+    blocks[1].is_booked = True
+    double = [_book(db_session, blocks[1], patient.id) for patient in (sample_patient, another_patient)]
+    # 2: free but referenced
+    free = _book(db_session, blocks[2], sample_patient.id)
+    # 3: booked, appointment runs past the block
+    blocks[3].is_booked = True
+    outside = _book(db_session, blocks[3], sample_patient.id, shift=timedelta(minutes=30))
+    db_session.commit()
+
+    plan = io.StringIO()
+    report = ConsistencyScanner(db_broker, batch_size=2).scan(plan=plan)
+
+    assert report.counts == {
+        BOOKED_WITHOUT_APPOINTMENT: 1,
+        MULTIPLE_APPOINTMENTS: 1,
+        FREE_WITH_APPOINTMENT: 1,
+        OUTSIDE_BLOCK: 1,
+    }
+    entries = {entry["kind"]: entry for entry in map(json.loads, plan.getvalue().splitlines())}
+    assert entries[BOOKED_WITHOUT_APPOINTMENT] == {
+        "kind": BOOKED_WITHOUT_APPOINTMENT,
+        "doctor_id": sample_doctor.id,
+        "block_id": blocks[0].id,
+        "appointment_ids": [],
+        "action": "release_block",
+    }
+    assert entries[MULTIPLE_APPOINTMENTS]["appointment_ids"] == [appointment.id for appointment in double]
+    assert entries[FREE_WITH_APPOINTMENT]["appointment_ids"] == [free.id]
+    assert entries[FREE_WITH_APPOINTMENT]["action"] == "mark_block_booked"
+    assert entries[OUTSIDE_BLOCK]["appointment_ids"] == [outside.id]
+
+    assert ConsistencyScanner(db_broker).scan(doctor_id=sample_doctor.id + 1000).consistent
+
+    # The release_block entries are what the orphaned-block repair fixes
+    ChunkedJobRunner(db_broker).run(ReleaseOrphanedBlocks())
+    assert ConsistencyScanner(db_broker).scan().counts[BOOKED_WITHOUT_APPOINTMENT] == 0
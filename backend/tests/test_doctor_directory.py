@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from app.models.office import Office as OfficeModel
+from app.schemas.user import DoctorCreate, DoctorUpdate
+from app.services.doctor_directory import DoctorDirectoryService
+from app.services.doctors import DoctorsService
+
+
+def _office(session, code: str) -> int:
+    office = OfficeModel(code=code, name=f"Sede {code}")
+    session.add(office)
+    session.flush()
+    return office.id
+
+
+def _doctor(session, name: str, specialty: str, office_id: int | None, *, is_active: bool = True):
+    return DoctorsService(session).create(
+        DoctorCreate(
+            email=f"{name.lower().replace(' ', '.')}@example.com",
+            password="doctorpass",
+            full_name=name,
+            specialty=specialty,
+            office_id=office_id,
+            is_active=is_active,
+        )
+    )
+
+
+def _seed(session) -> tuple[int, int]:
+    centro = _office(session, "CEN")
+    norte = _office(session, "NOR")
+    _doctor(session, "Ana Alvarez", "Cardiología", centro)
+    _doctor(session, "Bruno Benitez", "Cardiología", norte)
+    _doctor(session, "Carla Castro", "Pediatría", centro)
+    _doctor(session, "Dario Diaz", "Pediatría", centro, is_active=False)
+    session.commit()
+    return centro, norte
+
+
+def test_filters_page_and_facets(db_session):
+    centro, norte = _seed(db_session)
+    service = DoctorDirectoryService(db_session)
+
+    result = service.search(specialty="Cardiología", is_active=True, size=1)
+    assert [doctor.full_name for doctor in result.doctors.items] == ["Ana Alvarez"]
+    assert (result.doctors.total, result.doctors.pages, result.doctors.has_next) == (2, 2, True)
+    # Specialty counts ignore the specialty filter; office counts honor it
+    assert [(facet.specialty, facet.count) for facet in result.facets.specialties] == [
+        ("Cardiología", 2),
+        ("Pediatría", 1),
+    ]
+    assert [(facet.office_id, facet.office_name, facet.count) for facet in result.facets.offices] == [
+        (centro, "Sede CEN", 1),
+        (norte, "Sede NOR", 1),
+    ]
+
+    result = service.search(office_id=centro)
+    assert [doctor.full_name for doctor in result.doctors.items] == ["Ana Alvarez", "Carla Castro", "Dario Diaz"]
+    assert [(facet.specialty, facet.count) for facet in result.facets.specialties] == [
+        ("Pediatría", 2),
+        ("Cardiología", 1),
+    ]
+
+
+def test_facets_are_cached_until_a_doctor_changes(db_session, assert_max_queries):
+    centro, norte = _seed(db_session)
+    service = DoctorDirectoryService(db_session)
+    service.search()
+
+    # Warm cache: only the cache version and the page itself are read
+    with assert_max_queries(2):
+        result = service.search(specialty="Pediatría")
+    assert result.doctors.total == 2
+
+    doctor = _doctor(db_session, "Elena Espinoza", "Pediatría", norte)
+    db_session.commit()
+    assert service.search(specialty="Pediatría").doctors.total == 3
+
+    DoctorsService(db_session).update(doctor.id, DoctorUpdate(specialty="Dermatología"))
+    db_session.commit()
+    result = service.search()
+    assert {facet.specialty: facet.count for facet in result.facets.specialties} == {
+        "Cardiología": 2,
+        "Pediatría": 2,
+        "Dermatología": 1,
+    }
+
+    DoctorsService(db_session).update(doctor.id, DoctorUpdate(is_active=False))
+    db_session.commit()
+    assert service.search(is_active=False).doctors.total == 2
+
+
+def test_uncommitted_changes_stay_out_of_the_shared_cache(db_broker, db_session):
+    _seed(db_session)
+    # A broker-backed service reads in its own session, like another request
+    other_request = DoctorDirectoryService(broker=db_broker)
+    assert other_request.search().doctors.total == 4
+
+    listeners = len(db_session.dispatch.after_commit) + len(db_session.dispatch.after_rollback)
+    for name in ("Elena Espinoza", "Fabio Flores"):
+        _doctor(db_session, name, "Pediatría", None)
+        db_session.flush()
+    assert len(db_session.dispatch.after_commit) + len(db_session.dispatch.after_rollback) == listeners
+
+    # The writer counts its own doctors without caching them for everyone
+    assert DoctorDirectoryService(db_session).search().doctors.total == 6
+    assert other_request.search().doctors.total == 4
+
+    db_session.rollback()
+    assert other_request.search().doctors.total == 4
+    _doctor(db_session, "Elena Espinoza", "Pediatría", None)
+    db_session.commit()
+    assert other_request.search().doctors.total == 5
+
+
+def test_directory_route(client, db_session):
+    centro, _ = _seed(db_session)
+
+    response = client.get(
+        "/api/v1/doctors/directory", params={"specialty": "Pediatría", "is_active": "true"}
+    )
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert [doctor["full_name"] for doctor in body["doctors"]["items"]] == ["Carla Castro"]
+    assert "email" not in body["doctors"]["items"][0]
+    assert body["facets"]["offices"] == [{"office_id": centro, "office_name": "Sede CEN", "count": 1}]
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, select
+
+from app.db.chunked import ChunkedJobRunner
+from app.models.doctor_patient import DoctorPatient as DoctorPatientModel
+from app.schemas.appointment import AppointmentCreate, AvailabilityCreate
+from app.services.appointments import AppointmentsService
+from app.services.doctors import DoctorsService
+from app.services.repairs import RebuildDoctorPatients
+
+
+def _start() -> datetime:
+    return datetime.now(timezone.utc).replace(hour=8, minute=0, second=0, microsecond=0) + timedelta(days=1)
+
+
+def _book(appointments: AppointmentsService, doctor_id: int, patient_id: int, hour: int):
+    start = _start() + timedelta(hours=hour)
+    return appointments.book(
+        AppointmentCreate(doctor_id=doctor_id, patient_id=patient_id, start_at=start, end_at=start + timedelta(hours=1))
+    )
+
+
+def _pairs(session) -> list[tuple]:
+    session.expire_all()
+    return [
+        (row.patient_id, row.appointment_count, row.first_seen.hour, row.last_appointment_at.hour)
+        for row in session.scalars(select(DoctorPatientModel).order_by(DoctorPatientModel.patient_id))
+    ]
+
+
+def _schedule(db_session, sample_doctor, sample_patient, another_patient) -> AppointmentsService:
+    appointments = AppointmentsService(db_session)
+    appointments.create_availability(
+        AvailabilityCreate(doctor_id=sample_doctor.id, start_at=_start(), end_at=_start() + timedelta(hours=5))
+    )
+    _book(appointments, sample_doctor.id, sample_patient.id, 0)
+    _book(appointments, sample_doctor.id, another_patient.id, 1)
+    return appointments
+
+
+def test_pairs_follow_booking_and_cancellation(db_session, sample_doctor, sample_patient, another_patient):
+    appointments = _schedule(db_session, sample_doctor, sample_patient, another_patient)
+    late = _book(appointments, sample_doctor.id, sample_patient.id, 3)
+    db_session.commit()
+    assert _pairs(db_session) == [(sample_patient.id, 2, 8, 11), (another_patient.id, 1, 9, 9)]
+
+    # Canceling keeps the patient listed and the dates; only the count drops
+    appointments.cancel(late.id)
+    db_session.commit()
+    assert _pairs(db_session) == [(sample_patient.id, 1, 8, 11), (another_patient.id, 1, 9, 9)]
+
+    patients = DoctorsService(db_session).get_patients_for_doctor(sample_doctor.id)
+    assert [patient.id for patient in patients] == [sample_patient.id, another_patient.id]
+
+
+def test_my_patients_is_an_index_range_read(
+    db_session, sample_doctor, sample_patient, another_patient, assert_max_queries
+):
+    _schedule(db_session, sample_doctor, sample_patient, another_patient)
+    db_session.commit()
+
+    with assert_max_queries(2) as stats:
+        page = DoctorsService(db_session).get_patients_for_doctor_paginated(sample_doctor.id, page=1, size=1)
+    assert all("appointments" not in sql for sql in stats.statements)
+    assert page.total == 2
+    assert [patient.id for patient in page.items] == [another_patient.id]
+
+
+def test_rebuild_restores_pairs(db_broker, db_session, sample_doctor, sample_patient, another_patient):
+    _schedule(db_session, sample_doctor, sample_patient, another_patient)
+    db_session.commit()
+    maintained = _pairs(db_session)
+
+    db_session.execute(delete(DoctorPatientModel))
+    db_session.commit()
+    report = ChunkedJobRunner(db_broker, chunk_size=1).run(RebuildDoctorPatients())
+
+    assert report.completed
+    assert _pairs(db_session) == maintained
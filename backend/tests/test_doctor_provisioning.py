@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+
+import pytest
+
+from app.db.query_stats import track_queries
+from app.schemas.doctor_provisioning import DoctorProvisioningRequest
+from app.schemas.office import OfficeCreate
+from app.services.admin_dashboard import AdminDashboardService
+from app.services.appointments import AppointmentsService
+from app.services.doctor_directory import DoctorDirectoryService
+from app.services.doctor_provisioning import DoctorProvisioningService
+from app.services.doctors import DoctorsService
+from app.services.offices import OfficesService
+from app.services.system_settings import SystemSettingsService
+
+
+# A Monday
+MONDAY = date(2030, 1, 7)
+
+
+def _entry(n: int, **extra) -> dict:
+    return {
+        "email": f"provisioned{n}@example.com",
+        "password": f"secret{n}",
+        "full_name": f"Dr. Provisioned {n}",
+        "specialty": "Pediatría",
+        "license_number": f"PROV-{n:04d}",
+        **extra,
+    }
+
+
+def _request(*entries: dict, **extra) -> DoctorProvisioningRequest:
+    return DoctorProvisioningRequest.model_validate({"doctors": list(entries), **extra})
+
+
+def test_provision_creates_doctors_and_weekly_availability(db_session):
+    office = OfficesService(db_session).create(OfficeCreate(code="NORTE", name="Sede Norte"))
+    slots = [
+        {"weekday": 0, "start": "09:00", "end": "12:00"},
+        {"weekday": 3, "start": "14:00", "end": "16:00"},
+    ]
+
+    report = DoctorProvisioningService(db_session).provision(
+        _request(
+            _entry(1, office_id=office.id, weekly_availability=slots),
+            _entry(2, office_id=office.id, is_active=False),
+            availability_from=MONDAY,
+            weeks=2,
+        )
+    )
+    db_session.commit()
+
+    assert [doctor.email for doctor in report.doctors] == ["provisioned1@example.com", "provisioned2@example.com"]
+    assert (report.availabilities, report.blocks) == (4, 10)
+
+    first = report.doctors[0].id
+    assert DoctorsService(db_session).authenticate("provisioned1@example.com", "secret1") is not None
+    assert DoctorsService(db_session).get(first).office_id == office.id
+    availability = AppointmentsService(db_session).list_availability(
+        first, datetime(2030, 1, 7, tzinfo=timezone.utc), datetime(2030, 1, 20, tzinfo=timezone.utc)
+    )
+    assert [(item.start_at.day, item.start_at.hour, len(item.blocks)) for item in availability] == [
+        (7, 9, 3),
+        (10, 14, 2),
+        (14, 9, 3),
+        (17, 14, 2),
+    ]
+
+    directory = DoctorDirectoryService(db_session).search(office_id=office.id)
+    assert directory.doctors.total == 2
+    assert AdminDashboardService(db_session).reconcile() == {}
+
+
+def test_rejected_batch_writes_nothing(db_session, sample_doctor):
+    request = _request(
+        _entry(1, license_number=sample_doctor.license_number),
+        _entry(2, email=sample_doctor.email),
+        _entry(3, office_id=999),
+        _entry(4, email="provisioned3@example.com", weekly_availability=[
+            {"weekday": 1, "start": "09:30", "end": "10:30"},
+            {"weekday": 1, "start": "10:00", "end": "11:00"},
+        ]),
+    )
+
+    with pytest.raises(ValueError) as excinfo:
+        DoctorProvisioningService(db_session).provision(request)
+
+    assert str(excinfo.value).split("; ") == [
+        f"doctors[0]: license number {sample_doctor.license_number} already registered",
+        f"doctors[1]: email {sample_doctor.email} already registered",
+        "doctors[2]: email provisioned3@example.com repeated in the batch",
+        "doctors[2]: office with id 999 does not exist",
+        "doctors[3]: email provisioned3@example.com repeated in the batch",
+        "doctors[3]: slot 09:30-10:30 on weekday 1 must start on the hour",
+        "doctors[3]: slot 10:00-11:00 on weekday 1 overlaps another slot",
+    ]
+    assert [doctor.id for doctor in DoctorsService(db_session).list()] == [sample_doctor.id]
+
+
+def test_statements_do_not_grow_with_the_batch(db_session):
+    slot = [{"weekday": 2, "start": "08:00", "end": "10:00"}]
+    # The block duration is read once and then cached
+    SystemSettingsService(db_session).get_block_duration()
+    with track_queries() as few:
+        DoctorProvisioningService(db_session).provision(
+            _request(*(_entry(n, weekly_availability=slot) for n in range(2)), availability_from=MONDAY)
+        )
+    with track_queries() as many:
+        report = DoctorProvisioningService(db_session).provision(
+            _request(*(_entry(n, weekly_availability=slot) for n in range(2, 52)), availability_from=MONDAY)
+        )
+
+    assert (len(report.doctors), report.blocks) == (50, 400)
+    assert many.count == few.count
+
+
+def test_provision_route(client):
+    response = client.post("/api/v1/doctors/batch", json={"doctors": [_entry(1), _entry(2)]})
+    assert response.status_code == 201, response.text
+    assert [doctor["license_number"] for doctor in response.json()["doctors"]] == ["PROV-0001", "PROV-0002"]
+
+    response = client.post("/api/v1/doctors/batch", json={"doctors": [_entry(1)]})
+    assert response.status_code == 400
+    assert "already registered" in response.json()["detail"]
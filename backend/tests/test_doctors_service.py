@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models.appointment import Appointment as AppointmentModel
+from app.models.appointment_block import AppointmentBlock as AppointmentBlockModel
+from app.models.archive import ArchivedAppointment
+from app.models.availability import Availability as AvailabilityModel
+from app.models.enums import AppointmentStatus
+from app.models.medical_record import MedicalRecord as MedicalRecordModel
+from app.schemas.appointment import AvailabilityCreate
+from app.schemas.medical_record import MedicalRecordCreate
+from app.services.admin_dashboard import AdminDashboardService
+from app.services.appointments import AppointmentsService
+from app.services.doctor_directory import DoctorDirectoryService
+from app.services.doctors import DoctorsService
+from app.services.medical_records import MedicalRecordsService
+
+
+def _count(session, model) -> int:
+    return session.scalar(select(func.count()).select_from(model))
+
+
+def test_delete_removes_schedule_with_set_based_statements(
+    db_session, sample_doctor, sample_patient, assert_max_queries
+):
+    start = datetime.now(timezone.utc).replace(hour=8, minute=0, second=0, microsecond=0) + timedelta(days=1)
+    appointments = AppointmentsService(db_session)
+    for day in range(10):
+        day_start = start + timedelta(days=day)
+        appointments.create_availability(
+            AvailabilityCreate(doctor_id=sample_doctor.id, start_at=day_start, end_at=day_start + timedelta(hours=8))
+        )
+    record = MedicalRecordsService(db_session).create(
+        MedicalRecordCreate(patient_id=sample_patient.id, doctor_id=sample_doctor.id, diagnosis="Control")
+    )
+    db_session.commit()
+    assert _count(db_session, AppointmentBlockModel) >= 80
+    assert DoctorDirectoryService(db_session).search().doctors.total == 1
+
+    # Independent of the number of blocks and availabilities
+    with assert_max_queries(10):
+        assert DoctorsService(db_session).delete(sample_doctor.id) is True
+    db_session.commit()
+
+    assert _count(db_session, AppointmentBlockModel) == 0
+    assert _count(db_session, AvailabilityModel) == 0
+    assert DoctorsService(db_session).get(sample_doctor.id) is None
+    assert db_session.get(MedicalRecordModel, record.id).doctor_id is None
+    assert AdminDashboardService(db_session).reconcile() == {}
+    assert DoctorDirectoryService(db_session).search().doctors.total == 0
+
+
+def test_delete_refuses_doctor_with_appointments(db_session, sample_doctor, sample_patient, assert_max_queries):
+    start = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0) + timedelta(days=1)
+    for hour in range(4):
+        db_session.add(
+            AppointmentModel(
+                doctor_id=sample_doctor.id,
+                patient_id=sample_patient.id,
+                start_at=start + timedelta(hours=hour),
+                end_at=start + timedelta(hours=hour, minutes=30),
+                status=AppointmentStatus.PENDING,
+            )
+        )
+    db_session.commit()
+
+    with assert_max_queries(3), pytest.raises(ValueError) as excinfo:
+        DoctorsService(db_session).delete(sample_doctor.id)
+
+    message = str(excinfo.value)
+    assert "4 turno(s)" in message
+    assert message.count("Patient Test") == 3
+    assert "y 1 más" in message
+    assert DoctorsService(db_session).exists(sample_doctor.id)
+
+
+def test_delete_refuses_doctor_with_archived_appointments(db_session, sample_doctor, sample_patient):
+    start = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0) - timedelta(days=400)
+    db_session.add(
+        ArchivedAppointment(
+            id=1,
+            doctor_id=sample_doctor.id,
+            patient_id=sample_patient.id,
+            start_at=start,
+            end_at=start + timedelta(minutes=30),
+            status=AppointmentStatus.COMPLETED,
+            created_at=start,
+            updated_at=start,
+        )
+    )
+    db_session.commit()
+
+    with pytest.raises(ValueError) as excinfo:
+        DoctorsService(db_session).delete(sample_doctor.id)
+
+    assert "1 turno(s) con pacientes: Patient Test." in str(excinfo.value)
+    assert _count(db_session, ArchivedAppointment) == 1
+
+
+def test_delete_missing_doctor(db_session):
+    assert DoctorsService(db_session).delete(999) is False
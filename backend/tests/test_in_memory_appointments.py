@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.models.enums import AppointmentStatus
+from app.repositories.appointments import AppointmentRepository, InMemoryAppointmentRepository
+from app.schemas.appointment import Appointment, AppointmentCreate, AvailabilityCreate
+from app.services.appointments import AppointmentsService, ValidationError
+from app.services.in_memory_appointments import InMemoryAppointmentsService
+
+
+def _start() -> datetime:
+    return datetime.now(timezone.utc).replace(hour=8, minute=0, second=0, microsecond=0) + timedelta(days=1)
+
+
+def _appointment(repo, *, doctor_id=1, patient_id=1, hour=0, hours=1, status=AppointmentStatus.PENDING):
+    start = _start() + timedelta(hours=hour)
+    return repo.add(
+        Appointment(
+            id=repo.next_identity(),
+            doctor_id=doctor_id,
+            patient_id=patient_id,
+            start_at=start,
+            end_at=start + timedelta(hours=hours),
+            status=status,
+        )
+    )
+
+
+def test_repository_range_queries_and_copy_on_write():
+    repo = InMemoryAppointmentRepository()
+    assert isinstance(repo, AppointmentRepository)
+    late = _appointment(repo, hour=5)
+    early = _appointment(repo, hour=1)
+    _appointment(repo, patient_id=2, hour=3)
+
+    assert [item.id for item in repo.list_by_patient(1)] == [early.id, late.id]
+    window = repo.list_by_doctor(1, _start() + timedelta(hours=1), _start() + timedelta(hours=5))
+    assert [item.start_at.hour for item in window] == [9, 11]
+
+    # Reads share the stored instance; writes copy and reindex
+    assert repo.get(early.id) is repo.get(early.id)
+    later = timedelta(hours=6)
+    moved = early.model_copy(update={"start_at": early.start_at + later, "end_at": early.end_at + later})
+    repo.save(moved)
+    moved.notes = "changed after saving"
+    assert repo.get(early.id).notes is None
+    assert [item.id for item in repo.list_by_patient(1)] == [late.id, early.id]
+
+
+def test_conflicts_use_the_interval_index():
+    repo = InMemoryAppointmentRepository()
+    long_one = _appointment(repo, hour=0, hours=6)
+    for hour in range(7, 12):
+        _appointment(repo, hour=hour)
+    _appointment(repo, hour=12, status=AppointmentStatus.CANCELED)
+
+    start = _start()
+    assert repo.find_conflict(1, start + timedelta(hours=5), start + timedelta(hours=6)).id == long_one.id
+    assert repo.find_conflict(1, start + timedelta(hours=6), start + timedelta(hours=7)) is None
+    assert repo.find_conflict(1, start + timedelta(hours=12), start + timedelta(hours=13)) is None
+    assert repo.find_conflict(2, start, start + timedelta(hours=1)) is None
+
+    repo.save(repo.get(long_one.id).model_copy(update={"status": AppointmentStatus.CANCELED}))
+    assert repo.find_conflict(1, start + timedelta(hours=5), start + timedelta(hours=6)) is None
+
+
+def _scenario(service: AppointmentsService, doctor_id: int, patient_id: int) -> list:
+    """A booking workflow; returns what a caller would observe."""
+    start = _start()
+    observed = []
+    availability = service.create_availability(
+        AvailabilityCreate(doctor_id=doctor_id, start_at=start, end_at=start + timedelta(hours=4))
+    )
+    observed.append(len(availability.blocks))
+
+    def book(hour):
+        begin = start + timedelta(hours=hour)
+        return service.book(
+            AppointmentCreate(doctor_id=doctor_id, patient_id=patient_id, start_at=begin, end_at=begin + timedelta(hours=1))
+        )
+
+    first = book(0)
+    second = book(2)
+    for hour in (0, 5):
+        with pytest.raises(ValidationError) as excinfo:
+            book(hour)
+        observed.append(str(excinfo.value).split(" (")[0])
+    with pytest.raises(ValidationError):
+        service.create_availability(
+            AvailabilityCreate(doctor_id=doctor_id, start_at=start + timedelta(hours=3), end_at=start + timedelta(hours=5))
+        )
+
+    service.confirm(second.id)
+    service.cancel(first.id)
+    observed.append(service.complete(second.id).status)
+    free = service.list_available_blocks(doctor_id, start, start + timedelta(hours=4))
+    observed.append([block.start_at.hour for block in free])
+
+    # Deleting the free block at 11:00 shrinks the availability; then 9:00 splits it
+    service.delete_block(free[-1].id)
+    service.delete_block(free[1].id)
+    windows = service.list_availability(doctor_id, start)
+    observed.append([(item.start_at.hour, item.end_at.hour, len(item.blocks)) for item in windows])
+    observed.append([(item.start_at.hour, item.status) for item in service.list_for_patient(patient_id)])
+    return observed
+
+
+def test_service_matches_the_database_backend(db_session, sample_doctor, sample_patient):
+    expected = _scenario(AppointmentsService(db_session), sample_doctor.id, sample_patient.id)
+
+    service = InMemoryAppointmentsService()
+    service.store.doctor_ids.add(7)
+    service.store.patient_ids.add(9)
+
+    assert _scenario(service, 7, 9) == expected
+    assert expected[-1] == [(8, AppointmentStatus.CANCELED), (10, AppointmentStatus.COMPLETED)]
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import pytest
+
+from app.schemas.medical_record import MedicalRecordCreate, MedicalRecordUpdate
+from app.services.unit_of_work import UnitOfWork
+
+
+def _record(uow: UnitOfWork, patient_id: int, doctor_id: int | None, diagnosis: str, **fields):
+    return uow.medical_records.create(
+        MedicalRecordCreate(patient_id=patient_id, doctor_id=doctor_id, diagnosis=diagnosis, **fields)
+    )
+
+
+def test_search_ignores_accents_and_matches_prefixes(db_session, sample_doctor, sample_patient):
+    uow = UnitOfWork(db_session)
+    hypertension = _record(uow, sample_patient.id, sample_doctor.id, "Hipertensión arterial")
+    _record(uow, sample_patient.id, sample_doctor.id, "Gripe", treatment="Reposo e hidratación")
+
+    for query in ("hipertension", "HIPERTENSIÓN", "hiperten arterial"):
+        page = uow.medical_records.search(query)
+        assert [hit.id for hit in page.items] == [hypertension.id]
+        assert page.items[0].doctor_name == sample_doctor.full_name
+    assert [hit.diagnosis for hit in uow.medical_records.search("hidratacion").items] == ["Gripe"]
+    assert uow.medical_records.search("hipertension diabetes").items == []
+
+
+def test_search_follows_updates_and_filters(db_session, sample_doctor, sample_patient, another_patient):
+    uow = UnitOfWork(db_session)
+    mine = _record(uow, sample_patient.id, sample_doctor.id, "Control")
+    other = _record(uow, another_patient.id, None, "Diabetes tipo 2")
+    assert uow.medical_records.search("diabetes").items[0].id == other.id
+
+    uow.medical_records.update(mine.id, MedicalRecordUpdate(notes="Sospecha de diabetes"))
+    assert {hit.id for hit in uow.medical_records.search("diabetes").items} == {mine.id, other.id}
+    assert [hit.id for hit in uow.medical_records.search("diabetes", doctor_id=sample_doctor.id).items] == [mine.id]
+    assert [hit.id for hit in uow.medical_records.search("diabetes", patient_id=another_patient.id).items] == [
+        other.id
+    ]
+
+    uow.medical_records.update(mine.id, MedicalRecordUpdate(notes="Sin hallazgos"))
+    assert [hit.id for hit in uow.medical_records.search("diabetes").items] == [other.id]
+
+
+def test_search_pages_by_rank_with_a_cursor(db_session, sample_doctor, sample_patient):
+    uow = UnitOfWork(db_session)
+    strong = _record(uow, sample_patient.id, sample_doctor.id, "asma asma", notes="asma bronquial")
+    weak = [
+        _record(uow, sample_patient.id, sample_doctor.id, f"asma leve, control {number} de una serie larga")
+        for number in range(4)
+    ]
+
+    first = uow.medical_records.search("asma", limit=2)
+    assert first.items[0].id == strong.id
+    assert first.items[0].score >= first.items[1].score
+    seen = [hit.id for hit in first.items]
+    cursor = first.next_cursor
+    while cursor:
+        page = uow.medical_records.search("asma", limit=2, cursor=cursor)
+        seen.extend(hit.id for hit in page.items)
+        cursor = page.next_cursor
+    assert sorted(seen) == sorted([strong.id, *(record.id for record in weak)])
+
+    with pytest.raises(ValueError):
+        uow.medical_records.search("asma", cursor="not-a-cursor")
+    with pytest.raises(ValueError):
+        uow.medical_records.search("a, de")
+
+
+def test_search_endpoint(client, db_session, sample_doctor, sample_patient):
+    record = _record(UnitOfWork(db_session), sample_patient.id, sample_doctor.id, "Hipertensión")
+    db_session.commit()
+
+    response = client.get("/api/v1/medical-records/search", params={"q": "hipertension"})
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["id"] for item in body["items"]] == [record.id]
+    assert body["next_cursor"] is None
+
+    assert client.get("/api/v1/medical-records/search", params={"q": "de"}).status_code == 400
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from app.schemas.medical_record import MedicalRecordCreate
+from app.services.medical_records import PREVIEW_LENGTH
+from app.services.unit_of_work import UnitOfWork
+
+
+def _records(db_session, doctor_id: int, patient_id: int, count: int):
+    uow = UnitOfWork(db_session)
+    return [
+        uow.medical_records.create(
+            MedicalRecordCreate(
+                patient_id=patient_id,
+                doctor_id=doctor_id,
+                diagnosis=f"Consulta {number}",
+                notes="x" * 5000,
+            )
+        )
+        for number in range(count)
+    ]
+
+
+def test_summaries_skip_full_texts(db_session, sample_doctor, sample_patient, assert_max_queries):
+    records = _records(db_session, sample_doctor.id, sample_patient.id, 3)
+    service = UnitOfWork(db_session).medical_records
+
+    with assert_max_queries(2) as stats:
+        page = service.get_patient_history_paginated(sample_patient.id, page=1, size=2)
+    assert all("notes" not in statement and "treatment" not in statement for statement in stats.statements)
+
+    assert (page.total, page.pages, page.has_next) == (3, 2, True)
+    assert [item.id for item in page.items] == [records[2].id, records[1].id]
+    assert page.items[0].doctor_name == sample_doctor.full_name
+    assert page.items[0].diagnosis_preview == "Consulta 2"
+
+    last = service.list_for_doctor_paginated(sample_doctor.id, page=2, size=2)
+    assert [item.id for item in last.items] == [records[0].id]
+    assert service.get(records[0].id).notes == "x" * 5000
+
+
+def test_long_diagnosis_is_cut(db_session, sample_doctor, sample_patient):
+    uow = UnitOfWork(db_session)
+    uow.medical_records.create(
+        MedicalRecordCreate(patient_id=sample_patient.id, diagnosis="a" * (PREVIEW_LENGTH + 50))
+    )
+    [item] = uow.medical_records.list_for_patient_paginated(sample_patient.id).items
+    assert item.diagnosis_preview == "a" * PREVIEW_LENGTH + "…"
+    assert item.doctor_id is None and item.doctor_name is None
+
+    empty = uow.medical_records.list_for_doctor_paginated(sample_doctor.id)
+    assert (empty.items, empty.total, empty.pages) == ([], 0, 0)
+
+
+def test_paginated_endpoints(client, db_session, sample_doctor, sample_patient):
+    _records(db_session, sample_doctor.id, sample_patient.id, 3)
+    db_session.commit()
+
+    for path in (
+        f"/api/v1/medical-records/patients/{sample_patient.id}/paginated",
+        f"/api/v1/medical-records/patients/{sample_patient.id}/history/paginated",
+        f"/api/v1/medical-records/doctors/{sample_doctor.id}/paginated",
+    ):
+        response = client.get(path, params={"page": 1, "size": 2})
+        assert response.status_code == 200
+        body = response.json()
+        assert (body["total"], len(body["items"])) == (3, 2)
+        assert "notes" not in body["items"][0]
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from app.db.query_stats import track_queries
+from app.services.admin_dashboard import AdminDashboardService
+from app.services.patient_import import PatientImportService
+from app.services.patients import PatientsService
+
+
+HEADER = "email,password,full_name,document_number,address,phone,date_of_birth,medical_record_number"
+
+
+def _csv(*rows: str) -> io.StringIO:
+    return io.StringIO("\n".join((HEADER, *rows)) + "\n", newline="")
+
+
+def _rows(count: int, start: int = 0) -> list[str]:
+    return [
+        f"import{n}@example.com,secret{n},Paciente Importado {n},4{n:07d},Calle {n},555-{n:04d},1990-01-02,"
+        for n in range(start, start + count)
+    ]
+
+
+def test_import_creates_patients_and_reports_rejected_rows(db_session, sample_patient):
+    csv_file = _csv(
+        "ana@example.com,secreta,Ana Gómez,30111222,Calle 1,555-0001,1985-04-12,MRN-A",
+        # Line 3: no phone
+        "bruno@example.com,secreta,Bruno Díaz,30111333,Calle 2,,,",
+        # Line 4: email repeated in the file, in another case
+        "ANA@example.com,secreta,Ana Bis,30111444,Calle 3,555-0003,,",
+        # Line 5: email of an existing patient
+        f"{sample_patient.email},secreta,Otro,30111555,Calle 4,555-0004,,",
+        # Line 6: document already imported in an earlier chunk
+        "carla@example.com,secreta,Carla Ruiz,30111222,Calle 5,555-0005,,",
+        "dario@example.com,secreta,Dario Paz,30111666,Calle 6,555-0006,,",
+    )
+
+    report = PatientImportService(db_session, chunk_size=2).import_csv(csv_file)
+    db_session.commit()
+
+    assert (report.created, report.failed) == (2, 4)
+    assert [(error.line, error.message) for error in report.errors] == [
+        (3, "phone: Field required"),
+        (4, "Email repeated in the file"),
+        (5, "Email already registered"),
+        (6, "Document number repeated in the file"),
+    ]
+
+    found = PatientsService(db_session).search("30111222")
+    assert [(patient.full_name, patient.medical_record_number) for patient in found] == [("Ana Gómez", "MRN-A")]
+    assert str(found[0].date_of_birth) == "1985-04-12"
+    auth = PatientsService(db_session).authenticate("dario@example.com", "secreta")
+    assert auth is not None
+    assert AdminDashboardService(db_session).reconcile() == {}
+
+
+def test_statements_per_chunk_do_not_grow_with_rows(db_session):
+    with track_queries() as few:
+        PatientImportService(db_session, chunk_size=500).import_csv(_csv(*_rows(5)))
+    with track_queries() as many:
+        report = PatientImportService(db_session, chunk_size=500).import_csv(_csv(*_rows(200, start=5)))
+
+    assert report.created == 200
+    assert many.count == few.count
+
+
+def test_process_pool_hashing(db_session):
+    report = PatientImportService(db_session, hash_workers=2).import_csv(_csv(*_rows(3)))
+
+    assert report.created == 3
+    user = PatientsService(db_session).authenticate("import1@example.com", "secret1")
+    assert user is not None
+
+
+def test_header_is_validated(db_session):
+    with pytest.raises(ValueError, match="Missing required column"):
+        PatientImportService(db_session).import_csv(io.StringIO("email,password\n"))
+    with pytest.raises(ValueError, match="Unknown column"):
+        PatientImportService(db_session).import_csv(io.StringIO(HEADER + ",nickname\n"))
+
+
+def test_import_route(client, db_session):
+    body = "\n".join((HEADER, *_rows(2), "bad,row")) + "\n"
+
+    response = client.post("/api/v1/patients/import", content=body, headers={"Content-Type": "text/csv"})
+
+    assert response.status_code == 200, response.text
+    assert response.json()["created"] == 2
+    assert response.json()["errors"][0]["line"] == 4
+
+    response = client.post("/api/v1/patients/import", content="email\n", headers={"Content-Type": "text/csv"})
+    assert response.status_code == 400
+
+
+def test_import_route_accepts_a_byte_order_mark(client, db_session):
+    # Spreadsheet exports often start with a UTF-8 BOM
+    body = "\ufeff" + "\n".join((HEADER, *_rows(1))) + "\n"
+
+    response = client.post(
+        "/api/v1/patients/import", content=body.encode("utf-8"), headers={"Content-Type": "text/csv"}
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.json()["created"] == 1
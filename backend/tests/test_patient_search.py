@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import delete, func, select
+
+from app.db.chunked import ChunkedJobRunner
+from app.models.patient_search_term import PatientSearchTerm
+from app.schemas.user import PatientCreate, PatientUpdate, UserUpdate
+from app.services.patients import PatientsService
+from app.services.repairs import ReindexPatientSearch
+from app.services.users import UsersService
+
+
+def _patient(service: PatientsService, email: str, full_name: str, document_number: str):
+    return service.create(
+        PatientCreate(
+            email=email,
+            password="patientpass",
+            full_name=full_name,
+            document_type="dni",
+            document_number=document_number,
+            address="Calle 123",
+            phone="555-0000",
+        )
+    )
+
+
+@pytest.fixture()
+def patients(db_session):
+    service = PatientsService(db_session)
+    return {
+        "gomez": _patient(service, "ana.gomez@example.com", "Ana María Gómez", "30.123.456"),
+        "nunez": _patient(service, "jnunez@example.com", "Juan Núñez", "12345678"),
+        "perez": _patient(service, "lperez@example.com", "Lucía Pérez", "30123"),
+    }
+
+
+def _ids(results) -> list[int]:
+    return [patient.id for patient in results]
+
+
+def test_search_by_name_email_and_document(db_session, patients):
+    service = PatientsService(db_session)
+    gomez, nunez, perez = patients["gomez"], patients["nunez"], patients["perez"]
+
+    assert _ids(service.search("gomez")) == [gomez.id]
+    assert _ids(service.search("NÚÑ")) == [nunez.id]
+    assert _ids(service.search("mar gom")) == [gomez.id]
+    assert service.search("maria nunez") == []
+    assert _ids(service.search("lperez@")) == [perez.id]
+    # Any part of a document number, with or without punctuation
+    assert _ids(service.search("3456")) == [gomez.id, nunez.id]
+    assert _ids(service.search("0.123.456")) == [gomez.id]
+
+    with pytest.raises(ValueError):
+        service.search("-a-")
+
+
+def test_exact_document_ranks_first(db_session, patients):
+    service = PatientsService(db_session)
+    # "30123" prefixes Ana's document but is Lucía's whole one
+    assert _ids(service.search("30123")) == [patients["perez"].id, patients["gomez"].id]
+
+
+def test_index_follows_updates_from_any_service(db_session, patients):
+    service = PatientsService(db_session)
+    nunez = patients["nunez"]
+
+    service.update(nunez.id, PatientUpdate(document_number="99.888.777"))
+    assert service.search("12345678") == []
+    assert _ids(service.search("99888777")) == [nunez.id]
+
+    UsersService(db_session).update(nunez.id, UserUpdate(full_name="Juan Ibáñez"))
+    assert _ids(service.search("ibanez")) == [nunez.id]
+    assert service.search("nunez") == []
+
+    service.delete(nunez.id)
+    db_session.flush()
+    assert db_session.scalar(
+        select(func.count()).select_from(PatientSearchTerm).where(PatientSearchTerm.patient_id == nunez.id)
+    ) == 0
+
+
+def test_reindex_repair_rebuilds_terms(db_broker, db_session, patients):
+    db_session.execute(delete(PatientSearchTerm))
+    db_session.commit()
+    assert PatientsService(db_session).search("gomez") == []
+
+    report = ChunkedJobRunner(db_broker, chunk_size=2).run(ReindexPatientSearch())
+    assert report.changed == 3
+    db_session.expire_all()
+    assert _ids(PatientsService(db_session).search("gomez")) == [patients["gomez"].id]
+
+
+def test_search_endpoint(client, db_session, patients):
+    db_session.commit()
+    response = client.get("/api/v1/patients/search", params={"q": "Gómez"})
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()] == [patients["gomez"].id]
+    assert client.get("/api/v1/patients/search", params={"q": "."}).status_code == 400
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.db.broker import DBBroker
+from app.db.pool import MonitoredQueuePool
+from app.db.settings import DatabaseSettings
+
+
+@pytest.fixture()
+def file_broker(tmp_path):
+    broker = DBBroker(
+        DatabaseSettings(
+            url=f"sqlite:///{tmp_path / 'pool.db'}",
+            pool_size=2,
+            max_overflow=1,
+            pool_timeout=0.05,
+            pool_recycle=600,
+        )
+    )
+    yield broker
+    broker.engine.dispose()
+
+
+def test_pool_settings_reach_the_engine(file_broker):
+    pool = file_broker.engine.pool
+    assert isinstance(pool, MonitoredQueuePool)
+    assert pool.size() == 2
+    assert pool.timeout() == 0.05
+
+    status = file_broker.pool_status()
+    assert (status.size, status.max_overflow, status.recycle) == (2, 1, 600)
+
+
+def test_pool_status_tracks_checkouts_and_overflow(file_broker):
+    connections = [file_broker.engine.connect() for _ in range(3)]
+    try:
+        status = file_broker.pool_status()
+        assert status.checked_out == 3
+        assert status.overflow == 1
+        # Pool exhausted: the next checkout waits for pool_timeout and fails
+        with pytest.raises(PoolTimeoutError):
+            file_broker.engine.connect()
+    finally:
+        for conn in connections:
+            conn.close()
+
+    status = file_broker.pool_status()
+    assert status.checked_out == 0
+    assert status.idle == 2
+    assert status.checkouts == 4
+    assert status.timeouts == 1
+    assert status.wait_max_ms >= 50
+
+
+def test_memory_database_reports_static_pool():
+    broker = DBBroker(DatabaseSettings(url="sqlite://"))
+    try:
+        status = broker.pool_status()
+        assert status.pool_class == "StaticPool"
+        assert status.checked_out is None
+    finally:
+        broker.engine.dispose()
+
+
+def test_ping_is_cached(file_broker, assert_max_queries):
+    first = file_broker.ping()
+    assert first.ok
+    with assert_max_queries(0):
+        assert file_broker.ping() is first
+    assert file_broker.ping(max_age=0) is not first
+
+
+def test_healthz_db_reports_pool_and_ping(client):
+    response = client.get("/healthz/db")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "ok"
+    assert body["ping"]["ok"] is True
+    assert body["pool"]["pool_class"] == "MonitoredQueuePool"
+    assert {"checked_out", "idle", "overflow", "wait_avg_ms", "wait_max_ms"} <= body["pool"].keys()
+
+
+def test_healthz_db_is_unavailable_when_ping_fails(client, db_broker, monkeypatch):
+    def _failing_connect():
+        raise PoolTimeoutError("pool exhausted")
+
+    monkeypatch.setattr(db_broker, "_last_ping", None)
+    monkeypatch.setattr(db_broker.engine, "connect", _failing_connect)
+
+    response = client.get("/healthz/db")
+
+    assert response.status_code == 503
+    assert response.json()["ping"]["error"].startswith("TimeoutError")
@@ -0,0 +1,207 @@
+"""EXPLAIN regression tests for the scheduling hot paths.
+
+Each test runs a real service call on a seeded schedule, captures every SELECT
+it issues and asks the database for the plan. A full table scan on any of them
+fails the test, so a dropped index or a rewritten predicate that stops using
+one shows up here rather than as a slow endpoint in production.
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event
+
+from app.schemas.appointment import AppointmentCreate, AvailabilityCreate
+from app.schemas.user import DoctorCreate, PatientCreate
+from app.services.unit_of_work import UnitOfWork
+
+
+DOCTORS = 3
+PATIENTS = 3
+DAYS = 10
+
+
+@pytest.fixture()
+def seeded_schedule(db_session):
+    """A few doctors with ten days of availability each and some bookings."""
+    uow = UnitOfWork(db_session)
+    doctors = [
+        uow.doctors.create(
+            DoctorCreate(
+                email=f"plan.doctor{index}@example.com",
+                password="doctorpass",
+                full_name=f"Plan Doctor {index}",
+                license_number=f"PLAN-{index}",
+            )
+        )
+        for index in range(DOCTORS)
+    ]
+    patients = [
+        uow.patients.create(
+            PatientCreate(
+                email=f"plan.patient{index}@example.com",
+                password="patientpass",
+                full_name=f"Plan Patient {index}",
+                document_number=f"PLAN{index}",
+                address="Plan 123",
+                phone="555-0000",
+            )
+        )
+        for index in range(PATIENTS)
+    ]
+    first_day = datetime.now(timezone.utc).replace(hour=9, minute=0, second=0, microsecond=0) + timedelta(days=1)
+    for doctor in doctors:
+        for day in range(DAYS):
+            start = first_day + timedelta(days=day)
+            uow.appointments.create_availability(
+                AvailabilityCreate(doctor_id=doctor.id, start_at=start, end_at=start + timedelta(hours=4))
+            )
+        for offset, patient in enumerate(patients):
+            start = first_day + timedelta(days=offset)
+            uow.appointments.book(
+                AppointmentCreate(
+                    doctor_id=doctor.id,
+                    patient_id=patient.id,
+                    start_at=start,
+                    end_at=start + timedelta(minutes=30),
+                )
+            )
+    db_session.commit()
+    return {"doctors": doctors, "patients": patients, "first_day": first_day}
+
+
+@contextmanager
+def _captured_selects(engine):
+    captured: list[tuple[str, object]] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        yield captured
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+
+def _full_scans(engine, captured) -> list[str]:
+    """Return a readable description of every full scan in the captured plans.
+
+    Scans of derived tables (subqueries SQLAlchemy aliases ``anon_N``) only
+    read rows an inner, indexed query already produced, so they are allowed.
+    """
+    problems = []
+    with engine.connect() as conn:
+        for statement, parameters in captured:
+            if engine.dialect.name == "sqlite":
+                rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+                scans = [
+                    row[3] for row in rows if row[3].startswith("SCAN ") and not row[3].startswith("SCAN anon_")
+                ]
+            elif engine.dialect.name == "mysql":
+                rows = conn.exec_driver_sql(f"EXPLAIN {statement}", parameters).mappings().all()
+                scans = [
+                    f"ALL on {row['table']}"
+                    for row in rows
+                    if row["type"] == "ALL" and not str(row["table"]).startswith("<derived")
+                ]
+            else:  # pragma: no cover - only SQLite and MySQL are supported
+                pytest.skip(f"No plan checks for dialect {engine.dialect.name}")
+            problems.extend(f"{scan}\n    in: {statement}" for scan in scans)
+    return problems
+
+
+def _assert_no_full_scans(engine, captured) -> None:
+    assert captured, "no SELECT statements were captured"
+    problems = _full_scans(engine, captured)
+    assert not problems, "Full scans found:\n" + "\n".join(problems)
+
+
+@pytest.mark.integration
+def test_list_available_blocks_uses_indexes(db_engine, db_session, seeded_schedule):
+    doctor = seeded_schedule["doctors"][1]
+    window_start = seeded_schedule["first_day"] + timedelta(days=2)
+
+    with _captured_selects(db_engine) as captured:
+        UnitOfWork(db_session).appointments.list_available_blocks(
+            doctor.id, window_start, window_start + timedelta(days=3)
+        )
+
+    _assert_no_full_scans(db_engine, captured)
+
+
+@pytest.mark.integration
+def test_list_availability_uses_indexes(db_engine, db_session, seeded_schedule):
+    doctor = seeded_schedule["doctors"][0]
+
+    with _captured_selects(db_engine) as captured:
+        UnitOfWork(db_session).appointments.list_availability(doctor.id)
+
+    _assert_no_full_scans(db_engine, captured)
+
+
+@pytest.mark.integration
+def test_booking_checks_use_indexes(db_engine, db_session, seeded_schedule):
+    doctor = seeded_schedule["doctors"][2]
+    patient = seeded_schedule["patients"][0]
+    start = seeded_schedule["first_day"] + timedelta(days=5, hours=1)
+
+    with _captured_selects(db_engine) as captured:
+        UnitOfWork(db_session).appointments.book(
+            AppointmentCreate(
+                doctor_id=doctor.id,
+                patient_id=patient.id,
+                start_at=start,
+                end_at=start + timedelta(minutes=30),
+            )
+        )
+    db_session.rollback()
+
+    _assert_no_full_scans(db_engine, captured)
+
+
+@pytest.mark.integration
+def test_appointment_listings_use_indexes(db_engine, db_session, seeded_schedule):
+    uow = UnitOfWork(db_session)
+
+    with _captured_selects(db_engine) as captured:
+        uow.appointments.list_for_patient(seeded_schedule["patients"][1].id)
+        uow.appointments.list_for_doctor(seeded_schedule["doctors"][1].id)
+
+    _assert_no_full_scans(db_engine, captured)
+
+
+@pytest.mark.integration
+def test_authentication_lookups_use_indexes(db_engine, db_session, seeded_schedule):
+    uow = UnitOfWork(db_session)
+
+    with _captured_selects(db_engine) as captured:
+        uow.patients.authenticate("plan.patient0@example.com", "patientpass")
+        uow.doctors.authenticate("plan.doctor0@example.com", "doctorpass")
+
+    _assert_no_full_scans(db_engine, captured)
+
+
+@pytest.mark.integration
+def test_patient_search_uses_indexes(db_engine, db_session, seeded_schedule):
+    uow = UnitOfWork(db_session)
+
+    with _captured_selects(db_engine) as captured:
+        uow.patients.search("plan pat")
+        uow.patients.search("PLAN1")
+
+    _assert_no_full_scans(db_engine, captured)
+
+
+@pytest.mark.integration
+def test_doctor_patients_use_indexes(db_engine, db_session, seeded_schedule):
+    uow = UnitOfWork(db_session)
+
+    with _captured_selects(db_engine) as captured:
+        uow.doctors.get_patients_for_doctor(seeded_schedule["doctors"][1].id)
+        uow.doctors.get_patients_for_doctor_paginated(seeded_schedule["doctors"][1].id, page=2, size=5)
+
+    _assert_no_full_scans(db_engine, captured)
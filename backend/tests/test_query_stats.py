@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from app.db import settings as settings_module
+from app.db.query_stats import track_queries
+from app.main import create_app
+from app.models.user import User as UserModel
+from app.schemas.appointment import AvailabilityCreate
+from app.services.unit_of_work import UnitOfWork
+
+
+def _add_availabilities(db_session, doctor_id: int, days: range) -> None:
+    uow = UnitOfWork(db_session)
+    start = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0) + timedelta(days=1)
+    for day in days:
+        slot_start = start + timedelta(days=day)
+        uow.appointments.create_availability(
+            AvailabilityCreate(doctor_id=doctor_id, start_at=slot_start, end_at=slot_start + timedelta(hours=1))
+        )
+    db_session.commit()
+
+
+def test_track_queries_counts_statements_and_time(db_session):
+    with track_queries() as outer:
+        db_session.execute(select(UserModel)).all()
+        with track_queries() as inner:
+            db_session.execute(select(UserModel.id)).all()
+
+    assert inner.count == 1
+    assert outer.count == 2
+    assert outer.duration >= inner.duration > 0
+    assert "users" in outer.statements[0]
+
+
+def test_track_queries_ignores_statements_outside_block(db_session):
+    with track_queries() as stats:
+        pass
+    db_session.execute(select(UserModel)).all()
+
+    assert stats.count == 0
+
+
+@pytest.mark.integration
+def test_debug_mode_reports_query_stats_headers(db_broker, db_engine, monkeypatch):
+    monkeypatch.setenv("DATABASE_DEBUG_QUERY_STATS", "1")
+    settings_module.get_database_settings.cache_clear()
+    try:
+        with TestClient(create_app()) as debug_client:
+            response = debug_client.get("/api/v1/offices/")
+    finally:
+        settings_module.get_database_settings.cache_clear()
+
+    assert response.status_code == 200
+    assert int(response.headers["X-DB-Query-Count"]) >= 1
+    assert float(response.headers["X-DB-Query-Time-Ms"]) >= 0
+
+
+@pytest.mark.integration
+def test_query_stats_headers_are_off_by_default(client):
+    response = client.get("/api/v1/offices/")
+
+    assert response.status_code == 200
+    assert "X-DB-Query-Count" not in response.headers
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    ("path", "limit"),
+    [
+        ("/api/v1/doctors/", 1),
+        ("/api/v1/doctors/paginated", 2),
+        ("/api/v1/doctors/{doctor_id}", 2),
+        ("/api/v1/doctors/{doctor_id}/patients", 2),
+        ("/api/v1/patients/paginated", 2),
+        ("/api/v1/appointments/patients/{patient_id}", 2),
+        ("/api/v1/admins/dashboard/summary", 1),
+        ("/api/v1/offices/", 1),
+    ],
+)
+def test_endpoint_query_budget(client, db_session, sample_doctor, sample_patient, assert_max_queries, path, limit):
+    db_session.commit()
+    url = path.format(doctor_id=sample_doctor.id, patient_id=sample_patient.id)
+
+    with assert_max_queries(limit):
+        response = client.get(url)
+
+    assert response.status_code == 200, response.text
+
+
+@pytest.mark.integration
+def test_doctor_availability_query_count_does_not_grow_with_rows(client, db_session, sample_doctor):
+    url = f"/api/v1/doctors/{sample_doctor.id}/availability"
+    _add_availabilities(db_session, sample_doctor.id, range(1))
+    with track_queries() as single:
+        client.get(url)
+
+    _add_availabilities(db_session, sample_doctor.id, range(1, 4))
+    with track_queries() as several:
+        client.get(url)
+
+    assert several.count == single.count
+
+
+@pytest.mark.integration
+def test_doctor_availability_window_defaults_to_upcoming(client, db_session, sample_doctor):
+    _add_availabilities(db_session, sample_doctor.id, range(-4, 1))
+    url = f"/api/v1/doctors/{sample_doctor.id}/availability"
+
+    upcoming = client.get(url).json()
+    history = client.get(url, params={"start_date": "2000-01-01T00:00:00Z"}).json()
+
+    assert len(upcoming) == 2
+    assert len(history) == 5
+    assert all(
+        [block["block_number"] for block in item["blocks"]] == sorted(block["block_number"] for block in item["blocks"])
+        for item in history
+    )
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event, func, select, update
+
+from app.db.chunked import ChunkedJobRunner
+from app.models.appointment import Appointment as AppointmentModel
+from app.models.appointment_block import AppointmentBlock as AppointmentBlockModel
+from app.models.availability import Availability as AvailabilityModel
+from app.models.enums import AppointmentStatus
+from app.models.job_checkpoint import JobCheckpoint
+from app.services.repairs import LinkAppointmentsToBlocks, ReleaseOrphanedBlocks
+
+
+START = datetime(2026, 7, 1, 9, 0, tzinfo=timezone.utc)
+
+
+def _blocks(session, doctor_id: int, count: int) -> list[AppointmentBlockModel]:
+    availability = AvailabilityModel(doctor_id=doctor_id, start_at=START, end_at=START + timedelta(hours=count))
+    session.add(availability)
+    session.flush()
+    blocks = [
+        AppointmentBlockModel(
+            availability_id=availability.id,
+            doctor_id=doctor_id,
+            block_number=number + 1,
+            start_at=START + timedelta(hours=number),
+            end_at=START + timedelta(hours=number + 1),
+            is_booked=False,
+        )
+        for number in range(count)
+    ]
+    session.add_all(blocks)
+    session.flush()
+    return blocks
+
+
+def _unlinked_appointment(session, doctor_id: int, patient_id: int, block: AppointmentBlockModel) -> None:
+    """An appointment as older code left it: on a block's slot, without ``block_id``."""
+    session.add(
+        AppointmentModel(
+            doctor_id=doctor_id,
+            patient_id=patient_id,
+            availability_id=block.availability_id,
+            start_at=block.start_at,
+            end_at=block.end_at,
+            status=AppointmentStatus.PENDING,
+        )
+    )
+
+
+@pytest.fixture()
+def unlinked(db_session, sample_doctor, sample_patient):
+    blocks = _blocks(db_session, sample_doctor.id, 6)
+    for block in blocks[:5]:
+        _unlinked_appointment(db_session, sample_doctor.id, sample_patient.id, block)
+    db_session.commit()
+    return blocks
+
+
+def _unlinked_count(session) -> int:
+    return session.scalar(
+        select(func.count()).select_from(AppointmentModel).where(AppointmentModel.block_id.is_(None))
+    )
+
+
+def _checkpoints(session) -> list[JobCheckpoint]:
+    return session.scalars(select(JobCheckpoint)).all()
+
+
+@pytest.mark.integration
+def test_dry_run_reports_without_writing(db_broker, db_session, unlinked):
+    report = ChunkedJobRunner(db_broker, chunk_size=2, dry_run=True).run(LinkAppointmentsToBlocks())
+
+    assert report.completed
+    assert report.changed == 5
+    db_session.expire_all()
+    assert _unlinked_count(db_session) == 5
+    assert _checkpoints(db_session) == []
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("workers", [1, 3])
+def test_link_appointments_to_blocks(db_broker, db_session, unlinked, workers):
+    report = ChunkedJobRunner(db_broker, chunk_size=2, workers=workers).run(LinkAppointmentsToBlocks())
+
+    assert report.completed
+    assert report.changed == 5
+    db_session.expire_all()
+    assert _unlinked_count(db_session) == 0
+    for appointment in db_session.scalars(select(AppointmentModel)):
+        block = db_session.get(AppointmentBlockModel, appointment.block_id)
+        assert block.is_booked
+        assert (block.start_at, block.end_at) == (appointment.start_at, appointment.end_at)
+    assert not db_session.get(AppointmentBlockModel, unlinked[5].id).is_booked
+    assert _checkpoints(db_session) == []
+
+
+@pytest.mark.integration
+def test_link_skips_blocks_booked_after_they_were_read(db_broker, db_session, sample_doctor, sample_patient):
+    block = _blocks(db_session, sample_doctor.id, 1)[0]
+    _unlinked_appointment(db_session, sample_doctor.id, sample_patient.id, block)
+    db_session.commit()
+
+    def book_after_reading_candidates(state):
+        # Run the candidate query, then let another transaction take the block
+        if state.is_select and state.statement.column_descriptions[0]["entity"] is AppointmentBlockModel:
+            frozen = state.invoke_statement().freeze()
+            with db_broker.session() as other:
+                other.execute(update(AppointmentBlockModel).values(is_booked=True))
+            return frozen()
+
+    with db_broker.session() as session:
+        event.listen(session, "do_orm_execute", book_after_reading_candidates)
+        ids = session.scalars(select(AppointmentModel.id)).all()
+        assert LinkAppointmentsToBlocks().process_chunk(session, ids) == 0
+
+    db_session.expire_all()
+    assert _unlinked_count(db_session) == 1
+
+
+@pytest.mark.integration
+def test_interrupted_repair_resumes_from_checkpoint(db_broker, db_session, unlinked):
+    runner = ChunkedJobRunner(db_broker, chunk_size=2)
+
+    first = runner.run(LinkAppointmentsToBlocks(), max_chunks=1)
+    assert not first.completed
+    assert first.changed == 2
+    [checkpoint] = _checkpoints(db_session)
+    assert checkpoint.last_id > 0
+
+    with pytest.raises(ValueError):
+        ChunkedJobRunner(db_broker, chunk_size=5).run(LinkAppointmentsToBlocks())
+
+    second = runner.run(LinkAppointmentsToBlocks())
+    assert second.completed
+    assert second.changed == 3
+    db_session.expire_all()
+    assert _unlinked_count(db_session) == 0
+    assert _checkpoints(db_session) == []
+
+
+@pytest.mark.integration
+def test_release_orphaned_blocks(db_broker, db_session, sample_doctor, sample_patient):
+    blocks = _blocks(db_session, sample_doctor.id, 3)
+    for block in blocks:
+        block.is_booked = True
+    # Only the first orphan has an appointment it can be re-linked to
+    _unlinked_appointment(db_session, sample_doctor.id, sample_patient.id, blocks[0])
+    db_session.commit()
+
+    report = ChunkedJobRunner(db_broker, chunk_size=1).run(ReleaseOrphanedBlocks())
+
+    assert report.completed
+    assert report.changed == 3
+    db_session.expire_all()
+    appointment = db_session.scalars(select(AppointmentModel)).one()
+    assert appointment.block_id == blocks[0].id
+    assert [db_session.get(AppointmentBlockModel, block.id).is_booked for block in blocks] == [True, False, False]
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import text
+
+from app.db.broker import DBBroker
+from app.db.settings import DatabaseSettings
+
+
+def test_file_database_uses_wal_and_foreign_keys(tmp_path):
+    broker = DBBroker(DatabaseSettings(url=f"sqlite:///{tmp_path / 'wal.db'}"))
+    try:
+        with broker.engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+    finally:
+        broker.engine.dispose()
+
+
+def test_memory_database_shares_one_connection():
+    broker = DBBroker(DatabaseSettings(url="sqlite://"))
+    try:
+        broker.create_all()
+        with broker.session() as session:
+            session.execute(text("INSERT INTO offices (code) VALUES ('MAIN')"))
+        with broker.session() as session:
+            assert session.execute(text("SELECT count(*) FROM offices")).scalar() == 1
+    finally:
+        broker.engine.dispose()
+
+
+def test_pragma_values_must_be_keywords():
+    with pytest.raises(ValueError):
+        DatabaseSettings(url="sqlite://", sqlite_journal_mode="WAL; DROP TABLE users")
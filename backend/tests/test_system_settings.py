@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from app.services.system_settings import SettingsCache, SystemSettingsService
+
+
+def test_block_duration_is_served_from_memory(db_session, assert_max_queries):
+    service = SystemSettingsService(db_session, cache=SettingsCache(check_interval=60))
+    service.update_block_duration(30)
+    db_session.commit()
+
+    assert service.get_block_duration() == 30
+    with assert_max_queries(0):
+        assert service.get_block_duration() == 30
+        assert service.get_setting("appointment_block_duration_minutes") == "30"
+        assert [setting.setting_key for setting in service.get_all_settings()] == [
+            "appointment_block_duration_minutes"
+        ]
+
+
+def test_update_is_visible_immediately_in_this_process(db_session):
+    service = SystemSettingsService(db_session, cache=SettingsCache(check_interval=60))
+    assert service.get_block_duration() == 60
+
+    service.update_block_duration(45)
+
+    assert service.get_block_duration() == 45
+    db_session.commit()
+    assert service.get_block_duration() == 45
+
+
+def test_other_workers_pick_up_changes_through_the_version_row(db_session, assert_max_queries):
+    worker = SettingsCache(check_interval=0)
+    other_worker = SettingsCache(check_interval=0)
+    reader = SystemSettingsService(db_session, cache=worker)
+    assert reader.get_block_duration() == 60
+
+    # Unchanged version: one cheap version lookup, no reload
+    with assert_max_queries(1):
+        assert reader.get_block_duration() == 60
+
+    SystemSettingsService(db_session, cache=other_worker).update_block_duration(90)
+    db_session.commit()
+
+    with assert_max_queries(2):
+        assert reader.get_block_duration() == 90
+
+
+def test_rolled_back_update_is_not_cached(db_session):
+    service = SystemSettingsService(db_session, cache=SettingsCache(check_interval=60))
+    service.update_block_duration(15)
+    assert service.get_block_duration() == 15
+
+    db_session.rollback()
+
+    assert service.get_block_duration() == 60
+
+
+def test_uncommitted_update_is_not_served_to_other_sessions(db_broker, db_session):
+    cache = SettingsCache(check_interval=60)
+    writer = SystemSettingsService(db_session, cache=cache)
+    # A broker-backed service reads in its own session, like another request
+    other_request = SystemSettingsService(broker=db_broker, cache=cache)
+    assert other_request.get_setting("maintenance") is None
+
+    listeners = len(db_session.dispatch.after_commit) + len(db_session.dispatch.after_rollback)
+    writer.update_setting("maintenance", "on")
+    writer.update_setting("maintenance", "uncommitted")
+    assert len(db_session.dispatch.after_commit) + len(db_session.dispatch.after_rollback) == listeners
+
+    assert writer.get_setting("maintenance") == "uncommitted"
+    assert other_request.get_setting("maintenance") is None
+
+    db_session.rollback()
+    assert other_request.get_setting("maintenance") is None
+    writer.update_setting("maintenance", "on")
+    db_session.commit()
+    assert other_request.get_setting("maintenance") == "on"
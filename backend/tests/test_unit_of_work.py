@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.api.dependencies import SessionDep
+from app.models.office import Office as OfficeModel
+
+from app.schemas.appointment import AvailabilityCreate
+from app.schemas.user import PatientUpdate, UserUpdate
+from app.services.unit_of_work import UnitOfWork
+
+
+@pytest.fixture()
+def engine_counters(db_engine):
+    """Count pool checkouts and commits issued on the shared test engine."""
+    counters = {"checkouts": 0, "commits": 0}
+
+    def _on_checkout(*_args):
+        counters["checkouts"] += 1
+
+    def _on_commit(*_args):
+        counters["commits"] += 1
+
+    event.listen(db_engine, "checkout", _on_checkout)
+    event.listen(db_engine, "commit", _on_commit)
+    yield counters
+    event.remove(db_engine, "checkout", _on_checkout)
+    event.remove(db_engine, "commit", _on_commit)
+
+
+def test_unit_of_work_shares_collaborators(db_session):
+    uow = UnitOfWork(db_session)
+
+    assert uow.appointments is uow.appointments
+    assert uow.appointments._patients is uow.patients
+    assert uow.appointments._doctors is uow.doctors
+    assert uow.appointments._settings is uow.settings
+    assert uow.medical_records._patients is uow.patients
+
+
+@pytest.mark.integration
+def test_booking_request_uses_one_connection_and_one_commit(
+    client, db_session, sample_doctor, sample_patient, engine_counters
+):
+    uow = UnitOfWork(db_session)
+    start = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0) + timedelta(days=1)
+    uow.appointments.create_availability(
+        AvailabilityCreate(doctor_id=sample_doctor.id, start_at=start, end_at=start + timedelta(hours=1))
+    )
+    db_session.commit()
+    engine_counters.update(checkouts=0, commits=0)
+
+    response = client.post(
+        "/api/v1/appointments/",
+        json={
+            "doctor_id": sample_doctor.id,
+            "patient_id": sample_patient.id,
+            "start_at": start.isoformat(),
+            "end_at": (start + timedelta(hours=1)).isoformat(),
+        },
+    )
+
+    assert response.status_code == 201, response.text
+    assert engine_counters == {"checkouts": 1, "commits": 1}
+
+
+@pytest.mark.integration
+def test_doctor_patients_route_reuses_request_session(client, db_session, sample_doctor, engine_counters):
+    db_session.commit()
+    engine_counters.update(checkouts=0, commits=0)
+
+    response = client.get(f"/api/v1/doctors/{sample_doctor.id}/patients")
+
+    assert response.status_code == 200
+    assert response.json() == []
+    assert engine_counters["checkouts"] == 1
+
+
+def test_failed_request_commit_is_reported_to_the_client(app):
+    @app.post("/scratch/offices")
+    def _create_office(session: SessionDep):
+        # Not flushed: the NOT NULL violation surfaces when the request commits
+        session.add(OfficeModel(code=None, name="Sin codigo"))
+        return {"ok": 1}
+
+    with TestClient(app, raise_server_exceptions=False) as client:
+        response = client.post("/scratch/offices")
+    assert response.status_code == 500
+
+
+def test_entity_lookups_are_memoized_per_unit_of_work(db_session, sample_doctor, sample_patient, assert_max_queries):
+    db_session.commit()
+    db_session.expunge_all()
+    uow = UnitOfWork(db_session)
+
+    with assert_max_queries(2) as stats:
+        assert uow.patients.exists(sample_patient.id)
+        assert uow.doctors.exists(sample_doctor.id)
+    # Only the key is selected
+    assert all("password_hash" not in sql for sql in stats.statements)
+
+    assert uow.doctors.get(sample_doctor.id) is not None
+    with assert_max_queries(0):
+        assert uow.doctors.exists(sample_doctor.id)
+        assert uow.patients.exists(sample_patient.id)
+
+    missing = sample_doctor.id + 1000
+    assert not uow.doctors.exists(missing)
+    with assert_max_queries(0):
+        assert not uow.doctors.exists(missing)
+
+    # A fresh unit of work (next request) looks things up again
+    with assert_max_queries(1):
+        assert UnitOfWork(db_session).doctors.exists(sample_doctor.id)
+
+
+def test_entity_memo_is_dropped_on_update(db_session, sample_patient):
+    uow = UnitOfWork(db_session)
+    assert uow.patients.get(sample_patient.id).full_name == "Patient Test"
+
+    uow.patients.update(sample_patient.id, PatientUpdate(full_name="Renamed"))
+
+    assert uow.patients.get(sample_patient.id).full_name == "Renamed"
+    uow.patients.delete(sample_patient.id)
+    assert not uow.patients.exists(sample_patient.id)
+
+
+def test_lookups_see_writes_through_other_services(db_session, sample_doctor, sample_patient):
+    uow = UnitOfWork(db_session)
+    assert uow.patients.get(sample_patient.id).full_name == "Patient Test"
+    assert uow.doctors.get(sample_doctor.id).is_active
+
+    uow.users.update(sample_patient.id, UserUpdate(full_name="Renamed"))
+    uow.users.update(sample_doctor.id, UserUpdate(is_active=False))
+
+    assert uow.patients.get(sample_patient.id).full_name == "Renamed"
+    assert not uow.doctors.get(sample_doctor.id).is_active
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+
+from app.models.appointment import Appointment as AppointmentModel
+from app.models.appointment_block import AppointmentBlock as AppointmentBlockModel
+from app.models.availability import Availability as AvailabilityModel
+from app.models.enums import AppointmentStatus
+from app.services.utilization import UtilizationService
+
+
+START = datetime(2026, 7, 1, 9, 0, tzinfo=timezone.utc)
+JULY = date(2026, 7, 1)
+AUGUST = date(2026, 8, 1)
+
+
+def _schedule(session, doctor_id: int, patient_id: int) -> None:
+    """Four hourly blocks: booked, canceled then rebooked, and two free ones."""
+    availability = AvailabilityModel(doctor_id=doctor_id, start_at=START, end_at=START + timedelta(hours=4))
+    session.add(availability)
+    session.flush()
+    blocks = [
+        AppointmentBlockModel(
+            availability_id=availability.id,
+            doctor_id=doctor_id,
+            block_number=number + 1,
+            start_at=START + timedelta(hours=number),
+            end_at=START + timedelta(hours=number + 1),
+            is_booked=number < 2,
+        )
+        for number in range(4)
+    ]
+    session.add_all(blocks)
+    session.flush()
+    for block, status in (
+        (blocks[0], AppointmentStatus.CONFIRMED),
+        (blocks[1], AppointmentStatus.CANCELED),
+        (blocks[1], AppointmentStatus.PENDING),
+    ):
+        session.add(
+            AppointmentModel(
+                doctor_id=doctor_id,
+                patient_id=patient_id,
+                block_id=block.id,
+                start_at=block.start_at,
+                end_at=block.end_at,
+                status=status,
+            )
+        )
+    session.flush()
+
+
+def test_refresh_summarizes_block_occupancy(db_session, sample_doctor, sample_patient):
+    _schedule(db_session, sample_doctor.id, sample_patient.id)
+    service = UtilizationService(db_session)
+
+    result = service.refresh(now=START + timedelta(hours=3, minutes=30))
+    assert result.periods == [JULY]
+    assert result.rows == 1
+
+    [row] = service.report(JULY, date(2026, 7, 31))
+    assert (row.doctor_id, row.offered, row.booked, row.refilled, row.empty_past) == (sample_doctor.id, 4, 2, 1, 1)
+    assert row.utilization == 50.0
+    assert service.report(JULY, date(2026, 7, 31), doctor_id=sample_doctor.id + 1) == []
+
+
+def test_refresh_finalizes_closed_periods_once(db_session, sample_doctor, sample_patient):
+    _schedule(db_session, sample_doctor.id, sample_patient.id)
+    service = UtilizationService(db_session)
+    service.refresh(now=START)
+
+    # July ended after its last refresh, so it is recomputed one last time
+    result = service.refresh(now=datetime(2026, 8, 2, tzinfo=timezone.utc))
+    assert result.periods == [JULY, AUGUST]
+    [row] = service.report(JULY, JULY)
+    assert row.empty_past == 2
+
+    assert service.refresh(now=datetime(2026, 8, 3, tzinfo=timezone.utc)).periods == [AUGUST]
+
+
+def test_rebuild_covers_every_period_since(db_session, sample_doctor, sample_patient):
+    _schedule(db_session, sample_doctor.id, sample_patient.id)
+    result = UtilizationService(db_session).rebuild(date(2026, 6, 15), now=datetime(2026, 8, 2, tzinfo=timezone.utc))
+    assert result.periods == [date(2026, 6, 1), JULY, AUGUST]
+    assert result.rows == 1
+
+
+def test_utilization_endpoints(client, db_session, sample_doctor, sample_patient):
+    _schedule(db_session, sample_doctor.id, sample_patient.id)
+    UtilizationService(db_session).rebuild(JULY)
+    db_session.commit()
+
+    response = client.get(
+        "/api/v1/admins/reports/utilization",
+        params={"start_date": "2026-07-01", "end_date": "2026-07-31"},
+    )
+    assert response.status_code == 200
+    [row] = response.json()
+    assert (row["offered"], row["booked"], row["utilization"]) == (4, 2, 50.0)
+
+    response = client.get(
+        "/api/v1/admins/reports/utilization",
+        params={"start_date": "2026-07-31", "end_date": "2026-07-01"},
+    )
+    assert response.status_code == 400
+
+    response = client.post("/api/v1/admins/reports/utilization/refresh")
+    assert response.status_code == 200
+    assert date.fromisoformat(response.json()["periods"][-1]) == datetime.now(timezone.utc).date().replace(day=1)